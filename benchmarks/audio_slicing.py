@@ -0,0 +1,95 @@
+"""
+Measures the time and the amount of file system writes spent per decoding interval by the audio chopper.
+
+Compares the former approach (writing the audio to a wave file in the temporary directory as it arrives, then
+hardlinking it once per profile) with collecting the audio in memory and writing one file per decoder run right before
+it starts. Decoders are not run, only the files are read back the way a decoder would.
+
+Usage: python3 -m benchmarks.audio_slicing
+"""
+
+from owrx.audio.wav import SliceBuffer
+from datetime import datetime
+import tempfile
+import wave
+import time
+import os
+
+# 12kHz 16bit audio, delivered in the chunk size the chopper typically receives
+CHUNK_SIZE = 4096
+INTERVAL = 15
+PROFILES = 4
+ROUNDS = 5
+
+
+def readBack(filename):
+    with wave.open(filename, "rb") as f:
+        f.readframes(f.getnframes())
+
+
+def fileBased(directory, chunk, chunks):
+    filename = "{dir}/openwebrx-audiochopper-master-0-{timestamp}.wav".format(
+        dir=directory, timestamp=datetime.utcnow().strftime("%y%m%d_%H%M%S")
+    )
+    waveFile = wave.open(filename, "wb")
+    waveFile.setnchannels(1)
+    waveFile.setsampwidth(2)
+    waveFile.setframerate(12000)
+    for _ in range(chunks):
+        waveFile.writeframes(chunk)
+    waveFile.close()
+    links = []
+    for i in range(PROFILES):
+        link = "{dir}/openwebrx-audiochopper-{i}.wav".format(dir=directory, i=i)
+        os.link(filename, link)
+        links.append(link)
+    os.unlink(filename)
+    for link in links:
+        readBack(link)
+        os.unlink(link)
+
+
+def memoryBased(directory, chunk, chunks, buffer):
+    for _ in range(chunks):
+        buffer.write(chunk)
+    audioSlice = buffer.getSlice()
+    for i in range(PROFILES):
+        filename = "{dir}/openwebrx-audiochopper-{i}.wav".format(dir=directory, i=i)
+        audioSlice.writeWaveFile(filename)
+        readBack(filename)
+        os.unlink(filename)
+
+
+def measure(name, method):
+    start = time.process_time()
+    wallStart = time.perf_counter()
+    for _ in range(ROUNDS):
+        method()
+    cpu = (time.process_time() - start) / ROUNDS
+    wall = (time.perf_counter() - wallStart) / ROUNDS
+    print("{name:>32}: {cpu:8.3f} ms cpu / {wall:8.3f} ms wall per interval".format(
+        name=name, cpu=cpu * 1000, wall=wall * 1000
+    ))
+
+
+def main():
+    chunk = os.urandom(CHUNK_SIZE)
+    chunks = INTERVAL * 12000 * 2 // CHUNK_SIZE
+    writes = chunks
+    print("{0} profiles, {1}s interval, {2} chunks of {3} bytes".format(PROFILES, INTERVAL, chunks, CHUNK_SIZE))
+    print("file based: {0} write calls per interval during collection".format(writes))
+    print("memory based: 0 write calls during collection, {0} file writes right before decoding".format(PROFILES))
+
+    candidates = [tempfile.gettempdir()]
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        candidates.append("/dev/shm")
+    for base in candidates:
+        with tempfile.TemporaryDirectory(dir=base) as directory:
+            print("\nin {0}:".format(base))
+            measure("wave file + hardlinks", lambda: fileBased(directory, chunk, chunks))
+            buffer = SliceBuffer(INTERVAL)
+            measure("in-memory slice", lambda: memoryBased(directory, chunk, chunks, buffer))
+
+
+if __name__ == "__main__":
+    main()
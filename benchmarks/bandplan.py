@@ -0,0 +1,81 @@
+"""
+Measures band lookups the way decoders do them, and bookmark range queries.
+
+Every decoded message looks up the band of its frequency, so the band lookup rate is an upper bound for the number of
+decodes per second the parsers can handle. The previous implementation, which checked the file modification times and
+scanned all bands on every lookup, is emulated for comparison.
+
+Needs a working configuration, just like openwebrx itself.
+
+Usage: python3 -m benchmarks.bandplan
+"""
+
+from owrx.bands import Bandplan
+from owrx.bookmarks import Bookmarks, Bookmark
+import random
+import time
+
+LOOKUPS = 100000
+BOOKMARKS = 10000
+QUERIES = 1000
+
+
+def measure(name, method, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        method()
+    duration = time.perf_counter() - start
+    print("{name:>48}: {rate:12.0f} / s".format(name=name, rate=count / duration))
+
+
+def main():
+    random.seed(0)
+    bandplan = Bandplan.getSharedInstance()
+    bandplan.findBand(0)
+    bands = bandplan.bands
+    print("{0} bands".format(len(bands)))
+
+    # decodes cluster on a few dial frequencies, with a spread of a few kHz each
+    dials = [random.choice(bands).lower_bound + random.randrange(100000) for _ in range(20)]
+    frequencies = iter([random.choice(dials) + random.randrange(3000) for _ in range(LOOKUPS * 3)])
+
+    def linear():
+        freq = next(frequencies)
+        bandplan._getFileModifiedTimestamp()
+        matches = [band for band in bands if band.inBand(freq)]
+        return matches[0] if matches else None
+
+    measure("band lookups, stat and linear scan", linear, LOOKUPS)
+    measure("band lookups, index", lambda: bandplan.findBand(next(frequencies)), LOOKUPS)
+
+    # a new client per query, looking at 2 MHz somewhere in HF
+    spans = [(f, f + 2000000) for f in (random.randrange(30000000) for _ in range(QUERIES * 4))]
+    spans = iter(spans)
+
+    def linearDials():
+        span = next(spans)
+        return [e for b in bands for e in b.getDialFrequencies(span)]
+
+    measure("dial frequency queries, linear", linearDials, QUERIES)
+    measure("dial frequency queries, index", lambda: bandplan.collectDialFrequencies(next(spans)), QUERIES)
+
+    bookmarks = Bookmarks.getSharedInstance()
+    bookmarks.getBookmarks()
+    for i in range(BOOKMARKS):
+        bookmarks.addBookmark(
+            Bookmark({"name": "bookmark {0}".format(i), "frequency": random.randrange(30000000), "modulation": "am"})
+        )
+    everything = bookmarks.getBookmarks()
+    print("{0} bookmarks".format(len(everything)))
+
+    def linearBookmarks():
+        lo, hi = next(spans)
+        bookmarks._getFileModifiedTimestamp()
+        return [b for b in everything if lo <= b.getFrequency() <= hi]
+
+    measure("bookmark queries, stat and linear scan", linearBookmarks, QUERIES)
+    measure("bookmark queries, index", lambda: bookmarks.getBookmarks(next(spans)), QUERIES)
+
+
+if __name__ == "__main__":
+    main()
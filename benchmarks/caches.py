@@ -0,0 +1,127 @@
+"""
+Compares the cache formats of the EIBI schedule and the marker database: pretty-printed JSON, as they used to be
+written, and the compact columnar format.
+
+The data is taken from the caches in the data directory (in either format), or scraped if there are none. Both are
+written to a temporary directory in both formats, and every load runs in a fresh interpreter, so that the memory
+numbers are not distorted by earlier runs. Memory is the growth of the resident set while loading, including the
+pages of mapped files.
+
+Needs a working configuration, just like openwebrx itself.
+
+Usage: python3 -m benchmarks.caches
+"""
+
+from owrx.eibi import EIBI
+from owrx.markers import Markers
+from owrx.compact import CompactTable
+import subprocess
+import tempfile
+import json
+import sys
+import os
+
+RUNS = 5
+
+LOAD = """
+import sys
+from benchmarks.caches import measureLoad
+measureLoad(sys.argv[1], sys.argv[2])
+"""
+
+
+def getRss():
+    with open("/proc/self/statm", "r") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def measureLoad(kind: str, fileName: str):
+    """
+    Runs in the child process: loads the file like openwebrx does at startup, prints the duration and memory growth.
+    """
+    import time
+
+    if kind == "eibi":
+        from owrx.eibi import ScheduleIndex
+
+        eibi = EIBI()
+
+        def load():
+            schedule = eibi.loadSchedule(fileName)
+            index = ScheduleIndex(schedule)
+            # what a client looking at 2 MHz of HF would see
+            index.findActive(5000000, 7000000, ScheduleIndex.getMinuteOfWeek())
+            return schedule, index
+
+    else:
+        markers = Markers()
+
+        def load():
+            return markers.loadMarkers(fileName)
+
+    rss = getRss()
+    start = time.perf_counter()
+    result = load()
+    duration = time.perf_counter() - start
+    print(duration, getRss() - rss)
+    return result
+
+
+def compare(name: str, kind: str, rows: list, directory: str):
+    jsonFile = os.path.join(directory, kind + ".json")
+    compactFile = os.path.join(directory, kind + ".cache")
+    with open(jsonFile, "w") as f:
+        json.dump(rows if kind == "eibi" else {r["id"]: r for r in rows}, f, indent=2)
+    CompactTable.store(compactFile, rows)
+
+    print("{0}: {1} entries".format(name, len(rows)))
+    for formatName, fileName in [("json", jsonFile), ("compact", compactFile)]:
+        results = []
+        for _ in range(RUNS):
+            output = subprocess.check_output([sys.executable, "-c", LOAD, kind, fileName])
+            duration, rss = output.decode().strip().split("\n")[-1].split()
+            results.append((float(duration), int(rss)))
+        print(
+            "{0:>16}: {1:10.1f} kB file {2:10.1f} ms load {3:10.1f} kB resident".format(
+                formatName,
+                os.path.getsize(fileName) / 1024,
+                min(d for d, _ in results) * 1000,
+                min(r for _, r in results) / 1024,
+            )
+        )
+
+
+def main():
+    eibi = EIBI()
+    schedule = []
+    for file in [EIBI._getCachedScheduleFile(), EIBI._getLegacyScheduleFile()]:
+        if os.path.isfile(file):
+            schedule = list(eibi.loadSchedule(file))
+            break
+    if not schedule:
+        schedule = eibi.scrape()
+
+    markers = Markers()
+    cache = {}
+    for file in [Markers._getCachedMarkersFile(), Markers._getLegacyMarkersFile()]:
+        if os.path.isfile(file):
+            cache = markers.loadMarkers(file)
+            break
+    if not cache:
+        cache.update(markers.scrapeKiwiSDR() or {})
+        cache.update(markers.scrapeWebSDR() or {})
+        cache.update(markers.scrapeOWRX() or {})
+
+    with tempfile.TemporaryDirectory() as directory:
+        if schedule:
+            compare("EIBI schedule", "eibi", sorted(schedule, key=lambda e: e["freq"]), directory)
+        else:
+            print("no EIBI schedule available")
+        if cache:
+            compare("marker database", "markers", [r.toJSON() for r in cache.values()], directory)
+        else:
+            print("no markers available")
+
+
+if __name__ == "__main__":
+    main()
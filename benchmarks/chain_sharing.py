@@ -0,0 +1,132 @@
+"""
+Measures the CPU load of a number of clients listening to the same frequency, each with a private demodulator chain
+and with all of them sharing one chain.
+
+Synthetic IQ data is written into a source buffer at the nominal rate of the source for a few seconds, and the
+process CPU time is measured while all clients receive the demodulated audio. The clients are regular DspManagers on
+a stand-in for an sdr source, with handlers that discard the data. Needs pycsdr.
+
+Usage: python3 -m benchmarks.chain_sharing
+"""
+
+from owrx.dsp import DspManager, ChainRegistry
+from owrx.property import PropertyLayer
+from csdr.chain.channelizer import Channelizer
+from pycsdr.modules import Buffer
+from pycsdr.types import Format
+import threading
+import time
+import os
+
+SAMPLE_RATE = 2400000
+CLIENTS = [1, 5, 20]
+DURATION = 3
+# complex float samples per write
+BLOCK = 16384
+PARAMETERS = {"mod": "nfm", "offset_freq": 250000, "low_cut": -4000, "high_cut": 4000, "squelch_level": -150}
+
+
+class Source(object):
+    def __init__(self):
+        self.buffer = Buffer(Format.COMPLEX_FLOAT)
+        self.channelizer = Channelizer(self.buffer)
+        self.props = PropertyLayer(
+            samp_rate=SAMPLE_RATE,
+            center_freq=145000000,
+            start_mod="nfm",
+            start_freq=145250000,
+            audio_compression="adpcm",
+            fft_compression="adpcm",
+            digimodes_fft_size=2048,
+            wfm_deemphasis_tau=50e-6,
+        )
+
+    def getProps(self):
+        return self.props
+
+    def getId(self):
+        return "benchmark"
+
+    def isAvailable(self):
+        return True
+
+    def getChannelizer(self):
+        return self.channelizer
+
+    def addClient(self, client):
+        pass
+
+    def removeClient(self, client):
+        pass
+
+
+class Handler(object):
+    def __init__(self):
+        self.bytes = 0
+
+    def write_dsp_data(self, data):
+        self.bytes += len(data)
+
+    def __getattr__(self, name):
+        if name.startswith("write_"):
+            return lambda *args: None
+        raise AttributeError(name)
+
+
+def run(count, shared):
+    source = Source()
+    handlers = []
+    clients = []
+    for _ in range(count):
+        if not shared:
+            # a registry per client keeps every chain private, like before chains were shared
+            ChainRegistry.sharedInstance = ChainRegistry()
+        handler = Handler()
+        client = DspManager(handler, source)
+        client.setProperties(PARAMETERS)
+        client.start()
+        handlers.append(handler)
+        clients.append(client)
+
+    chains = len({id(c.shared) for c in clients})
+    threads = threading.active_count()
+
+    block = os.urandom(BLOCK * 8)
+    blocks = int(SAMPLE_RATE * DURATION / BLOCK)
+    interval = BLOCK / SAMPLE_RATE
+
+    start = time.process_time()
+    wallStart = time.perf_counter()
+    for i in range(blocks):
+        source.buffer.write(block)
+        # pace the input at the nominal sample rate
+        delay = wallStart + (i + 1) * interval - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    cpu = time.process_time() - start
+    wall = time.perf_counter() - wallStart
+
+    audio = min(h.bytes for h in handlers)
+    for client in clients:
+        client.stop()
+    source.channelizer.stop()
+    ChainRegistry.sharedInstance = None
+    return cpu / wall * 100, chains, threads, audio
+
+
+def main():
+    print("{0} MS/s source, {1}s per measurement".format(SAMPLE_RATE / 1e6, DURATION))
+    print(
+        "{0:>8} {1:>8} {2:>8} {3:>8} {4:>14} {5:>8} {6:>8} {7:>8} {8:>14}".format(
+            "clients", "private", "chains", "threads", "audio (bytes)", "shared", "chains", "threads", "audio (bytes)"
+        )
+    )
+    for count in CLIENTS:
+        results = run(count, False) + run(count, True)
+        print(
+            "{0:>8} {1:>7.1f}% {2:>8} {3:>8} {4:>14} {5:>7.1f}% {6:>8} {7:>8} {8:>14}".format(count, *results)
+        )
+
+
+if __name__ == "__main__":
+    main()
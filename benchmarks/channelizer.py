@@ -0,0 +1,98 @@
+"""
+Measures the CPU load of a number of concurrent selectors reading from one source, with and without the shared
+channelizer.
+
+Synthetic IQ data is written into a source buffer at the nominal rate of the source for a few seconds, and the
+process CPU time is measured while all selectors are processing it. Selector offsets are spread randomly over the
+source bandwidth. Needs pycsdr.
+
+Usage: python3 -m benchmarks.channelizer
+"""
+
+from csdr.chain.selector import Selector
+from csdr.chain.channelizer import Channelizer
+from pycsdr.modules import Buffer
+from pycsdr.types import Format
+import threading
+import random
+import time
+import os
+
+SAMPLE_RATES = [2400000, 6000000, 10000000]
+DEMODULATORS = [1, 5, 10, 25, 50]
+OUTPUT_RATE = 12000
+DURATION = 3
+# complex float samples per write
+BLOCK = 16384
+
+
+def drain(reader):
+    def run():
+        while True:
+            try:
+                data = reader.read()
+            except ValueError:
+                continue
+            if data is None:
+                break
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+def run(sampleRate, count, shared):
+    source = Buffer(Format.COMPLEX_FLOAT)
+    channelizer = Channelizer(source)
+    random.seed(count)
+    selectors = []
+    outputs = []
+    for _ in range(count):
+        selector = Selector(sampleRate, OUTPUT_RATE, withSquelch=False)
+        selector.setFrequencyOffset(int(random.uniform(-0.45, 0.45) * sampleRate))
+        output = Buffer(Format.COMPLEX_FLOAT)
+        selector.setWriter(output)
+        reader = output.getReader()
+        drain(reader)
+        outputs.append(reader)
+        if shared:
+            selector.setChannelizer(channelizer)
+        else:
+            selector.setReader(source.getReader())
+        selectors.append(selector)
+
+    block = os.urandom(BLOCK * 8)
+    blocks = int(sampleRate * DURATION / BLOCK)
+    interval = BLOCK / sampleRate
+
+    start = time.process_time()
+    wallStart = time.perf_counter()
+    for i in range(blocks):
+        source.write(block)
+        # pace the input at the nominal sample rate
+        delay = wallStart + (i + 1) * interval - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    cpu = time.process_time() - start
+    wall = time.perf_counter() - wallStart
+
+    channels = len(channelizer.channels)
+    for selector in selectors:
+        selector.stop()
+    channelizer.stop()
+    for reader in outputs:
+        reader.stop()
+    return cpu / wall * 100, channels
+
+
+def main():
+    print("selectors at {0} Hz output rate, {1}s per measurement".format(OUTPUT_RATE, DURATION))
+    for sampleRate in SAMPLE_RATES:
+        print("\n{0:.1f} MS/s:".format(sampleRate / 1e6))
+        print("{0:>12} {1:>14} {2:>14} {3:>10}".format("selectors", "private (cpu%)", "shared (cpu%)", "channels"))
+        for count in DEMODULATORS:
+            private, _ = run(sampleRate, count, False)
+            shared, channels = run(sampleRate, count, True)
+            print("{0:>12} {1:>14.1f} {2:>14.1f} {3:>10}".format(count, private, shared, channels))
+
+
+if __name__ == "__main__":
+    main()
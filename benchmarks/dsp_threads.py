@@ -0,0 +1,101 @@
+"""
+Compares the python threads and context switches needed to deliver the outputs of the demodulator chains to clients,
+with a pump thread per output per client, as it used to be, and with one pump per chain output that serves all
+clients of the chain and only runs while the output is in use.
+
+The clients listen to one frequency with an analog mode, or with a digimode, which adds the secondary outputs. The
+chains are shared in both cases, so only the delivery differs. Context switches are voluntary and involuntary ones of
+the whole process, per second. Needs pycsdr.
+
+Usage: python3 -m benchmarks.dsp_threads
+"""
+
+from benchmarks.chain_sharing import Source, Handler, SAMPLE_RATE, BLOCK
+from owrx.dsp import DspManager, ChainRegistry
+import threading
+import resource
+import time
+import os
+
+CLIENTS = [1, 5, 20]
+DURATION = 3
+MODES = {
+    "nfm": {"mod": "nfm", "offset_freq": 250000, "low_cut": -4000, "high_cut": 4000},
+    "usb + bpsk31": {"mod": "usb", "offset_freq": 250000, "low_cut": 0, "high_cut": 3000, "secondary_mod": "bpsk31"},
+}
+
+
+def wirePerClient(client):
+    # what DspManager.wireOutput() used to do: a reader and a thread for every output, whether it is used or not
+    readers = []
+    for t, pump in list(client.shared.outputs.items()):
+        _, write = client.outputs[t]
+        client.unwireOutput(t)
+        reader = pump.buffer.getReader()
+        readers.append(reader)
+        threading.Thread(target=client.chain.pump(reader.read, write), name="dsp_pump_{}".format(t)).start()
+    return readers
+
+
+def contextSwitches():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_nvcsw + usage.ru_nivcsw
+
+
+def run(parameters, count, perClient):
+    source = Source()
+    clients = []
+    readers = []
+    for _ in range(count):
+        client = DspManager(Handler(), source)
+        client.setProperties(parameters)
+        client.start()
+        if perClient:
+            readers += wirePerClient(client)
+        clients.append(client)
+
+    threads = threading.active_count() - 1
+
+    block = os.urandom(BLOCK * 8)
+    blocks = int(SAMPLE_RATE * DURATION / BLOCK)
+    interval = BLOCK / SAMPLE_RATE
+
+    switches = contextSwitches()
+    start = time.process_time()
+    wallStart = time.perf_counter()
+    for i in range(blocks):
+        source.buffer.write(block)
+        # pace the input at the nominal sample rate
+        delay = wallStart + (i + 1) * interval - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    cpu = time.process_time() - start
+    wall = time.perf_counter() - wallStart
+    switches = contextSwitches() - switches
+
+    for reader in readers:
+        reader.stop()
+    for client in clients:
+        client.stop()
+    source.channelizer.stop()
+    ChainRegistry.sharedInstance = None
+    return threads, switches / wall, cpu / wall * 100
+
+
+def main():
+    print("{0} MS/s source, {1}s per measurement".format(SAMPLE_RATE / 1e6, DURATION))
+    for name, parameters in MODES.items():
+        print("\n{0}:".format(name))
+        print("{0:>8} {1:>32} {2:>32}".format("", "pump per client", "pump per chain"))
+        print(
+            "{0:>8} {1:>10} {2:>12} {3:>8} {4:>10} {5:>12} {6:>8}".format(
+                "clients", "threads", "switches/s", "cpu", "threads", "switches/s", "cpu"
+            )
+        )
+        for count in CLIENTS:
+            results = run(parameters, count, True) + run(parameters, count, False)
+            print("{0:>8} {1:>10} {2:>12.0f} {3:>7.1f}% {4:>10} {5:>12.0f} {6:>7.1f}%".format(count, *results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Measures EIBI schedule lookups over the full A-season schedule.
+
+The schedule is taken from the cached copy in the data directory (in either format), or scraped from the EIBI website if
+there is none. The previous implementation, which scanned the whole schedule on every lookup, is emulated for
+comparison. Note that it ignored the days of the week, so it returns more entries than the index.
+
+Needs a working configuration, just like openwebrx itself.
+
+Usage: python3 -m benchmarks.eibi
+"""
+
+from owrx.eibi import EIBI
+from datetime import datetime
+import random
+import time
+import os
+
+LOOKUPS = 10000
+PROFILES = 50
+ROLLOVERS = 100
+
+
+def measure(name, method, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        method()
+    duration = time.perf_counter() - start
+    print("{name:>48}: {rate:12.0f} / s".format(name=name, rate=count / duration))
+
+
+def main():
+    random.seed(0)
+    eibi = EIBI()
+    schedule = []
+    for file in [EIBI._getCachedScheduleFile(), EIBI._getLegacyScheduleFile()]:
+        if os.path.isfile(file):
+            schedule = eibi.loadSchedule(file)
+            break
+    if not schedule:
+        schedule = eibi.scrape()
+    if not schedule:
+        print("no schedule available, neither in the data directory nor from the EIBI website")
+        return
+    print("{0} schedule entries".format(len(schedule)))
+
+    start = time.perf_counter()
+    eibi.setSchedule(schedule)
+    print("{name:>48}: {duration:12.1f} ms".format(name="index compilation", duration=(time.perf_counter() - start) * 1000))
+    print("{0} segments of the week".format(len(eibi.index.segments)))
+
+    # a new client per lookup, looking at 2 MHz somewhere in HF
+    spans = iter([(f, f + 2000000) for f in (random.randrange(30000000) for _ in range(LOOKUPS * 4))])
+    sources = [e["itu"] + e["src"] for e in schedule]
+
+    def linear():
+        freq1, freq2 = next(spans)
+        now = datetime.utcnow()
+        now = now.hour * 100 + now.minute
+        return [e for e in schedule if freq1 <= e["freq"] <= freq2 and e["time1"] <= now < e["time2"]]
+
+    def linearSource():
+        src = random.choice(sources)
+        now = datetime.utcnow()
+        now = now.hour * 100 + now.minute
+        return [e for e in schedule if e["time1"] <= now < e["time2"] and e["itu"] + e["src"] == src]
+
+    measure("on air in range, linear scan", linear, LOOKUPS // 10)
+    measure("on air in range, index", lambda: eibi.findCurrent(*next(spans)), LOOKUPS)
+    measure("on air by source, linear scan", linearSource, LOOKUPS // 10)
+    measure("on air by source, index", lambda: eibi.findBySource(random.choice(sources)), LOOKUPS)
+
+    # minute rollover for a number of profiles, each with a number of clients
+    for _ in range(PROFILES):
+        span = next(spans)
+        for _ in range(3):
+            eibi.subscribe(span, lambda entries: None)
+
+    def rollover():
+        eibi.updateOnAir(force=True)
+
+    measure("minute rollovers, {0} profiles".format(PROFILES), rollover, ROLLOVERS)
+    print("{0} bytes of bitmaps".format(sum((b.bit_length() + 7) // 8 for b in eibi.index.bitmaps)))
+
+
+if __name__ == "__main__":
+    main()
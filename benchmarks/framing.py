@@ -0,0 +1,181 @@
+"""
+Measures how fast decoder output can be split into lines and scanlines, the way the text, fax and SSTV parsers used
+to do it (appending every read to a copy of the buffer, then finding and deleting one line or record at a time) and
+with the framer.
+
+The text logs are decoder output captured to files, given on the command line. Without any, a few MB of synthetic
+output are generated, resembling rtl_433 (JSON), multimon-ng (POCSAG) and dumphfdl. The image stream is a series of
+SSTV frames, a BMP header followed by the scanlines, which are base64 encoded for the clients like the SSTV parser
+does. The data is fed in reads of different sizes, since the parsers get whatever has piled up in the buffer since
+their last read.
+
+Usage: python3 -m benchmarks.framing [log file ...]
+"""
+
+from owrx.framer import Framer
+import base64
+import random
+import time
+import json
+import sys
+
+SIZE = 8 * 1024 * 1024
+READS = [512, 8192, 131072]
+RUNS = 3
+# Martin 1, 320 pixels of RGB per scanline
+WIDTH = 320 * 3
+HEIGHT = 256
+
+
+def createLog() -> bytes:
+    random.seed(0)
+    lines = []
+    size = 0
+    while size < SIZE:
+        kind = random.randrange(3)
+        if kind == 0:
+            line = json.dumps(
+                {
+                    "time": "2026-10-18 12:00:{0:02d}".format(random.randrange(60)),
+                    "model": "Acurite-Tower",
+                    "id": random.randrange(10000),
+                    "battery_ok": 1,
+                    "temperature_C": random.randrange(-200, 400) / 10,
+                    "humidity": random.randrange(100),
+                }
+            )
+        elif kind == 1:
+            line = "POCSAG1200: Address: {0:7d}  Function: 3  Alpha:   {1}".format(
+                random.randrange(2000000), "ALARM FEUERWEHR " * random.randrange(1, 6)
+            )
+        else:
+            line = "[2026-10-18 12:00:00 UTC] [8977.0 kHz] [{0} dBFS] AC{1:04X} > GS ACARS: {2}".format(
+                -random.randrange(60), random.randrange(65536), "X" * random.randrange(200)
+            )
+        lines.append(line.encode())
+        size += len(lines[-1]) + 1
+    return b"\n".join(lines) + b"\n"
+
+
+def createImages() -> bytes:
+    frames = []
+    size = 0
+    while size < SIZE:
+        header = bytearray(54)
+        header[0:2] = b"BM"
+        header[18:22] = (WIDTH // 3).to_bytes(4, "little")
+        header[22:26] = (0x100000000 - HEIGHT).to_bytes(4, "little")
+        frames.append(bytes(header) + bytes(random.getrandbits(8) for _ in range(WIDTH)) * HEIGHT)
+        size += len(frames[-1])
+    return b"".join(frames)
+
+
+def legacyLines(reads):
+    # what TextParser.run() and process() used to do
+    data = bytearray(b"")
+    count = 0
+    for inp in reads:
+        data = data + inp.tobytes()
+        eol = data.find(b"\n")
+        while eol >= 0:
+            data[0:eol].decode(encoding="utf-8", errors="replace")
+            del data[0 : eol + 1]
+            count += 1
+            eol = data.find(b"\n")
+    return count
+
+
+def framerLines(reads):
+    framer = Framer()
+    count = 0
+    for inp in reads:
+        framer.append(inp)
+        for line in framer.lines():
+            line.decode(encoding="utf-8", errors="replace")
+            count += 1
+    return count
+
+
+def legacyImages(reads):
+    # what SstvParser.run() and process() used to do, minus the BMP fields
+    data = bytearray(b"")
+    count = 0
+    line = 0
+    for inp in reads:
+        data = data + inp.tobytes()
+        while True:
+            if line > 0:
+                if len(data) < WIDTH:
+                    break
+                base64.b64encode(data[0:WIDTH])
+                del data[0:WIDTH]
+                line = line + 1 if line < HEIGHT else 0
+            else:
+                w = data.find(b"BM")
+                if w < 0 or len(data) - w < 54:
+                    break
+                del data[0:w]
+                data[0:54]
+                del data[0:54]
+                line = 1
+            count += 1
+    return count
+
+
+def framerImages(reads):
+    framer = Framer()
+    count = 0
+    line = 0
+    for inp in reads:
+        framer.append(inp)
+        while True:
+            if line > 0:
+                if len(framer) < WIDTH:
+                    break
+                base64.b64encode(framer.take(WIDTH))
+                line = line + 1 if line < HEIGHT else 0
+            else:
+                w = framer.find(b"BM")
+                if w < 0 or len(framer) - w < 54:
+                    break
+                framer.skip(w)
+                framer.take(54)
+                line = 1
+            count += 1
+    return count
+
+
+def measure(method, reads):
+    durations = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        count = method(reads)
+        durations.append(time.perf_counter() - start)
+    return count, min(durations)
+
+
+def compare(name: str, data: bytes, legacy, framer):
+    print("{0}: {1:.1f} MB".format(name, len(data) / 1024 / 1024))
+    print("{0:>10} {1:>10} {2:>14} {3:>14}".format("read size", "records", "legacy (MB/s)", "framer (MB/s)"))
+    view = memoryview(data)
+    for size in READS:
+        reads = [view[i : i + size] for i in range(0, len(data), size)]
+        count, legacyDuration = measure(legacy, reads)
+        framerCount, framerDuration = measure(framer, reads)
+        assert count == framerCount
+        mb = len(data) / 1024 / 1024
+        print("{0:>10} {1:>10} {2:>14.1f} {3:>14.1f}".format(size, count, mb / legacyDuration, mb / framerDuration))
+
+
+def main():
+    if len(sys.argv) > 1:
+        for fileName in sys.argv[1:]:
+            with open(fileName, "rb") as f:
+                compare(fileName, f.read(), legacyLines, framerLines)
+    else:
+        compare("synthetic decoder log", createLog(), legacyLines, framerLines)
+    compare("SSTV frames", createImages(), legacyImages, framerImages)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Measures the map with a large number of synthetic stations.
+
+Compares sending the complete map to a new client with sending only the tiles of a typical viewport, broadcasting
+updates to clients with and without viewports, and removing expired positions by scanning all positions versus using
+the expiry heap. Also reports the memory used per position record (plain dict versus slotted record), and how many
+messages an update burst produces per client, with and without batching.
+
+Needs a working configuration, just like openwebrx itself.
+
+Usage: python3 -m benchmarks.map_index
+"""
+
+from owrx.map import Map, PositionRecord, LatLngLocation, LocatorLocation
+from datetime import datetime, timedelta
+import tracemalloc
+import random
+import time
+
+STATIONS = 100000
+CLIENTS = 50
+
+
+class NullClient(object):
+    def __init__(self):
+        self.messages = 0
+        self.items = 0
+
+    def write_update(self, update):
+        self.messages += 1
+        self.items += len(update)
+
+    def write_removal(self, callsigns):
+        self.messages += 1
+        self.items += len(callsigns)
+
+
+def measure(name, method):
+    start = time.perf_counter()
+    result = method()
+    duration = time.perf_counter() - start
+    print("{name:>48}: {duration:10.3f} ms".format(name=name, duration=duration * 1000))
+    return result
+
+
+def randomLocation():
+    if random.random() < 0.3:
+        return LocatorLocation("{0}{1}{2}{3}".format(
+            chr(ord("A") + random.randrange(18)),
+            chr(ord("A") + random.randrange(18)),
+            random.randrange(10),
+            random.randrange(10),
+        ))
+    return LatLngLocation(random.uniform(-80, 80), random.uniform(-180, 180))
+
+
+def recordMemory(factory):
+    loc = LatLngLocation(0, 0)
+    now = datetime.now()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = [factory(loc, now) for _ in range(STATIONS)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    return (after - before) / STATIONS
+
+
+def main():
+    random.seed(0)
+    m = Map.getSharedInstance()
+    print("{0} stations, {1} clients".format(STATIONS, CLIENTS))
+
+    print("{0:>48}: {1:10.1f} bytes".format(
+        "memory per record, dict",
+        recordMemory(lambda loc, now: {
+            "location": loc, "updated": now, "mode": "APRS", "band": None, "hops": [], "tile": (0, 0)
+        }),
+    ))
+    print("{0:>48}: {1:10.1f} bytes".format(
+        "memory per record, slotted",
+        recordMemory(lambda loc, now: PositionRecord(loc, now, "APRS", None, [], (0, 0))),
+    ))
+
+    def populate():
+        for i in range(STATIONS):
+            m.updateLocation("STATION{0}".format(i), randomLocation(), "APRS")
+
+    measure("populate", populate)
+    m.flush()
+
+    # a viewport roughly covering central europe at zoom level 5
+    bounds = (60, 40, 30, -10)
+
+    legacy = NullClient()
+    measure("new client, complete map", lambda: m.addClient(legacy))
+    m.removeClient(legacy)
+    print("{0:>48}: {1}".format("locations sent", legacy.items))
+
+    viewport = NullClient()
+
+    def subscribe():
+        m.addClient(viewport, True)
+        m.setViewport(viewport, *bounds)
+
+    measure("new client, viewport", subscribe)
+    m.removeClient(viewport)
+    print("{0:>48}: {1}".format("locations sent", viewport.items))
+
+    updates = [("STATION{0}".format(i), randomLocation()) for i in range(10000)]
+
+    def broadcast():
+        for callsign, loc in updates:
+            m.updateLocation(callsign, loc, "APRS")
+        m.flush()
+
+    clients = [NullClient() for _ in range(CLIENTS)]
+    for c in clients:
+        m.addClient(c)
+    for c in clients:
+        c.messages = 0
+    measure("10000 updates, clients without viewport", broadcast)
+    print("{0:>48}: {1}".format("messages sent", sum(c.messages for c in clients)))
+    print("{0:>48}: {1}".format("messages per client, unbatched", len(updates)))
+    print("{0:>48}: {1}".format("messages per client, batched", clients[0].messages))
+    for c in clients:
+        m.removeClient(c)
+
+    clients = [NullClient() for _ in range(CLIENTS)]
+    for c in clients:
+        m.addClient(c, True)
+        m.setViewport(c, *bounds)
+    for c in clients:
+        c.messages = 0
+    measure("10000 updates, clients with viewport", broadcast)
+    print("{0:>48}: {1}".format("messages sent", sum(c.messages for c in clients)))
+    for c in clients:
+        m.removeClient(c)
+
+    cutoff = datetime.now() - timedelta(hours=1)
+    measure(
+        "expiry check, scanning all positions",
+        lambda: [callsign for (callsign, pos) in m.positions.items() if pos.updated < cutoff],
+    )
+    measure("expiry check, expiry heap", m.removeOldPositions)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Measures how many decoded APRS and AIS packets per second can be passed from the packet decoder to the clients,
+with pickle between the modules and JSON encoding per client, as it used to be, and with the message framing.
+
+The fixture is a flood of AX.25 frames, as direwolf would hand them over for APRS and AIS: positions, weather reports,
+status reports, messages and (for AIS) objects. The parsers run once up front, since their work is the same either
+way. What is measured is everything between them, from the KISS deframer through the AX.25 and APRS parsers to the
+websocket frames.
+Needs pycsdr.
+
+Usage: python3 -m benchmarks.messages
+"""
+
+from owrx.aprs import Ax25Parser, AprsParser, ax25FrameType
+from owrx.message import Message, MessageReader
+from owrx.websocket import Frame
+from io import BytesIO
+import random
+import pickle
+import time
+
+PACKETS = 20000
+RUNS = 3
+CLIENTS = [1, 5, 20]
+
+INFORMATION = [
+    "!5210.{0:02d}N/00510.{1:02d}E>mobile, {2} km/h",
+    "@092345z4903.{0:02d}N/07201.{1:02d}W_220/004g005t077r000p000P000h50b09900",
+    ">Net tonight at {2}:00 on 145.500",
+    ":DL{2}ABC   :meet you at the repeater{{0{2}",
+]
+AIS = ";{2:09d}*092345z4903.{0:02d}N/07201.{1:02d}W>088/036"
+
+
+def encodeCallsign(callsign: str, last: bool = False):
+    call, _, ssid = callsign.partition("-")
+    encoded = bytes([ord(c) << 1 for c in call.ljust(6)])
+    return encoded + bytes([0b01100000 | (int(ssid or 0) << 1) | (1 if last else 0)])
+
+
+def createFrame(i: int):
+    if i % 3 == 0:
+        source, information = "AIS", AIS
+    else:
+        source, information = "DL{0}XYZ-9".format(i % 10), random.choice(INFORMATION)
+    information = information.format(random.randrange(100), random.randrange(100), random.randrange(100))
+    return (
+        encodeCallsign("APRS")
+        + encodeCallsign(source)
+        + encodeCallsign("WIDE1-1")
+        + encodeCallsign("WIDE2-1", True)
+        + bytes([0x03, 0xF0])
+        + information.encode()
+    )
+
+
+def pickled(packets, clients):
+    for frame, ax25, aprsData in packets:
+        pickle.loads(pickle.dumps(frame))
+        pickle.loads(pickle.dumps(ax25))
+        data = pickle.dumps(aprsData)
+        for _ in range(clients):
+            # what DspManager._unpickle() and WebSocketConnection.send() used to do for every client
+            io = BytesIO(data)
+            Frame({"type": "secondary_demod", "value": pickle.load(io)})
+
+
+def framed(packets, clients):
+    kiss, ax25Reader, output = MessageReader(), MessageReader(), MessageReader()
+    for frame, ax25, aprsData in packets:
+        for message in kiss.feed(Message.encode(frame)):
+            message.getValue()
+        for message in ax25Reader.feed(Message.encode(ax25, ax25FrameType)):
+            message.getValue()
+        for message in output.feed(Message.encode(aprsData)):
+            for _ in range(clients):
+                message.getFrame("secondary_demod")
+
+
+def measure(method, packets, clients):
+    durations = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        method(packets, clients)
+        durations.append(time.perf_counter() - start)
+    return len(packets) / min(durations)
+
+
+def main():
+    random.seed(0)
+    # the parsers are only used for their process methods, which don't need a running module
+    ax25Parser = Ax25Parser.__new__(Ax25Parser)
+    aprsParser = AprsParser.__new__(AprsParser)
+    packets = []
+    for i in range(PACKETS):
+        frame = createFrame(i)
+        ax25 = ax25Parser.process(frame)
+        aprsData = aprsParser.parseAprsData(ax25)
+        aprsData["mode"] = "AIS" if aprsData.get("source") == "AIS" else "APRS"
+        packets.append((frame, ax25, aprsData))
+
+    print("{0} packets, {1:.0f} bytes per frame on average".format(PACKETS, sum(len(p[0]) for p in packets) / PACKETS))
+    print(
+        "{0:>16}: {1:8.0f} bytes pickled, {2:8.0f} bytes framed".format(
+            "decoded size",
+            sum(len(pickle.dumps(p[2])) for p in packets) / PACKETS,
+            sum(len(Message.encode(p[2])) for p in packets) / PACKETS,
+        )
+    )
+    print("{0:>8} {1:>18} {2:>18}".format("clients", "pickle (pkts/s)", "framed (pkts/s)"))
+    for clients in CLIENTS:
+        print(
+            "{0:>8} {1:>18.0f} {2:>18.0f}".format(
+                clients, measure(pickled, packets, clients), measure(framed, packets, clients)
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Micro-benchmarks for the property system, on stacks nested the way they are at runtime.
+
+The nesting mimics a DspManager: a client stack on top of a filtered source stack, which in turn sits on top of a
+profile carousel and the config stack with its three layers. Measures reads, writes, key enumeration and the fan-out of
+change events to wired callbacks and filters. Does not need a configuration.
+
+Usage: python3 -m benchmarks.properties
+"""
+
+from owrx.property import PropertyLayer, PropertyStack, PropertyCarousel
+from owrx.property.filter import ByLambda
+from owrx.property import PropertyFilter
+import timeit
+
+KEYS = 200
+
+
+def buildConfig():
+    config = PropertyStack()
+    config.addLayer(0, PropertyLayer())
+    config.addLayer(1, PropertyLayer(**{"config_{0}".format(i): i for i in range(KEYS // 2)}))
+    config.addLayer(2, PropertyLayer(**{"config_{0}".format(i): -i for i in range(KEYS)}))
+    return config
+
+
+def buildSource(config):
+    carousel = PropertyCarousel()
+    carousel.addLayer("profile", PropertyLayer(**{"profile_{0}".format(i): i for i in range(20)}))
+    carousel.switch("profile")
+    source = PropertyStack()
+    source.addLayer(0, PropertyLayer(center_freq=14000000))
+    source.addLayer(1, PropertyFilter(carousel, ByLambda(lambda x: x != "name")))
+    source.addLayer(2, PropertyLayer(**{"device_{0}".format(i): i for i in range(20)}))
+    source.addLayer(3, PropertyLayer(sdr_id="test").readonly())
+    source.addLayer(4, config)
+    return source
+
+
+def buildClient(source):
+    local = PropertyLayer(offset_freq=0, mod="usb")
+    client = PropertyStack()
+    client.addLayer(0, local)
+    client.addLayer(1, source)
+    return client, local
+
+
+def measure(name, statement, number):
+    duration = min(timeit.repeat(statement, number=number, repeat=5)) / number
+    print("{name:>40}: {duration:10.3f} µs".format(name=name, duration=duration * 1e6))
+
+
+def main():
+    config = buildConfig()
+    source = buildSource(config)
+    client, local = buildClient(source)
+
+    measure("get, top layer", lambda: client["offset_freq"], 100000)
+    measure("get, bottom of config", lambda: client["config_150"], 100000)
+    measure("contains, missing key", lambda: "missing" in client, 100000)
+    measure("keys()", lambda: client.keys(), 1000)
+    measure("__dict__()", lambda: client.__dict__(), 1000)
+
+    values = iter(range(10 ** 9))
+    measure("set, top layer", lambda: local.__setitem__("offset_freq", next(values)), 100000)
+
+    for clients in [1, 10, 50]:
+        stacks = [buildClient(source) for _ in range(clients)]
+        subscriptions = [stack.wireProperty("config_10", lambda v: None) for stack, _ in stacks]
+        measure(
+            "config change, {0} clients wired".format(clients),
+            lambda: config.__setitem__("config_10", next(values)),
+            1000,
+        )
+        for sub in subscriptions:
+            sub.cancel()
+
+    # on a separate config, so that the stacks above do not contribute
+    config = buildConfig()
+    for clients in [1, 10, 50, 500]:
+        # every client filters the config for a handful of keys, like the connections do
+        subscriptions = [
+            config.filter(*["config_{0}".format(k) for k in range(i % 20, i % 20 + 5)]).wire(lambda changes: None)
+            for i in range(clients)
+        ]
+        measure(
+            "config change, {0} filters wired".format(clients),
+            lambda: config.__setitem__("config_10", next(values)),
+            1000,
+        )
+        measure(
+            "unfiltered change, {0} filters wired".format(clients),
+            lambda: config.__setitem__("config_90", next(values)),
+            1000,
+        )
+        for sub in subscriptions:
+            sub.cancel()
+
+    # a settings page writing 20 keys, with 50 clients filtering for some of them
+    subscriptions = [
+        config.filter(*["config_{0}".format(k) for k in range(i % 20, i % 20 + 5)]).wire(lambda changes: None)
+        for i in range(50)
+    ]
+
+    def save():
+        for k in range(20):
+            config["config_{0}".format(k)] = next(values)
+
+    def saveTransaction():
+        with config.transaction():
+            save()
+
+    measure("settings save, 20 keys", save, 100)
+    measure("settings save, 20 keys, transaction", saveTransaction, 100)
+    for sub in subscriptions:
+        sub.cancel()
+
+
+if __name__ == "__main__":
+    main()
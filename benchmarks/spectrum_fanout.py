@@ -0,0 +1,73 @@
+"""
+Measures the CPU time spent per FFT line when a spectrum line is distributed to a number of websocket clients.
+
+Compares encoding one websocket frame per client with encoding a single frame shared by all clients. The sockets are
+replaced with null sockets, so only the framing and sending work done in python is measured.
+
+Usage: python3 -m benchmarks.spectrum_fanout
+"""
+
+from owrx.websocket import WebSocketConnection, WebSocketMetrics, Frame
+from owrx.metrics import CounterMetric
+import threading
+import time
+import os
+
+
+class NullSocket(object):
+    def sendmsg(self, buffers):
+        return sum(memoryview(b).nbytes for b in buffers)
+
+    def send(self, buffer):
+        return memoryview(buffer).nbytes
+
+
+def createConnection():
+    metrics = WebSocketMetrics.__new__(WebSocketMetrics)
+    metrics.bytesCounter = CounterMetric()
+    metrics.framesCounter = CounterMetric()
+    metrics.syscallCounter = CounterMetric()
+    metrics.blockedCounter = CounterMetric()
+
+    conn = WebSocketConnection.__new__(WebSocketConnection)
+    conn.socket = NullSocket()
+    conn.vectored = True
+    conn.metrics = metrics
+    conn.sendLock = threading.Lock()
+    conn.socketError = False
+    conn.open = True
+    return conn
+
+
+def perClient(connections, line):
+    for c in connections:
+        c.send(bytes([0x01]) + line)
+
+
+def shared(connections, line):
+    frame = Frame(bytes([0x01]) + line)
+    for c in connections:
+        c.send(frame)
+
+
+def measure(method, connections, line, lines):
+    start = time.process_time()
+    for _ in range(lines):
+        method(connections, line)
+    return (time.process_time() - start) / lines
+
+
+def main():
+    # 4096 bins, adpcm compressed, plus padding
+    line = os.urandom(2058)
+    print("{:>8} {:>18} {:>18}".format("clients", "per-client (us)", "shared (us)"))
+    for clientCount in [1, 10, 100, 500]:
+        connections = [createConnection() for _ in range(clientCount)]
+        lines = max(20, 20000 // clientCount)
+        a = measure(perClient, connections, line, lines)
+        b = measure(shared, connections, line, lines)
+        print("{:>8} {:>18.1f} {:>18.1f}".format(clientCount, a * 1e6, b * 1e6))
+
+
+if __name__ == "__main__":
+    main()
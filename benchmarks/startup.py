@@ -0,0 +1,95 @@
+"""
+Measures the startup time of the receiver.
+
+Reports the time a fresh interpreter needs to import the receiver modules, and the time from starting openwebrx until
+the web server accepts connections, compared against the target. Every run is a separate process, so nothing is
+shared between runs except the persisted feature checks and the operating system caches.
+
+Needs a working configuration, just like openwebrx itself. The web port of that configuration must be free.
+
+Usage: python3 -m benchmarks.startup
+"""
+
+from owrx.config.core import CoreConfig
+import subprocess
+import socket
+import signal
+import time
+import sys
+
+RUNS = 5
+# cold start to listening, in seconds
+TARGET = 5
+TIMEOUT = 60
+
+IMPORTS = """
+import time
+start = time.perf_counter()
+from owrx.http import RequestHandler
+from owrx.sdr import SdrService
+from owrx.service import Services
+from owrx.markers import Markers
+from owrx.eibi import EIBI
+print(time.perf_counter() - start)
+"""
+
+STARTUP = """
+import sys
+from owrx.__main__ import main
+sys.exit(main())
+"""
+
+
+def measureImports():
+    output = subprocess.check_output([sys.executable, "-c", IMPORTS], stderr=subprocess.DEVNULL)
+    return float(output.decode().strip().split("\n")[-1])
+
+
+def isListening(port):
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.1):
+            return True
+    except OSError:
+        return False
+
+
+def measureStartup(port):
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-c", STARTUP], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while not isListening(port):
+            if process.poll() is not None:
+                raise RuntimeError("openwebrx exited with code {0}".format(process.returncode))
+            if time.perf_counter() - start > TIMEOUT:
+                raise RuntimeError("openwebrx did not start listening within {0}s".format(TIMEOUT))
+            time.sleep(0.01)
+        return time.perf_counter() - start
+    finally:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def main():
+    port = CoreConfig().get_web_port()
+    if isListening(port):
+        print("port {0} is in use, please stop openwebrx first".format(port))
+        return 1
+
+    imports = min(measureImports() for _ in range(RUNS))
+    print("{0:>32}: {1:10.1f} ms".format("receiver module imports", imports * 1000))
+
+    startups = [measureStartup(port) for _ in range(RUNS)]
+    print("{0:>32}: {1:10.1f} ms".format("first start to listening", startups[0] * 1000))
+    print("{0:>32}: {1:10.1f} ms".format("best start to listening", min(startups) * 1000))
+    print("{0:>32}: {1:10.1f} ms ({2})".format(
+        "target", TARGET * 1000, "met" if max(startups) <= TARGET else "missed"
+    ))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+from csdr.chain import Chain
+from pycsdr.modules import Shift, FirDecimate, Buffer
+from pycsdr.types import Format
+from typing import Optional
+import threading
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Channel(Chain):
+    """
+    One coarse channel of a Channelizer: shifts the channel center to DC and decimates the full-rate input down to the
+    channel rate. Any number of selectors can read from the output buffer.
+    """
+
+    def __init__(self, inputRate: int, center: float, decimation: int):
+        self.inputRate = inputRate
+        self.center = center
+        self.decimation = decimation
+        self.outputRate = inputRate / decimation
+        self.users = 0
+        self.buffer = Buffer(Format.COMPLEX_FLOAT)
+        # same filter parameters as the Decimator uses for integer decimations
+        workers = [
+            Shift(-center / inputRate),
+            FirDecimate(decimation, 0.15 / decimation, 0.5),
+        ]
+        super().__init__(workers)
+        self.setWriter(self.buffer)
+
+    def getReader(self):
+        return self.buffer.getReader()
+
+    def canServe(self, inputRate: int, offset: float, bandwidth: float) -> bool:
+        if inputRate != self.inputRate:
+            return False
+        return abs(offset - self.center) + bandwidth / 2 <= self.outputRate * Channelizer.usableBandwidth / 2
+
+
+class Channelizer(object):
+    """
+    Shares the wideband part of the selector work among all selectors of a source.
+
+    The source bandwidth is covered by a grid of overlapping coarse channels that are only created while selectors are
+    using them. Selectors read from a channel instead of the full-rate source buffer, so every additional selector in a
+    channel only costs a narrowband shift and decimation. Selectors that need more bandwidth than a channel offers are
+    handed the full-rate source instead.
+    """
+
+    # target rate of the coarse channels. the actual rate is the next higher integer fraction of the source rate.
+    channelRate = 250000
+    # part of a channel that is unaffected by the channel filter, as a fraction of the channel rate
+    usableBandwidth = 0.8
+
+    def __init__(self, buffer: Buffer):
+        self.buffer = buffer
+        self.channels = []
+        self.lock = threading.Lock()
+
+    def getSourceReader(self):
+        return self.buffer.getReader()
+
+    def acquire(self, inputRate: int, offset: float, bandwidth: float) -> Optional[Channel]:
+        """
+        Returns a channel suitable for the given offset and bandwidth, or None if the selector should read the
+        full-rate source. Every channel returned must be given back with release().
+        """
+        decimation = int(inputRate // Channelizer.channelRate)
+        if decimation < 2:
+            # the source is narrow enough already
+            return None
+        rate = inputRate / decimation
+        # channels are spaced at a quarter of their rate, so the closest channel center is never more than 1/8th off
+        spacing = rate / 4
+        center = round(offset / spacing) * spacing
+        if abs(offset - center) + bandwidth / 2 > rate * Channelizer.usableBandwidth / 2:
+            return None
+
+        with self.lock:
+            # prefer channels that are running already
+            candidates = [c for c in self.channels if c.canServe(inputRate, offset, bandwidth)]
+            if candidates:
+                channel = max(candidates, key=lambda c: c.users)
+            else:
+                logger.debug("starting channel at %f (rate: %f)", center, rate)
+                channel = Channel(inputRate, center, decimation)
+                channel.setReader(self.buffer.getReader())
+                self.channels.append(channel)
+            channel.users += 1
+            return channel
+
+    def release(self, channel: Channel) -> None:
+        with self.lock:
+            channel.users -= 1
+            if channel.users > 0:
+                return
+            if channel not in self.channels:
+                # the channelizer has been stopped already
+                return
+            logger.debug("stopping unused channel at %f", channel.center)
+            self.channels.remove(channel)
+        channel.stop()
+
+    def stop(self):
+        with self.lock:
+            channels = self.channels
+            self.channels = []
+        for channel in channels:
+            channel.stop()
@@ -1,4 +1,5 @@
 from csdr.chain import Chain
+from csdr.chain.channelizer import Channelizer
 from pycsdr.modules import Shift, FirDecimate, Bandpass, Squelch, FractionalDecimator, Writer
 from pycsdr.types import Format
 import math
@@ -66,6 +67,8 @@ class Selector(Chain):
         self.inputRate = inputRate
         self.outputRate = outputRate
         self.frequencyOffset = 0
+        self.channelizer = None
+        self.channel = None
 
         self.shift = Shift(0.0)
 
@@ -90,14 +93,51 @@ class Selector(Chain):
         bp_transition = 320.0 / self.outputRate
         return Bandpass(transition=bp_transition, use_fft=True)
 
+    def setChannelizer(self, channelizer: Channelizer) -> None:
+        """
+        Makes the selector read from the channelizer instead of a reader passed in with setReader().
+        """
+        if self.channel is not None:
+            self.channelizer.release(self.channel)
+            self.channel = None
+        self.channelizer = channelizer
+        self._switchChannel(channelizer.acquire(self.inputRate, self.frequencyOffset, self.outputRate))
+
+    def _getTapRate(self):
+        return self.inputRate if self.channel is None else self.channel.outputRate
+
+    def _updateChannel(self):
+        if self.channelizer is not None:
+            if self.channel is None or not self.channel.canServe(self.inputRate, self.frequencyOffset, self.outputRate):
+                channel = self.channelizer.acquire(self.inputRate, self.frequencyOffset, self.outputRate)
+                # nothing to switch if we are reading the full-rate source already, and will continue to do so
+                if channel is not None or self.channel is not None or self.reader is None:
+                    self._switchChannel(channel)
+                    return
+        self.decimation.setInputRate(self._getTapRate())
+        self._updateShift()
+
+    def _switchChannel(self, channel):
+        previous = self.channel
+        self.channel = channel
+        self.decimation.setInputRate(self._getTapRate())
+        self._updateShift()
+        if channel is None:
+            super().setReader(self.channelizer.getSourceReader())
+        else:
+            super().setReader(channel.getReader())
+        if previous is not None:
+            self.channelizer.release(previous)
+
     def setFrequencyOffset(self, offset: int) -> None:
         if offset == self.frequencyOffset:
             return
         self.frequencyOffset = offset
-        self._updateShift()
+        self._updateChannel()
 
     def _updateShift(self):
-        shift = -self.frequencyOffset / self.inputRate
+        center = 0 if self.channel is None else self.channel.center
+        shift = -(self.frequencyOffset - center) / self._getTapRate()
         self.shift.setRate(shift)
 
     def _convertToLinear(self, db: float) -> float:
@@ -127,6 +167,7 @@ class Selector(Chain):
             return
         self.outputRate = outputRate
 
+        self._updateChannel()
         self.decimation.setOutputRate(outputRate)
         self.squelch.setReportInterval(int(outputRate / (self.readings_per_second * 1024)))
         self.bandpass = self._buildBandpass()
@@ -137,8 +178,13 @@ class Selector(Chain):
         if inputRate == self.inputRate:
             return
         self.inputRate = inputRate
-        self.decimation.setInputRate(inputRate)
-        self._updateShift()
+        self._updateChannel()
+
+    def stop(self):
+        super().stop()
+        if self.channel is not None:
+            self.channelizer.release(self.channel)
+            self.channel = None
 
 
 class SecondarySelector(Chain):
@@ -3,10 +3,13 @@ from pycsdr.modules import Reader, Writer
 from pycsdr.types import Format
 from abc import ABCMeta, abstractmethod
 from threading import Thread
-from io import BytesIO
 from subprocess import Popen, PIPE, TimeoutExpired
 from functools import partial
-import pickle
+from owrx.message import Message, MessageReader
+
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class Module(BaseModule, metaclass=ABCMeta):
@@ -82,7 +85,14 @@ class ThreadModule(AutoStartModule, Thread, metaclass=ABCMeta):
         Thread.start(self)
 
 
-class PickleModule(ThreadModule):
+class MessageModule(ThreadModule):
+    """
+    Processes the messages written by other modules (see owrx.message), one at a time.
+    """
+
+    # type of the output messages, or None to choose by value
+    outputType = None
+
     def getInputFormat(self) -> Format:
         return Format.CHAR
 
@@ -90,19 +100,19 @@ class PickleModule(ThreadModule):
         return Format.CHAR
 
     def run(self):
+        messages = MessageReader()
         while self.doRun:
             data = self.reader.read()
             if data is None:
                 self.doRun = False
                 break
-            io = BytesIO(data.tobytes())
-            try:
-                while True:
-                    output = self.process(pickle.load(io))
-                    if output is not None:
-                        self.writer.write(pickle.dumps(output))
-            except EOFError:
-                pass
+            for message in messages.feed(data):
+                output = self.process(message.getValue())
+                if output is not None:
+                    try:
+                        self.writer.write(Message.encode(output, self.outputType))
+                    except (TypeError, ValueError):
+                        logger.exception("cannot encode output of %s", type(self).__name__)
 
     @abstractmethod
     def process(self, input):
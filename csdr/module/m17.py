@@ -1,11 +1,11 @@
 from csdr.module import PopenModule
+from owrx.message import Message
 from pycsdr.types import Format
 from pycsdr.modules import Writer
 from subprocess import Popen, PIPE
 from threading import Thread
 
 import re
-import pickle
 
 
 class M17Module(PopenModule):
@@ -52,7 +52,7 @@ class M17Module(PopenModule):
             pass
         else:
             return
-        self.metawriter.write(pickle.dumps(msg))
+        self.metawriter.write(Message.encode(msg))
 
     def setMetaWriter(self, writer: Writer) -> None:
         self.metawriter = writer
@@ -1,7 +1,7 @@
 from pycsdr.types import Format
 from csdr.module import PopenModule, ThreadModule
 from owrx.wsjt import WsjtParser, Msk144Profile
-import pickle
+from owrx.message import Message
 
 import logging
 logger = logging.getLogger(__name__)
@@ -45,7 +45,7 @@ class ParserAdapter(ThreadModule):
                 for line in lines[0:-1]:
                     # actual messages from msk144decoder should start with "*** "
                     if line[0:4] == b"*** ":
-                        self.writer.write(pickle.dumps(self.parser.parse(profile, self.dialFrequency, line[4:])))
+                        self.writer.write(Message.encode(self.parser.parse(profile, self.dialFrequency, line[4:])))
 
     def getInputFormat(self) -> Format:
         return Format.CHAR
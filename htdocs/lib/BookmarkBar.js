@@ -91,9 +91,11 @@ BookmarkBar.prototype.render = function(){
                     '<div class="openwebrx-button action" data-action="edit"><svg viewBox="0 0 80 80"><use xlink:href="static/gfx/svg-defs.svg#edit"></use></svg></div>' +
                     '<div class="openwebrx-button action" data-action="delete"><svg viewBox="0 0 80 80"><use xlink:href="static/gfx/svg-defs.svg#trashcan"></use></svg></div>' +
                 '</div>' +
-                '<div class="bookmark-content">' + b.name + '</div>' +
+                '<div class="bookmark-content"></div>' +
             '</div>'
         );
+        // names can come from third parties (EIBI schedule), so they are never interpreted as markup
+        $bookmark.find('.bookmark-content').text(b.name);
         $bookmark.data(b);
         return $bookmark;
     });
@@ -288,11 +288,39 @@ $(function(){
 
     var config = {}
 
+    var socket;
+
+    // tell the server which part of the map is visible, it will only send updates for that area
+    var sendViewport = function(){
+        if (!map || !socket || socket.readyState != WebSocket.OPEN) return;
+        var bounds = map.getBounds();
+        if (!bounds) return;
+        var ne = bounds.getNorthEast();
+        var sw = bounds.getSouthWest();
+        socket.send(JSON.stringify({
+            type: "setviewport",
+            params: {north: ne.lat(), south: sw.lat(), east: ne.lng(), west: sw.lng()}
+        }));
+    };
+
+    var removeLocations = function(callsigns){
+        callsigns.forEach(function(callsign){
+            [markers, rectangles].forEach(function(items){
+                if (items[callsign]) {
+                    items[callsign].setMap();
+                    delete items[callsign];
+                }
+            });
+        });
+    };
+
     var connect = function(){
         var ws = new WebSocket(ws_url);
+        socket = ws;
         ws.onopen = function(){
-            ws.send("SERVER DE CLIENT client=map.js type=map");
+            ws.send("SERVER DE CLIENT client=map.js type=map viewport=1");
             reconnect_timeout = false
+            sendViewport();
         };
 
         ws.onmessage = function(e){
@@ -318,6 +346,7 @@ $(function(){
                                     center: receiverPos,
                                     zoom: 5,
                                 });
+                                map.addListener('idle', sendViewport);
 
                                 $.getScript("static/lib/nite-overlay.js").done(function(){
                                     nite.init(map);
@@ -383,6 +412,9 @@ $(function(){
                     case "update":
                         processUpdates(json.value);
                     break;
+                    case "remove":
+                        removeLocations(json.value);
+                    break;
                     case 'receiver_details':
                         $('.webrx-top-container').header().setDetails(json['value']);
                     break;
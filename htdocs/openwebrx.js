@@ -1170,6 +1170,19 @@ function on_ws_recv(evt) {
                     case "bookmarks":
                         bookmarks.replace_bookmarks(json['value'], "server");
                         break;
+                    case "eibi":
+                        // stations currently on air, one bookmark per frequency
+                        var on_air = {};
+                        json['value'].forEach(function (e) {
+                            if (e['freq'] in on_air) return;
+                            on_air[e['freq']] = {
+                                name: e['name'],
+                                modulation: 'am',
+                                frequency: e['freq']
+                            };
+                        });
+                        bookmarks.replace_bookmarks(Object.values(on_air), 'eibi');
+                        break;
                     case "sdr_error":
                         divlog(json['value'], true);
                         var $overlay = $('#openwebrx-error-overlay');
@@ -5,21 +5,11 @@ logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(name)s - %(leve
 logger = logging.getLogger(__name__)
 
 from http.server import HTTPServer
-from owrx.http import RequestHandler
-from owrx.config.core import CoreConfig
-from owrx.config import Config
 from owrx.config.commands import MigrateCommand
-from owrx.feature import FeatureDetector
-from owrx.sdr import SdrService
 from socketserver import ThreadingMixIn
-from owrx.service import Services
-from owrx.websocket import WebSocketConnection
-from owrx.reporting import ReportingEngine
 from owrx.version import openwebrx_version
-from owrx.audio.queue import DecoderQueue
 from owrx.admin import add_admin_parser, run_admin_action
-from owrx.markers import Markers
-from owrx.eibi import EIBI
+from contextlib import nullcontext
 import signal
 import argparse
 import ssl
@@ -41,6 +31,9 @@ def main():
     parser = argparse.ArgumentParser(description="OpenWebRX+ - Open Source SDR Web App for Everyone!")
     parser.add_argument("-v", "--version", action="store_true", help="Show the software version")
     parser.add_argument("--debug", action="store_true", help="Set loglevel to DEBUG")
+    parser.add_argument(
+        "--profile-startup", action="store_true", help="Report import and initialization times once the server listens"
+    )
 
     moduleparser = parser.add_subparsers(title="Modules", dest="module")
     adminparser = moduleparser.add_parser("admin", help="Administration actions")
@@ -68,10 +61,20 @@ def main():
     if args.module == "config":
         return run_admin_action(configparser, args)
 
-    return start_receiver()
+    profiler = None
+    if args.profile_startup:
+        from owrx.profiling import StartupProfiler
+
+        profiler = StartupProfiler()
+        profiler.startProfiling()
+
+    return start_receiver(profiler)
+
 
+def start_receiver(profiler=None):
+    def phase(name):
+        return profiler.phase(name) if profiler is not None else nullcontext()
 
-def start_receiver():
     print(
         """
 
@@ -90,11 +93,35 @@ Support and info:       https://groups.io/g/openwebrx
     for sig in [signal.SIGINT, signal.SIGTERM]:
         signal.signal(sig, handleSignal)
 
+    # the receiver modules are only imported here, so that the command line tools start quickly and the imports are
+    # covered by the startup profiler
+    with phase("imports"):
+        from owrx.http import RequestHandler
+        from owrx.config.core import CoreConfig
+        from owrx.config import Config
+        from owrx.feature import FeatureDetector
+        from owrx.sdr import SdrService
+        from owrx.service import Services
+        from owrx.websocket import WebSocketConnection
+        from owrx.reporting import ReportingEngine
+        from owrx.audio.queue import DecoderQueue
+        from owrx.markers import Markers
+        from owrx.eibi import EIBI
+        from owrx.storage import FileIndex
+        from owrx.property import DispatchMetrics
+
     # config warmup
-    Config.validateConfig()
-    coreConfig = CoreConfig()
+    with phase("config"):
+        Config.validateConfig()
+        coreConfig = CoreConfig()
+        # measuring event dispatch needs the config to be set up already
+        DispatchMetrics.start()
 
     featureDetector = FeatureDetector()
+    with phase("feature detection"):
+        # check everything up front and concurrently, so that no request has to wait for a check
+        featureDetector.detectAll()
+        FeatureDetector.startRefresh()
     failed = featureDetector.get_failed_requirements("core")
     if failed:
         logger.error(
@@ -110,32 +137,52 @@ Support and info:       https://groups.io/g/openwebrx
 
     # Get error messages about unknown / unavailable features as soon as possible
     # start up "always-on" sources right away
-    SdrService.getAllSources()
+    with phase("sdr sources"):
+        SdrService.getAllSources()
+
+    with phase("services"):
+        Services.start()
 
-    Services.start()
+    # Index stored files once, the index is kept up to date from then on
+    with phase("storage"):
+        FileIndex.getSharedInstance()
 
     # Instantiate and refresh marker database
-    Markers.start()
+    with phase("markers"):
+        Markers.start()
 
     # Instantiate and refresh broadcasting schedule
-    EIBI.start()
+    with phase("eibi"):
+        EIBI.start()
 
     try:
-        # This is our HTTP server
-        server = ThreadedHttpServer(("0.0.0.0", coreConfig.get_web_port()), RequestHandler)
         # We expect to find SSL certificate here
         keyFile  = "/etc/openwebrx/key.pem"
         certFile = "/etc/openwebrx/cert.pem"
+        sslContext = None
         # If SSL certificate found, use HTTPS instead of HTTP
         if os.path.isfile(keyFile) and os.path.isfile(certFile):
-            server.socket = ssl.wrap_socket(
-                server.socket, keyFile, certFile, server_side=True)
+            sslContext = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            sslContext.load_cert_chain(certFile, keyFile)
             logger.info("Found SSL certificate, using https:// protocol.")
         else:
             logger.info("No SSL certificate, using http:// protocol.")
             logger.info("To enable https://, supply SSL certificate:")
             logger.info("    " + certFile)
             logger.info("    " + keyFile)
+        # This is our HTTP server
+        with phase("web server"):
+            if coreConfig.get_web_server() == "asyncio":
+                # local import since the event loop server is optional
+                from owrx.eventloop import AsyncHttpServer
+                logger.info("Using asyncio web server.")
+                server = AsyncHttpServer(("0.0.0.0", coreConfig.get_web_port()), sslContext)
+            else:
+                server = ThreadedHttpServer(("0.0.0.0", coreConfig.get_web_port()), RequestHandler)
+                if sslContext is not None:
+                    server.socket = sslContext.wrap_socket(server.socket, server_side=True)
+        if profiler is not None:
+            profiler.report()
         # Run the server
         server.serve_forever()
     except SignalException:
@@ -148,5 +195,6 @@ Support and info:       https://groups.io/g/openwebrx
     SdrService.stopAllSources()
     ReportingEngine.stopAll()
     DecoderQueue.stopAll()
+    FeatureDetector.stopRefresh()
 
     return 0
@@ -2,7 +2,8 @@ from owrx.map import Map, LatLngLocation
 from owrx.metrics import Metrics, CounterMetric
 from owrx.bands import Bandplan
 from datetime import datetime, timezone
-from csdr.module import PickleModule
+from csdr.module import MessageModule
+from owrx.message import MessageTypes, RecordMessageType
 import re
 import logging
 
@@ -45,7 +46,15 @@ def getSymbolData(symbol, table):
     return {"symbol": symbol, "table": table, "index": ord(symbol) - 33, "tableindex": ord(table) - 33}
 
 
-class Ax25Parser(PickleModule):
+# decoded AX.25 frames, as passed from the Ax25Parser to the AprsParser
+ax25FrameType = MessageTypes.register(
+    RecordMessageType(4, "ax25", [("destination", "str"), ("source", "str"), ("path", "strlist"), ("data", "bytes")])
+)
+
+
+class Ax25Parser(MessageModule):
+    outputType = ax25FrameType
+
     def process(self, ax25frame):
         control_pid = ax25frame.find(bytes([0x03, 0xF0]))
         if control_pid % 7 > 0:
@@ -156,7 +165,7 @@ class AprsLocation(LatLngLocation):
         return res
 
 
-class AprsParser(PickleModule):
+class AprsParser(MessageModule):
     def __init__(self):
         super().__init__()
         self.metrics = {}
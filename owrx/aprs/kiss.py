@@ -1,6 +1,6 @@
 from pycsdr.types import Format
 from csdr.module import ThreadModule
-import pickle
+from owrx.message import Message
 
 import logging
 
@@ -31,7 +31,7 @@ class KissDeframer(ThreadModule):
                 self.doRun = False
             else:
                 for frame in self.parse(data):
-                    self.writer.write(pickle.dumps(frame))
+                    self.writer.write(Message.encode(bytes(frame)))
 
     def parse(self, input):
         for b in input:
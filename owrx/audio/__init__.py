@@ -20,6 +20,16 @@ class AudioChopperProfile(ABC):
     def decoder_commandline(self, file):
         pass
 
+    @abstractmethod
+    def getMode(self):
+        pass
+
+    def supportsBatching(self):
+        """
+        Batching decoders take multiple files as their last arguments and print "<DecodeFinished>" after each of them.
+        """
+        return False
+
 
 class ProfileSourceSubscriber(ABC):
     @abstractmethod
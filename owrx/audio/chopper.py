@@ -4,10 +4,10 @@ from itertools import groupby
 from owrx.audio import ProfileSourceSubscriber
 from owrx.audio.wav import AudioWriter
 from owrx.audio.queue import QueueJob
+from owrx.message import Message
 from csdr.module import ThreadModule
 from pycsdr.types import Format
 from abc import ABC, abstractmethod
-import pickle
 
 import logging
 
@@ -67,8 +67,9 @@ class AudioChopper(ThreadModule, ProfileSourceSubscriber):
             if data is None:
                 self.doRun = False
             else:
+                data = data.tobytes()
                 for w in self.writers:
-                    w.write(data.tobytes())
+                    w.write(data)
 
         logger.debug("Audio chopper shutting down")
         self.profile_source.unsubscribe(self)
@@ -81,11 +82,11 @@ class AudioChopper(ThreadModule, ProfileSourceSubscriber):
     def setDialFrequency(self, frequency: int) -> None:
         self.dialFrequency = frequency
 
-    def createJob(self, profile, filename):
-        return QueueJob(profile, self.dialFrequency, self, filename)
+    def createJob(self, profile, audioSlice):
+        return QueueJob(profile, self.dialFrequency, self, audioSlice)
 
     def sendResult(self, result):
         for line in result.lines:
             data = self.parser.parse(result.profile, result.frequency, line)
             if data is not None and self.writer is not None:
-                self.writer.write(pickle.dumps(data))
+                self.writer.write(Message.encode(data))
@@ -1,10 +1,15 @@
 from owrx.config import Config
 from owrx.config.core import CoreConfig
-from owrx.metrics import Metrics, CounterMetric, DirectMetric
+from owrx.metrics import Metrics, CounterMetric, DirectMetric, HistogramMetric
+from owrx.property.debounce import Debouncer
 from queue import Queue, Full, Empty
+from itertools import count
+import heapq
 import subprocess
 import os
+import re
 import threading
+import time
 
 import logging
 
@@ -20,21 +25,83 @@ class QueueJobResult:
 
 
 class QueueJob(object):
-    def __init__(self, profile, frequency, writer, file):
+    def __init__(self, profile, frequency, writer, audioSlice):
         self.profile = profile
         self.frequency = frequency
         self.writer = writer
-        self.file = file
+        self.audioSlice = audioSlice
+        self.file = None
+        self.created = time.monotonic()
+        # results are only useful to the user until the next slice of the same profile has been decoded
+        self.deadline = self.created + profile.getInterval()
 
-    def run(self):
-        logger.debug("processing file %s", self.file)
+    def getBatchKey(self):
+        """
+        Jobs with the same batch key can be decoded in a single decoder invocation.
+        """
+        if not self.profile.supportsBatching():
+            return None
+        return tuple(self.profile.decoder_commandline(self.file)[:-1])
+
+    @staticmethod
+    def getSliceDirectory():
+        # decoders need a file, but only for as long as they run, so memory-backed storage is preferred if available
+        if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+            return "/dev/shm"
+        return CoreConfig().get_temporary_directory()
+
+    def materialize(self):
+        """
+        Writes the audio to a file for the decoder. The decoders parse the timestamp from the file name.
+        """
+        if self.file is None:
+            self.file = "{dir}/openwebrx-audiochopper-{pid}-{timestamp}.wav".format(
+                dir=QueueJob.getSliceDirectory(),
+                pid=id(self.profile),
+                timestamp=self.audioSlice.getTimestamp().strftime(self.profile.getFileTimestampFormat()),
+            )
+            self.audioSlice.writeWaveFile(self.file)
+        return self.file
+
+    def unlink(self):
+        if self.file is None:
+            return
+        try:
+            os.unlink(self.file)
+        except FileNotFoundError:
+            pass
+        self.file = None
+
+
+class QueueJobBatch(object):
+    decodeFinishedRegex = re.compile(b" ?<DecodeFinished>")
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.profile = jobs[0].profile
+
+    def run(self, cpu=None):
+        files = [job.materialize() for job in self.jobs]
+        logger.debug("processing files %s", ", ".join(files))
+        commandLine = self.profile.decoder_commandline(files[0])
+        if len(files) > 1:
+            commandLine = commandLine[:-1] + files
         tmp_dir = CoreConfig().get_temporary_directory()
+        start = time.monotonic()
         decoder = subprocess.Popen(
-            ["nice", "-n", "10"] + self.profile.decoder_commandline(self.file),
+            ["nice", "-n", "10"] + commandLine,
             stdout=subprocess.PIPE,
             cwd=tmp_dir,
             close_fds=True,
             )
+        spawnTime = time.monotonic() - start
+        if cpu is not None and hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(decoder.pid, {cpu})
+            except OSError:
+                # the decoder may already be gone
+                pass
+
         lines = None
         try:
             lines = [l for l in decoder.stdout]
@@ -45,7 +112,8 @@ class QueueJob(object):
 
         # keep this out of the try/except
         if lines is not None:
-            self.writer.sendResult(QueueJobResult(self.profile, self.frequency, lines))
+            for job, jobLines in zip(self.jobs, self._splitLines(lines)):
+                job.writer.sendResult(QueueJobResult(job.profile, job.frequency, jobLines))
 
         try:
             rc = decoder.wait(timeout=10)
@@ -56,19 +124,32 @@ class QueueJob(object):
             decoder.kill()
             raise
 
+        return spawnTime, time.monotonic() - start
+
+    def _splitLines(self, lines):
+        if len(self.jobs) == 1:
+            return [lines]
+        # batching decoders report the end of every file, that's where the output is split
+        result = [[] for _ in self.jobs]
+        index = 0
+        for line in lines:
+            result[index].append(line)
+            if QueueJobBatch.decodeFinishedRegex.match(line) and index < len(self.jobs) - 1:
+                index += 1
+        return result
+
     def unlink(self):
-        try:
-            os.unlink(self.file)
-        except FileNotFoundError:
-            pass
+        for job in self.jobs:
+            job.unlink()
 
 
 PoisonPill = object()
 
 
 class QueueWorker(threading.Thread):
-    def __init__(self, queue):
+    def __init__(self, queue, cpu=None):
         self.queue = queue
+        self.cpu = cpu
         self.doRun = True
         super().__init__()
 
@@ -77,25 +158,45 @@ class QueueWorker(threading.Thread):
             job = self.queue.get()
             if job is PoisonPill:
                 self.stop()
-            else:
-                try:
-                    job.run()
-                except Exception:
-                    logger.exception("failed to decode job")
-                    self.queue.onError()
-                finally:
-                    job.unlink()
+                self.queue.task_done()
+                continue
+
+            jobs = [job] + self.queue.getBatch(job)
+            batch = QueueJobBatch(jobs)
+            self.queue.acquireSlot()
+            self.queue.onStarted(jobs)
+            try:
+                spawnTime, latency = batch.run(self.cpu)
+                self.queue.onDecoded(batch.profile, len(jobs), spawnTime, latency)
+            except Exception:
+                logger.exception("failed to decode job")
+                self.queue.onError()
+            finally:
+                self.queue.releaseSlot()
+                self.queue.onFinished(jobs)
+                batch.unlink()
 
-            self.queue.task_done()
+            for _ in jobs:
+                self.queue.task_done()
 
     def stop(self):
         self.doRun = False
 
 
 class DecoderQueue(Queue):
+    """
+    Decoding jobs are processed earliest-deadline-first. When the queue is full, jobs that won't be done in time are
+    evicted to make room, starting with the one that becomes useless first.
+    """
+
     sharedInstance = None
     creationLock = threading.Lock()
 
+    # maximum number of decoders running on a single cpu core at the same time
+    decodersPerCore = 2
+    # maximum number of files passed to a single decoder invocation
+    maxBatchSize = 8
+
     @staticmethod
     def getSharedInstance():
         with DecoderQueue.creationLock:
@@ -113,11 +214,18 @@ class DecoderQueue(Queue):
     def __init__(self):
         pm = Config.get()
         super().__init__(pm["decoding_queue_length"])
+        # decoding time per mode, used to find jobs that won't make their deadline anyway
+        self.latencies = {}
+        self.cores = DecoderQueue.getUsableCores()
+        self.running = 0
+        self.slotCondition = threading.Condition()
         self.workers = []
         self._setWorkers(pm["decoding_queue_workers"])
+        # starting and stopping workers is expensive, so a burst of changes is only applied once
+        self.workersDebouncer = Debouncer(lambda: self._setWorkers(Config.get()["decoding_queue_workers"]))
         self.subscriptions = [
             pm.wireProperty("decoding_queue_length", self._setMaxSize),
-            pm.wireProperty("decoding_queue_workers", self._setWorkers),
+            pm.filter("decoding_queue_workers").wire(self.workersDebouncer),
         ]
         metrics = Metrics.getSharedInstance()
         metrics.addMetric("decoding.queue.length", DirectMetric(self.qsize))
@@ -129,6 +237,126 @@ class DecoderQueue(Queue):
         metrics.addMetric("decoding.queue.overflow", self.overflowCounter)
         self.errorCounter = CounterMetric()
         metrics.addMetric("decoding.queue.error", self.errorCounter)
+        metrics.addMetric("decoding.queue.running", DirectMetric(lambda: self.running))
+        metrics.addMetric("decoding.queue.limit", DirectMetric(self.getConcurrencyLimit))
+
+    @staticmethod
+    def getUsableCores():
+        if hasattr(os, "sched_getaffinity"):
+            return sorted(os.sched_getaffinity(0))
+        return list(range(os.cpu_count() or 1))
+
+    def getConcurrencyLimit(self):
+        limit = len(self.cores) * DecoderQueue.decodersPerCore
+        try:
+            # back off when the system is already busy with other things
+            overload = os.getloadavg()[0] - len(self.cores)
+            if overload > 0:
+                limit -= int(overload)
+        except OSError:
+            pass
+        return max(1, limit)
+
+    def acquireSlot(self):
+        with self.slotCondition:
+            while self.running >= self.getConcurrencyLimit():
+                # load may change without notice, so check again from time to time
+                self.slotCondition.wait(1)
+            self.running += 1
+
+    def releaseSlot(self):
+        with self.slotCondition:
+            self.running -= 1
+            self.slotCondition.notify()
+
+    def getBatch(self, job):
+        """
+        Removes queued jobs that can be decoded together with the given job from the queue and returns them.
+        Every returned job still needs its own task_done().
+        """
+        key = job.getBatchKey()
+        if key is None:
+            return []
+        with self.mutex:
+            batch = [e for e in sorted(self.queue) if e[2] is not PoisonPill and e[2].getBatchKey() == key]
+            batch = batch[0:DecoderQueue.maxBatchSize - 1]
+            if batch:
+                for e in batch:
+                    self.queue.remove(e)
+                heapq.heapify(self.queue)
+                self.not_full.notify(len(batch))
+        self.outCounter.inc(len(batch))
+        return [e[2] for e in batch]
+
+    # the following methods implement the Queue storage as a heap ordered by deadline
+    def _init(self, maxsize):
+        self.queue = []
+        self.sequence = count()
+
+    def _qsize(self):
+        return len(self.queue)
+
+    def _put(self, item):
+        # PoisonPills go first
+        deadline = float("-inf") if item is PoisonPill else item.deadline
+        heapq.heappush(self.queue, (deadline, next(self.sequence), item))
+
+    def _get(self):
+        return heapq.heappop(self.queue)[2]
+
+    def _isAchievable(self, job, now):
+        return now + self.latencies.get(job.profile.getMode(), 0) <= job.deadline
+
+    def _evict(self, job):
+        """
+        Makes room for the job in a full queue. Returns the evicted job, or raises Full if the new job itself is the
+        one that should go.
+        """
+        now = time.monotonic()
+        candidates = [e for e in self.queue if e[2] is not PoisonPill and not self._isAchievable(e[2], now)]
+        if not candidates:
+            raise Full()
+        victim = min(candidates)
+        if self._isAchievable(job, now) or victim[0] < job.deadline:
+            self.queue.remove(victim)
+            heapq.heapify(self.queue)
+            # the evicted job will never be processed
+            self.unfinished_tasks -= 1
+            return victim[2]
+        raise Full()
+
+    def _getProfileMetric(self, name, profile, factory):
+        metrics = Metrics.getSharedInstance()
+        metricName = "decoding.{name}.{mode}".format(name=name, mode=profile.getMode())
+        metric = metrics.getMetric(metricName)
+        if metric is None:
+            metric = factory()
+            metrics.addMetric(metricName, metric)
+        return metric
+
+    def onStarted(self, jobs):
+        now = time.monotonic()
+        for job in jobs:
+            metric = self._getProfileMetric("wait", job.profile, lambda: HistogramMetric([0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120]))
+            metric.observe(now - job.created)
+
+    def onFinished(self, jobs):
+        now = time.monotonic()
+        for job in jobs:
+            if now > job.deadline:
+                self._getProfileMetric("missed", job.profile, CounterMetric).inc()
+
+    def onDecoded(self, profile, files, spawnTime, latency):
+        mode = profile.getMode()
+        # smoothed decoding time per invocation
+        self.latencies[mode] = latency if mode not in self.latencies else 0.8 * self.latencies[mode] + 0.2 * latency
+        self._getProfileMetric(
+            "spawn", profile, lambda: HistogramMetric([0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1])
+        ).observe(spawnTime)
+        self._getProfileMetric(
+            "latency", profile, lambda: HistogramMetric([0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 60, 120])
+        ).observe(latency)
+        self._getProfileMetric("files", profile, CounterMetric).inc(files)
 
     def _setMaxSize(self, size):
         if self.maxsize == size:
@@ -147,6 +375,7 @@ class DecoderQueue(Queue):
         logger.debug("shutting down the queue")
         while self.subscriptions:
             self.subscriptions.pop().cancel()
+        self.workersDebouncer.cancel()
         try:
             # purge all remaining jobs
             while not self.empty():
@@ -163,11 +392,24 @@ class DecoderQueue(Queue):
 
     def put(self, item, **kwargs):
         self.inCounter.inc()
-        try:
-            super(DecoderQueue, self).put(item, block=False)
-        except Full:
+        evicted = None
+        with self.not_full:
+            if item is not PoisonPill and 0 < self.maxsize <= self._qsize():
+                try:
+                    evicted = self._evict(item)
+                except Full:
+                    self.overflowCounter.inc()
+                    # the new job was turned away, nothing has been evicted
+                    self._getProfileMetric("rejected", item.profile, CounterMetric).inc()
+                    raise
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+        if evicted is not None:
+            logger.debug("decoding queue overflow; evicting job that can't be decoded in time")
             self.overflowCounter.inc()
-            raise
+            self._getProfileMetric("evicted", evicted.profile, CounterMetric).inc()
+            evicted.unlink()
 
     def get(self, **kwargs):
         # super.get() is blocking, so it would mess up the stats to inc() first
@@ -176,7 +418,8 @@ class DecoderQueue(Queue):
         return out
 
     def newWorker(self):
-        worker = QueueWorker(self)
+        # spread the workers across the available cores
+        worker = QueueWorker(self, self.cores[len(self.workers) % len(self.cores)])
         worker.start()
         return worker
 
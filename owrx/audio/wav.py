@@ -1,9 +1,7 @@
-from owrx.config.core import CoreConfig
 from owrx.audio import AudioChopperProfile
 from owrx.audio.queue import DecoderQueue
 import threading
 import wave
-import os
 from datetime import datetime, timedelta
 from queue import Full
 from typing import List
@@ -14,42 +12,48 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
-class WaveFile(object):
-    def __init__(self, writer_id):
-        self.timestamp = datetime.utcnow()
-        self.writer_id = writer_id
-        tmp_dir = CoreConfig().get_temporary_directory()
-        self.filename = "{tmp_dir}/openwebrx-audiochopper-master-{id}-{timestamp}.wav".format(
-            tmp_dir=tmp_dir,
-            id=self.writer_id,
-            timestamp=self.timestamp.strftime("%y%m%d_%H%M%S"),
-        )
-        self.waveFile = wave.open(self.filename, "wb")
-        self.waveFile.setnchannels(1)
-        self.waveFile.setsampwidth(2)
-        self.waveFile.setframerate(12000)
-
-    def __del__(self):
-        # Close and delete currently open file, if any
-        if self.waveFile is not None:
-            self.close()
-            self.unlink()
-
-    def close(self):
-        self.waveFile.close()
-
-    def getFileName(self):
-        return self.filename
+class AudioSlice(object):
+    """
+    One interval worth of 12kHz mono 16bit audio, kept in memory until a decoder needs it.
+    """
+
+    def __init__(self, timestamp: datetime, data: bytes):
+        self.timestamp = timestamp
+        self.data = data
 
     def getTimestamp(self):
         return self.timestamp
 
-    def writeframes(self, data):
-        return self.waveFile.writeframes(data)
+    def writeWaveFile(self, filename):
+        with wave.open(filename, "wb") as waveFile:
+            waveFile.setnchannels(1)
+            waveFile.setsampwidth(2)
+            waveFile.setframerate(12000)
+            waveFile.writeframes(self.data)
+
+
+class SliceBuffer(object):
+    def __init__(self, interval):
+        # preallocate enough space for one interval, plus some headroom for timing jitter
+        self.buffer = bytearray(int(interval * 12000 * 2 * 1.1))
+        self.length = 0
+        self.timestamp = datetime.utcnow()
 
-    def unlink(self):
-        os.unlink(self.filename)
-        self.waveFile = None
+    def write(self, data):
+        end = self.length + len(data)
+        if end > len(self.buffer):
+            self.buffer.extend(bytes(end - len(self.buffer)))
+        self.buffer[self.length:end] = data
+        self.length = end
+
+    def getSlice(self) -> AudioSlice:
+        """
+        Returns the collected audio and starts over with an empty buffer.
+        """
+        audioSlice = AudioSlice(self.timestamp, bytes(memoryview(self.buffer)[:self.length]))
+        self.length = 0
+        self.timestamp = datetime.utcnow()
+        return audioSlice
 
 
 class AudioWriter(object):
@@ -57,13 +61,10 @@ class AudioWriter(object):
         self.chopper = chopper
         self.interval = interval
         self.profiles = profiles
-        self.wavefile = None
+        self.buffer = None
         self.switchingLock = threading.Lock()
         self.timer = None
 
-    def getWaveFile(self):
-        return WaveFile(id(self))
-
     def getNextDecodingTime(self):
         # add one second to have the intervals tick over one second earlier
         # this avoids filename collisions, but also avoids decoding wave files with less than one second of audio
@@ -88,59 +89,30 @@ class AudioWriter(object):
 
     def switchFiles(self):
         with self.switchingLock:
-            file = self.wavefile
-            self.wavefile = self.getWaveFile()
-
-        # if previously open file exists...
-        if file is not None:
-            file.close()
-            tmp_dir = CoreConfig().get_temporary_directory()
-
-            for profile in self.profiles:
-                # create hardlinks for the individual profiles
-                filename = "{tmp_dir}/openwebrx-audiochopper-{pid}-{timestamp}.wav".format(
-                    tmp_dir=tmp_dir,
-                    pid=id(profile),
-                    timestamp=file.getTimestamp().strftime(profile.getFileTimestampFormat()),
-                )
-                try:
-                    os.link(file.getFileName(), filename)
-                except OSError:
-                    logger.exception("Error while linking job files")
-                    continue
-
-                job = self.chopper.createJob(profile, filename)
-                try:
-                    DecoderQueue.getSharedInstance().put(job)
-                except Full:
-                    logger.warning("decoding queue overflow; dropping one file")
-                    job.unlink()
+            if self.buffer is None:
+                return
+            audioSlice = self.buffer.getSlice()
 
+        # all profiles share the same slice, files are only written right before the decoder runs
+        for profile in self.profiles:
+            job = self.chopper.createJob(profile, audioSlice)
             try:
-                # our master can be deleted now, the profiles will delete their hardlinked copies after processing
-                file.unlink()
-            except OSError:
-                logger.exception("Error while unlinking job files")
+                DecoderQueue.getSharedInstance().put(job)
+            except Full:
+                logger.warning("decoding queue overflow; dropping one file")
 
-            self._scheduleNextSwitch()
+        self._scheduleNextSwitch()
 
     def start(self):
-        self.wavefile = self.getWaveFile()
+        self.buffer = SliceBuffer(self.interval)
         self._scheduleNextSwitch()
 
     def write(self, data):
         with self.switchingLock:
-            self.wavefile.writeframes(data)
+            if self.buffer is not None:
+                self.buffer.write(data)
 
     def stop(self):
         self.cancelTimer()
-        try:
-            self.wavefile.close()
-        except Exception:
-            logger.exception("error closing wave file")
-        try:
-            with self.switchingLock:
-                self.wavefile.unlink()
-        except Exception:
-            logger.exception("error removing undecoded file")
-        self.wavefile = None
+        with self.switchingLock:
+            self.buffer = None
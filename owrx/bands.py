@@ -1,6 +1,9 @@
 from owrx.modes import Modes, DigitalMode
 from datetime import datetime, timezone
+from bisect import bisect_left, bisect_right
+import threading
 import json
+import time
 import os
 
 import logging
@@ -63,26 +66,98 @@ class Band(object):
         return [e for e in self.frequencies if low <= e["frequency"] <= hi]
 
 
+class BandIndex(object):
+    """
+    Immutable index of a bandplan.
+
+    The band limits divide the spectrum into segments, and the bands covering every segment are determined up front, so
+    a lookup only needs a binary search. Band limits are inclusive, so the limits themselves are indexed separately
+    from the open segments between them. Results are in bandplan order.
+    """
+
+    def __init__(self, bands):
+        self.bands = bands
+        self.boundaries = sorted({b for band in bands for b in [band.lower_bound, band.upper_bound]})
+        # bands covering exactly the boundary of the same index
+        self.points = [[band for band in bands if band.inBand(b)] for b in self.boundaries]
+        # bands covering the open segment below the boundary of the same index. the last entry is above all boundaries.
+        self.segments = [[]]
+        for lower, upper in zip(self.boundaries, self.boundaries[1:]):
+            self.segments.append([band for band in bands if band.lower_bound <= lower and upper <= band.upper_bound])
+        self.segments.append([])
+
+        dials = [
+            (e["frequency"], (i, j), e) for i, band in enumerate(bands) for j, e in enumerate(band.frequencies)
+        ]
+        dials.sort(key=lambda d: d[0])
+        self.dialFrequencies = [d[0] for d in dials]
+        self.dials = [(d[1], d[2]) for d in dials]
+
+        # results of recent lookups, since decoders tend to look up the same few frequencies over and over
+        self.cache = {}
+
+    def findBands(self, freq):
+        # a single lookup, since another thread may clear the cache at any time
+        bands = self.cache.get(freq)
+        if bands is not None:
+            return bands
+        i = bisect_left(self.boundaries, freq)
+        if i < len(self.boundaries) and self.boundaries[i] == freq:
+            bands = self.points[i]
+        else:
+            bands = self.segments[i]
+        if len(self.cache) >= Bandplan.cacheSize:
+            self.cache.clear()
+        self.cache[freq] = bands
+        return bands
+
+    def collectDialFrequencies(self, range):
+        (low, hi) = range
+        dials = self.dials[bisect_left(self.dialFrequencies, low):bisect_right(self.dialFrequencies, hi)]
+        # back to bandplan order
+        dials.sort(key=lambda d: d[0])
+        return [e for _, e in dials]
+
+
 class Bandplan(object):
     sharedInstance = None
+    creationLock = threading.Lock()
+    # the files are checked for modifications no more often than this, in seconds
+    refreshInterval = 10
+    # maximum number of frequencies in the band lookup cache
+    cacheSize = 1024
 
     @staticmethod
     def getSharedInstance():
-        if Bandplan.sharedInstance is None:
-            Bandplan.sharedInstance = Bandplan()
+        with Bandplan.creationLock:
+            if Bandplan.sharedInstance is None:
+                Bandplan.sharedInstance = Bandplan()
         return Bandplan.sharedInstance
 
     def __init__(self):
-        self.bands = []
+        self.index = BandIndex([])
         self.file_modified = None
+        self.lastCheck = None
+        self.lock = threading.Lock()
         self.fileList = ["/etc/openwebrx/bands.json", "bands.json"]
 
+    @property
+    def bands(self):
+        return self.index.bands
+
     def _refresh(self):
-        modified = self._getFileModifiedTimestamp()
-        if self.file_modified is None or modified > self.file_modified:
-            logger.debug("reloading bands from disk due to file modification")
-            self.bands = self._loadBands()
-            self.file_modified = modified
+        now = time.monotonic()
+        if self.lastCheck is not None and now - self.lastCheck < Bandplan.refreshInterval:
+            return
+        with self.lock:
+            if self.lastCheck is not None and now - self.lastCheck < Bandplan.refreshInterval:
+                return
+            modified = self._getFileModifiedTimestamp()
+            if self.file_modified is None or modified > self.file_modified:
+                logger.debug("reloading bands from disk due to file modification")
+                self.index = BandIndex(self._loadBands())
+                self.file_modified = modified
+            self.lastCheck = now
 
     def _getFileModifiedTimestamp(self):
         timestamp = 0
@@ -113,10 +188,11 @@ class Bandplan(object):
 
     def findBands(self, freq):
         self._refresh()
-        return [band for band in self.bands if band.inBand(freq)]
+        return list(self.index.findBands(freq))
 
     def findBand(self, freq):
-        bands = self.findBands(freq)
+        self._refresh()
+        bands = self.index.findBands(freq)
         if bands:
             return bands[0]
         else:
@@ -124,4 +200,4 @@ class Bandplan(object):
 
     def collectDialFrequencies(self, range):
         self._refresh()
-        return [e for b in self.bands for e in b.getDialFrequencies(range)]
+        return self.index.collectDialFrequencies(range)
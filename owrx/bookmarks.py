@@ -1,6 +1,9 @@
 from datetime import datetime, timezone
 from owrx.config.core import CoreConfig
+from bisect import bisect_left, bisect_right
+import threading
 import json
+import time
 import os.path
 import os
 
@@ -55,16 +58,24 @@ class BookmakrSubscription(object):
 
 class Bookmarks(object):
     sharedInstance = None
+    creationLock = threading.Lock()
+    # the files are checked for modifications no more often than this, in seconds
+    refreshInterval = 10
 
     @staticmethod
     def getSharedInstance():
-        if Bookmarks.sharedInstance is None:
-            Bookmarks.sharedInstance = Bookmarks()
+        with Bookmarks.creationLock:
+            if Bookmarks.sharedInstance is None:
+                Bookmarks.sharedInstance = Bookmarks()
         return Bookmarks.sharedInstance
 
     def __init__(self):
         self.file_modified = None
+        self.lastCheck = None
+        self.lock = threading.Lock()
         self.bookmarks = []
+        # frequency index for range queries, rebuilt on demand after the bookmarks have changed
+        self.index = None
         self.subscriptions = []
         # Known bookmark files, starting with the main file
         self.fileList = [
@@ -82,11 +93,28 @@ class Bookmarks(object):
             pass
 
     def _refresh(self):
-        modified = self._getFileModifiedTimestamp()
-        if self.file_modified is None or modified > self.file_modified:
-            logger.debug("reloading bookmarks from disk due to file modification")
-            self.bookmarks = self._loadBookmarks()
-            self.file_modified = modified
+        now = time.monotonic()
+        if self.lastCheck is not None and now - self.lastCheck < Bookmarks.refreshInterval:
+            return
+        with self.lock:
+            if self.lastCheck is not None and now - self.lastCheck < Bookmarks.refreshInterval:
+                return
+            modified = self._getFileModifiedTimestamp()
+            if self.file_modified is None or modified > self.file_modified:
+                logger.debug("reloading bookmarks from disk due to file modification")
+                self.bookmarks = self._loadBookmarks()
+                self.index = None
+                self.file_modified = modified
+            self.lastCheck = now
+
+    def _getIndex(self):
+        index = self.index
+        if index is None:
+            # keep the position, so that results can be returned in the original order
+            entries = sorted(enumerate(self.bookmarks), key=lambda e: e[1].getFrequency())
+            index = ([b.getFrequency() for _, b in entries], entries)
+            self.index = index
+        return index
 
     def _getFileModifiedTimestamp(self):
         timestamp = 0
@@ -129,7 +157,10 @@ class Bookmarks(object):
             return self.bookmarks
         else:
             (lo, hi) = range
-            return [b for b in self.bookmarks if lo <= b.getFrequency() <= hi]
+            frequencies, entries = self._getIndex()
+            entries = entries[bisect_left(frequencies, lo):bisect_right(frequencies, hi)]
+            entries.sort(key=lambda e: e[0])
+            return [b for _, b in entries]
 
     @staticmethod
     def _getBookmarksFile():
@@ -146,18 +177,24 @@ class Bookmarks(object):
         with open(Bookmarks._getBookmarksFile(), "w") as file:
             file.write(jsonContent)
         self.file_modified = self._getFileModifiedTimestamp()
+        # bookmarks may have been edited in place
+        self.index = None
 
     def addBookmark(self, bookmark: Bookmark):
         self.bookmarks.append(bookmark)
+        self.index = None
         self.notifySubscriptions(bookmark)
 
     def removeBookmark(self, bookmark: Bookmark):
         if bookmark not in self.bookmarks:
             return
         self.bookmarks.remove(bookmark)
+        self.index = None
         self.notifySubscriptions(bookmark)
 
     def notifySubscriptions(self, bookmark: Bookmark):
+        # also called after a bookmark has been edited in place
+        self.index = None
         for sub in self.subscriptions:
             if sub.inRange(bookmark):
                 try:
@@ -166,7 +203,9 @@ class Bookmarks(object):
                     logger.exception("Error while calling bookmark subscriptions")
 
     def subscribe(self, range, callback):
-        self.subscriptions.append(BookmakrSubscription(self, range, callback))
+        sub = BookmakrSubscription(self, range, callback)
+        self.subscriptions.append(sub)
+        return sub
 
     def unsubscribe(self, subscriptions: BookmakrSubscription):
         if subscriptions not in self.subscriptions:
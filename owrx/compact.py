@@ -0,0 +1,258 @@
+from collections.abc import Sequence
+import struct
+import json
+import mmap
+import os
+
+
+class CompactTable(Sequence):
+    """
+    Columnar on-disk format for large lists of flat dicts, like the cached schedules and marker databases.
+
+    The file is memory-mapped. Number columns are read in place, strings go through a table of unique strings that
+    are only decoded when accessed, and rows are materialized as dicts on first access. Files must only ever be
+    replaced (see store()), never rewritten in place, since that would pull the ground from under existing maps.
+
+    Layout, in native byte order, every section aligned to 8 bytes:
+    header, column descriptors, string offsets, string data, one array of values per column.
+    """
+
+    magic = b"OWXC"
+    version = 1
+    # magic, version, byte order check, number of columns, rows and strings
+    header = struct.Struct("=4sHHIII")
+    byteOrderCheck = 0x0102
+    # name (string index), type
+    columnHeader = struct.Struct("=Ic3x")
+
+    # column types
+    typeInt = "q"
+    typeFloat = "d"
+    typeString = "s"
+    # anything else, stored as json in the string table
+    typeJson = "j"
+
+    # string index of missing values
+    missing = 0xFFFFFFFF
+    # marks rows that do not have a column at all, as opposed to a None value
+    absent = object()
+
+    @staticmethod
+    def isCompact(fileName: str):
+        try:
+            with open(fileName, "rb") as f:
+                return f.read(len(CompactTable.magic)) == CompactTable.magic
+        except OSError:
+            return False
+
+    @staticmethod
+    def load(fileName: str):
+        with open(fileName, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return CompactTable(buffer)
+
+    @staticmethod
+    def _getColumnType(values):
+        present = [v for v in values if v is not CompactTable.absent]
+        if len(present) == len(values):
+            if all(type(v) is int for v in present):
+                if all(-(2**63) <= v < 2**63 for v in present):
+                    return CompactTable.typeInt
+            elif all(type(v) in [int, float] for v in present):
+                return CompactTable.typeFloat
+        if all(type(v) is str for v in present):
+            return CompactTable.typeString
+        return CompactTable.typeJson
+
+    @staticmethod
+    def _pad(data: bytes):
+        return data + bytes(-len(data) % 8)
+
+    @staticmethod
+    def store(fileName: str, rows: list):
+        """
+        Writes the rows (dicts with arbitrary keys) to the file, replacing it atomically.
+        """
+        names = []
+        for row in rows:
+            for name in row.keys():
+                if name not in names:
+                    names.append(name)
+
+        strings = {}
+
+        def intern(s: str):
+            if s not in strings:
+                strings[s] = len(strings)
+            return strings[s]
+
+        columns = []
+        for name in names:
+            values = [row.get(name, CompactTable.absent) for row in rows]
+            columnType = CompactTable._getColumnType(values)
+            if columnType == CompactTable.typeString:
+                values = [CompactTable.missing if v is CompactTable.absent else intern(v) for v in values]
+            elif columnType == CompactTable.typeJson:
+                values = [CompactTable.missing if v is CompactTable.absent else intern(json.dumps(v)) for v in values]
+            data = struct.pack("={0}{1}".format(len(values), "I" if columnType in "sj" else columnType), *values)
+            columns.append((intern(name), columnType, data))
+
+        blobs = [s.encode("utf-8") for s in strings.keys()]
+        offsets = [0]
+        for blob in blobs:
+            offsets.append(offsets[-1] + len(blob))
+
+        sections = [
+            CompactTable.header.pack(
+                CompactTable.magic,
+                CompactTable.version,
+                CompactTable.byteOrderCheck,
+                len(columns),
+                len(rows),
+                len(strings),
+            )
+        ]
+        sections += [CompactTable.columnHeader.pack(index, t.encode()) for index, t, _ in columns]
+        sections = [CompactTable._pad(b"".join(sections))]
+        sections.append(CompactTable._pad(struct.pack("={0}I".format(len(offsets)), *offsets)))
+        sections.append(CompactTable._pad(b"".join(blobs)))
+        sections += [CompactTable._pad(data) for _, _, data in columns]
+
+        tmp = fileName + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(b"".join(sections))
+        os.replace(tmp, fileName)
+
+    def __init__(self, buffer):
+        view = memoryview(buffer)
+        if len(view) < CompactTable.header.size:
+            raise ValueError("file too short")
+        magic, version, byteOrder, columnCount, self.rowCount, stringCount = CompactTable.header.unpack_from(view)
+        if magic != CompactTable.magic:
+            raise ValueError("not a compact table")
+        if version != CompactTable.version:
+            raise ValueError("unsupported version {0}".format(version))
+        if byteOrder != CompactTable.byteOrderCheck:
+            raise ValueError("written with a different byte order")
+
+        offset = CompactTable.header.size
+        descriptors = []
+        for _ in range(columnCount):
+            descriptors.append(CompactTable.columnHeader.unpack_from(view, offset))
+            offset += CompactTable.columnHeader.size
+        offset += -offset % 8
+
+        def section(length: int, itemType: str):
+            nonlocal offset
+            size = length * struct.calcsize(itemType)
+            if offset + size > len(view):
+                raise ValueError("file truncated")
+            result = view[offset : offset + size].cast(itemType)
+            offset += size + (-size % 8)
+            return result
+
+        self.stringOffsets = section(stringCount + 1, "I")
+        self.stringData = section(self.stringOffsets[-1], "B")
+        self.strings = [None] * stringCount
+
+        self.columns = {}
+        for nameIndex, columnType in descriptors:
+            columnType = columnType.decode()
+            values = section(self.rowCount, "I" if columnType in "sj" else columnType)
+            self.columns[self._getString(nameIndex)] = (columnType, values)
+
+        self.rows = [None] * self.rowCount
+
+    def _getString(self, index: int):
+        s = self.strings[index]
+        if s is None:
+            data = self.stringData[self.stringOffsets[index] : self.stringOffsets[index + 1]]
+            s = self.strings[index] = str(data, "utf-8")
+        return s
+
+    def _decode(self, columnType: str, value):
+        if columnType == CompactTable.typeString:
+            return None if value == CompactTable.missing else self._getString(value)
+        elif columnType == CompactTable.typeJson:
+            return None if value == CompactTable.missing else json.loads(self._getString(value))
+        return value
+
+    def getColumnNames(self):
+        return list(self.columns.keys())
+
+    def _decodeColumn(self, name: str):
+        columnType, values = self.columns[name]
+        if columnType in [CompactTable.typeInt, CompactTable.typeFloat]:
+            return values.tolist()
+        values = values.tolist()
+        # whole columns are faster to decode from a single copy of the string data
+        if None in self.strings:
+            self._decodeAllStrings()
+        strings = self.strings + [CompactTable.absent]
+        if CompactTable.missing in values:
+            values = [len(self.strings) if v == CompactTable.missing else v for v in values]
+        if columnType == CompactTable.typeString:
+            return [strings[v] for v in values]
+        decoded = {v: json.loads(strings[v]) for v in set(values) if v < len(self.strings)}
+        return [decoded.get(v, CompactTable.absent) for v in values]
+
+    def getColumn(self, name: str):
+        """
+        Returns all values of a column, without materializing any rows. Missing values are None.
+        """
+        return [None if v is CompactTable.absent else v for v in self._decodeColumn(name)]
+
+    def _materialize(self, index: int):
+        row = {}
+        for name, (columnType, values) in self.columns.items():
+            value = values[index]
+            if columnType in "sj":
+                if value != CompactTable.missing:
+                    row[name] = self._decode(columnType, value)
+            else:
+                row[name] = value
+        return row
+
+    def _decodeAllStrings(self):
+        data = bytes(self.stringData)
+        offsets = self.stringOffsets.tolist()
+        self.strings = [
+            str(data[start:end], "utf-8") if s is None else s
+            for s, start, end in zip(self.strings, offsets, offsets[1:])
+        ]
+
+    def _materializeAll(self):
+        names = list(self.columns.keys())
+        columns = [self._decodeColumn(name) for name in names]
+        rows = [dict(zip(names, values)) for values in zip(*columns)]
+        for name, column in zip(names, columns):
+            columnType, values = self.columns[name]
+            if columnType in "sj" and CompactTable.missing in values:
+                for i, value in enumerate(column):
+                    if value is CompactTable.absent:
+                        del rows[i][name]
+        self.rows = [row if old is None else old for row, old in zip(rows, self.rows)]
+
+    def __len__(self):
+        return self.rowCount
+
+    def __iter__(self):
+        # iterating usually means everything is needed, and materializing whole columns at once is a lot faster
+        if None in self.rows:
+            self._materializeAll()
+        return iter(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.rowCount))]
+        if index < 0:
+            index += self.rowCount
+        if not 0 <= index < self.rowCount:
+            raise IndexError("row index out of range")
+        row = self.rows[index]
+        if row is None:
+            row = self.rows[index] = self._materialize(index)
+        return row
+
+    def isMaterialized(self, index: int):
+        return self.rows[index] is not None
@@ -12,6 +12,7 @@ class CoreConfig(object):
         },
         "web": {
             "port": 8073,
+            "server": "threaded",
         },
         "aprs": {
             "symbols_path": "/usr/share/aprs-symbols/png"
@@ -36,6 +37,9 @@ class CoreConfig(object):
         self.temperature_sensor = config.get("core", "temperature_sensor")
         CoreConfig.checkDirectory(self.temporary_directory, "temporary_directory")
         self.web_port = config.getint("web", "port")
+        self.web_server = config.get("web", "server")
+        if self.web_server not in ["threaded", "asyncio"]:
+            raise ConfigError("server", "unsupported web server type: {0}".format(self.web_server))
         self.aprs_symbols_path = config.get("aprs", "symbols_path")
 
     @staticmethod
@@ -50,6 +54,9 @@ class CoreConfig(object):
     def get_web_port(self):
         return self.web_port
 
+    def get_web_server(self):
+        return self.web_server
+
     def get_data_directory(self):
         return self.data_directory
 
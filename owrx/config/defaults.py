@@ -173,7 +173,9 @@ defaultConfig = PropertyLayer(
     flight_url="https://flightaware.com/live/flight/{}",
     usage_policy_url="policy",
     session_timeout=0,
+    client_lag_limit=10,
     keep_files=20,
+    keep_files_size=0,
     decoding_queue_workers=2,
     decoding_queue_length=10,
     wsjt_decoding_depth=3,
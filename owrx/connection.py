@@ -8,17 +8,23 @@ from owrx.feature import FeatureDetector
 from owrx.version import openwebrx_version
 from owrx.bands import Bandplan
 from owrx.bookmarks import Bookmarks
+from owrx.eibi import EIBI
 from owrx.map import Map
 from owrx.property import PropertyStack, PropertyDeleted
 from owrx.modes import Modes, DigitalMode
 from owrx.config import Config
 from owrx.waterfall import WaterfallOptions
-from owrx.websocket import Handler
-from queue import Queue, Full, Empty
+from owrx.websocket import Handler, Frame
+from owrx.message import Message
+from owrx.metrics import Metrics, CounterMetric, DirectMetric
 from abc import ABCMeta, abstractmethod
+from collections import deque
+from weakref import WeakSet
+from enum import Enum
 import json
 import threading
 import struct
+import time
 
 import logging
 
@@ -27,10 +33,225 @@ logger = logging.getLogger(__name__)
 PoisonPill = object()
 
 
+class MessageClass(Enum):
+    AUDIO = 1
+    FFT = 2
+    SECONDARY_FFT = 3
+    METADATA = 4
+    CONFIG = 5
+    OTHER = 6
+
+    @staticmethod
+    def classify(data):
+        if isinstance(data, Frame):
+            data = data.payload
+        if isinstance(data, dict):
+            if data.get("type") == "config":
+                return MessageClass.CONFIG
+            if data.get("type") in SendQueue.supersedingTypes:
+                return MessageClass.METADATA
+            return MessageClass.OTHER
+        if isinstance(data, (bytes, bytearray, memoryview)) and len(data):
+            return {
+                0x01: MessageClass.FFT,
+                0x02: MessageClass.AUDIO,
+                0x03: MessageClass.SECONDARY_FFT,
+                0x04: MessageClass.AUDIO,
+            }.get(data[0], MessageClass.OTHER)
+        return MessageClass.OTHER
+
+
+class SendQueueEntry(object):
+    __slots__ = ["messageClass", "data", "timestamp"]
+
+    def __init__(self, messageClass, data):
+        self.messageClass = messageClass
+        self.data = data
+        self.timestamp = time.monotonic()
+
+
+class SendQueueMetrics(object):
+    """
+    Metrics of all client send queues together, so that connecting clients don't add metrics of their own.
+    """
+
+    sharedInstance = None
+    creationLock = threading.Lock()
+
+    @staticmethod
+    def getSharedInstance():
+        with SendQueueMetrics.creationLock:
+            if SendQueueMetrics.sharedInstance is None:
+                SendQueueMetrics.sharedInstance = SendQueueMetrics()
+        return SendQueueMetrics.sharedInstance
+
+    def __init__(self):
+        self.queues = WeakSet()
+        self.lock = threading.Lock()
+        metrics = Metrics.getSharedInstance()
+        metrics.addMetric("openwebrx.clients.queue.depth", DirectMetric(self.getDepth))
+        metrics.addMetric("openwebrx.clients.queue.lag", DirectMetric(self.getLag))
+        self.dropCounter = CounterMetric()
+        metrics.addMetric("openwebrx.clients.queue.dropped", self.dropCounter)
+        self.coalesceCounter = CounterMetric()
+        metrics.addMetric("openwebrx.clients.queue.coalesced", self.coalesceCounter)
+
+    def addQueue(self, queue):
+        with self.lock:
+            self.queues.add(queue)
+
+    def removeQueue(self, queue):
+        with self.lock:
+            self.queues.discard(queue)
+
+    def _getQueues(self):
+        with self.lock:
+            return list(self.queues)
+
+    def getDepth(self):
+        # messages queued for all clients
+        return sum(queue.qsize() for queue in self._getQueues())
+
+    def getLag(self):
+        # lag of the client that is furthest behind
+        return max((queue.lag() for queue in self._getQueues()), default=0)
+
+
+class SendQueue(object):
+    """
+    Outbound message queue for a single client.
+
+    When the client can't keep up, waterfall lines are dropped (oldest first), and state messages that are superseded
+    by a newer message of the same type are replaced in place. The client is only considered lost once a message that
+    can't be dropped has been waiting for longer than the lag limit, or when the queue overflows with such messages.
+    """
+
+    # status messages where only the latest value is of any interest
+    supersedingTypes = ["cpuusage", "temperature", "clients", "smeter"]
+    # drop order under backpressure
+    droppableClasses = [MessageClass.FFT, MessageClass.SECONDARY_FFT]
+
+    def __init__(self, maxsize: int, lagLimit: float):
+        self.maxsize = maxsize
+        self.lagLimit = lagLimit
+        self.entries = deque()
+        # latest queued entry for every message type that can be coalesced
+        self.pending = {}
+        self.condition = threading.Condition()
+        self.closed = False
+        self.listener = None
+
+        self.metrics = SendQueueMetrics.getSharedInstance()
+        self.dropCounter = self.metrics.dropCounter
+        self.coalesceCounter = self.metrics.coalesceCounter
+        self.metrics.addQueue(self)
+
+    def setListener(self, listener):
+        """
+        The listener is called whenever a new message has been queued. Used by consumers that can't block on get().
+        """
+        self.listener = listener
+
+    def qsize(self):
+        return len(self.entries)
+
+    def lag(self):
+        # waterfall lines are dropped before they can cause any lag, so only look at the messages that are kept
+        for entry in list(self.entries):
+            if entry.messageClass not in SendQueue.droppableClasses:
+                return time.monotonic() - entry.timestamp
+        return 0
+
+    def _coalescingKey(self, messageClass, data):
+        if messageClass is MessageClass.CONFIG:
+            return "config"
+        if messageClass is MessageClass.METADATA:
+            return data["type"]
+        return None
+
+    def _dropStale(self):
+        for messageClass in SendQueue.droppableClasses:
+            for entry in self.entries:
+                if entry.messageClass is messageClass:
+                    self.entries.remove(entry)
+                    self.dropCounter.inc()
+                    return True
+        return False
+
+    def put(self, data) -> bool:
+        """
+        Returns False if the client has fallen behind for too long and should be disconnected.
+        """
+        messageClass = MessageClass.classify(data)
+        key = self._coalescingKey(messageClass, data)
+        with self.condition:
+            if self.closed:
+                return True
+            if self.lag() > self.lagLimit:
+                return False
+
+            if key is not None and key in self.pending:
+                entry = self.pending[key]
+                if messageClass is MessageClass.CONFIG:
+                    # merge into the pending config message, newer values win
+                    entry.data = {"type": "config", "value": {**entry.data["value"], **data["value"]}}
+                else:
+                    entry.data = data
+                self.coalesceCounter.inc()
+                return True
+
+            if len(self.entries) >= self.maxsize and not self._dropStale():
+                if messageClass in SendQueue.droppableClasses:
+                    self.dropCounter.inc()
+                    return True
+                # nothing left to drop, allow a bit of overshoot for important messages before giving up
+                if len(self.entries) >= self.maxsize * 2:
+                    return False
+
+            entry = SendQueueEntry(messageClass, data)
+            self.entries.append(entry)
+            if key is not None:
+                self.pending[key] = entry
+            self.condition.notify()
+        self._notifyListener()
+        return True
+
+    def _notifyListener(self):
+        if self.listener is not None:
+            self.listener()
+
+    def get(self, block: bool = True):
+        """
+        Returns None if block is False and there is nothing queued.
+        """
+        with self.condition:
+            while not self.entries:
+                if not block:
+                    return None
+                self.condition.wait()
+            entry = self.entries.popleft()
+            for key, pending in list(self.pending.items()):
+                if pending is entry:
+                    del self.pending[key]
+            return entry.data
+
+    def close(self):
+        with self.condition:
+            if self.closed:
+                return
+            self.closed = True
+            self.entries.clear()
+            self.pending = {}
+            self.entries.append(SendQueueEntry(MessageClass.OTHER, PoisonPill))
+            self.condition.notify()
+        self._notifyListener()
+        self.metrics.removeQueue(self)
+
+
 class Client(Handler, metaclass=ABCMeta):
     def __init__(self, conn):
         self.conn = conn
-        self.multithreadingQueue = Queue(100)
+        self.multithreadingQueue = SendQueue(100, Config.get()["client_lag_limit"])
 
         def mp_passthru():
             run = True
@@ -41,7 +262,6 @@ class Client(Handler, metaclass=ABCMeta):
                         run = False
                     else:
                         self.send(data)
-                    self.multithreadingQueue.task_done()
                 except (EOFError, OSError, ValueError):
                     run = False
                 except Exception:
@@ -50,7 +270,11 @@ class Client(Handler, metaclass=ABCMeta):
             # unset the queue object to free shared memory file descriptors
             self.multithreadingQueue = None
 
-        threading.Thread(target=mp_passthru, name="connection_mp_passthru").start()
+        if hasattr(conn, "attachSendQueue"):
+            # connections running on an event loop consume the queue themselves, no thread required
+            conn.attachSendQueue(self.multithreadingQueue)
+        else:
+            threading.Thread(target=mp_passthru, name="connection_mp_passthru").start()
 
     def send(self, data):
         try:
@@ -61,24 +285,15 @@ class Client(Handler, metaclass=ABCMeta):
 
     def close(self, error: bool = False):
         if self.multithreadingQueue is not None:
-            while True:
-                try:
-                    self.multithreadingQueue.get(block=False)
-                except Empty:
-                    break
-            try:
-                self.multithreadingQueue.put(PoisonPill, block=False)
-            except Full:
-                # this shouldn't happen, we just emptied the queue, but it's not worth risking the exception
-                logger.exception("impossible queue state: Full after Empty")
+            self.multithreadingQueue.close()
         self.conn.close(socketError=error)
 
     def mp_send(self, data):
+        # never blocks. messages go out in order, but may be dropped or merged when the client falls behind.
         if self.multithreadingQueue is None:
             return
-        try:
-            self.multithreadingQueue.put(data, block=False)
-        except Full:
+        if not self.multithreadingQueue.put(data):
+            logger.warning("client has been lagging behind for too long, disconnecting")
             self.close(error=True)
 
     @abstractmethod
@@ -106,7 +321,7 @@ class OpenWebRxClient(Client, metaclass=ABCMeta):
         send_receiver_info()
 
     def write_receiver_details(self, details):
-        self.send({"type": "receiver_details", "value": details})
+        self.mp_send({"type": "receiver_details", "value": details})
 
     def close(self, error: bool = False):
         self._detailsSubscription.cancel()
@@ -154,6 +369,7 @@ class OpenWebRxReceiverClient(OpenWebRxClient, SdrSourceEventClient):
         self.sdr = None
         self.configSubs = []
         self.bookmarkSub = None
+        self.eibiSub = None
         self.connectionProperties = {}
 
         try:
@@ -225,8 +441,21 @@ class OpenWebRxReceiverClient(OpenWebRxClient, SdrSourceEventClient):
                 self.bookmarkSub = Bookmarks.getSharedInstance().subscribe(frequencyRange, sendBookmarks)
                 sendBookmarks()
 
+        def updateEibiSubscription(*args):
+            if self.eibiSub is not None:
+                self.eibiSub.cancel()
+                self.eibiSub = None
+            if "center_freq" in configProps and "samp_rate" in configProps:
+                cf = configProps["center_freq"]
+                srh = configProps["samp_rate"] / 2
+                frequencyRange = (cf - srh, cf + srh)
+                # the on-air list is recomputed once per minute for all clients looking at the same range
+                self.eibiSub = EIBI.getSharedInstance().subscribe(frequencyRange, self.write_eibi)
+                self.write_eibi(EIBI.getSharedInstance().getOnAir(frequencyRange))
+
         self.configSubs.append(configProps.wire(sendConfig))
         self.configSubs.append(stack.filter("center_freq", "samp_rate").wire(updateBookmarkSubscription))
+        self.configSubs.append(stack.filter("center_freq", "samp_rate").wire(updateEibiSubscription))
 
         # send initial config
         sendConfig()
@@ -379,6 +608,9 @@ class OpenWebRxReceiverClient(OpenWebRxClient, SdrSourceEventClient):
         if self.bookmarkSub is not None:
             self.bookmarkSub.cancel()
             self.bookmarkSub = None
+        if self.eibiSub is not None:
+            self.eibiSub.cancel()
+            self.eibiSub = None
         super().close(error)
 
     def stopDsp(self):
@@ -395,20 +627,26 @@ class OpenWebRxReceiverClient(OpenWebRxClient, SdrSourceEventClient):
                 self.dsp = DspManager(self, self.sdr)
         return self.dsp
 
-    def write_spectrum_data(self, data):
-        self.mp_send(bytes([0x01]) + data)
+    @staticmethod
+    def encode_spectrum_data(data) -> Frame:
+        return Frame(bytes([0x01]) + data)
+
+    def write_spectrum_data(self, frame: Frame):
+        self.mp_send(frame)
 
+    # the dsp outputs are written by the output pumps, which are shared by all clients on the same chain. they go
+    # through the queue, so that a slow client can't hold up the others.
     def write_dsp_data(self, data):
-        self.send(bytes([0x02]) + data)
+        self.mp_send(bytes([0x02]) + data)
 
     def write_hd_audio(self, data):
-        self.send(bytes([0x04]) + data)
+        self.mp_send(bytes([0x04]) + data)
 
     def write_s_meter_level(self, level):
         # may contain more than one sample, so only take the last 4 bytes = 1 float
         level, = struct.unpack('f', level[-4:])
         try:
-            self.send({"type": "smeter", "value": level})
+            self.mp_send({"type": "smeter", "value": level})
         except ValueError:
             logger.warning("unable to send smeter value: %s", str(level))
 
@@ -422,42 +660,52 @@ class OpenWebRxReceiverClient(OpenWebRxClient, SdrSourceEventClient):
         self.mp_send({"type": "clients", "value": clients})
 
     def write_secondary_fft(self, data):
-        self.send(bytes([0x03]) + data)
+        self.mp_send(bytes([0x03]) + data)
 
     def write_secondary_demod(self, message):
-        self.send({"type": "secondary_demod", "value": message})
+        if isinstance(message, Message):
+            self.mp_send(message.getFrame("secondary_demod"))
+        else:
+            self.mp_send({"type": "secondary_demod", "value": message})
 
     def write_secondary_dsp_config(self, cfg):
-        self.send({"type": "secondary_config", "value": cfg})
+        self.mp_send({"type": "secondary_config", "value": cfg})
 
     def write_config(self, cfg):
-        self.send({"type": "config", "value": cfg})
+        self.mp_send({"type": "config", "value": cfg})
 
     def write_profiles(self, profiles):
-        self.send({"type": "profiles", "value": profiles})
+        self.mp_send({"type": "profiles", "value": profiles})
 
     def write_features(self, features):
-        self.send({"type": "features", "value": features})
+        self.mp_send({"type": "features", "value": features})
 
     def write_metadata(self, metadata):
-        self.send({"type": "metadata", "value": metadata})
+        if isinstance(metadata, Message):
+            self.mp_send(metadata.getFrame("metadata"))
+        else:
+            self.mp_send({"type": "metadata", "value": metadata})
 
     def write_dial_frequencies(self, frequencies):
-        self.send({"type": "dial_frequencies", "value": frequencies})
+        self.mp_send({"type": "dial_frequencies", "value": frequencies})
 
     def write_bookmarks(self, bookmarks):
-        self.send({"type": "bookmarks", "value": bookmarks})
+        self.mp_send({"type": "bookmarks", "value": bookmarks})
+
+    def write_eibi(self, entries):
+        self.mp_send({"type": "eibi", "value": entries})
 
     def write_log_message(self, message):
-        self.send({"type": "log_message", "value": message})
+        self.mp_send({"type": "log_message", "value": message})
 
     def write_sdr_error(self, message):
-        self.send({"type": "sdr_error", "value": message})
+        self.mp_send({"type": "sdr_error", "value": message})
 
     def write_demodulator_error(self, message):
-        self.send({"type": "demodulator_error", "value": message})
+        self.mp_send({"type": "demodulator_error", "value": message})
 
     def write_backoff_message(self, reason):
+        # sent right away, since the connection is closed afterwards, which discards everything still queued
         self.send({"type": "backoff", "reason": reason})
 
     def write_modes(self, modes):
@@ -475,11 +723,11 @@ class OpenWebRxReceiverClient(OpenWebRxClient, SdrSourceEventClient):
                 res["underlying"] = m.underlying
             return res
 
-        self.send({"type": "modes", "value": [to_json(m) for m in modes]})
+        self.mp_send({"type": "modes", "value": [to_json(m) for m in modes]})
 
 
 class MapConnection(OpenWebRxClient):
-    def __init__(self, conn):
+    def __init__(self, conn, viewport: bool = False):
         super().__init__(conn)
 
         pm = Config.get()
@@ -498,21 +746,39 @@ class MapConnection(OpenWebRxClient):
 
         self.write_config(filtered_config.__dict__())
 
-        Map.getSharedInstance().addClient(self)
+        Map.getSharedInstance().addClient(self, viewport)
 
     def handleTextMessage(self, conn, message):
-        pass
+        try:
+            message = json.loads(message)
+            if "type" in message:
+                if message["type"] == "setviewport" and "params" in message:
+                    params = message["params"]
+                    try:
+                        bounds = [float(params[k]) for k in ["north", "south", "east", "west"]]
+                    except (KeyError, TypeError, ValueError):
+                        logger.warning("invalid viewport: {0}".format(params))
+                        return
+                    Map.getSharedInstance().setViewport(self, *bounds)
+            else:
+                logger.warning("received message without type: {0}".format(message))
+
+        except json.JSONDecodeError:
+            logger.warning("message is not json: {0}".format(message))
 
     def close(self, error: bool = False):
         Map.getSharedInstance().removeClient(self)
         super().close(error)
 
     def write_config(self, cfg):
-        self.send({"type": "config", "value": cfg})
+        self.mp_send({"type": "config", "value": cfg})
 
     def write_update(self, update):
         self.mp_send({"type": "update", "value": update})
 
+    def write_removal(self, callsigns):
+        self.mp_send({"type": "remove", "value": callsigns})
+
 
 class HandshakeMessageHandler(Handler):
     """
@@ -527,11 +793,14 @@ class HandshakeMessageHandler(Handler):
             logger.debug("client connection initialized")
 
             client = None
+            options = {}
             if "type" in handshake:
                 if handshake["type"] == "receiver":
                     client = OpenWebRxReceiverClient
                 elif handshake["type"] == "map":
                     client = MapConnection
+                    # map clients supporting viewports only receive what they can see
+                    options["viewport"] = handshake.get("viewport") == "1"
                 else:
                     logger.warning("invalid connection type: %s", handshake["type"])
 
@@ -539,7 +808,7 @@ class HandshakeMessageHandler(Handler):
                 logger.debug("handshake complete, handing off to %s", client.__name__)
                 # hand off all further communication to the correspondig connection
                 conn.send("CLIENT DE SERVER server=openwebrx version={version}".format(version=openwebrx_version))
-                conn.setMessageHandler(client(conn))
+                conn.setMessageHandler(client(conn, **options))
             else:
                 logger.warning('invalid handshake received')
         else:
@@ -3,7 +3,6 @@ from owrx.config.core import CoreConfig
 from datetime import datetime, timezone
 import mimetypes
 import os
-import pkg_resources
 from abc import ABCMeta, abstractmethod
 import gzip
 
@@ -100,6 +99,9 @@ class OwrxAssetsController(AssetsController):
                 user_file = "{}/{}.{}".format(config.get_data_directory(), mappedFiles[file], ext)
                 if os.path.exists(user_file) and os.path.isfile(user_file):
                     return user_file
+        # pkg_resources is slow to import, so it is only imported once the first asset is requested
+        import pkg_resources
+
         return pkg_resources.resource_filename("htdocs", file)
 
 
@@ -172,6 +174,8 @@ class CompiledAssetsController(GzipMixin, ModificationAwareController):
             self.send_response("profile not found", code=404)
             return
 
+        import pkg_resources
+
         files = CompiledAssetsController.profiles[profileName]
         files = [pkg_resources.resource_filename("htdocs", f) for f in files]
 
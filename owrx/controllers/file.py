@@ -10,10 +10,21 @@ class FileController(AssetsController):
 
 
 class FilesController(WebpageController):
+    # Number of files shown per page, three per row
+    pageSize = 60
+
+    def getPage(self):
+        try:
+            return max(int(self.request.query["page"][0]), 1) if "page" in self.request.query else 1
+        except ValueError:
+            return 1
+
     def template_variables(self):
         isimg = re.compile(r'.*\.(png|bmp|gif|jpg)$')
         issnd = re.compile(r'.*\.(mp3|wav)$')
-        files = Storage().getStoredFiles()
+        pages = max((Storage().countStoredFiles() + self.pageSize - 1) // self.pageSize, 1)
+        page  = min(self.getPage(), pages)
+        files = Storage().getStoredFiles((page - 1) * self.pageSize, self.pageSize)
         rows  = ""
 
         for i in range(len(files)):
@@ -41,8 +52,18 @@ class FilesController(WebpageController):
         if len(files) > 0 and len(files) % 3 != 0:
             rows += '</tr>\n'
 
+        # Link to neighboring pages
+        nav = ""
+        if page > 1:
+            nav += '<a href="?page=%d">&laquo; Newer</a> ' % (page - 1)
+        if pages > 1:
+            nav += 'Page %d of %d' % (page, pages)
+        if page < pages:
+            nav += ' <a href="?page=%d">Older &raquo;</a>' % (page + 1)
+
         variables = super().template_variables()
         variables["rows"] = rows
+        variables["pages"] = nav
         return variables
 
     def indexAction(self):
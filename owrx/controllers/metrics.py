@@ -1,5 +1,5 @@
 from . import Controller
-from owrx.metrics import CounterMetric, DirectMetric, Metrics
+from owrx.metrics import CounterMetric, DirectMetric, HistogramMetric, Metrics
 import json
 import re
 
@@ -15,15 +15,27 @@ class MetricsController(Controller):
 
         def prometheusFormat(key, metric):
             value = metric.getValue()
+            key = re.sub('[^a-zA-Z0-9:_]', '_', key)
             if isinstance(metric, CounterMetric):
                 key += "_total"
                 value = value["count"]
+            elif isinstance(metric, HistogramMetric):
+                lines = [
+                    '{key}_bucket{{le="{le}"}} {value}'.format(key=key, le=le, value=count)
+                    for le, count in value["buckets"].items()
+                ]
+                lines += [
+                    '{key}_bucket{{le="+Inf"}} {value}'.format(key=key, value=value["count"]),
+                    "{key}_sum {value}".format(key=key, value=value["sum"]),
+                    "{key}_count {value}".format(key=key, value=value["count"]),
+                ]
+                return "\n".join(lines)
             elif isinstance(metric, DirectMetric):
                 pass
             else:
                 raise ValueError("Unexpected metric type for metric {}".format(repr(metric)))
 
-            return "{key} {value}".format(key=re.sub('[^a-zA-Z0-9:_]', '_', key), value=value)
+            return "{key} {value}".format(key=key, value=value)
 
         data = ["# https://prometheus.io/docs/instrumenting/exposition_formats/"] + [
             prometheusFormat(k, v) for k, v in metrics.items()
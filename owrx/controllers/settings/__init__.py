@@ -111,12 +111,14 @@ class SettingsFormController(AuthorizationMixin, BreadcrumbMixin, WebpageControl
 
     def processData(self, data):
         config = self.getData()
-        for k, v in data.items():
-            if v is None:
-                if k in config:
-                    del config[k]
-            else:
-                config[k] = v
+        # fire a single change event for the whole form
+        with config.transaction():
+            for k, v in data.items():
+                if v is None:
+                    if k in config:
+                        del config[k]
+                else:
+                    config[k] = v
 
     def store(self):
         Config.get().store()
@@ -79,12 +79,25 @@ class GeneralSettingsController(SettingsFormController):
                     "Maximum number of files",
                     infotext="Number of received images and other files to keep.",
                 ),
+                NumberInput(
+                    "keep_files_size",
+                    "Maximum size of files",
+                    infotext="Total size of received images and other files to keep (0 for no limit).",
+                    append="MB",
+                ),
                 NumberInput(
                     "session_timeout",
                     "Session timeout",
                     infotext="Client session timeout in seconds (0 to disable timeout).",
                     append="secs",
                 ),
+                NumberInput(
+                    "client_lag_limit",
+                    "Client lag limit",
+                    infotext="Clients that cannot keep up with the data for longer than this will be disconnected. "
+                    + "Waterfall lines are skipped for lagging clients before that happens.",
+                    append="secs",
+                ),
                 TextInput(
                     "usage_policy_url",
                     "Usage policy URL",
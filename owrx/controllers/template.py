@@ -1,11 +1,13 @@
 from owrx.controllers import Controller
 from owrx.details import ReceiverDetails
 from string import Template
-import pkg_resources
 
 
 class TemplateController(Controller):
     def render_template(self, file, **vars):
+        # pkg_resources is slow to import, so it is only imported once the first page is requested
+        import pkg_resources
+
         file_content = pkg_resources.resource_string("htdocs", file).decode("utf-8")
         template = Template(file_content)
 
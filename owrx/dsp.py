@@ -1,21 +1,21 @@
 from owrx.source import SdrSourceEventClient, SdrSourceState, SdrClientClass
-from owrx.property import PropertyStack, PropertyLayer, PropertyValidator
+from owrx.property import PropertyStack, PropertyLayer, PropertyValidator, PropertyDeleted
 from owrx.property.validators import OrValidator, RegexValidator, BoolValidator
 from owrx.modes import Modes, DigitalMode
+from owrx.message import MessageReader
 from csdr.chain import Chain
 from csdr.chain.demodulator import BaseDemodulatorChain, FixedIfSampleRateChain, FixedAudioRateChain, HdAudio, SecondaryDemodulator, DialFrequencyReceiver, MetaProvider, SlotFilterChain, SecondarySelectorChain, DeemphasisTauChain, DemodulatorError
 from csdr.chain.selector import Selector, SecondarySelector
+from csdr.chain.channelizer import Channelizer
 from csdr.chain.clientaudio import ClientAudioChain
 from csdr.chain.fft import FftChain
 from csdr.chain.dummy import DummyDemodulator
 from pycsdr.modules import Buffer, Writer
 from pycsdr.types import Format
 from typing import Union, Optional
-from io import BytesIO
 from abc import ABC, abstractmethod
 import threading
 import re
-import pickle
 
 import logging
 
@@ -300,6 +300,9 @@ class ClientDemodulatorChain(Chain):
         self.sampleRate = sampleRate
         self.selector.setInputRate(sampleRate)
 
+    def setChannelizer(self, channelizer: Channelizer) -> None:
+        self.selector.setChannelizer(channelizer)
+
     def setPowerWriter(self, writer: Writer) -> None:
         self.selector.setPowerWriter(writer)
 
@@ -404,16 +407,255 @@ class ModulationValidator(OrValidator):
         super().__init__(BoolValidator(), RegexValidator(re.compile("^[a-z0-9]+$")))
 
 
-class DspManager(SdrSourceEventClient, ClientDemodulatorSecondaryDspEventClient):
+class OutputPump(object):
+    """
+    Reads one output buffer of a chain and hands the data to all clients using the chain, from a single thread. The
+    thread only runs while the output has clients and is active, i.e. while its part of the chain can produce data.
+    The callbacks must not block, or a single slow client holds up all the others.
+
+    Outputs carrying messages are split into messages (see owrx.message) before they are handed out, so every message
+    is only parsed and encoded for the clients once.
+    """
+
+    def __init__(self, name: str, buffer: Buffer, active: bool = True, messages: bool = False):
+        self.name = name
+        self.buffer = buffer
+        self.active = active
+        self.messages = messages
+        # replaced, never modified, so the pump thread can iterate without locking
+        self.callbacks = []
+        self.reader = None
+        self.lock = threading.Lock()
+
+    def add(self, callback):
+        with self.lock:
+            self.callbacks = self.callbacks + [callback]
+            self._update()
+
+    def remove(self, callback):
+        with self.lock:
+            self.callbacks = [c for c in self.callbacks if c is not callback]
+            self._update()
+
+    def setActive(self, active: bool):
+        with self.lock:
+            self.active = active
+            self._update()
+
+    def stop(self):
+        with self.lock:
+            self.callbacks = []
+            self._update()
+
+    def _update(self):
+        running = self.reader is not None
+        if self.active and self.callbacks and not running:
+            self.reader = self.buffer.getReader()
+            threading.Thread(target=self._pump, args=(self.reader,), name="dsp_pump_{}".format(self.name)).start()
+        elif running and not (self.active and self.callbacks):
+            self.reader.stop()
+            self.reader = None
+
+    def _pump(self, reader):
+        messages = MessageReader() if self.messages else None
+        while True:
+            data = None
+            try:
+                data = reader.read()
+            except ValueError:
+                pass
+            except BrokenPipeError:
+                break
+            if data is None or isinstance(data, bytes) and len(data) == 0:
+                break
+            for item in [data] if messages is None else messages.feed(data):
+                for callback in self.callbacks:
+                    try:
+                        callback(item)
+                    except Exception:
+                        logger.exception("error while writing %s output", self.name)
+
+
+class SharedChain(ClientDemodulatorSecondaryDspEventClient):
+    """
+    A running ClientDemodulatorChain together with its output buffers. All DspManagers using it read from the same
+    buffers, and secondary DSP events are forwarded to all of them.
+
+    The lock is held while the chain is reconfigured and while a user wires itself to the outputs, so users never see
+    a chain in the middle of a change.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self.chain = None
+        self.users = []
+        self.lock = threading.RLock()
+        # output type -> OutputPump
+        self.outputs = {}
+        # current audio mode. should be "audio" or "hd_audio" depending on what demodulatur is in use.
+        self.audioOutput = None
+        # last secondary dsp config sent, for clients that join later
+        self.secondaryDspConfig = {}
+        # error message if the demodulator could not be set up, for clients that join later
+        self.demodulatorError = None
+
+    def setOutput(self, t: str, buffer: Buffer):
+        previous = self.outputs.get(t)
+        self.outputs[t] = OutputPump(t, buffer, self._isActive(t), t in ["secondary_demod", "meta"])
+        for user in list(self.users):
+            user.wireOutput(t, self.outputs[t])
+        if previous is not None:
+            previous.stop()
+
+    def _isActive(self, t: str) -> bool:
+        if t == "meta":
+            return isinstance(self.chain.demodulator, MetaProvider)
+        if t in ["secondary_fft", "secondary_demod"]:
+            return self.chain.secondaryDemodulator is not None
+        return True
+
+    def updateOutputs(self):
+        """
+        Starts or stops reading outputs that the chain can only produce with certain demodulators.
+        """
+        for t, pump in self.outputs.items():
+            pump.setActive(self._isActive(t))
+
+    def setAudioOutput(self, t: str, buffer: Buffer):
+        for other in ["audio", "hd_audio"]:
+            if other != t and other in self.outputs:
+                for user in list(self.users):
+                    user.unwireOutput(other)
+                self.outputs.pop(other).stop()
+        self.audioOutput = t
+        self.setOutput(t, buffer)
+
+    def sendSecondaryDspConfig(self, config):
+        self.secondaryDspConfig.update(config)
+        for user in list(self.users):
+            user.handler.write_secondary_dsp_config(config)
+
+    def sendDemodulatorError(self, error: str):
+        self.demodulatorError = error
+        for user in list(self.users):
+            user.handler.write_demodulator_error(error)
+
+    def onSecondaryDspBandwidthChange(self, bw):
+        self.sendSecondaryDspConfig({"secondary_bw": bw})
+
+    def onSecondaryDspRateChange(self, rate):
+        self.sendSecondaryDspConfig({"if_samp_rate": rate})
+
+    def stop(self):
+        for pump in self.outputs.values():
+            pump.stop()
+        self.outputs = {}
+        if self.chain is not None:
+            self.chain.stop()
+            self.chain = None
+
+
+class ChainRegistry(object):
+    """
+    Keeps track of the running demodulator chains, so that clients listening to the same thing with the same
+    parameters can share a single chain.
+    """
+
+    sharedInstance = None
+    creationLock = threading.Lock()
+
+    @staticmethod
+    def getSharedInstance():
+        with ChainRegistry.creationLock:
+            if ChainRegistry.sharedInstance is None:
+                ChainRegistry.sharedInstance = ChainRegistry()
+        return ChainRegistry.sharedInstance
+
+    def __init__(self):
+        self.chains = {}
+        self.lock = threading.Lock()
+        from owrx.metrics import Metrics, DirectMetric
+
+        Metrics.getSharedInstance().addMetric("dsp.chains", DirectMetric(self.chainCount))
+
+    def chainCount(self):
+        return len(self.chains)
+
+    def acquire(self, key, user: "DspManager") -> SharedChain:
+        """
+        Returns the chain registered for the key, or a new one created by the user if there is none. Every chain
+        returned must be given back with release().
+        """
+        with self.lock:
+            shared = self.chains.get(key)
+            if shared is None:
+                shared = user.createChain(key)
+                self.chains[key] = shared
+            shared.users.append(user)
+            return shared
+
+    def release(self, shared: SharedChain, user: "DspManager"):
+        with self.lock:
+            if user in shared.users:
+                shared.users.remove(user)
+            if shared.users:
+                return
+            if self.chains.get(shared.key) is shared:
+                del self.chains[shared.key]
+        shared.stop()
+
+    def withdraw(self, shared: SharedChain, key) -> bool:
+        """
+        Takes a chain out of the registry, so that its only user can change its parameters in place before it is
+        published under the new key. Returns False if the chain has other users, or if there is a chain for the new key
+        already; the user should acquire() that instead.
+        """
+        with self.lock:
+            if len(shared.users) > 1 or key in self.chains:
+                return False
+            if self.chains.get(shared.key) is shared:
+                del self.chains[shared.key]
+            return True
+
+    def publish(self, shared: SharedChain, key) -> bool:
+        """
+        Registers a withdrawn chain under its new key. Returns False if a chain for that key has been set up in the
+        meantime; the user should acquire() that instead.
+        """
+        with self.lock:
+            shared.key = key
+            if key in self.chains:
+                return False
+            self.chains[key] = shared
+            return True
+
+
+class DspManager(SdrSourceEventClient):
+    # properties that set clients apart. clients that agree on all of them (and on the source) share a chain. all
+    # other properties are inherited from the sdr, so they are the same for all clients of a source anyway.
+    chainProperties = [
+        "output_rate",
+        "hd_output_rate",
+        "squelch_level",
+        "secondary_mod",
+        "low_cut",
+        "high_cut",
+        "offset_freq",
+        "mod",
+        "secondary_offset_freq",
+        "dmr_filter",
+        "nr_enabled",
+        "nr_threshold",
+        "start_mod",
+        "start_freq",
+    ]
+
     def __init__(self, handler, sdrSource):
         self.handler = handler
         self.sdrSource = sdrSource
 
         self.props = PropertyStack()
 
-        # current audio mode. should be "audio" or "hd_audio" depending on what demodulatur is in use.
-        self.audioOutput = None
-
         # local demodulator properties not forwarded to the sdr
         # ensure strict validation since these can be set from the client
         # and are used to build executable commands
@@ -462,7 +704,61 @@ class DspManager(SdrSourceEventClient, ClientDemodulatorSecondaryDspEventClient)
             ).readonly()
         )
 
-        self.chain = ClientDemodulatorChain(
+        # the chain is only set up on start(), when the client has sent its parameters, so it can join a running one
+        self.shared = None
+        # output type -> (OutputPump, callback)
+        self.outputs = {}
+        self.lock = threading.RLock()
+        # guards the outputs only, since they are rewired by whichever user of a shared chain changes it. never held
+        # while waiting for any other lock but those of the pumps.
+        self.outputLock = threading.Lock()
+
+        self.subscriptions = [self.props.wire(self._onPropertiesChanged)]
+
+        self.startOnAvailable = False
+
+        self.sdrSource.addClient(self)
+
+    @property
+    def chain(self) -> Optional[ClientDemodulatorChain]:
+        return None if self.shared is None else self.shared.chain
+
+    def _getChainKey(self):
+        return (self.sdrSource.getId(),) + tuple(
+            self.props[name] if name in self.props else None for name in DspManager.chainProperties
+        )
+
+    def _getSetters(self):
+        # in the order they need to be applied to a new chain
+        return {
+            "audio_compression": self.setAudioCompression,
+            "fft_compression": self.setSecondaryFftCompression,
+            "fft_voverlap_factor": self.chain.setSecondaryFftOverlapFactor,
+            "fft_fps": self.chain.setSecondaryFftFps,
+            "digimodes_fft_size": self.setSecondaryFftSize,
+            "samp_rate": self.chain.setSampleRate,
+            "output_rate": self.chain.setOutputRate,
+            "hd_output_rate": self.chain.setHdOutputRate,
+            "offset_freq": self.chain.setFrequencyOffset,
+            "center_freq": self.chain.setCenterFrequency,
+            "squelch_level": self.chain.setSquelchLevel,
+            "low_cut": self.chain.setLowCut,
+            "high_cut": self.chain.setHighCut,
+            "mod": self.setDemodulator,
+            "dmr_filter": self.chain.setSlotFilter,
+            "wfm_deemphasis_tau": self.chain.setWfmDeemphasisTau,
+            "secondary_mod": self.setSecondaryDemodulator,
+            "secondary_offset_freq": self.chain.setSecondaryFrequencyOffset,
+            "nr_enabled": self.chain.setNrEnabled,
+            "nr_threshold": self.chain.setNrThreshold,
+        }
+
+    def createChain(self, key) -> SharedChain:
+        """
+        Sets up a new chain from the current properties. Called by the ChainRegistry.
+        """
+        self.shared = SharedChain(key)
+        self.shared.chain = ClientDemodulatorChain(
             self._getDemodulator("nfm"),
             self.props["samp_rate"],
             self.props["output_rate"],
@@ -470,11 +766,9 @@ class DspManager(SdrSourceEventClient, ClientDemodulatorSecondaryDspEventClient)
             self.props["audio_compression"],
             self.props["nr_enabled"],
             self.props["nr_threshold"],
-            self
+            self.shared,
         )
 
-        self.readers = {}
-
         if "start_mod" in self.props:
             mode = Modes.findByModulation(self.props["start_mod"])
             if mode:
@@ -493,56 +787,84 @@ class DspManager(SdrSourceEventClient, ClientDemodulatorSecondaryDspEventClient)
         else:
             self.chain.setFrequencyOffset(0)
 
-        self.subscriptions = [
-            self.props.wireProperty("audio_compression", self.setAudioCompression),
-            self.props.wireProperty("fft_compression", self.setSecondaryFftCompression),
-            self.props.wireProperty("fft_voverlap_factor", self.chain.setSecondaryFftOverlapFactor),
-            self.props.wireProperty("fft_fps", self.chain.setSecondaryFftFps),
-            self.props.wireProperty("digimodes_fft_size", self.setSecondaryFftSize),
-            self.props.wireProperty("samp_rate", self.chain.setSampleRate),
-            self.props.wireProperty("output_rate", self.chain.setOutputRate),
-            self.props.wireProperty("hd_output_rate", self.chain.setHdOutputRate),
-            self.props.wireProperty("offset_freq", self.chain.setFrequencyOffset),
-            self.props.wireProperty("center_freq", self.chain.setCenterFrequency),
-            self.props.wireProperty("squelch_level", self.chain.setSquelchLevel),
-            self.props.wireProperty("low_cut", self.chain.setLowCut),
-            self.props.wireProperty("high_cut", self.chain.setHighCut),
-            self.props.wireProperty("mod", self.setDemodulator),
-            self.props.wireProperty("dmr_filter", self.chain.setSlotFilter),
-            self.props.wireProperty("wfm_deemphasis_tau", self.chain.setWfmDeemphasisTau),
-            self.props.wireProperty("secondary_mod", self.setSecondaryDemodulator),
-            self.props.wireProperty("secondary_offset_freq", self.chain.setSecondaryFrequencyOffset),
-            self.props.wireProperty("nr_enabled", self.chain.setNrEnabled),
-            self.props.wireProperty("nr_threshold", self.chain.setNrThreshold),
-        ]
+        for name, setter in self._getSetters().items():
+            if name in self.props:
+                setter(self.props[name])
 
         # wire power level output
         buffer = Buffer(Format.FLOAT)
         self.chain.setPowerWriter(buffer)
-        self.wireOutput("smeter", buffer)
+        self.shared.setOutput("smeter", buffer)
 
         # wire meta output
         buffer = Buffer(Format.CHAR)
         self.chain.setMetaWriter(buffer)
-        self.wireOutput("meta", buffer)
+        self.shared.setOutput("meta", buffer)
 
         # wire secondary FFT
         buffer = Buffer(self.chain.getSecondaryFftOutputFormat())
         self.chain.setSecondaryFftWriter(buffer)
-        self.wireOutput("secondary_fft", buffer)
+        self.shared.setOutput("secondary_fft", buffer)
 
         # wire secondary demodulator
         buffer = Buffer(Format.CHAR)
         self.chain.setSecondaryWriter(buffer)
-        self.wireOutput("secondary_demod", buffer)
-
-        self.startOnAvailable = False
-
-        self.sdrSource.addClient(self)
+        self.shared.setOutput("secondary_demod", buffer)
+
+        self.chain.setChannelizer(self.sdrSource.getChannelizer())
+        return self.shared
+
+    def _attach(self):
+        """
+        Joins the chain matching the current properties, or sets up a new one, and leaves the previous chain.
+        """
+        previous = self.shared
+        registry = ChainRegistry.getSharedInstance()
+        self.shared = registry.acquire(self._getChainKey(), self)
+        if previous is not None:
+            # once released, the previous chain doesn't rewire this user anymore
+            with previous.lock:
+                registry.release(previous, self)
+
+        with self.shared.lock:
+            for t in list(self.outputs.keys()):
+                if t not in self.shared.outputs:
+                    self.unwireOutput(t)
+            for t, pump in self.shared.outputs.items():
+                self.wireOutput(t, pump)
+            if self.shared.secondaryDspConfig:
+                self.handler.write_secondary_dsp_config(self.shared.secondaryDspConfig)
+            if self.shared.demodulatorError is not None:
+                self.handler.write_demodulator_error(self.shared.demodulatorError)
+
+    def _onPropertiesChanged(self, changes):
+        with self.lock:
+            if self.shared is None:
+                return
+            registry = ChainRegistry.getSharedInstance()
+            shared = self.shared
+            key = shared.key
+            if any(name in DspManager.chainProperties for name in changes):
+                key = self._getChainKey()
+            with shared.lock:
+                # retuning a shared chain would retune everybody else as well, so this client moves on
+                move = key != shared.key and not registry.withdraw(shared, key)
+                if not move:
+                    # a private chain can be changed in place. on shared chains, only properties of the sdr change,
+                    # and they change for all users alike.
+                    setters = self._getSetters()
+                    for name, value in changes.items():
+                        if name in setters and value is not PropertyDeleted:
+                            setters[name](value)
+                    # only now that it has been changed, others may join the chain with the new key
+                    if key != shared.key:
+                        move = not registry.publish(shared, key)
+            if move:
+                self._attach()
 
     def setSecondaryFftSize(self, size):
         self.chain.setSecondaryFftSize(size)
-        self.handler.write_secondary_dsp_config({"secondary_fft_size": size})
+        self.shared.sendSecondaryDspConfig({"secondary_fft_size": size})
 
     def _getDemodulator(self, demod: Union[str, BaseDemodulatorChain]) -> Optional[BaseDemodulatorChain]:
         if isinstance(demod, BaseDemodulatorChain):
@@ -587,6 +909,7 @@ class DspManager(SdrSourceEventClient, ClientDemodulatorSecondaryDspEventClient)
 
     def setDemodulator(self, mod):
         self.chain.stopDemodulator()
+        self.shared.demodulatorError = None
         try:
             demodulator = self._getDemodulator(mod)
             if demodulator is None:
@@ -595,14 +918,15 @@ class DspManager(SdrSourceEventClient, ClientDemodulatorSecondaryDspEventClient)
 
             output = "hd_audio" if isinstance(demodulator, HdAudio) else "audio"
 
-            if output != self.audioOutput:
-                self.audioOutput = output
+            if output != self.shared.audioOutput:
                 # re-wire the audio to the correct client API
                 buffer = Buffer(self.chain.getOutputFormat())
                 self.chain.setWriter(buffer)
-                self.wireOutput(self.audioOutput, buffer)
+                self.shared.setAudioOutput(output, buffer)
         except DemodulatorError as de:
-            self.handler.write_demodulator_error(str(de))
+            # new chains have no users yet, they get the error when they attach
+            self.shared.sendDemodulatorError(str(de))
+        self.shared.updateOutputs()
 
     def _getSecondaryDemodulator(self, mod) -> Optional[SecondaryDemodulator]:
         if isinstance(mod, SecondaryDemodulator):
@@ -670,6 +994,7 @@ class DspManager(SdrSourceEventClient, ClientDemodulatorSecondaryDspEventClient)
             self.chain.setSecondaryDemodulator(None)
         else:
             self.chain.setSecondaryDemodulator(demodulator)
+        self.shared.updateOutputs()
 
     def setAudioCompression(self, comp):
         try:
@@ -678,76 +1003,59 @@ class DspManager(SdrSourceEventClient, ClientDemodulatorSecondaryDspEventClient)
             # wrong output format... need to re-wire
             buffer = Buffer(self.chain.getOutputFormat())
             self.chain.setWriter(buffer)
-            self.wireOutput(self.audioOutput, buffer)
+            self.shared.setOutput(self.shared.audioOutput, buffer)
 
     def setSecondaryFftCompression(self, comp):
         # if it returns true, we need to re-wire a new output buffer
         if self.chain.setSecondaryFftCompression(comp):
             buffer = Buffer(self.chain.getSecondaryFftOutputFormat())
             self.chain.setSecondaryFftWriter(buffer)
-            self.wireOutput("secondary_fft", buffer)
+            self.shared.setOutput("secondary_fft", buffer)
 
     def start(self):
-        if self.sdrSource.isAvailable():
-            self.chain.setReader(self.sdrSource.getBuffer().getReader())
-        else:
-            self.startOnAvailable = True
+        with self.lock:
+            if self.shared is not None:
+                return
+            if self.sdrSource.isAvailable():
+                self._attach()
+            else:
+                self.startOnAvailable = True
 
     def unwireOutput(self, t: str):
-        if t in self.readers:
-            self.readers[t].stop()
-            del self.readers[t]
+        with self.outputLock:
+            if t in self.outputs:
+                pump, write = self.outputs.pop(t)
+                pump.remove(write)
 
-    def wireOutput(self, t: str, buffer: Buffer):
+    def wireOutput(self, t: str, pump: OutputPump):
         logger.debug("wiring new output of type %s", t)
         writers = {
             "audio": self.handler.write_dsp_data,
             "hd_audio": self.handler.write_hd_audio,
             "smeter": self.handler.write_s_meter_level,
             "secondary_fft": self.handler.write_secondary_fft,
-            "secondary_demod": self._unpickle(self.handler.write_secondary_demod),
-            "meta": self._unpickle(self.handler.write_metadata),
+            "secondary_demod": self.handler.write_secondary_demod,
+            "meta": self.handler.write_metadata,
         }
 
         write = writers[t]
 
-        self.unwireOutput(t)
-
-        reader = buffer.getReader()
-        self.readers[t] = reader
-        threading.Thread(target=self.chain.pump(reader.read, write), name="dsp_pump_{}".format(t)).start()
-
-    def _unpickle(self, callback):
-        def unpickler(data):
-            b = data.tobytes()
-            # If we know it's not pickled, let us not unpickle
-            if len(b) < 2 or b[0] != 0x80 or not 3 <= b[1] <= pickle.HIGHEST_PROTOCOL:
-                try:
-                    callback(b.decode("ascii"))
-                except Exception as e:
-                    logger.debug("Unpickler: %s" % e)
-                return
-
-            io = BytesIO(b)
-            try:
-                while True:
-                    callback(pickle.load(io))
-            except EOFError:
-                pass
-            except pickle.UnpicklingError:
-                callback(b.decode("ascii"))
-            except ValueError:
-                pass
-
-        return unpickler
+        with self.outputLock:
+            if t in self.outputs:
+                previous, previousWrite = self.outputs.pop(t)
+                previous.remove(previousWrite)
+            self.outputs[t] = (pump, write)
+            pump.add(write)
 
     def stop(self):
-        if self.chain:
-            self.chain.stop()
-            self.chain = None
-        for reader in self.readers.values():
-            reader.stop()
-        self.readers = {}
+        with self.lock:
+            if self.shared is not None:
+                # once released, the chain doesn't rewire this user anymore
+                with self.shared.lock:
+                    ChainRegistry.getSharedInstance().release(self.shared, self)
+                self.shared = None
+            for t in list(self.outputs.keys()):
+                self.unwireOutput(t)
 
         self.startOnAvailable = False
         self.sdrSource.removeClient(self)
@@ -768,9 +1076,10 @@ class DspManager(SdrSourceEventClient, ClientDemodulatorSecondaryDspEventClient)
     def onStateChange(self, state: SdrSourceState):
         if state is SdrSourceState.RUNNING:
             logger.debug("received STATE_RUNNING, attempting DspSource restart")
-            if self.startOnAvailable:
-                self.chain.setReader(self.sdrSource.getBuffer().getReader())
-                self.startOnAvailable = False
+            with self.lock:
+                if self.startOnAvailable:
+                    self.startOnAvailable = False
+                    self._attach()
         elif state is SdrSourceState.STOPPING:
             logger.debug("received STATE_STOPPING, shutting down DspSource")
             self.stop()
@@ -781,9 +1090,3 @@ class DspManager(SdrSourceEventClient, ClientDemodulatorSecondaryDspEventClient)
 
     def onShutdown(self):
         self.stop()
-
-    def onSecondaryDspBandwidthChange(self, bw):
-        self.handler.write_secondary_dsp_config({"secondary_bw": bw})
-
-    def onSecondaryDspRateChange(self, rate):
-        self.handler.write_secondary_dsp_config({"if_samp_rate": rate})
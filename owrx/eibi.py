@@ -1,6 +1,8 @@
 from owrx.config.core import CoreConfig
+from owrx.compact import CompactTable
 from datetime import datetime
-from json import JSONEncoder
+from bisect import bisect_left, bisect_right
+from itertools import compress
 
 import urllib
 import threading
@@ -14,9 +16,141 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 
-class MyJSONEncoder(JSONEncoder):
-    def default(self, obj):
-        return obj.toJSON()
+class ScheduleIndex(object):
+    """
+    Compiled form of the schedule, for lookups by frequency and time.
+
+    Entries are sorted by frequency, so a frequency range is a slice found by bisection. The activity of all entries at
+    any minute of the week is a bitmap, bit i standing for the i-th entry in frequency order. Bitmaps only change when
+    a broadcast starts or ends, so one bitmap is stored per such segment of the week.
+
+    The index is compiled from the columns of the schedule only, so entries of a CompactTable are materialized when
+    they are returned by a lookup.
+    """
+
+    minutesPerDay = 24 * 60
+    minutesPerWeek = 7 * minutesPerDay
+    flagTable = bytes.maketrans(b"01", b"\0\1")
+
+    def __init__(self, schedule):
+        self.schedule = schedule
+        if isinstance(schedule, CompactTable):
+            columns = {name: schedule.getColumn(name) for name in ["freq", "time1", "time2", "days", "itu", "src"]}
+        else:
+            columns = {name: [e[name] for e in schedule] for name in ["freq", "time1", "time2", "days", "itu", "src"]}
+        freqs = columns["freq"]
+        # position in frequency order -> position in the schedule. cached schedules are stored in frequency order.
+        self.order = sorted(range(len(schedule)), key=freqs.__getitem__)
+        self.freqs = [freqs[i] for i in self.order]
+        self.times = [(columns["time1"][i], columns["time2"][i]) for i in self.order]
+        self.sources = {}
+        for i, k in enumerate(self.order):
+            self.sources.setdefault(columns["itu"][k] + columns["src"][k], []).append(i)
+
+        # most entries share their times with others, so they are toggled together
+        groups = {}
+        for i, k in enumerate(self.order):
+            key = (columns["time1"][k], columns["time2"][k], columns["days"][k])
+            groups[key] = groups.get(key, 0) | (1 << i)
+
+        # minute of the week -> bits of the entries starting or ending at that minute
+        toggles = {0: 0}
+        for key, bits in groups.items():
+            for start, end in ScheduleIndex._getIntervals(*key):
+                toggles[start] = toggles.get(start, 0) ^ bits
+                if end < ScheduleIndex.minutesPerWeek:
+                    toggles[end] = toggles.get(end, 0) ^ bits
+
+        self.segments = sorted(toggles.keys())
+        self.bitmaps = []
+        bitmap = 0
+        for minute in self.segments:
+            bitmap ^= toggles[minute]
+            self.bitmaps.append(bitmap)
+
+    @staticmethod
+    def _toMinutes(hhmm: int):
+        return min(hhmm // 100 * 60 + hhmm % 100, ScheduleIndex.minutesPerDay)
+
+    @staticmethod
+    def _getIntervals(time1: int, time2: int, days: str):
+        """
+        Returns the non-overlapping intervals [start, end) in minutes of the week that an entry is on air.
+        """
+        start = ScheduleIndex._toMinutes(time1)
+        end = ScheduleIndex._toMinutes(time2)
+        if end <= start:
+            # broadcasts past midnight continue on the next day, equal times mean all day
+            end += ScheduleIndex.minutesPerDay
+        intervals = []
+        for day, c in enumerate(days[:7]):
+            if c == ".":
+                continue
+            offset = day * ScheduleIndex.minutesPerDay
+            if offset + end > ScheduleIndex.minutesPerWeek:
+                # Sunday night continues on Monday morning
+                intervals.append((0, offset + end - ScheduleIndex.minutesPerWeek))
+                intervals.append((offset + start, ScheduleIndex.minutesPerWeek))
+            else:
+                intervals.append((offset + start, offset + end))
+
+        # merge overlapping and adjacent intervals, so that toggling bits on their bounds is correct
+        result = []
+        for start, end in sorted(intervals):
+            if result and start <= result[-1][1]:
+                result[-1] = (result[-1][0], max(result[-1][1], end))
+            else:
+                result.append((start, end))
+        return result
+
+    @staticmethod
+    def getMinuteOfWeek(now: datetime = None):
+        if now is None:
+            now = datetime.utcnow()
+        return now.weekday() * ScheduleIndex.minutesPerDay + now.hour * 60 + now.minute
+
+    def getBitmap(self, minute: int):
+        return self.bitmaps[bisect_right(self.segments, minute % ScheduleIndex.minutesPerWeek) - 1]
+
+    def _getRange(self, freq1: int, freq2: int):
+        return bisect_left(self.freqs, freq1), bisect_right(self.freqs, freq2)
+
+    @staticmethod
+    def _getFlags(bits: int, length: int):
+        # one byte per bit, lowest bit first. much faster than testing bits one by one on large ints.
+        return format(bits, "0{0}b".format(length))[::-1].encode().translate(ScheduleIndex.flagTable)
+
+    def findActive(self, freq1: int, freq2: int, minute: int):
+        lo, hi = self._getRange(freq1, freq2)
+        if lo >= hi:
+            return []
+        bits = (self.getBitmap(minute) >> lo) & ((1 << (hi - lo)) - 1)
+        return [self.schedule[k] for k in compress(self.order[lo:hi], ScheduleIndex._getFlags(bits, hi - lo))]
+
+    def findBySource(self, src: str, minute: int):
+        flags = ScheduleIndex._getFlags(self.getBitmap(minute), len(self.order))
+        return [self.schedule[self.order[i]] for i in self.sources.get(src, []) if flags[i]]
+
+    def find(self, freq1: int, freq2: int, time1: int, time2: int):
+        lo, hi = self._getRange(freq1, freq2)
+        return [
+            self.schedule[self.order[i]]
+            for i in range(lo, hi)
+            if self.times[i][0] <= time2 and self.times[i][1] > time1
+        ]
+
+
+class EIBISubscription(object):
+    def __init__(self, subscriptee, range, subscriber: callable):
+        self.subscriptee = subscriptee
+        self.range = range
+        self.subscriber = subscriber
+
+    def call(self, *args, **kwargs):
+        self.subscriber(*args, **kwargs)
+
+    def cancel(self):
+        self.subscriptee.unsubscribe(self)
 
 
 class EIBI(object):
@@ -40,6 +174,12 @@ class EIBI(object):
 
     @staticmethod
     def _getCachedScheduleFile():
+        coreConfig = CoreConfig()
+        return "{data_directory}/eibi.cache".format(data_directory=coreConfig.get_data_directory())
+
+    @staticmethod
+    def _getLegacyScheduleFile():
+        # schedules used to be cached as JSON
         coreConfig = CoreConfig()
         return "{data_directory}/eibi.json".format(data_directory=coreConfig.get_data_directory())
 
@@ -47,10 +187,16 @@ class EIBI(object):
         self.refreshPeriod = 60*60*24*30
         self.event = threading.Event()
         self.schedule = []
+        self.index = ScheduleIndex([])
         self.thread = None
+        self.subscriptions = []
+        # frequency range -> entries on air in that range, as of the last minute rollover
+        self.onAir = {}
+        self.minute = None
+        self.lock = threading.Lock()
 
     def toJSON(self):
-        return self.schedule
+        return list(self.schedule)
 
     # Start the main thread
     def startThread(self):
@@ -73,32 +219,97 @@ class EIBI(object):
         file = self._getCachedScheduleFile()
         ts   = os.path.getmtime(file) if os.path.isfile(file) else 0
 
+        # Legacy caches have wrong days of the week, so they are only
+        # used, with all days active, if the schedule can't be scraped
+        if ts == 0 and os.path.isfile(self._getLegacyScheduleFile()):
+            legacy   = self.loadSchedule(self._getLegacyScheduleFile())
+            schedule = self.updateSchedule()
+            self.setSchedule(schedule if schedule else [dict(e, days="1234567") for e in legacy])
         # Try loading cached schedule from file first, unless stale
-        if time.time() - ts < self.refreshPeriod:
+        elif time.time() - ts < self.refreshPeriod:
             logger.debug("Loading cached schedule from '{0}'...".format(file))
-            self.schedule = self.loadSchedule(file)
+            self.setSchedule(self.loadSchedule(file))
         else:
-            self.schedule = self.updateSchedule()
+            self.setSchedule(self.updateSchedule())
+        nextRefresh = time.time() + self.refreshPeriod
 
         while not self.event.is_set():
-            # Sleep until it is time to update schedule
-            self.event.wait(self.refreshPeriod)
+            # Sleep until the next minute starts, or until it is time to update schedule
+            now = time.time()
+            self.event.wait(max(0, min(60 - now % 60, nextRefresh - now)))
             # If not terminated yet...
-            if not self.event.is_set():
+            if self.event.is_set():
+                break
+            if time.time() >= nextRefresh:
                 # Update schedule
                 logger.debug("Refreshing schedule...")
-                self.schedule = self.updateSchedule()
+                self.setSchedule(self.updateSchedule())
+                nextRefresh = time.time() + self.refreshPeriod
+            else:
+                self.updateOnAir()
 
         # Done
         logger.debug("Stopped EIBI main thread.")
         self.thread = None
 
-    # Load schedule from a given JSON file
+    # Replace schedule and compile it for lookups
+    def setSchedule(self, schedule):
+        self.index = ScheduleIndex(schedule)
+        self.schedule = schedule
+        self.updateOnAir(force=True)
+
+    # Recompute on-air lists of all subscribed ranges, notify subscribers of changes
+    def updateOnAir(self, force: bool = False):
+        minute = ScheduleIndex.getMinuteOfWeek()
+        with self.lock:
+            if minute == self.minute and not force:
+                return
+            self.minute = minute
+            subscriptions = self.subscriptions.copy()
+            previous = self.onAir
+            ranges = {sub.range for sub in subscriptions}
+            self.onAir = {r: self.index.findActive(*r, minute) for r in ranges}
+        for sub in subscriptions:
+            if self.onAir.get(sub.range) != previous.get(sub.range):
+                try:
+                    sub.call(self.onAir[sub.range])
+                except Exception:
+                    logger.exception("Error while calling EIBI subscriptions")
+
+    # Get entries currently on air within given frequency range
+    def getOnAir(self, range):
+        with self.lock:
+            if range in self.onAir:
+                return self.onAir[range]
+            result = self.index.findActive(*range, ScheduleIndex.getMinuteOfWeek())
+            # only keep lists that are updated on minute rollover
+            if any(sub.range == range for sub in self.subscriptions):
+                self.onAir[range] = result
+            return result
+
+    # Subscribe to changes of the on-air list within given frequency range
+    def subscribe(self, range, callback):
+        sub = EIBISubscription(self, range, callback)
+        with self.lock:
+            self.subscriptions.append(sub)
+        return sub
+
+    def unsubscribe(self, subscription: EIBISubscription):
+        with self.lock:
+            if subscription in self.subscriptions:
+                self.subscriptions.remove(subscription)
+            if not any(sub.range == subscription.range for sub in self.subscriptions):
+                self.onAir.pop(subscription.range, None)
+
+    # Load schedule from a given compact or JSON file
     def loadSchedule(self, fileName: str):
         try:
-            with open(fileName, "r") as f:
-                result = json.load(f)
-                f.close()
+            if CompactTable.isCompact(fileName):
+                result = CompactTable.load(fileName)
+            else:
+                with open(fileName, "r") as f:
+                    result = json.load(f)
+                    f.close()
         except Exception as e:
             logger.debug("loadSchedule() exception: {0}".format(e))
             result = []
@@ -111,46 +322,34 @@ class EIBI(object):
         logger.debug("Scraping EIBI website...")
         file     = self._getCachedScheduleFile()
         schedule = self.scrape()
+        # Keep the cached schedule if scraping failed
+        if not schedule:
+            return schedule
         # Save parsed data into a file
         logger.debug("Saving {0} schedule entries to '{1}'...".format(len(schedule), file))
         try:
-            with open(file, "w") as f:
-                json.dump(schedule, f, cls=MyJSONEncoder, indent=2)
-                f.close()
+            # Stored in frequency order, so the index does not need to reorder it
+            CompactTable.store(file, sorted(schedule, key=lambda e: e["freq"]))
+            # Continue with the mapped file, so that only the entries actually looked up stay in memory
+            schedule = CompactTable.load(file)
+            if os.path.isfile(self._getLegacyScheduleFile()):
+                os.remove(self._getLegacyScheduleFile())
         except Exception as e:
             logger.debug("updateSchedule() exception: {0}".format(e))
         # Done
         return schedule
 
     def findBySource(self, src: str):
-        # Get entries active at the current time
-        now = datetime.utcnow()
-        now = now.hour * 100 + now.minute
-        result = []
-        # Search for entries originating from given source at current time
-        for entry in self.schedule:
-            if entry["time1"] <= now and entry["time2"] > now:
-                if entry["itu"] + entry["src"] == src:
-                    result.append(entry)
-        # Done
-        return result
+        # Get entries originating from given source, active at the current time
+        return self.index.findBySource(src, ScheduleIndex.getMinuteOfWeek())
 
     def findCurrent(self, freq1: int, freq2: int):
-        # Get entries active at the current time
-        now = datetime.utcnow()
-        now = now.hour * 100 + now.minute
-        return self.find(freq1, freq2, now, now)
+        # Get entries within given frequency range, active at the current time
+        return self.index.findActive(freq1, freq2, ScheduleIndex.getMinuteOfWeek())
 
     def find(self, freq1: int, freq2: int, time1: int, time2: int):
-        result = []
         # Search for entries within given frequency and time ranges
-        for entry in self.schedule:
-            f = entry["freq"]
-            if f >= freq1 and f <= freq2:
-                if entry["time1"] <= time2 and entry["time2"] > time1:
-                    result.append(entry)
-        # Done
-        return result
+        return self.index.find(freq1, freq2, time1, time2)
 
     def convertDays(self, days: str):
         # Replace day names with digits, remove commas
@@ -161,29 +360,31 @@ class EIBI(object):
         days = re.sub("Fr", "5", days)
         days = re.sub("Sa", "6", days)
         days = re.sub("Su", "7", days)
-        days = re.sub(r"[^0-9\-]", "", days)
-        # Empty strings mean every day of the week
-        if days == "":
+        # Dates and irregular schedules (15Mar, irr) mean every day
+        if re.search(r"[^1-7\-,]", days):
             return "1234567"
-        # Parse input string
-        span = True
-        curr = 1
-        out  = ""
-        for j in range(len(days)):
-            if days[j] == "-":
-                span = True
+        days = re.sub(",", "", days)
+        # Parse input string, collecting single days and day ranges
+        active = set()
+        prev   = None
+        span   = False
+        for c in days:
+            if c == "-":
+                span = prev is not None
             else:
-                next = int(days[j])
-                while curr < next:
-                  out  += str(curr) if span else "."
-                  curr += 1
+                curr = int(c)
+                # Ranges may wrap around the end of the week (Sa-Mo)
+                while span and prev != curr:
+                    active.add(prev)
+                    prev = prev % 7 + 1
+                active.add(curr)
+                prev = curr
                 span = False
-        # Add final days
-        while curr < 8:
-            out  += str(curr) if span else "."
-            curr += 1
+        # Empty strings mean every day of the week
+        if not active:
+            return "1234567"
         # Done
-        return out
+        return "".join(str(d) if d in active else "." for d in range(1, 8))
 
     def scrape(self, url: str = "http://www.eibispace.de/dx/sked-a23.csv"):
         result = []
@@ -219,4069 +420,10 @@ class EIBI(object):
         return result
 
 
-#
-# Country Codes
-#
-EIBI_Countries = {
-  "ABW": "Aruba",
-  "AFG": "Afghanistan",
-  "AFS": "South Africa",
-  "AGL": "Angola",
-  "AIA": "Anguilla",
-  "ALB": "Albania",
-  "ALG": "Algeria",
-  "ALS": "Alaska",
-  "AMS": "Saint Paul & Amsterdam Is.",
-  "AND": "Andorra",
-  "AOE": "Western Sahara",
-  "ARG": "Argentina",
-  "ARM": "Armenia",
-  "ARS": "Saudi Arabia",
-  "ASC": "Ascension Island",
-  "ATA": "Antarctica",
-  "ATG": "Antigua and Barbuda",
-  "ATN": "Netherlands Leeward Antilles (dissolved in 2010)",
-  "AUS": "Australia",
-  "AUT": "Austria",
-  "AZE": "Azerbaijan",
-  "AZR": "Azores",
-  "B":   "Brasil",
-  "BAH": "Bahamas",
-  "BDI": "Burundi",
-  "BEL": "Belgium",
-  "BEN": "Benin",
-  "BER": "Bermuda",
-  "BES": "Bonaire, St Eustatius, Saba (Dutch islands in the Caribbean)",
-  "BFA": "Burkina Faso",
-  "BGD": "Bangla Desh",
-  "BHR": "Bahrain",
-  "BIH": "Bosnia-Herzegovina",
-  "BIO": "Chagos Is. (Diego Garcia) (British Indian Ocean Territory)",
-  "BLM": "Saint-Barthelemy",
-  "BLR": "Belarus",
-  "BLZ": "Belize",
-  "BOL": "Bolivia",
-  "BOT": "Botswana",
-  "BRB": "Barbados",
-  "BRU": "Brunei Darussalam",
-  "BTN": "Bhutan",
-  "BUL": "Bulgaria",
-  "BVT": "Bouvet",
-  "CAB": "Cabinda *",
-  "CAF": "Central African Republic",
-  "CAN": "Canada",
-  "CBG": "Cambodia",
-  "CEU": "Ceuta *",
-  "CG7": "Guantanamo Bay",
-  "CHL": "Chile",
-  "CHN": "China (People's Republic)",
-  "CHR": "Christmas Island (Indian Ocean)",
-  "CKH": "Cook Island",
-  "CLA": "Clandestine stations *",
-  "CLM": "Colombia",
-  "CLN": "Sri Lanka",
-  "CME": "Cameroon",
-  "CNR": "Canary Islands",
-  "COD": "Democratic Republic of Congo (capital Kinshasa)",
-  "COG": "Republic of Congo (capital Brazzaville)",
-  "COM": "Comores",
-  "CPT": "Clipperton",
-  "CPV": "Cape Verde Islands",
-  "CRO": "Crozet Archipelago",
-  "CTI": "Ivory Coast (Côte d'Ivoire)",
-  "CTR": "Costa Rica",
-  "CUB": "Cuba",
-  "CUW": "Curacao",
-  "CVA": "Vatican State",
-  "CYM": "Cayman Islands",
-  "CYP": "Cyprus",
-  "CZE": "Czech Republic",
-  "D":   "Germany",
-  "DJI": "Djibouti",
-  "DMA": "Dominica",
-  "DNK": "Denmark",
-  "DOM": "Dominican Republic",
-  "E":   "Spain",
-  "EGY": "Egypt",
-  "EQA": "Ecuador",
-  "ERI": "Eritrea",
-  "EST": "Estonia",
-  "ETH": "Ethiopia",
-  "EUR": "Iles Europe & Bassas da India *",
-  "F":   "France",
-  "FIN": "Finland",
-  "FJI": "Fiji",
-  "FLK": "Falkland Islands",
-  "FRO": "Faroe Islands",
-  "FSM": "Federated States of Micronesia",
-  "G":   "United Kingdom of Great Britain and Northern Ireland",
-  "GAB": "Gabon",
-  "GEO": "Georgia",
-  "GHA": "Ghana",
-  "GIB": "Gibraltar",
-  "GLP": "Guadeloupe",
-  "GMB": "Gambia",
-  "GNB": "Guinea-Bissau",
-  "GNE": "Equatorial Guinea",
-  "GPG": "Galapagos *",
-  "GRC": "Greece",
-  "GRD": "Grenada",
-  "GRL": "Greenland",
-  "GTM": "Guatemala",
-  "GUF": "French Guyana",
-  "GUI": "Guinea",
-  "GUM": "Guam / Guahan",
-  "GUY": "Guyana",
-  "HKG": "Hong Kong, part of China",
-  "HMD": "Heard & McDonald Islands",
-  "HND": "Honduras",
-  "HNG": "Hungary",
-  "HOL": "The Netherlands",
-  "HRV": "Croatia",
-  "HTI": "Haiti",
-  "HWA": "Hawaii",
-  "HWL": "Howland & Baker",
-  "I":   "Italy",
-  "ICO": "Cocos (Keeling) Island",
-  "IND": "India",
-  "INS": "Indonesia",
-  "IRL": "Ireland",
-  "IRN": "Iran",
-  "IRQ": "Iraq",
-  "ISL": "Iceland",
-  "ISR": "Israel",
-  "IW":  "International Waters",
-  "IWA": "Ogasawara (Bonin, Iwo Jima) *",
-  "J":   "Japan",
-  "JAR": "Jarvis Island",
-  "JDN": "Juan de Nova *",
-  "JMC": "Jamaica",
-  "JMY": "Jan Mayen *",
-  "JON": "Johnston Island",
-  "JOR": "Jordan",
-  "JUF": "Juan Fernandez Island *",
-  "KAL": "Kaliningrad *",
-  "KAZ": "Kazakstan / Kazakhstan",
-  "KEN": "Kenya",
-  "KER": "Kerguelen",
-  "KGZ": "Kyrgyzstan",
-  "KIR": "Kiribati",
-  "KNA": "St Kitts and Nevis",
-  "KOR": "Korea, South (Republic)",
-  "KOS": "Kosovo",
-  "KRE": "Korea, North (Democratic People's Republic)",
-  "KWT": "Kuwait",
-  "LAO": "Laos",
-  "LBN": "Lebanon",
-  "LBR": "Liberia",
-  "LBY": "Libya",
-  "LCA": "Saint Lucia",
-  "LIE": "Liechtenstein",
-  "LSO": "Lesotho",
-  "LTU": "Lithuania",
-  "LUX": "Luxembourg",
-  "LVA": "Latvia",
-  "MAC": "Macao",
-  "MAF": "St Martin",
-  "MAU": "Mauritius",
-  "MCO": "Monaco",
-  "MDA": "Moldova",
-  "MDG": "Madagascar",
-  "MDR": "Madeira",
-  "MDW": "Midway Islands",
-  "MEL": "Melilla *",
-  "MEX": "Mexico",
-  "MHL": "Marshall Islands",
-  "MKD": "Macedonia (F.Y.R.)",
-  "MLA": "Malaysia",
-  "MLD": "Maldives",
-  "MLI": "Mali",
-  "MLT": "Malta",
-  "MNE": "Montenegro",
-  "MNG": "Mongolia",
-  "MOZ": "Mozambique",
-  "MRA": "Northern Mariana Islands",
-  "MRC": "Morocco",
-  "MRN": "Marion & Prince Edward Islands",
-  "MRT": "Martinique",
-  "MSR": "Montserrat",
-  "MTN": "Mauritania",
-  "MWI": "Malawi",
-  "MYA": "Myanmar (Burma) (also BRM)",
-  "MYT": "Mayotte",
-  "NCG": "Nicaragua",
-  "NCL": "New Caledonia",
-  "NFK": "Norfolk Island",
-  "NGR": "Niger",
-  "NIG": "Nigeria",
-  "NIU": "Niue",
-  "NMB": "Namibia",
-  "NOR": "Norway",
-  "NPL": "Nepal",
-  "NRU": "Nauru",
-  "NZL": "New Zealand",
-  "OCE": "French Polynesia",
-  "OMA": "Oman",
-  "PAK": "Pakistan",
-  "PAQ": "Easter Island",
-  "PHL": "Philippines",
-  "PHX": "Phoenix Is.",
-  "PLM": "Palmyra Island",
-  "PLW": "Palau",
-  "PNG": "Papua New Guinea",
-  "PNR": "Panama",
-  "POL": "Poland",
-  "POR": "Portugal",
-  "PRG": "Paraguay",
-  "PRU": "Peru",
-  "PRV": "Okino-Tori-Shima (Parece Vela) *",
-  "PSE": "Palestine",
-  "PTC": "Pitcairn",
-  "PTR": "Puerto Rico",
-  "QAT": "Qatar",
-  "REU": "La Réunion",
-  "ROD": "Rodrigues",
-  "ROU": "Romania",
-  "RRW": "Rwanda",
-  "RUS": "Russian Federation",
-  "S":   "Sweden",
-  "SAP": "San Andres & Providencia *",
-  "SDN": "Sudan",
-  "SEN": "Senegal",
-  "SEY": "Seychelles",
-  "SGA": "South Georgia Islands *",
-  "SHN": "Saint Helena",
-  "SLM": "Solomon Islands",
-  "SLV": "El Salvador",
-  "SMA": "Samoa (American)",
-  "SMO": "Samoa",
-  "SMR": "San Marino",
-  "SNG": "Singapore",
-  "SOK": "South Orkney Islands *",
-  "SOM": "Somalia",
-  "SPM": "Saint Pierre et Miquelon",
-  "SRB": "Serbia",
-  "SRL": "Sierra Leone",
-  "SSD": "South Sudan",
-  "SSI": "South Sandwich Islands *",
-  "STP": "Sao Tome & Principe",
-  "SUI": "Switzerland",
-  "SUR": "Suriname",
-  "SVB": "Svalbard *",
-  "SVK": "Slovakia",
-  "SVN": "Slovenia",
-  "SWZ": "Swaziland",
-  "SXM": "Sint Maarten",
-  "SYR": "Syria",
-  "TCA": "Turks and Caicos Islands",
-  "TCD": "Tchad",
-  "TGO": "Togo",
-  "THA": "Thailand",
-  "TJK": "Tajikistan",
-  "TKL": "Tokelau",
-  "TKM": "Turkmenistan",
-  "TLS": "Timor-Leste",
-  "TON": "Tonga",
-  "TRC": "Tristan da Cunha",
-  "TRD": "Trinidad and Tobago",
-  "TUN": "Tunisia",
-  "TUR": "Turkey",
-  "TUV": "Tuvalu",
-  "TWN": "Taiwan *",
-  "TZA": "Tanzania",
-  "UAE": "United Arab Emirates",
-  "UGA": "Uganda",
-  "UKR": "Ukraine",
-  "UN":  "United Nations *",
-  "URG": "Uruguay",
-  "USA": "United States of America",
-  "UZB": "Uzbekistan",
-  "VCT": "Saint Vincent and the Grenadines",
-  "VEN": "Venezuela",
-  "VIR": "American Virgin Islands",
-  "VRG": "British Virgin Islands",
-  "VTN": "Vietnam",
-  "VUT": "Vanuatu",
-  "WAK": "Wake Island",
-  "WAL": "Wallis and Futuna",
-  "XBY": "Abyei area",
-  "XGZ": "Gaza strip",
-  "XSP": "Spratly Islands",
-  "XUU": "Unidentified",
-  "XWB": "West Bank",
-  "YEM": "Yemen",
-  "ZMB": "Zambia",
-  "ZWE": "Zimbabwe"
-}
-
-#
-# Languages
-#
-EIBI_Languages = {
-  "-CW": { "name": "Morse Station" },
-  "-EC": { "name": "Empty Carrier" },
-  "-HF": { "name": "HFDL Squitter (Aircraft comms station)" },
-  "-MX": { "name": "Music" },
-  "-TS": { "name": "Time Signal Station" },
-  "-TY": { "name": "Teletype or other digital Station (RTTY/SITOR/..)" },
-  "A":   { "name": "Arabic (300m)", "code": "arb" },
-  "AB":  { "name": "Abkhaz: Georgia-Abkhazia (0.1m)", "code": "abk" },
-  "AC":  { "name": "Aceh: Indonesia-Sumatera (3m)", "code": "ace" },
-  "ACH": { "name": "Achang / Ngac'ang: Myanmar, South China (60,000)", "code": "acn" },
-  "AD":  { "name": "Adygea / Adyghe / Circassian: Russia-Caucasus (0.5m)", "code": "ady" },
-  "ADI": { "name": "Adi: India-Assam,Arunachal Pr. (0.1m)", "code": "adi" },
-  "AF":  { "name": "Afrikaans: South Africa, Namibia (5m)", "code": "afr" },
-  "AFA": { "name": "Afar: Djibouti (0.3m), Ethiopia (0.45m), Eritrea (0.3m)", "code": "aar" },
-  "AFG": { "name": "Pashto and Dari (main Afghan languages, see there)" },
-  "AH":  { "name": "Amharic: Ethiopia (22m)", "code": "amh" },
-  "AJ":  { "name": "Adja / Aja-Gbe: Benin, Togo (0.5m)", "code": "ajg" },
-  "AK":  { "name": "Akha: Burma (0.2m), China-Yunnan (0.13m)", "code": "ahk" },
-  "AKL": { "name": "Aklanon: Philippines-Visayas (0.5m)", "code": "akl" },
-  "AL":  { "name": "Albanian: Albania (Tosk)(3m), Macedonia/Yugoslavia (Gheg)(2m)", "code": "sqi" },
-  "ALG": { "name": "Algerian (Arabic): Algeria (28m)", "code": "arq" },
-  "AM":  { "name": "Amoy: S China (25m), Taiwan (15m), SoEaAsia (5m); dialect of Minnan", "code": "nan" },
-  "AMD": { "name": "Tibetan Amdo (Tibet, Qinghai, Gansu, Sichuan: 2m)", "code": "adx" },
-  "Ang": { "name": "Angelus programme of Vatican Radio" },
-  "AR":  { "name": "Armenian: Armenia (3m), USA (1m), RUS,GEO,SYR,LBN,IRN,EGY", "code": "hye" },
-  "ARO": { "name": "Aromanian/Vlach: Greece, Albania, Macedonia (0.1m)", "code": "rup" },
-  "ARU": { "name": "Languages of Arunachal, India (collectively)" },
-  "ASS": { "name": "Assamese: India-Assam (13m)", "code": "asm" },
-  "ASY": { "name": "Assyrian/Syriac/Neo-Aramaic: Iraq, Iran, Syria (0.2m)", "code": "aii" },
-  "ATS": { "name": "Atsi / Zaiwa: Myanmar (13,000), China-Yunnan (70,000)", "code": "atb" },
-  "Aud": { "name": "Papal Audience (Vatican Radio)" },
-  "AV":  { "name": "Avar: Dagestan, S Russia (0.7m)", "code": "ava" },
-  "AW":  { "name": "Awadhi: N&Ce India (3m)", "code": "awa" },
-  "AY":  { "name": "Aymara: Bolivia (2m)", "code": "ayr" },
-  "AZ":  { "name": "Azeri/Azerbaijani: Azerbaijan (6m)", "code": "azj" },
-  "BAD": { "name": "Badaga: India-Tamil Nadu (0.13m)", "code": "bfq" },
-  "BAG": { "name": "Bagri: India-Punjab (0.6m), Pakistan (0.2m)", "code": "bgq" },
-  "BAI": { "name": "Bai: China-Yunnan (1.2m)", "code": "bca" },
-  "BAJ": { "name": "Bajau: Malaysia-Sabah (50,000)", "code": "bdr" },
-  "BAL": { "name": "Balinese: Indonesia-Bali (3m)", "code": "ban" },
-  "BAN": { "name": "Banjar/Banjarese: Indonesia-Kalimantan (3.5m)", "code": "bjn" },
-  "BAO": { "name": "Baoulé: Cote d'Ivoire (2m)", "code": "bci" },
-  "BAR": { "name": "Bari: South Sudan (0.4m)", "code": "bfa" },
-  "BAS": { "name": "Bashkir/Bashkort:  Russia-Bashkortostan (1m)", "code": "bak" },
-  "BAY": { "name": "Bayash/Boyash (gypsy dialect of Romanian): Serbia, Croatia (10,000)" },
-  "BB":  { "name": "Braj Bhasa/Braj Bhasha/Brij: India-Rajasthan (0.6m)", "code": "bra" },
-  "BC":  { "name": "Baluchi: Pakistan (5m)", "code": "bal" },
-  "BE":  { "name": "Bengali/Bangla: Bangladesh (110m), India (82m)", "code": "ben" },
-  "BED": { "name": "Bedawiyet / Bedawi / Beja: Sudan (1m)", "code": "bej" },
-  "BEM": { "name": "Bemba: Zambia (3m)", "code": "bem" },
-  "BET": { "name": "Bete / Bété (Guiberoua): Ivory Coast (0.2m)", "code": "bet" },
-  "BGL": { "name": "Bagheli: N India (3m)", "code": "bfy" },
-  "BH":  { "name": "Bhili: India-Madhya Pradesh, Gujarat (3.3m)", "code": "bhb" },
-  "BHN": { "name": "Bahnar: Vietnam (160,000)", "code": "bdq" },
-  "BHT": { "name": "Bhatri: India-Chhattisgarh,Maharashtra (0.2m)", "code": "bgw" },
-  "BI":  { "name": "Bilen/Bile: Eritrea-Keren (90,000)", "code": "byn" },
-  "BID": { "name": "Bidayuh languages: Malaysia-Sarawak (70,000)", "code": "sdo" },
-  "BIS": { "name": "Bisaya: Malaysia-Sarawak,Sabah (20,000), Brunei (40,000)", "code": "bsb" },
-  "BJ":  { "name": "Bhojpuri/Bihari: India (38m), Nepal (1.7m)", "code": "bho" },
-  "BK":  { "name": "Balkarian: Russia-Caucasus (0.3m)", "code": "krc" },
-  "BLK": { "name": "Balkan Romani: Bulgaria (0.3m), Serbia (0.1m), Macedonia (0.1m)", "code": "rmn" },
-  "BLT": { "name": "Balti: NE Pakistan (0.3m)", "code": "bft" },
-  "BM":  { "name": "Bambara/Bamanankan/Mandenkan: Mali (4m)", "code": "bam" },
-  "BNA": { "name": "Borana Oromo/Afan Oromo: Ethiopia (4m)", "code": "gax" },
-  "BNG": { "name": "Bangala / Mbangala: Central Angola (0.4m)", "code": "mxg" },
-  "BNI": { "name": "Baniua/Baniwa: Brazil-Amazonas (6,000)", "code": "bwi" },
-  "BNJ": { "name": "Banjari / Banjara / Gormati / Lambadi: India (4m)", "code": "lmn" },
-  "BNT": { "name": "Bantawa: Nepal (400,000)", "code": "bap" },
-  "BNY": { "name": "Banyumasan dialect of Javanese: western Central Java" },
-  "BON": { "name": "Bondo: India-Odisha (9000)", "code": "bfw" },
-  "BOR": { "name": "Boro / Bodo: India-Assam,W Bengal (1.3m)", "code": "brx" },
-  "BOS": { "name": "Bosnian (derived from Serbocroat): Bosnia-Hercegovina (2m)", "code": "bos" },
-  "BR":  { "name": "Burmese / Barma / Myanmar: Myanmar (32m)", "code": "mya" },
-  "BRA": { "name": "Brahui: Pakistan (4m), Afghanistan (0.2m)", "code": "brh" },
-  "BRB": { "name": "Bariba / Baatonum: Benin (0.5m), Nigeria (0.1m)", "code": "bba" },
-  "BRU": { "name": "Bru: Laos (30,000), Vietnam (55,000)", "code": "bru" },
-  "BSL": { "name": "Bislama: Vanuatu (10,000)", "code": "bis" },
-  "BT":  { "name": "Black Tai / Tai Dam: Vietnam (0.7m)", "code": "blt" },
-  "BTK": { "name": "Batak-Toba: Indonesia-Sumatra (2m)", "code": "bbc" },
-  "BU":  { "name": "Bulgarian: Bulgaria (6m)", "code": "bul" },
-  "BUG": { "name": "Bugis / Buginese: Indonesia-Sulawesi (5m)", "code": "bug" },
-  "BUK": { "name": "Bukharian/Bukhori: Israel (50,000), Uzbekistan (10,000)", "code": "bhh" },
-  "BUN": { "name": "Bundeli / Bundelkhandi / Bundelkandi: India-Uttar,Madhya Pr. (3m)", "code": "bns" },
-  "BUR": { "name": "Buryat: Russia-Buryatia, Lake Baikal (0.4m)", "code": "bxr" },
-  "BUY": { "name": "Bouyei/Buyi/Yay: China-Guizhou (2.6m), No.Vietnam. Close to ZH.", "code": "pcc" },
-  "BY":  { "name": "Byelorussian / Belarusian: Belarus, Poland, Ukraine (8m)", "code": "bel" },
-  "C":   { "name": "Chinese (not further specified)" },
-  "CA":  { "name": "Cantonese / Yue: China-Guangdong (50m),Hongkong (6m),Malaysia (1m)", "code": "yue" },
-  "CC":  { "name": "Chaochow (dialect of Min-Nan): China-Guangdong (10m), Thailand (1m)", "code": "nan" },
-  "CD":  { "name": "Chowdary/Chaudhry/Chodri: India-Gujarat (0.2m)", "code": "cdi" },
-  "CEB": { "name": "Cebuano: Philippines (16m)", "code": "ceb" },
-  "CH":  { "name": "Chin (not further specified): Myanmar; includes those below a.o." },
-  "C-A": { "name": "Chin-Asho: Myanmar-Ayeyarwady,Rakhine (30,000)", "code": "csh" },
-  "C-D": { "name": "Chin-Daai: Myanmar-Chin (37,000)", "code": "dao" },
-  "C-F": { "name": "Chin-Falam / Halam: Myanmar-Chin, Bangladesh, India (0.1m)", "code": "cfm" },
-  "C-H": { "name": "Chin-Haka: Myanmar-Chin (100,000)", "code": "cnh" },
-  "CHA": { "name": "Cha'palaa / Chachi: Ecuador-Esmeraldas (10,000)", "code": "cbi" },
-  "CHE": { "name": "Chechen: Russia-Chechnya (1.4m)", "code": "che" },
-  "CHG": { "name": "Chhattisgarhi: India-Chhattisgarh, Odisha, Bihar (13m)", "code": "hne" },
-  "CHI": { "name": "Chitrali / Khowar: NW Pakistan (0.2m)", "code": "khw" },
-  "C-K": { "name": "Chin-Khumi: Myanmar-Chin,Rakhine (0.6m)", "code": "cnk" },
-  "C-M": { "name": "Chin-Mro: Myanmar-Rakhine,Chin (75,000)", "code": "cmr" },
-  "C-O": { "name": "Chin-Thado / Thadou-Kuki: India-Assam, Manipur (0.2m)", "code": "tcz" },
-  "CHR": { "name": "Chrau: Vietnam (7,000)", "code": "crw" },
-  "CHU": { "name": "Chuwabu: Mozambique (1m)", "code": "chw" },
-  "C-T": { "name": "Chin-Tidim: Myanmar-Chin (0.2m), India-Mizoram,Manipur (0.15m)", "code": "ctd" },
-  "C-Z": { "name": "Chin-Zomin / Zomi-Chin: Myanmar (60,000), India-Manipur (20,000)", "code": "zom" },
-  "CKM": { "name": "Chakma: India-Mizoram,Tripura,Assam (0.2m), Bangladesh (0.15m)", "code": "ccp" },
-  "CKW": { "name": "Chokwe: Angola (0.5m), DR Congo (0.5m)", "code": "cjk" },
-  "COF": { "name": "Cofan / Cofán: Ecuador-Napo, Colombia (2000)", "code": "con" },
-  "COK": { "name": "Cook Islands Maori / Rarotongan: Cook Islands (13,000)", "code": "rar" },
-  "CR":  { "name": "Creole / Haitian: Haiti (7m)", "code": "hat" },
-  "CRU": { "name": "Chru: Vietnam (19,000)", "code": "cje" },
-  "CT":  { "name": "Catalan: Spain (7m), Andorra (31,000)", "code": "cat" },
-  "CV":  { "name": "Chuvash: Russia-Chuvashia (1m)", "code": "chv" },
-  "CVC": { "name": "Chavacano/Chabacano: Spanish creole in PHL-Mindanao (4m)", "code": "cbk" },
-  "CW":  { "name": "Chewa/Chichewa/Nyanja/Chinyanja: Malawi (7m), MOZ (0.6m),ZMB (0.8m)", "code": "nya" },
-  "CZ":  { "name": "Czech: Czech Republic (9m)", "code": "ces" },
-  "D":   { "name": "German: Germany (80m), Austria, Switzerland, Belgium", "code": "deu" },
-  "D-P": { "name": "Lower German (varieties in N.Germany, USA:Pennsylvania Dutch)", "code": "pdc" },
-  "DA":  { "name": "Danish: Denmark (5.5m)", "code": "dan" },
-  "DAH": { "name": "Dahayia: India" },
-  "DAO": { "name": "Dao: Vietnam ethnic group speaking MIE and Kim Mun (0.7m)" },
-  "DAR": { "name": "Dargwa/Dargin: Russia-Dagestan (0.5m)", "code": "dar" },
-  "DD":  { "name": "Dhodiya / Dhodia: India-Gujarat (150,000)", "code": "dho" },
-  "DEC": { "name": "Deccan/Deccani/Desi: India-Maharashtra (13m)", "code": "dcc" },
-  "DEG": { "name": "Degar / Montagnard (Vietnam): comprises JR, RAD, BHN, KOH, MNO, STI" },
-  "DEN": { "name": "Dendi: Benin (30,000)", "code": "ddn" },
-  "DEO": { "name": "Deori: India-Assam (27,000)", "code": "der" },
-  "DES": { "name": "Desiya / Deshiya: India-Odisha (50,000)", "code": "dso" },
-  "DH":  { "name": "Dhivehi: Maldives (0.3m)", "code": "div" },
-  "DI":  { "name": "Dinka: South Sudan (1.4m)", "code": "dip,diw,dik,dib,dks" },
-  "DIM": { "name": "Dimasa/Dhimasa: India-Assam: (0.1m)", "code": "dis" },
-  "DIT": { "name": "Ditamari: Benin (0.1m)", "code": "tbz" },
-  "DO":  { "name": "Dogri (sometimes includes Kangri dialect): N India (4m)", "code": "doi,dgo,him" },
-  "DR":  { "name": "Dari / Eastern Farsi: Afghanistan (7m), Pakistan (2m)", "code": "prs" },
-  "DU":  { "name": "Dusun: Malaysia-Sabah (0.1m)", "code": "dtp" },
-  "DUN": { "name": "Dungan: Kyrgyzstan (40,000)", "code": "dng" },
-  "DY":  { "name": "Dyula/Jula: Burkina Faso (1m), Ivory Coast (1.5m), Mali (50,000)", "code": "dyu" },
-  "DZ":  { "name": "Dzongkha: Bhutan (0.2m)", "code": "dzo" },
-  "E":   { "name": "English: UK (60m), USA (225m), India (200m), others", "code": "eng" },
-  "EC":  { "name": "Eastern Cham: Vietnam (70,000)", "code": "cjm" },
-  "EGY": { "name": "Egyptian Arabic: Egypt (52m)", "code": "arz" },
-  "EO":  { "name": "Esperanto: Constructed language (2m)", "code": "epo" },
-  "ES":  { "name": "Estonian: Estonia (1m)", "code": "ekk" },
-  "EWE": { "name": "Ewe / Éwé: Ghana (2m), Togo (1m)", "code": "ewe" },
-  "F":   { "name": "French: France (53m), Canada (7m), Belgium (4m), Switzerland (1m)", "code": "fra" },
-  "FA":  { "name": "Faroese: Faroe Islands (66,000)", "code": "fao" },
-  "FI":  { "name": "Finnish: Finland (5m)", "code": "fin" },
-  "FJ":  { "name": "Fijian: Fiji (0.3m)", "code": "fij" },
-  "FON": { "name": "Fon / Fongbe: Benin (1.4m)", "code": "fon" },
-  "FP":  { "name": "Filipino (based on Tagalog): Philippines (25m)", "code": "fil" },
-  "FS":  { "name": "Farsi / Iranian Persian: Iran (45m)", "code": "pes" },
-  "FT":  { "name": "Fiote / Vili: Rep. Congo (7000), Gabon (4000)", "code": "vif" },
-  "FU":  { "name": "Fulani/Fulfulde: Nigeria (8m), Niger (1m),Burkina Faso (1m)", "code": "fub,fuh,fuq" },
-  "FUJ": { "name": "FutaJalon / Pular: Guinea (3m)", "code": "fuf" },
-  "Fujian:": { "name": "see TW-Taiwanese" },
-  "FUR": { "name": "Fur: Sudan-Darfur (0.5m)", "code": "fvr" },
-  "GA":  { "name": "Garhwali: India-Uttarakhand,Himachal Pr. (3m)", "code": "gbm" },
-  "GAG": { "name": "Gagauz: Moldova (0.1m)", "code": "gag" },
-  "GAR": { "name": "Garo: India-Meghalaya,Assam,Nagaland,Tripura (1m)", "code": "grt" },
-  "GD":  { "name": "Greenlandic Inuktikut: Greenland (50,000)", "code": "kal" },
-  "GE":  { "name": "Georgian: Georgia (4m)", "code": "kat" },
-  "GI":  { "name": "Gilaki: Iran (3m)", "code": "glk" },
-  "GJ":  { "name": "Gujari/Gojri: NW India (0.7m), Pakistan (0.3m)", "code": "gju" },
-  "GL":  { "name": "Galicic/Gallego: Spain (3m)", "code": "glg" },
-  "GM":  { "name": "Gamit: India-Gujarat (0.3m)", "code": "gbl" },
-  "GNG": { "name": "Gurung (Eastern and Western): Nepal (0.4m)", "code": "ggn,gvr" },
-  "GO":  { "name": "Gorontalo: Indonesia-Sulawesi (1m)", "code": "gor" },
-  "GON": { "name": "Gondi: India-Madhya Pr.,Maharashtra (2m)", "code": "gno" },
-  "GR":  { "name": "Greek: Greece (10m), Cyprus (0.7m)", "code": "ell" },
-  "GU":  { "name": "Gujarati: India-Gujarat,Maharashtra,Rajasthan (46m)", "code": "guj" },
-  "GUA": { "name": "Guaraní: Paraguay (5m)", "code": "grn" },
-  "GUN": { "name": "Gungbe / Gongbe / Goun: Benin, Nigeria (0.7m)", "code": "guw" },
-  "GUR": { "name": "Gurage/Guragena: Ethiopia (0.4m)", "code": "sgw" },
-  "GZ":  { "name": "Ge'ez / Geez (liturgic language of Ethiopia)", "code": "gez" },
-  "HA":  { "name": "Haussa: Nigeria (19m), Niger (5m), Benin (1m)", "code": "hau" },
-  "HAD": { "name": "Hadiya: Ethiopia (1.2m)", "code": "hdy" },
-  "HAR": { "name": "Haryanvi /  Bangri / Harayanvi / Hariyanvi: India-Haryana (8m)", "code": "bgc" },
-  "HAS": { "name": "Hassinya/Hassaniya: Mauritania (3m)", "code": "mey" },
-  "HB":  { "name": "Hebrew: Israel (5m)", "code": "heb" },
-  "HD":  { "name": "Hindko (Northern and Southern): Pakistan (3m)", "code": "hnd,hno" },
-  "HI":  { "name": "Hindi: India (260m)", "code": "hin" },
-  "HIM": { "name": "Himachali languages: India-Himachal Pradesh", "code": "him" },
-  "HK":  { "name": "Hakka: South China (26m), Taiwan (3m), Malaysia (1m)", "code": "hak" },
-  "Hokkien:": { "name": "see TW-Taiwanese" },
-  "HM":  { "name": "Hmong/Miao languages: S China, N Vietnam, N Laos, USA (3m)", "code": "hmn" },
-  "HMA": { "name": "Hmar: India-Assam,Manipur,Mizoram (80,000)", "code": "hmr" },
-  "HMB": { "name": "Hmong-Blue/Njua: Laos (0.1m), Thailand (60,000)", "code": "hnj" },
-  "HMQ": { "name": "Hmong/Miao, Northern Qiandong / Black Hmong: S China (1m)", "code": "hea" },
-  "HMW": { "name": "Hmong-White/Daw: Vietnam (1m), Laos (0.2m), S China (0.2m)", "code": "mww" },
-  "HN":  { "name": "Hani: China-Yunnan (0.7m)", "code": "hni" },
-  "HO":  { "name": "Ho: India-Jharkand,Odisha,W Bengal (1m)", "code": "hoc" },
-  "HR":  { "name": "Croatian/Hrvatski: Croatia (4m), BIH (0.5m), Serbia (0.1m)", "code": "hrv" },
-  "HRE": { "name": "Hre: Vietnam (0.1m)", "code": "hre" },
-  "HU":  { "name": "Hungarian: Hungary (10m), Romania (1.5m), SVK (0.5m), SRB (0.3m)", "code": "hun" },
-  "HUI": { "name": "Hui / Huizhou: China-Anhui,Zhejiang (5m)", "code": "czh" },
-  "HZ":  { "name": "Hazaragi: Afghanistan (1.8m), Iran (0.3m)", "code": "haz" },
-  "I":   { "name": "Italian: Italy (55m), Switzerland (0.5m), San Marino (25,000)", "code": "ita" },
-  "IB":  { "name": "Iban: Malaysia-Sarawak (0.7m)", "code": "iba" },
-  "IBN": { "name": "Ibanag: Philippines-Luzon (0.5m)", "code": "ibg" },
-  "IF":  { "name": "Ifè / Ife: Togo (0.1m), Benin (80,000)", "code": "ife" },
-  "IG":  { "name": "Igbo / Ibo: Nigeria (18m)", "code": "ibo" },
-  "ILC": { "name": "Ilocano: Philippines (7m)", "code": "ilo" },
-  "ILG": { "name": "Ilonggo / Hiligaynon: Philippines-Visayas/Mindanao (9m)", "code": "hil" },
-  "IN":  { "name": "Indonesian / Bahasa Indonesia: Indonesia (140m)", "code": "ind" },
-  "INU": { "name": "Inuktikut: Canada-Nunavut,N Quebec,Labrador (30,000)", "code": "ike" },
-  "IRQ": { "name": "Iraqi Arabic: Iraq (12m), Iran (1m), Syria (2m)", "code": "acm" },
-  "IS":  { "name": "Icelandic: Iceland (0.2m)", "code": "isl" },
-  "ISA": { "name": "Isan / Northeastern Thai: Thailand (15m)", "code": "tts" },
-  "ITA": { "name": "Itawis / Tawit: Philippines-Luzon (0.1m)", "code": "itv" },
-  "J":   { "name": "Japanese: Japan (122m)", "code": "jpn" },
-  "JAI": { "name": "Jaintia / Pnar / Synteng: India-Meghalaya, Bangladesh (250,000)", "code": "pbv" },
-  "JEH": { "name": "Jeh: Vietnam (15,000), Laos (8,000)", "code": "jeh" },
-  "JG":  { "name": "Jingpho: see KC-Kachin" },
-  "JOR": { "name": "Jordanian Arabic: Jordan (3.5m), Israel/Palestine (2.5m)", "code": "ajp" },
-  "JR":  { "name": "Jarai / Giarai / Jra: Vietnam (0.3m)", "code": "jra" },
-  "JU":  { "name": "Juba Arabic: South Sudan (60,000)", "code": "pga" },
-  "JV":  { "name": "Javanese: Indonesia-Java,Bali (84m)", "code": "jav" },
-  "K":   { "name": "Korean: Korea (62m), China-Jilin,Heilongjiang,Liaoning (2m)", "code": "kor" },
-  "KA":  { "name": "Karen (unspecified): Myanmar (3m)" },
-  "K-G": { "name": "Karen-Geba: Myanmar (40,000)", "code": "kvq" },
-  "K-K": { "name": "Karen-Geko / Gekho: Myanmar (17,000)", "code": "ghk" },
-  "K-M": { "name": "Manumanaw Karen / Kawyaw / Kayah: Myanmar (10,000)", "code": "kxf" },
-  "K-P": { "name": "Karen-Pao / Black Karen / Pa'o: Myanmar (0.5m)", "code": "blk" },
-  "K-S": { "name": "Karen-Sgaw / S'gaw: Myanmar (1.3m), Thailand (0.2m)", "code": "ksw" },
-  "K-W": { "name": "Karen-Pwo: Myanmar (1m); Northern variant: Thailand (60,000)", "code": "kjp,pww" },
-  "KAD": { "name": "Kadazan: Malaysia-Sabah (80,000)", "code": "kzj,dtb" },
-  "KAL": { "name": "Kalderash Romani (Dialect of Vlax): Romania (0.2m)", "code": "rmy" },
-  "KAB": { "name": "Kabardian: Russia-Caucasus (0.5m), Turkey (1m)", "code": "kbd" },
-  "KAM": { "name": "Kambaata: Ethiopia (0.6m)", "code": "ktb" },
-  "KAN": { "name": "Kannada: India-Karnataka,Andhra Pr.,Tamil Nadu (40m)", "code": "kan" },
-  "KAO": { "name": "Kaonde: Zambia (0.2m)", "code": "kqn" },
-  "KAR": { "name": "Karelian: Russia-Karelia (25,000), Finland (10,000)", "code": "krl" },
-  "KAT": { "name": "Katu: Vietnam (50,000)", "code": "ktv" },
-  "KAU": { "name": "Kau Bru / Kaubru/ Riang: India-Tripura,Mizoram,Assam (77,000)", "code": "ria" },
-  "KAY": { "name": "Kayan: Myanmar (0.1m)", "code": "pdu" },
-  "KB":  { "name": "Kabyle: Algeria (5m)", "code": "kab" },
-  "KBO": { "name": "Kok Borok/Tripuri: India (0.8m)", "code": "trp" },
-  "KC":  { "name": "Kachin / Jingpho: Myanmar (0.9m)", "code": "kac" },
-  "KG":  { "name": "Kyrgyz /Kirghiz: Kyrgystan (2.5m), China (0.1m)", "code": "kir" },
-  "KGU": { "name": "Kalanguya / Kallahan: Philippines-Luzon (0.1m)", "code": "kak" },
-  "KH":  { "name": "Khmer: Cambodia (13m), Vietnam (1m)", "code": "khm" },
-  "KHA": { "name": "Kham / Khams, Eastern: China-NE Tibet (1.4m)", "code": "khg" },
-  "KHM": { "name": "Khmu: Laos (0.6m)", "code": "kjg" },
-  "KHR": { "name": "Kharia / Khariya: India-Jharkand (0.2m)", "code": "khr" },
-  "KHS": { "name": "Khasi / Kahasi: India-Meghalaya,Assam (0.8m)", "code": "kha" },
-  "KHT": { "name": "Khota (India)" },
-  "KIM": { "name": "Kimwani: Mozambique (0.1m)", "code": "wmw" },
-  "KIN": { "name": "Kinnauri / Kinori: India-Himachal Pr. (65,000)", "code": "kfk" },
-  "KiR": { "name": "KiRundi: Burundi (9m)", "code": "run" },
-  "KIS": { "name": "Kisili: West Africa (ask TWR)" },
-  "KK":  { "name": "KiKongo/Kongo: DR Congo, Angola (8m)", "code": "kng" },
-  "KKA": { "name": "Kankana-ey: Philippines-Luzon (0.3m)", "code": "kne" },
-  "KKN": { "name": "Kukna: India-Gujarat (0.1m)", "code": "kex" },
-  "KKU": { "name": "Korku: India-Madhya Pr.,Maharashtra (1m)", "code": "kfq" },
-  "KMB": { "name": "Kimbundu/Mbundu/Luanda: Angola (4m)", "code": "kmb" },
-  "KMY": { "name": "Kumyk: Russia-Dagestan (0.4m)", "code": "kum" },
-  "KND": { "name": "Khandesi: India-Maharashtra (22,000)", "code": "khn" },
-  "KNG": { "name": "Kangri: close to Dogri; India-Himachal Pradesh, Punjab (1m)", "code": "xnr" },
-  "KNK": { "name": "KinyaRwanda-KiRundi service of the Voice of America / BBC" },
-  "KNU": { "name": "Kanuri: Nigeria (3.2m), Chad (0.1m), Niger (0.4m)", "code": "kau" },
-  "KNY": { "name": "Konyak Naga: India-Assam,Nagaland (0.25m)", "code": "nbe" },
-  "KOH": { "name": "Koho/Kohor: Vietnam (0.2m)", "code": "kpm" },
-  "KOK": { "name": "Kokang Shan: Myanmar (dialect of Shan)" },
-  "KOM": { "name": "Komering: Indonesia-Sumatera (0.5m)", "code": "kge" },
-  "KON": { "name": "Konkani: India-Maharashtra,Karnataka,Kerala (2.4m)", "code": "knn" },
-  "KOR": { "name": "Korambar / Kurumba Kannada: India-Tamil Nadu (0.2m)", "code": "kfi" },
-  "KOT": { "name": "Kotokoli / Tem: Togo (0.2m), Benin (0.05m), Ghana (0.05m)", "code": "kdh" },
-  "KOY": { "name": "Koya: India-Andhra Pr.,Odisha (0.4m)", "code": "kff" },
-  "KPK": { "name": "Karakalpak: W Uzbekistan (0.4m)", "code": "kaa" },
-  "KRB": { "name": "Karbi / Mikir / Manchati: India-Assam,Arunachal Pr. (0.4m)", "code": "mjw" },
-  "KRI": { "name": "Krio: Sierra Leone (0.5m)", "code": "kri" },
-  "KRW": { "name": "KinyaRwanda: Rwanda (7m), Uganda (0.4m), DR Congo (0.2m)", "code": "kin" },
-  "KRY": { "name": "Karay-a: Philippines-Visayas (0.4m)", "code": "krj" },
-  "KS":  { "name": "Kashmiri: India (5m), Pakistan (0.1m)", "code": "kas" },
-  "KT":  { "name": "Kituba (simplified Kikongo): Rep. Congo (1m), DR Congo (4m)", "code": "ktu" },
-  "KTW": { "name": "Kotwali (dialect of Bhili): India-Gujarat,Maharshtra", "code": "bhb" },
-  "KU":  { "name": "Kurdish: Turkey (15m), Iraq (6.3m), Iran (6.5m), Syria (1m)", "code": "ckb,kmr,sdh" },
-  "KuA": { "name": "Kurdish and Arabic" },
-  "KuF": { "name": "Kurdish and Farsi" },
-  "KUI": { "name": "Kui: India-Odisha,Ganjam,Andhra Pr. (1m)", "code": "kxu" },
-  "KUL": { "name": "Kulina: Brazil-Acre (3500)", "code": "cul" },
-  "KUM": { "name": "Kumaoni/Kumauni: India-Uttarakhand (2m)", "code": "kfy" },
-  "KUN": { "name": "Kunama: Eritrea (0.2m)", "code": "kun" },
-  "KUP": { "name": "Kupia / Kupiya: India-Andhra Pr. (6,000)", "code": "key" },
-  "KUR": { "name": "Kurukh/Kurux: India-Chhatisgarh,Jharkhand,W.Bengal (2m)", "code": "kru" },
-  "KUs": { "name": "Sorani (Central) Kurdish: Iraq (3.5m), Iran (3.3m)", "code": "ckb" },
-  "KUT": { "name": "Kutchi: India-Gujarat (0.4m), Pakistan-Sindh (0.2m)", "code": "gjk" },
-  "KUV": { "name": "Kuvi: India-Odisha (0.16m)", "code": "kxv" },
-  "KVI": { "name": "Kulluvi/Kullu: India-Himachal Pr. (0.1m)", "code": "kfx" },
-  "KWA": { "name": "Kwanyama/Kuanyama (dialect of OW): Angola (0.4m), Namibia (0.2m)", "code": "kua" },
-  "KYH": { "name": "Kayah: Myanmar (0.15m)", "code": "kyu" },
-  "KZ":  { "name": "Kazakh: Kazakhstan (7m), China (1m), Mongolia (0.1m)", "code": "kaz" },
-  "L":   { "name": "Latin: Official language of Catholic church", "code": "lat" },
-  "LA":  { "name": "Ladino: see SEF" },
-  "LAD": { "name": "Ladakhi / Ladak: India-Jammu and Kashmir (0.1m)", "code": "lbj" },
-  "LAH": { "name": "Lahu: China (0.3m), Myanmar (0.2m)", "code": "lhu" },
-  "LAK": { "name": "Lak: Russia-Dagestan (0.15m)", "code": "lbe" },
-  "LAM": { "name": "Lampung: Indonesia-Sumatera (1m)", "code": "abl,ljp" },
-  "LAO": { "name": "Lao: Laos (3m)", "code": "lao" },
-  "LB":  { "name": "Lun Bawang / Murut: Malaysia-Sarawak (24,000), Indonesia (23,000)", "code": "lnd" },
-  "LBN": { "name": "Lebanon Arabic (North Levantine): Lebanon (4m), Syria (9m)", "code": "apc" },
-  "LBO": { "name": "Limboo /Limbu: Nepal (0.3m), India-Sikkim,W.Bengal,Assam (40,000)", "code": "lif" },
-  "LEP": { "name": "Lepcha: India-Sikkim,W.Bengal (50,000)", "code": "lep" },
-  "LEZ": { "name": "Lezgi: Russia-Dagestan (0.4m), Azerbaijan (0.4m)", "code": "lez" },
-  "LIM": { "name": "Limba: Sierra Leone (0.3m)", "code": "lia" },
-  "LIN": { "name": "Lingala: DR Congo (2m), Rep. Congo (0.1m)", "code": "lin" },
-  "LIS": { "name": "Lisu: China-West Yunnan (0.6m), Burma (0.3m)", "code": "lis" },
-  "LND": { "name": "Lunda (see LU), in particular its dialect Ndembo: Angola (0.2m)", "code": "lun" },
-  "LNG": { "name": "Lungeli Magar (possibly same as MGA?)" },
-  "LO":  { "name": "Lomwe / Ngulu: Mocambique (1.5m)", "code": "ngl" },
-  "LOK": { "name": "Lokpa / Lukpa / Lupka: Benin (50,000), Togo (14,000)", "code": "dop" },
-  "LOZ": { "name": "Lozi / Silozi: Zambia (0.6m), ZWE (70,000), NMB-E Caprivi (30,000)", "code": "loz" },
-  "LT":  { "name": "Lithuanian: Lithuania (3m)", "code": "lit" },
-  "LTO": { "name": "Oriental Liturgy of Vatican Radio" },
-  "LU":  { "name": "Lunda: Zambia (0.5m)", "code": "lun" },
-  "LUB": { "name": "Luba: DR Congo-Kasai (6m)", "code": "lua" },
-  "LUC": { "name": "Luchazi: Angola (0.4m), Zambia (0.05m)", "code": "lch" },
-  "LUG": { "name": "Luganda: Uganda (4m)", "code": "lug" },
-  "LUN": { "name": "Lunyaneka/Nyaneka: Angola (0.3m)", "code": "nyk" },
-  "LUR": { "name": "Luri, Northern and Southern: Iran (1.5m and 0.9m)", "code": "lrc,luz" },
-  "LUV": { "name": "Luvale: Angola (0.5m), Zambia (0.2m)", "code": "lue" },
-  "LV":  { "name": "Latvian: Latvia (1.2m)", "code": "lvs" },
-  "M":   { "name": "Mandarin (Standard Chinese / Beijing dialect): China (840m)", "code": "cmn" },
-  "MA":  { "name": "Maltese: Malta (0.3m)", "code": "mlt" },
-  "MAD": { "name": "Madurese/Madura: Indonesia-Java (7m)", "code": "mad" },
-  "MAG": { "name": "Maghi/Magahi/Maghai: India-Bihar,Jharkhand (14m)", "code": "mag" },
-  "MAI": { "name": "Maithili / Maithali: India-Bihar (30m), Nepal (3m)", "code": "mai" },
-  "MAK": { "name": "Makonde: Tanzania (1m), Mozambique (0.4m)", "code": "kde" },
-  "MAL": { "name": "Malayalam: India-Kerala (33m)", "code": "mal" },
-  "MAM": { "name": "Maay / Mamay / Rahanweyn: Somalia (2m)", "code": "ymm" },
-  "MAN": { "name": "Mandenkan (dialect continuum of BM, DY, MLK): Mali, BFA, CTI, GUI", "code": "man" },
-  "MAO": { "name": "Maori: New Zealand (60,000)", "code": "mri" },
-  "MAR": { "name": "Marathi: India-Maharashtra (72m)", "code": "mar" },
-  "MAS": { "name": "Maasai/Massai/Masai: Kenya (0.8m), Tanzania (0.5m)", "code": "mas" },
-  "MC":  { "name": "Macedonian: Macedonia (1.4m), Albania (0.1m)", "code": "mkd" },
-  "MCH": { "name": "Mavchi/Mouchi/Mauchi/Mawchi: India-Gujarat,Maharashtra (0.1m)", "code": "mke" },
-  "MEI": { "name": "Meithei/Manipuri/Meitei: India-Manipur,Assam (1.5m)", "code": "mni" },
-  "MEN": { "name": "Mende: Sierra Leone (1.5m)", "code": "men" },
-  "MEW": { "name": "Mewari/Mewadi (a Rajasthani variety): India-Rajasthan (5m)", "code": "mtr" },
-  "MGA": { "name": "Magar (Western and Eastern): Nepal (0.8m)", "code": "mrd,mgp" },
-  "MIE": { "name": "Mien / Iu Mien: S China (0.4m), Vietnam (0.4m)", "code": "ium" },
-  "MIS": { "name": "Mising: India-Assam,Arunachal Pr. (0.5m)", "code": "mrg" },
-  "MKB": { "name": "Minangkabau: Indonesia-West Sumatra (5.5m)", "code": "min" },
-  "MKS": { "name": "Makassar/Makasar: Indonesia-South Sulawesi (2m)", "code": "mak" },
-  "MKU": { "name": "Makua / Makhuwa: Mocambique (3m)", "code": "vmw" },
-  "ML":  { "name": "Malay / Baku: Malaysia (10m), Singapore (0.4m), Indonesia (5m)", "code": "zsm,zlm" },
-  "MLK": { "name": "Malinke/Maninka (We/Ea): Guinea (3m), SEN (0.4m), Mali (0.8m)", "code": "emk,mlq" },
-  "MLT": { "name": "Malto / Kumarbhag Paharia: India-Jharkhand (12,000)", "code": "kmj" },
-  "MNA": { "name": "Mina / Gen: Togo (0.2m), Benin (0.1m)", "code": "gej" },
-  "MNB": { "name": "Manobo / T'duray: Philippines-Mindanao (0.1m)", "code": "mno" },
-  "MNE": { "name": "Montenegrin (quite the same as SR): Montenegro (0.2m)", "code": "srp" },
-  "MNO": { "name": "Mnong (Ea,Ce,So): Vietnam (90,000), Cambodia (40,000)", "code": "mng,cmo,mnn" },
-  "MO":  { "name": "Mongolian: Mongolia (Halh; 2m), China (Peripheral; 3m)", "code": "khk,mvf" },
-  "MON": { "name": "Mon: Myanmar-Mon,Kayin (0.7m), Thailand (0.1m)", "code": "mnw" },
-  "MOO": { "name": "Moore/Mòoré/Mossi: Burkina Faso (5m)", "code": "mos" },
-  "MOR": { "name": "Moro/Moru/Muro: Sudan-S Korodofan (30,000)", "code": "mor" },
-  "MR":  { "name": "Maronite / Cypriot Arabic: Cyprus (1300)", "code": "acy" },
-  "MRC": { "name": "Moroccan/Mugrabian Arabic: Morocco (20m)", "code": "ary" },
-  "MRI": { "name": "Mari: Russia-Mari (0.8m)", "code": "chm" },
-  "MRU": { "name": "Maru / Lhao Vo: Burma-Kachin,Shan (0.1m)", "code": "mhx" },
-  "MSY": { "name": "Malagasy: Madagaskar (16m)", "code": "mlg" },
-  "MUN": { "name": "Mundari: India-Jharkhand,Odisha (1.1m)", "code": "unr" },
-  "MUO": { "name": "Muong: Vietnam (1m)", "code": "mtq" },
-  "MUR": { "name": "Murut: Malaysia-Sarawak,Sabah (4500)", "code": "kxi,mvv,tih" },
-  "MV":  { "name": "Malvi: India-Madhya Pradesh, Rajasthan (6m)", "code": "mup" },
-  "MW":  { "name": "Marwari (a Rajasthani variety): India-Rajasthan,Gujarat (6m)", "code": "mwr,rwr" },
-  "MX":  { "name": "Macuxi/Macushi: Brazil (16,000), Guyana (1,000)", "code": "mbc" },
-  "MY":  { "name": "Maya (Yucatec): Mexico (0.7m), Belize (6000)", "code": "yua" },
-  "MZ":  { "name": "Mizo / Lushai: India-Mizoram (0.7m)", "code": "lus" },
-  "NAG": { "name": "Naga (var.incl. Ao,Makware): India-Nagaland, Assam (2m)", "code": "njh,njo,nmf,nph" },
-  "NAP": { "name": "Naga Pidgin / Bodo / Nagamese: India-Nagaland (30,000)", "code": "nag" },
-  "NDA": { "name": "Ndau: Mocambique (1.6m), Zimbabwe (0.8m)", "code": "ndc" },
-  "NDE": { "name": "Ndebele: Zimbabwe (1.5m), South Africa-Limpopo (0.6m)", "code": "nde,nbl" },
-  "NE":  { "name": "Nepali/Lhotshampa: Nepal (11m), India (3m), Bhutan (0.1m)", "code": "npi" },
-  "NG":  { "name": "Nagpuri / Sadani / Sadari / Sadri: India-Jharkhand,W.Bengal (3m)", "code": "sck" },
-  "NGA": { "name": "Ngangela/Nyemba: Angola (0.2m)", "code": "nba" },
-  "NIC": { "name": "Nicobari: India-Nicobar Islands (40,000)", "code": "caq" },
-  "NIG": { "name": "Nigerian Pidgin: Nigeria (30m)", "code": "pcm" },
-  "NIS": { "name": "Nishi/Nyishi: India-Arunachal Pradesh (0.2m)", "code": "njz" },
-  "NIU": { "name": "Niuean: Niue (2,000)", "code": "niu" },
-  "NJ":  { "name": "Ngaju Dayak: Indonesia-Borneo (0.9m)", "code": "nij" },
-  "NL":  { "name": "Dutch: Netherlands (16m), Belgium (6m), Suriname (0.2m)", "code": "nld" },
-  "NLA": { "name": "Nga La / Matu Chin: Myanmar-Chin (30,000), India-Mizoram (10,000)", "code": "hlt" },
-  "NO":  { "name": "Norwegian: Norway (5m)", "code": "nor" },
-  "NOC": { "name": "Nocte / Nockte: India-Assam,Arunachal Pr. (33,000)", "code": "njb" },
-  "NP":  { "name": "Nupe: Nigeria (0.8m)", "code": "nup" },
-  "NTK": { "name": "Natakani / Netakani / Varhadi-Nagpuri: India-Maharashtra,M.Pr. (7m)", "code": "vah" },
-  "NU":  { "name": "Nuer: Sudan (0.8m), Ethiopia (0.2m)", "code": "nus" },
-  "NUN": { "name": "Nung: Vietnam (1m)", "code": "nut" },
-  "NW":  { "name": "Newar/Newari: Nepal (0.8m)", "code": "new" },
-  "NY":  { "name": "Nyanja: see CW-Chichewa which is the same" },
-  "OG":  { "name": "Ogan: Indonesia-Sumatera (less than 0.5m)", "code": "pse" },
-  "OH":  { "name": "Otjiherero service in Namibia (Languages: Herero, SeTswana)" },
-  "OO":  { "name": "Oromo: Ethiopia (26m)", "code": "orm" },
-  "OR":  { "name": "Odia / Oriya / Orissa: India-Odisha,Chhattisgarh (32m)", "code": "ory" },
-  "OS":  { "name": "Ossetic: Russia (0.5m), Georgia (0.1m)", "code": "oss" },
-  "OW":  { "name": "Oshiwambo service in Angola and Namibia (Languages: Ovambo, Kwanyama)" },
-  "P":   { "name": "Portuguese: Brazil (187m), Angola (14m), Portugal (10m)", "code": "por" },
-  "PAL": { "name": "Palaung - Pale: Myanmar (0.3m)", "code": "pce" },
-  "PAS": { "name": "Pasemah: Indonesia-Sumatera (less than 0.5m)", "code": "pse" },
-  "PED": { "name": "Pedi: S Africa (4m)", "code": "nso" },
-  "PJ":  { "name": "Punjabi: Pakistan (60m), India-Punjab,Rajasthan (28m)", "code": "pnb,pan" },
-  "PO":  { "name": "Polish: Poland (37m)", "code": "pol" },
-  "POR": { "name": "Po: Myanmar-Rakhine (identical to K-W?)" },
-  "POT": { "name": "Pothwari: Pakistan (2.5m)", "code": "phr" },
-  "PS":  { "name": "Pashto / Pushtu: Afghanistan (6m), Pakistan (1m)", "code": "pbt" },
-  "PU":  { "name": "Pulaar: Senegal (3m), Gambia (0.3m)", "code": "fuc" },
-  "Q":   { "name": "Quechua: Peru, Bolivia, Ecuador (various varieties; 9m)", "code": "que,qvi" },
-  "QQ":  { "name": "Qashqai: Iran (1.5m)", "code": "qxq" },
-  "R":   { "name": "Russian: Russia (137m), Ukraine (8m), Kazakhstan (6m), Belarus (1m)", "code": "rus" },
-  "RAD": { "name": "Rade/Ede: Vietnam (0.2m)", "code": "rad" },
-  "RAJ": { "name": "Rajasthani: common lingua franca in Rajasthan (18m)", "code": "raj" },
-  "REN": { "name": "Rengao: Vietnam (18,000)", "code": "ren" },
-  "RGM": { "name": "Rengma Naga: India-Nagaland (34,000)", "code": "nre,nnl" },
-  "RO":  { "name": "Romanian: Romania (20m), Moldova (3m), Serbia-Vojvodina (0.2m)", "code": "ron" },
-  "ROG": { "name": "Roglai (Northern, Southern): Vietnam (0.1m)", "code": "rog,rgs" },
-  "ROH": { "name": "Rohingya (rjj): Myanmar-Rakhine (2m)", "code": "rhg" },
-  "RON": { "name": "Rongmei Naga: India-Manipur,Nagaland,Assam (60,000)", "code": "nbu" },
-  "Ros": { "name": "Rosary session of Vatican Radio" },
-  "RU":  { "name": "Rusyn / Ruthenian: Ukraine (0.5m), Serbia-Vojvodina (30,000)", "code": "rue" },
-  "RWG": { "name": "Rawang: Myanmar-Kachin (60,000)", "code": "raw" },
-  "S":   { "name": "Spanish/Castellano: Spain (30m), Latin America (336m), USA (34m)", "code": "spa" },
-  "SAH": { "name": "Saho: Eritrea (0.2m)", "code": "ssy" },
-  "SAN": { "name": "Sango: Central African Rep. (0.4m)", "code": "sag" },
-  "SAR": { "name": "Sara/Sar: Chad (0.2m)", "code": "mwm" },
-  "SAS": { "name": "Sasak: Indonesia-Lombok (2m)", "code": "sas" },
-  "SC":  { "name": "Serbocroat (Yugoslav language up to national/linguistic separation)", "code": "hbs" },
-  "SCA": { "name": "Scandinavian languages (Norwegian, Swedish, Finnish)" },
-  "SD":  { "name": "Sindhi: Pakistan (19m), India (2m)", "code": "snd" },
-  "SED": { "name": "Sedang: Vietnam (0.1m)", "code": "sed" },
-  "SEF": { "name": "Sefardi/Judeo Spanish/Ladino: Israel (0.1m), Turkey (10,000)", "code": "lad" },
-  "SEN": { "name": "Sena: Mocambique (1m)", "code": "seh" },
-  "SFO": { "name": "Senoufo/Sénoufo-Syenara: Mali (0.15m)", "code": "shz" },
-  "SGA": { "name": "Shangaan/Tsonga: Mocambique (2m), South Africa (2m)", "code": "tso" },
-  "SGM": { "name": "Sara Gambai / Sara Ngambai: Chad (0.9m)", "code": "sba" },
-  "SGO": { "name": "Songo: Angola (50,000)", "code": "nsx" },
-  "SGT": { "name": "Sangtam: India-Nagaland (84,000)", "code": "nsa" },
-  "SHA": { "name": "Shan: Myanmar (3m)", "code": "shn" },
-  "SHk": { "name": "Shan-Khamti: Myanmar (8,000), India-Assam (5,000)", "code": "kht" },
-  "SHC": { "name": "Sharchogpa / Sarchopa / Tshangla: E Bhutan (0.14m)", "code": "tsj" },
-  "SHE": { "name": "Sheena/Shina: Pakistan (0.6m)", "code": "scl,plk" },
-  "SHK": { "name": "Shiluk/Shilluk: South Sudan (0.2m)", "code": "shk" },
-  "SHO": { "name": "Shona: Zimbabwe (11m)", "code": "sna" },
-  "SHP": { "name": "Sherpa: Nepal (0.1m)", "code": "xsr" },
-  "SHU": { "name": "Shuwa Arabic: Chad (1m), Nigeria (0.1m), N Cameroon (0.1m)", "code": "shu" },
-  "SI":  { "name": "Sinhalese/Sinhala: Sri Lanka (16m)", "code": "sin" },
-  "SID": { "name": "Sidamo/Sidama: Ethiopia (3m)", "code": "sid" },
-  "SIK": { "name": "Sikkimese/Bhutia: India-Sikkim,W.Bengal (70,000)", "code": "sip" },
-  "SIR": { "name": "Siraiki/Seraiki: Pakistan (14m)", "code": "skr" },
-  "SK":  { "name": "Slovak: Slovakia (5m), Czech Republic (0.2m), Serbia (80,000)", "code": "slk" },
-  "SLM": { "name": "Pijin/Solomon Islands Pidgin: Solomon Islands (0.3m)", "code": "pis" },
-  "SLT": { "name": "Silte / East Gurage / xst: Ethiopia (1m)", "code": "stv" },
-  "SM":  { "name": "Samoan: Samoa (0.2m), American Samoa (0.05m)", "code": "smo" },
-  "SMP": { "name": "Sambalpuri / Sambealpuri: India-Odisha,Chhattisgarh (18m)", "code": "spv" },
-  "SNK": { "name": "Sanskrit: India (0.2m)", "code": "san" },
-  "SNT": { "name": "Santhali: India-Bihar,Jharkhand,Odisha (6m), Bangladesh (0.2m)", "code": "sat" },
-  "SO":  { "name": "Somali: Somalia (8m), Ethiopia (5m), Kenya (2m), Djibouti (0.3m)", "code": "som" },
-  "SON": { "name": "Songhai: Mali (0.6m)", "code": "ses,khq" },
-  "SOT": { "name": "SeSotho: South Africa (4m), Lesotho (2m)", "code": "sot" },
-  "SR":  { "name": "Serbian: Serbia (7m), Bosnia-Hercegovina (1.5m)", "code": "srp" },
-  "SRA": { "name": "Soura / Sora: India-Odisha,Andhra Pr. (0.3m)", "code": "srb" },
-  "STI": { "name": "Stieng: Vietnam (85,000)", "code": "sti,stt" },
-  "SUA": { "name": "Shuar: Ecuador (35,000)", "code": "jiv" },
-  "SUD": { "name": "Sudanese Arabic: Sudan and South Sudan (15m)", "code": "apd" },
-  "SUM": { "name": "Sumi Naga: India-Nagaland (0.1m)", "code": "nsm" },
-  "SUN": { "name": "Sunda/Sundanese: Indonesia-West Java (34m)", "code": "sun" },
-  "SUR": { "name": "Surgujia: India-Chhattisgarh (1.5m)", "code": "sgj" },
-  "SUS": { "name": "Sudan Service of IBRA, in SUD, BED, FUR, and TGR" },
-  "SV":  { "name": "Slovenian: Slovenia (1.7m), Italy (0.1m), Austria (18,000)", "code": "slv" },
-  "SWA": { "name": "Swahili/Kisuaheli: Tanzania (15m), Kenya, Ea.DR Congo (9m)", "code": "swc,swh" },
-  "SWE": { "name": "Swedish: Sweden (8m), Finland (0.3m)", "code": "swe" },
-  "SWZ": { "name": "SiSwati: Swaziland (1m), South Africa (1m)", "code": "ssw" },
-  "T":   { "name": "Thai: Thailand (20m)", "code": "tha" },
-  "TAG": { "name": "Tagalog: Philippines (22m)", "code": "tgl" },
-  "TAH": { "name": "Tachelhit/Sous: Morocco, southern (4m), Algeria", "code": "shi" },
-  "TAL": { "name": "Talysh: Azerbaijan, Iran (1m)", "code": "tly" },
-  "TAM": { "name": "Tamil: S.India (60m), Malaysia (4m), Sri Lanka (4m)", "code": "tam" },
-  "TAU": { "name": "Tausug: Philippines-Sulu, n.Borneo (1m)", "code": "tsg" },
-  "TB":  { "name": "Tibetan / Lhasa Tibetan: Tibet (1m), India (0.1m)", "code": "bod" },
-  "TBL": { "name": "Tboli / T'boli / Tagabili: Philippines-Mindanao (0.1m)", "code": "tbl" },
-  "TBS": { "name": "Tabasaran: Russia-Dagestan (0.1m)", "code": "tab" },
-  "TEL": { "name": "Telugu: India-Andhra Pr. (74m)", "code": "tel" },
-  "TEM": { "name": "Temme/Temne: Sierra Leone (1.5m)", "code": "tem" },
-  "TFT": { "name": "Tarifit: Morocco, northern (1.3m), Algeria", "code": "rif" },
-  "TGB": { "name": "Tagabawa / Bagobo: Philippines-Mindanao (43,000)", "code": "bgs" },
-  "TGK": { "name": "Tangkhul/Tangkul Naga: India-Manipur,Nagaland (0.15m)", "code": "nmf" },
-  "TGR": { "name": "Tigre/Tigré/Tigrawit: Eritrea (1m)", "code": "tig" },
-  "TGS": { "name": "Tangsa/Naga-Tase: Myanmar (60,000), India-Arunachal Pr. (40,000)", "code": "nst" },
-  "THA": { "name": "Tharu Buksa: India-Uttarakhand (43,000)", "code": "tkb" },
-  "TIG": { "name": "Tigrinya/Tigray: Ethiopia (4m), Eritrea (3m)", "code": "tir" },
-  "TJ":  { "name": "Tajik: Tajikistan (3m), Uzbekistan (1m)", "code": "tgk" },
-  "TK":  { "name": "Turkmen: Turkmenistan (3m), Iran (2m), Afghanistan (1.5m)", "code": "tuk" },
-  "TKL": { "name": "Tagakaulo (dialect of Kalagan): Philippines-Mindanao (0.2m)", "code": "kqe,klg" },
-  "TL":  { "name": "Tai-Lu/Lu: China-Yunnan (0.3m), Myanmar (0.2m), Laos (0.1m)", "code": "khb" },
-  "TM":  { "name": "Tamazight: Morocco, central (3m)", "code": "zgh" },
-  "TMG": { "name": "Tamang: Nepal (1.5m)", "code": "taj,tdg,tmk,tsf" },
-  "TMJ": { "name": "Tamajeq: Niger (0.8m), Mali (0.44m), Algeria (40,000)", "code": "taq,thv,thz,ttq" },
-  "TN":  { "name": "Tai-Nua/Chinese Shan: China-Yunnan (0.5m), LAO/MYA/VTN (0.2m)", "code": "tdd" },
-  "TNG": { "name": "Tonga: Zambia (1m), Zimbabwe (0.1m)", "code": "toi" },
-  "TO":  { "name": "Tongan: Tonga (0.1m)", "code": "ton" },
-  "TOK": { "name": "Tokelau: Tokelau (1000)", "code": "tkl" },
-  "TOR": { "name": "Torajanese/Toraja: Indonesia-Sulawesi (0.8m)", "code": "sda" },
-  "TP":  { "name": "Tok Pisin: Papua New Guinea (4m)", "code": "tpi" },
-  "TS":  { "name": "Tswana / SeTswana: Botswana (1m), South Africa (3m)", "code": "tsn" },
-  "TSA": { "name": "Tsangla: see SHC" },
-  "TSH": { "name": "Tshwa: Mocambique (1m)", "code": "tsc" },
-  "TT":  { "name": "Tatar: Russia-Tatarstan,Bashkortostan (5m)", "code": "tat" },
-  "TTB": { "name": "Tatar-Bashkir service of Radio Liberty" },
-  "TU":  { "name": "Turkish: Turkey (46m), Bulgaria (0.6m), N Cyprus (0.2m)", "code": "tur" },
-  "TUL": { "name": "Tulu: India-Karnataka,Kerala (2m)", "code": "tcy" },
-  "TUM": { "name": "Tumbuka: Malawi (2m), Zambia (0.5m)", "code": "tum" },
-  "TUN": { "name": "Tunisian Arabic: Tunisia (9m)", "code": "aeb" },
-  "TUR": { "name": "Turkana: NW Kenya (1m)", "code": "tuv" },
-  "TV":  { "name": "Tuva / Tuvinic: Russia-Tannu Tuva (0.25m)", "code": "tyv" },
-  "TW":  { "name": "Taiwanese/Fujian/Hokkien/Min Nan (CHN 25m, TWN 15m, others 9m)", "code": "nan" },
-  "TWI": { "name": "Twi/Akan: Ghana (8m)", "code": "aka" },
-  "TWT": { "name": "Tachawit/Shawiya/Chaouia: Algeria (1.4m)", "code": "shy" },
-  "TZ":  { "name": "Tamazight/Berber: Morocco (2m)", "code": "zgh,tzm" },
-  "UA":  { "name": "Uab Meto / Dawan / Baikenu: West Timor (1m)", "code": "aoz" },
-  "UD":  { "name": "Udmurt: Russia-Udmurtia (0.3m)", "code": "udm" },
-  "UI":  { "name": "Uighur: China-Xinjiang (8m), Kazakhstan (0.3m)", "code": "uig" },
-  "UK":  { "name": "Ukrainian: Ukraine (32m), Kazakhstan (0.9m), Moldova (0.6m)", "code": "ukr" },
-  "UM":  { "name": "Umbundu: Angola (6m)", "code": "umb" },
-  "UR":  { "name": "Urdu: Pakistan (104m), India (51m)", "code": "urd" },
-  "UZ":  { "name": "Uzbek: Uzbekistan (16m)", "code": "uzn" },
-  "V":   { "name": "Vasco / Basque / Euskera: Spain (0.6m), France (76,000)", "code": "eus" },
-  "VAD": { "name": "Vadari / Waddar / Od: India-Andhra Pr. (0.2m)", "code": "wbq" },
-  "VAR": { "name": "Varli / Warli: India-Maharashtra (0.6m)", "code": "vav" },
-  "Ves": { "name": "Vespers (Vatican Radio)" },
-  "Vn":  { "name": "Vernacular = local language(s)" },
-  "VN":  { "name": "Vietnamese: Vietnam (66m)", "code": "vie" },
-  "VV":  { "name": "Vasavi: India-Maharashtra,Gujarat (1m)", "code": "vas" },
-  "VX":  { "name": "Vlax Romani / Romanes / Gypsy: Romania (0.2m), Russia (0.1m)", "code": "rmy" },
-  "W":   { "name": "Wolof: Senegal (4m)", "code": "wol" },
-  "WA":  { "name": "Wa / Parauk: South China (0.4m), Myanmar (0.4m)", "code": "prk" },
-  "WAO": { "name": "Waodani/Waorani: Ecuador (2000)", "code": "auc" },
-  "WE":  { "name": "Wenzhou: dialect of WU" },
-  "WT":  { "name": "White Tai / Tai Don: Vietnam (0.3m), Laos (0.2m)", "code": "twh" },
-  "WU":  { "name": "Wu: China-Jiangsu,Zhejiang (80m)", "code": "wuu" },
-  "XH":  { "name": "Xhosa: South Africa (8m)", "code": "xho" },
-  "YAO": { "name": "Yao/Yawo: Malawi (2m), Mocambique (0.5m), Tanzania (0.4m)", "code": "yao" },
-  "YER": { "name": "Yerukula: India-Andhra Pr. (70,000)", "code": "yeu" },
-  "YI":  { "name": "Yi / Nosu: China-Sichuan (2m)", "code": "iii" },
-  "YK":  { "name": "Yakutian / Sakha: Russia-Sakha (0.5m)", "code": "sah" },
-  "YO":  { "name": "Yoruba: Nigeria (20m), Benin (0.5m)", "code": "yor" },
-  "YOL": { "name": "Yolngu/Yuulngu: Australia-Northern Territory (4000)", "code": "djr" },
-  "YUN": { "name": "Dialects/languages of Yunnan (China)" },
-  "YZ":  { "name": "Yezidi program (Kurdish-Kurmanji language)" },
-  "Z":   { "name": "Zulu: South Africa (10m), Lesotho (0.3m)", "code": "zul" },
-  "ZA":  { "name": "Zarma/Zama: Niger (2m)", "code": "dje" },
-  "ZD":  { "name": "Zande: DR Congo (0.7m), South Sudan (0.35m)", "code": "zne" },
-  "ZG":  { "name": "Zaghawa: Chad (87,000), Sudan (75,000)", "code": "zag" },
-  "ZH":  { "name": "Zhuang: Southern China, 16 varieties (15m)", "code": "zha" },
-  "ZWE": { "name": "Languages of Zimbabwe" },
-  "Zomi-Chin:": { "name": "see Chin-Zomi (C-Z)" }
-}
-
-#
-# Target Regions
-#
-EIBI_Targets = {
-  "Af":  "Africa",
-  "Am":  "America(s)",
-  "As":  "Asia",
-  "C..": "Central ..",
-  "Car": "Caribbean, Gulf of Mexico, Florida Waters",
-  "Cau": "Caucasus",
-  "CIS": "Commonwealth of Independent States (Former Soviet Union)",
-  "CNA": "Central North America",
-  "E..": "East ..",
-  "ENA": "Eastern North America",
-  "ENE": "East-northeast",
-  "ESE": "East-southeast",
-  "Eu":  "Europe (often including North Africa/Middle East)",
-  "FE":  "Far East",
-  "Glo": "Global",
-  "In":  "Indian subcontinent",
-  "LAm": "Latin America (=Central and South America)",
-  "ME":  "Middle East",
-  "N..": "North ..",
-  "NAO": "North Atlantic Ocean",
-  "NE":  "Northeast",
-  "NNE": "North-northeast",
-  "NNW": "North-northwest",
-  "NW":  "Northwest",
-  "Oc":  "Oceania (Australia, New Zealand, Pacific Ocean)",
-  "S..": "South ..",
-  "SAO": "South Atlantic Ocean",
-  "SE":  "Southeast",
-  "SEA": "South East Asia",
-  "SEE": "South East Europe",
-  "Sib": "Siberia",
-  "SSE": "South-southeast",
-  "SSW": "South-southwest",
-  "SW":  "Southwest",
-  "Tib": "Tibet",
-  "W..": "West ..",
-  "WIO": "Western Indian Ocean",
-  "WNA": "Western North America",
-  "WNW": "West-northwest",
-  "WSW": "West-southwest"
-}
-
-EIBI_Targets = {
-  "AFGk":  "Kabul / Pol-e-Charkhi",
-  "AFGx":  "Khost",
-  "AFGy":  "Kabul-Yakatut",
-  "AFS":   "Meyerton",
-  "AFSct": "Cape Town",
-  "AFSj":  "Johannesburg",
-  "AGLL":  "Luena (Moxico)",
-  "AGLlu": "Luanda Radio",
-  "AGLm":  "Luanda - Mulenvos",
-  "AIA":   "The Valley",
-  "ALBc":  "Cerrik (CRI)",
-  "ALBf":  "Fllake (Durres, 500kW)",
-  "ALBs":  "Shijiak (Radio Tirana) (1x100kW = 2x50kW)",
-  "ALGad": "Adrar",
-  "ALGal": "Algiers",
-  "ALGan": "Annaba",
-  "ALGb":  "Béchar",
-  "ALGfk": "F'Kirina (Aïn Beïda)",
-  "ALGo":  "Ouargla / Ourgla",
-  "ALGof": "Ouled Fayet",
-  "ALGor": "Oran 7TO",
-  "ALGr":  "Reggane",
-  "ALGs":  "In Salah (Ain Salih)",
-  "ALGt":  "Tindouf (Rabbouni)",
-  "ALGtm": "Timimoun",
-  "ALSan": "Annette",
-  "ALSap": "Anchor Point",
-  "ALSba": "Barrow",
-  "ALScb": "Cold Bay",
-  "ALSe":  "Elmendorf AFB",
-  "ALSg":  "Gakona",
-  "ALSk":  "Kodiak",
-  "ALSks": "King Salmon",
-  "ALSno": "Nome",
-  "ARGb":  "Buenos Aires",
-  "ARGco": "Córdoba",
-  "ARGcr": "Comodoro Rivadavia (Navy)",
-  "ARGcv": "Comodoro Rivadavia (Air)",
-  "ARGe":  "Ezeiza, Prov. Buenos Aires",
-  "ARGg":  "General Pacheco",
-  "ARGmp": "Mar del Plata, Prov. Buenos Aires",
-  "ARGr":  "Resistencia, Chaco",
-  "ARM":   "Gavar (formerly Kamo)",
-  "ARMy":  "Yerevan",
-  "ARSj":  "Jeddah/Jiddah",
-  "ARSjr": "Jiddah Radio",
-  "ARSjz": "Jazan",
-  "ARSnj": "Najran",
-  "ARSr":  "Riyadh",
-  "ASC":   "Ascension Island,",
-  "ATAe":  "Base Esperanza",
-  "ATAf":  "Bahia Fildes, King George Island",
-  "ATAma": "Maramio Base, Seymour Island",
-  "AUSa":  "Alice Springs NT",
-  "AUSae": "Aero Sites: Cape Pallarenda, Broken Hill, Knuckeys Lagoon",
-  "AUSas": "Alice Springs NT",
-  "AUSat": "Alice Springs NT",
-  "AUSb":  "Brandon QL",
-  "AUSbe": "Bendigo VIC",
-  "AUSbm": "Broadmeadows VIC",
-  "AUSc":  "Charleville QL",
-  "AUSex": "Exmouth WA",
-  "AUSg":  "Gunnedah NSW",
-  "AUSh":  "Humpty Doo NT",
-  "AUShp": "Hurlstone Park, Sydney NSW",
-  "AUSin": "Innisfail QL",
-  "AUSka": "Katherine NT",
-  "AUSL":  "Sydney-Leppington NSW",
-  "AUSm":  "Macleay Island QL",
-  "AUSma": "Manilla NSW",
-  "AUSn":  "Ningi QL",
-  "AUSri": "Russell Island QL",
-  "AUSrm": "Roma QL",
-  "AUSrz": "Razorback NSW",
-  "AUSs":  "Shepparton VIC",
-  "AUSsf": "Schofields, western Sydney",
-  "AUSsm": "St Mary's, Sydney",
-  "AUSt":  "Tennant Creek NT",
-  "AUSw":  "Wiluna WA",
-  "AUSww": "Wee Waa NSW",
-  "AUT":   "Moosbrunn",
-  "AZEb":  "Baku",
-  "AZEg":  "Gäncä",
-  "AZEs":  "Stepanakert",
-  "AZRho": "Horta",
-  "AZRlj": "Lajes Field",
-  "AZRsm": "Santa Maria",
-  "Ba":    "Porto Alegre, RS",
-  "Bag":   "Araguaína, TO",
-  "Bam":   "Amparo, SP",
-  "Ban":   "Anápolis, GO",
-  "Bap":   "Aparecida, SP",
-  "Bar":   "Araraquara, SP",
-  "Bb":    "Brasilia, Parque do Rodeador, DF",
-  "Bbe":   "Belém, PA",
-  "Bbh":   "Belo Horizonte, Minas Gerais",
-  "Bbr":   "Braganca, PA",
-  "Bbt":   "Belém, PA (Ondas Tropicais 5045)",
-  "Bbv":   "Boa Vista, RR",
-  "Bc":    "Contagem/Belo Horizonte, MG",
-  "Bca":   "Campo Largo (Curitiba), PR",
-  "Bcb":   "Camboriú, SC",
-  "Bcc":   "Cáceres, MT",
-  "Bcg":   "Campo Grande, MS",
-  "BCg":   "Campo Grande, MS",
-  "Bcm":   "Campinas, SP",
-  "Bcn":   "Congonhas, MG",
-  "Bco":   "Coari, AM",
-  "Bcp":   "Cachoeira Paulista, SP",
-  "BCp":   "Cachoeira Paulista, SP",
-  "Bcs":   "Cruzeiro do Sul, Estrada do Aeroporto, AC",
-  "Bcu":   "Curitiba, PR",
-  "Bcv":   "Cuiabá, MT",
-  "Bc2":   "Curitiba, PR RB2",
-  "BE":    "Esteio (Porto Alegre), RS",
-  "Be":    "Esteio (Porto Alegre), RS",
-  "Bf":    "Foz do Iguacu, PR",
-  "Bfl":   "Florianópolis, SC",
-  "Bfp":   "Florianópolis - Comboriú, SC",
-  "Bg":    "Guarujá, SP",
-  "Bgb":   "Guaíba (Porto Alegre), RS",
-  "Bgc":   "Sao Gabriel de Cachoeira, AM",
-  "Bgm":   "Guajará-Mirim, RO",
-  "Bgo":   "Goiânia,",
-  "Bgu":   "Guarulhos, SP",
-  "Bh":    "Belo Horizonte, MG",
-  "Bib":   "Ibitinga, SP",
-  "Bit":   "Itapevi, SP",
-  "Bld":   "Londrina, PR",
-  "Bli":   "Limeira, SP",
-  "Blj":   "Lajeado, RS",
-  "Blo":   "Londrina, PR",
-  "Bm":    "Manaus AM",
-  "Bma":   "Manaus - Radiodif.Amazonas, AM",
-  "Bmc":   "Macapá, AP",
-  "Bmg":   "Manaus - Radio Globo, AM",
-  "Bmi":   "Marília, SP",
-  "Bmm":   "São Mateus do Maranhão, Maranhão",
-  "Bmo":   "Mogi das Cruces, SP",
-  "Bmr":   "Manaus - Radio Rio Mar, AM",
-  "Bob":   "Óbidos, PA",
-  "Bos":   "Osasco, SP",
-  "Bpa":   "Parintins, AM",
-  "Bpc":   "Pocos da Caldas, MG",
-  "Bpe":   "Petrolina, PE",
-  "Bpi":   "Piraquara (Curitiba), PR",
-  "Br":    "Rio de Janeiro (Radio Globo), RJ",
-  "Brb":   "Rio Branco, AC",
-  "Brc":   "Rio de Janeiro (Radio Capital), RJ",
-  "Bre":   "Recife, PE",
-  "Brj":   "Rio de Janeiro (Radio Relogio), RJ",
-  "Bro":   "Rio de Janeiro, Observatório Nacional,",
-  "Brp":   "Ribeirão Preto, SP",
-  "Brs":   "Rio de Janeiro (Super Radio), RJ",
-  "Brw":   "Rio de Janeiro PWZ",
-  "Bsa":   "Santarém, PA",
-  "Bsb":   "Sao Paulo - Radio Bandeirantes, SP",
-  "Bsc":   "Sao Paulo - Radio Cultura, SP",
-  "Bse":   "Senador Guiomard, AC",
-  "Bsg":   "Sao Paulo - Radio Globo, SP",
-  "Bsj":   "Sao Paulo - Radio 9 de Julho, SP",
-  "Bsm":   "Santa Maria, RS",
-  "Bso":   "Sorocaba, SP / Votorantim,",
-  "Bsr":   "Sao Paulo - Radio Record, SP",
-  "Bsy":   "Sao Paulo PYB45",
-  "Bsz":   "Sao Paulo - Radio Gazeta, SP",
-  "Bta":   "Taubaté, SP",
-  "Bte":   "Teresina, PI",
-  "Btf":   "Tefé, AM",
-  "Bvi":   "Vitória, ES",
-  "Bx":    "Xapuri, AC",
-  "Bxm":   "Unknown location in Maranhão,",
-  "Bxn":   "Unknown location in Paraná,",
-  "Bxp":   "Unknown location in Paraíba,",
-  "BELo":  "Oostende",
-  "BELw":  "Wingene",
-  "BENc":  "Cotonou",
-  "BENp":  "Parakou",
-  "BERh":  "Bermuda Harbour",
-  "BES":   "Bonaire",
-  "BFA":   "Ouagadougou",
-  "BGDd":  "Dhaka-Dhamrai",
-  "BGDk":  "Dhaka-Khabirpur",
-  "BGDs":  "Dhaka-Savar",
-  "BHRa":  "Abu Hayan",
-  "BHRm":  "Al Muharraq",
-  "BIHb":  "Bijeljina",
-  "BIHz":  "Zavidovici",
-  "BIO":   "Diego Garcia",
-  "BLR":   "Minsk-Sasnovy/Kalodziscy",
-  "BLRb":  "Brest",
-  "BLRg":  "Hrodna/Grodno",
-  "BLRm":  "Mahiliou/Mogilev ('Orsha')",
-  "BLRmo": "Molodechno/Vileyka (43 Comm Center Russian Navy)",
-  "BLRvi": "Vitebsk",
-  "BOLay": "Santa Ana del Yacuma",
-  "BOLcb": "Cochabamba",
-  "BOLp":  "La Paz",
-  "BOLri": "Riberalta",
-  "BOLsc": "Santa Cruz",
-  "BOLsz": "Santa Cruz Airport",
-  "BOLuy": "Uyuni",
-  "BOLyu": "Yura",
-  "BOT":   "Mopeng Hill",
-  "BTN":   "Thimphu",
-  "BULbg": "Blagoevgrad (864)",
-  "BULbk": "Bankya",
-  "BULdo": "Doulovo (1161)",
-  "BULkj": "Kardjali (963)",
-  "BULp":  "Plovdiv-Padarsko",
-  "BULpe": "Petrich",
-  "BULs":  "Sofia-Kostinbrod",
-  "BULsa": "Samuil (864)",
-  "BULsl": "Salmanovo (747)",
-  "BULtv": "Targovishte (1161)",
-  "BULva": "Varna",
-  "BULvi": "Vidin",
-  "BULvk": "Vakarel (261)",
-  "CAFba": "Bangui",
-  "CAFbo": "Boali",
-  "CANal": "Aldergrove BC, Matsqui Tx site",
-  "CANap": "Amphitrite Point BC",
-  "CANc":  "Calgary AB",
-  "CANcb": "Cambridge Bay, Victoria Island NU",
-  "CANcc": "Churchill MB",
-  "CANch": "Coral Harbour NU",
-  "CANcr": "Cap des Rosiers",
-  "CANcw": "Cartwright NL",
-  "CANdi": "Digby Island BC",
-  "CANex": "Essex County (Harrow), near Detroit, ON",
-  "CANfg": "CFG8525 ON",
-  "CANg":  "Gander NL",
-  "CANh":  "Halifax NS",
-  "CANhd": "Hopedale NL",
-  "CANhp": "Hunter Point BC",
-  "CANhr": "Hay River",
-  "CANhx": "Halifax CFH NS",
-  "CANi":  "Iqaluit NU",
-  "CANin": "Inuvik NWT",
-  "CANj":  "St John's NL",
-  "CANk":  "Killiniq/Killinek NU",
-  "CANki": "Kingsburg NS",
-  "CANlp": "Lockeport NS",
-  "CANlv": "La Vernière, Îles-de-la-Madeleine QC",
-  "CANna": "Natashquan QC",
-  "CANo":  "Ottawa ON",
-  "CANpc": "Port Caledonia NS",
-  "CANr":  "Resolute, Cornwallis Island NU",
-  "CANsa": "St Anthony NL",
-  "CANsj": "St John's NL",
-  "CANsl": "St Lawrence NL",
-  "CANsm": "Sambro NS",
-  "CANsv": "Stephenville NL",
-  "CANt":  "Toronto (Mississauga/Clarkson) ON",
-  "CANtr": "Trenton (Pointe Petre, Lake Ontario)",
-  "CANtr2": "Trenton Receiver Site ON",
-  "CANv":  "Vancouver BC",
-  "CANym": "Yarmouth/Chebogue NS",
-  "CBGka": "Kandal",
-  "CHLa":  "Antofagasta",
-  "CHLe":  "Radio Esperanza",
-  "CHLfx": "Bahia Felix",
-  "CHLjf": "Juan Fernández",
-  "CHLpa": "Punta Arenas",
-  "CHLpm": "Puerto Montt",
-  "CHLs":  "Santiago (Calera de Tango)",
-  "CHLt":  "Talagante",
-  "CHLtq": "Talahuano, Quiriquina Island",
-  "CHLv":  "Valparaiso 32S48-71W29 or",
-  "CHLw":  "Wollaston Island",
-  "CHNa":  "Baoji-Xinjie (Shaanxi; CRI 150 kW; CNR2 9820) '722'",
-  "CHNas": "Baoji-Sifangshan (Shaanxi; CNR1,8) '724'",
-  "CHNb":  "Beijing-Matoucun '572' (100 kW CNR1)",
-  "CHNB":  "Beijing-Chaoyang/Gaobeidian/Shuangqiao '491' (CNR2-8)",
-  "CHNbd": "Beijing-Doudian (150/500 kW CRI) '564'",
-  "CHNbm": "Beijing BAF",
-  "CHNbs": "Beijing 3SD",
-  "CHNb0": "Basuo, Hainan",
-  "CHNc":  "Chengdu (Sichuan)",
-  "CHNcc": "Changchun '523' (Jilin)",
-  "CHNch": "Changzhou Henglinchen '623' (Jiangsu)",
-  "CHNd":  "Dongfang (Hainan)",
-  "CHNda": "Dalian",
-  "CHNdb": "Dongfang-Basuo",
-  "CHNe":  "Gejiu (Yunnan)",
-  "CHNeb": "Beijing, Posolstvo",
-  "CHNf":  "Fuzhou (Fujian)",
-  "CHNfz": "Fuzhou-Mawei XSL (Fujian) and Tailu",
-  "CHNg":  "Gannan (Hezuo)",
-  "CHNgu": "Gutian-Xincheng",
-  "CHNgx": "Guangzhou XSQ",
-  "CHNgy": "Guiyang",
-  "CHNgz": "Guangzhou-Huadu (Guangdong)",
-  "CHNh":  "Hohhot '694' (Nei Menggu, CRI)",
-  "CHNha": "Hailar (Nei Menggu)",
-  "CHNhd": "Huadian '763' (Jilin)",
-  "CHNhe": "Hezuo",
-  "CHNhh": "Hohhot-Yijianfang (Nei Menggu, PBS NM)",
-  "CHNhk": "Haikou (Hainan) XSR",
-  "CHNhu": "Hutubi (Xinjiang)",
-  "CHNj":  "Jinhua",
-  "CHNk":  "Kunming-Anning CRI (Yunnan)",
-  "CHNka": "Kashi (Kashgar) (Xinjiang)",
-  "CHNkl": "Kunming-Lantao PBS (Yunnan)",
-  "CHNL":  "Lingshi '725' (Shanxi)",
-  "CHNly": "Lianyungang, Jiangsu",
-  "CHNn":  "Nanning (Guangxi) '954'",
-  "CHNnj": "Nanjing (Jiangsu)",
-  "CHNp":  "Pucheng (Shaanxi)",
-  "CHNpt": "Putian (Fujian)",
-  "CHNq":  "Ge'ermu/Golmud '916' (Qinghai)",
-  "CHNqz": "Quanzhou '641' (Fujian)",
-  "CHNs":  "Shijiazhuang '723' (Hebei; Nanpozhuang CRI 500 kW; Huikou CNR 100 kW)",
-  "CHNsg": "Shanghai-Taopuzhen",
-  "CHNsh": "Shanghai XSG",
-  "CHNsn": "Sanya (Hainan)",
-  "CHNsq": "Shangqiu (Henan)",
-  "CHNst": "Shantou (Guangdong)",
-  "CHNsw": "Nanping-Shaowu (Fujian)",
-  "CHNsy": "Shuangyashan '128' (Heilongjiang)",
-  "CHNt":  "Tibet (Lhasa-Baiding '602')",
-  "CHNtj": "Tianjin",
-  "CHNu":  "Urumqi (Xinjiang, CRI)",
-  "CHNuc": "Urumqi-Changji (Xinjiang, PBS XJ)",
-  "CHNx":  "Xian-Xianyang '594' (Shaanxi)",
-  "CHNxc": "Xichang (Sichuan)",
-  "CHNxd": "Xiamen-Xiangdian (Fujian) XSM and Dong'an",
-  "CHNxg": "Xining (Qinghai)",
-  "CHNxm": "Xiamen (Fujian)",
-  "CHNxt": "Xiangtan (Hunan)",
-  "CHNxw": "Xuanwei (Yunnan)",
-  "CHNxy": "Xingyang (Henan)",
-  "CHNxz": "Xinzhaicun (Fujian)",
-  "CHNya": "Yanbian-Yanji (Jilin)",
-  "CHNyt": "Yantai (Shandong)",
-  "CHNzh": "Zhuhai '909' (Guangdong)",
-  "CHNzj": "Zhanjiang (Guangdong)",
-  "CHNzs": "Mount Putuo, Xiaohulu Island, Zhoushan",
-  "CKHrt": "Rarotonga",
-  "CLMb":  "Barranquilla",
-  "CLMbu": "Buenaventura",
-  "CLMpl": "Puerto Lleras",
-  "CLMr":  "Rioblanco, Tolima",
-  "CLMsa": "San Andrés Island (SAP)",
-  "CLNe":  "Ekala (SLBC,RJ)",
-  "CLNi":  "Iranawila (IBB)",
-  "CLNp":  "Puttalam",
-  "CLNt":  "Trincomalee (DW)",
-  "CME":   "Buea",
-  "CNRar": "Arrecife (Lanzarote)",
-  "CNRfc": "Fuencaliente (Las Palmas)",
-  "CNRgc": "Gran Canaria airport",
-  "CNRhr": "Haría (Tenerife)",
-  "CNRhy": "Los Hoyos (Gran Canaria)",
-  "CNRlm": "Las Mesas (Las Palmas)",
-  "CNRpr": "Puerto del Rosario",
-  "CODbk": "Bukavu",
-  "CODbu": "Bunia",
-  "COGb":  "Brazzaville-M'Pila",
-  "COGbv": "Brazzaville Volmet",
-  "COGpn": "Pointe Noire",
-  "CTIa":  "Abidjan",
-  "CTR":   "Cariari de Pococí (REE)",
-  "CTRg":  "Guápiles (Canton de Pococí, Prov.de Limón) ELCOR",
-  "CUB":   "La Habana sites Quivicán/Bejucal/Bauta",
-  "CUBb":  "Bauta (Centro Transmisor No.1)",
-  "CUBbe": "Bejucal (Centro Transmisor No.2)",
-  "CUBhr": "Havana Radio",
-  "CUBq":  "Quivicán/Titan (Centro Transmisor No.3)",
-  "CVA":   "Santa Maria di Galeria",
-  "CVAv":  "Citta del Vaticano",
-  "CYPa":  "Akrotiri (UK territory)",
-  "CYPcr": "Cyprus Radio",
-  "CYPg":  "Cape Greco",
-  "CYPm":  "Lady's Mile (UK territory)",
-  "CYPn":  "Nicosia",
-  "CYPy":  "Yeni Iskele",
-  "CZEb":  "Brno-Dobrochov",
-  "CZEcb": "Ceske Budejovice-Husova kolonie",
-  "CZEdl": "Dlouhá Louka",
-  "CZEkv": "Karlovy Vary-Stará Role",
-  "CZEmb": "Moravské Budejovice-Domamil",
-  "CZEos": "Ostrava-Svinov",
-  "CZEp":  "Praha",
-  "CZEpl": "Praha-Liblice",
-  "CZEpr": "Pruhonice / Pruhonice",
-  "CZEpv": "Panská Ves",
-  "CZEtr": "Trebon / Trebon",
-  "CZEva": "Vackov",
-  "Dal":   "Albersloh",
-  "Db":    "Biblis",
-  "Dbe":   "Berlin-Britz",
-  "Dbl":   "Berlin",
-  "Dbr":   "Braunschweig",
-  "Dbu":   "Burg",
-  "Dbv":   "Bonn-Venusberg",
-  "Dcx":   "Cuxhaven-Sahlenburg",
-  "Dd":    "Dillberg",
-  "Ddd":   "Dresden-Wilsdruff",
-  "Ddt":   "Datteln",
-  "De":    "Erlangen-Tennenlohe",
-  "Dfl":   "Flensburg",
-  "Dg":    "Goehren",
-  "Dge":   "Gera",
-  "Dha":   "Hannover",
-  "Dhc":   "Hamburg-Curslack",
-  "Dhe":   "Hannover/Hemmingen",
-  "Dhh":   "Hamburg-Moorfleet",
-  "Dht":   "Hartenstein (Sachsen)",
-  "Djr":   "Juliusruh",
-  "Dk":    "Kall-Krekel",
-  "DL":    "Lampertheim",
-  "Dla":   "Langenberg",
-  "Dli":   "Lingen",
-  "Dmf":   "Mainflingen",
-  "Dn":    "Nauen",
-  "Dnh":   "Neuharlingersiel DHJ59",
-  "Dnu":   "Nuernberg",
-  "Dor":   "Oranienburg",
-  "Dpi":   "Pinneberg",
-  "Dr":    "Rohrbach",
-  "Drf":   "Rhauderfehn",
-  "Ds":    "Stade",
-  "Dw":    "Wertachtal",
-  "Dwa":   "Winsen (Aller)",
-  "Dwb":   "Wachenbrunn",
-  "Dwe":   "Weenermoor",
-  "DJId":  "Djibouti",
-  "DJIi":  "Centre de Transmissions Interarmées FUV",
-  "DNKa":  "Aarhus-Mårslet",
-  "DNKbl": "Blaavand",
-  "DNKbr": "Bramming",
-  "DNKbv": "Bovbjerg",
-  "DNKco": "Copenhagen OXT",
-  "DNKf":  "Frederikshavn",
-  "DNKh":  "Hillerod",
-  "DNKhv": "Copenhagen Hvidovre",
-  "DNKi":  "Copenhagen Ishøj",
-  "DNKk":  "Kalundborg",
-  "DNKra": "Randers",
-  "DNKro": "Ronne",
-  "DNKsg": "Skagen",
-  "DNKsk": "Skamlebaek",
-  "DOMsd": "Santo Domingo",
-  "Eaf":   "Alfabia (Mallorca)",
-  "Eag":   "Aguilas",
-  "Ear":   "Ares",
-  "Eas":   "La Asomada",
-  "Ebo":   "Boal",
-  "Ec":    "Coruna",
-  "Ecg":   "Cabo de Gata - Sabinar",
-  "Ecp":   "Chipiona",
-  "Efi":   "Finisterre",
-  "Egm":   "Torreta de Guardamar, Guardamar del Segura",
-  "Eh":    "Huelva",
-  "Ehv":   "'Huelva'",
-  "Ejq":   "Jaizquibel",
-  "Ema":   "Madrid",
-  "Emu":   "Muxía",
-  "Emx":   "Marratxí",
-  "En":    "Noblejas",
-  "Epm":   "Palma de Mallorca",
-  "Epz":   "Pastoriza",
-  "Erq":   "Roquetas",
-  "Ers":   "Rostrío/Cabo de Peñas",
-  "Esb":   "Sabiner",
-  "Eta":   "Tarifa",
-  "Etj":   "Trijueque",
-  "Eto":   "Torrejón de Ardoz (Pegaso, Pavon, Brujo)",
-  "Evj":   "Vejer",
-  "EGYa":  "Abis",
-  "EGYal": "Alexandria / Al-Iskandaria",
-  "EGYca": "Cairo",
-  "EGYea": "El Arish",
-  "EGYz":  "Abu Zaabal",
-  "EQAa":  "Ambato",
-  "EQAc":  "Pico Pichincha",
-  "EQAg":  "Guayaquil",
-  "EQAi":  "Ibarra",
-  "EQAo":  "Otavalo",
-  "EQAp":  "Pifo",
-  "EQAs":  "Saraguro",
-  "EQAt":  "Tena",
-  "EQAu":  "Sucúa",
-  "ERI":   "Asmara-Saladaro",
-  "ESTta": "Tallinn Radio",
-  "ESTtt": "Tartu",
-  "ESTtv": "Tallinn Volmet",
-  "ETHa":  "Addis Abeba",
-  "ETHad": "Adama",
-  "ETHb":  "Bahir Dar",
-  "ETHd":  "Geja Dera (HS)",
-  "ETHj":  "Geja Jewe (FS)",
-  "ETHjj": "Jijiga",
-  "ETHm":  "Mekele",
-  "ETHn":  "Nekemte",
-  "ETHr":  "Robe",
-  "Fa":    "Allouis",
-  "Fau":   "Auros",
-  "Fav":   "Avord",
-  "Fbr":   "Brest",
-  "Fcm":   "Col de la Madone",
-  "Fco":   "Corsen",
-  "Fg":    "La Garde (Toulon)",
-  "Fgn":   "Gris-Nez",
-  "Fhy":   "Hyères Island",
-  "Fi":    "Issoudun",
-  "Fjb":   "Jobourg",
-  "Fma":   "Mont Angel/Fontbonne",
-  "Foe":   "Ouessant",
-  "Fp":    "Paris",
-  "Fr":    "Rennes",
-  "Fro":   "Roumoules",
-  "Fsa":   "Saissac (11)",
-  "Fsb":   "Strasbourg",
-  "Fsg":   "Saint Guénolé",
-  "Fto":   "Toulon",
-  "Fv":    "Favières FAV",
-  "Fve":   "Vernon",
-  "Fwu":   "Rosnay (HWU)",
-  "FINha": "Hailuoto (Oulu)",
-  "FINhe": "Helsinki",
-  "FINmh": "Mariehamn (Aland Islands)",
-  "FINo":  "Ovaniemi",
-  "FINp":  "Pori",
-  "FINt":  "Topeno, Loppi, near Riihimäki",
-  "FINv":  "Virrat",
-  "FINva": "Vaasa",
-  "FJIn":  "Nadi-Enamanu",
-  "FROt":  "Tórshavn",
-  "FSM":   "Pohnpei",
-  "Gab":   "Aberdeen (Gregness)",
-  "Gaq":   "Aberdeen (Blaikie's Quay)",
-  "Gan":   "Anthorn",
-  "Gba":   "Bangor (No.Ireland)",
-  "Gbd":   "Bridlington (East Yorkshire)",
-  "Gcf":   "Collafirth Hill (Shetland)",
-  "Gcm":   "Crimond (Aberdeenshire)",
-  "Gcp":   "London-Crystal Palace",
-  "Gcr":   "London-Croydon",
-  "Gct":   "Croughton (Northants)",
-  "Gcu":   "Cullercoats, Newcastle",
-  "Gd":    "Droitwich",
-  "Gdv":   "Dover",
-  "Gev":   "St.Eval (Cornwall)",
-  "Gfh":   "Fareham (Hampshire)",
-  "Gfl":   "Falmouth Coastguard",
-  "Gfm":   "Falmouth (Lizard)",
-  "Ghh":   "Holyhead (Isle of Anglesey, Wales)",
-  "Ghu":   "Humber (Flamborough)",
-  "Gic":   "Inskip (Lancashire), St.Eval (Cornwall), Crimond (Aberdeenshire)",
-  "Gin":   "Inskip (Lancashire)",
-  "Glo":   "London",
-  "Glw":   "Lerwick (Shetland)",
-  "Gmh":   "Milford Haven, Wales",
-  "Gni":   "Niton Navtex, Isle of Wight",
-  "Gnw":   "Northwood",
-  "Go":    "Orfordness",
-  "Gp":    "Portland",
-  "Gpp":   "Portpatrick Navtex (Dumfries and Galloway)",
-  "Gr":    "Rampisham",
-  "Gs":    "Skelton",
-  "Gsc":   "Shetland (Lerwick)",
-  "Gsm":   "St Mary's (Isles of Scilly)",
-  "Gsp":   "Saint Peter Port (Guernsey)",
-  "Gst":   "Stornoway (Butt of Lewis)",
-  "Gsw":   "Stornoway port",
-  "Gti":   "Tiree (Inner Hebrides)",
-  "Gw":    "Woofferton",
-  "Gwa":   "Washford (Somerset)",
-  "GAB":   "Moyabi",
-  "GEOs":  "Sukhumi",
-  "GNEb":  "Bata",
-  "GNEm":  "Malabo",
-  "GRCa":  "Avlis",
-  "GRCi":  "Iraklion",
-  "GRCk":  "Kerkyra",
-  "GRCL":  "Limnos (Myrina)",
-  "GRCo":  "Olimpia",
-  "GRCr":  "Rhodos",
-  "GRLaa": "Aasiaat",
-  "GRLik": "Ikerasassuaq (Prins Christian Sund)",
-  "GRLko": "Kook Island",
-  "GRLma": "Maniitsoq",
-  "GRLn":  "Nuuk",
-  "GRLpa": "Paamiut",
-  "GRLqa": "Qaqortoq",
-  "GRLqe": "Qeqertarsuaq",
-  "GRLsi": "Sisimiut",
-  "GRLsq": "Simiutaq",
-  "GRLt":  "Tasiilaq/Ammassalik",
-  "GRLup": "Upernavik",
-  "GRLuu": "Uummannaq",
-  "GUF":   "Montsinery",
-  "GUIc":  "Conakry-Sonfonia",
-  "GUMa":  "Station KSDA, Agat,",
-  "GUMan": "Andersen Air Force Base",
-  "GUMb":  "Barrigada",
-  "GUMh":  "Agana HFDL site",
-  "GUMm":  "Station KTWR, Agana/Merizo",
-  "GUMn":  "Naval station NPN",
-  "GUY":   "Sparendaam",
-  "HKGa":  "Cape d'Aguilar",
-  "HKGm":  "Marine Rescue Radio VRC",
-  "HNDt":  "Tegucigalpa",
-  "HNGb":  "Budapest",
-  "HNGlh": "Lakihegy",
-  "HOLa":  "Alphen aan den Rijn",
-  "HOLb":  "Borculo",
-  "HOLcg": "Coast Guard Den Helder - Scheveningen",
-  "HOLe":  "Elburg",
-  "HOLhe": "Heerde",
-  "HOLk":  "Klazienaveen",
-  "HOLm":  "Margraten",
-  "HOLn":  "Nijmegen",
-  "HOLo":  "Ouddorp, Goeree-Overflakkee island",
-  "HOLov": "Overslag (Westdorpe)",
-  "HOLzw": "Zwolle",
-  "HRV":   "Deanovec",
-  "HWAa":  "WWVH",
-  "HWAb":  "WWVH",
-  "HWAc":  "WWVH",
-  "HWAd":  "WWVH",
-  "HWAhi": "Hickam AFB",
-  "HWAho": "Honolulu/Iroquois Point",
-  "HWAm":  "Moloka'i",
-  "HWAn":  "Naalehu",
-  "HWAnm": "NMO Honolulu/Maili",
-  "HWAp":  "Pearl Harbour",
-  "Ia":    "Andrate",
-  "Ian":   "Ancona IPA",
-  "Iau":   "Augusta IQA (Sicily)",
-  "Ib":    "San Benedetto de Tronto IQP",
-  "Iba":   "Bari IPB",
-  "Icg":   "Cagliari IDC (Sardinia)",
-  "Icv":   "Civitavecchia IPD",
-  "Ige":   "Genova ICB",
-  "Ikr":   "Crotone IPC",
-  "Ili":   "Livorno-Montenero IPL",
-  "Ilm":   "Lampedusa-Ponente IQN",
-  "Ime":   "Messina IDF (Sicily)",
-  "Imp":   "Monteparano (IPC)",
-  "Imz":   "Mazara del Vallo IQQ",
-  "Ina":   "Napoli-Posillipo IQH",
-  "Ip":    "Padova",
-  "Ipa":   "Palermo-Punta Raisi IPP (Sicily)",
-  "Ipt":   "Porto Torres IZN (Sardinia)",
-  "Ir":    "Roma",
-  "Ira":   "Roma IMB",
-  "Ire":   "Rome",
-  "Isi":   "Sigonella (Sicilia)",
-  "Isr":   "Santa Rosa (Maritele), Roma",
-  "Isy":   "NSY",
-  "It":    "Trieste (Monte Radio) IQX",
-  "Iv":    "Viareggio, Toscana",
-  "INDa":  "Aligarh (4x250kW)",
-  "INDah": "Ahmedabad",
-  "INDaz": "Aizawl(10kW)",
-  "INDb":  "Bengaluru-Doddaballapur (Bangalore)",
-  "INDbh": "Bhopal(50kW)",
-  "INDc":  "Chennai (Madras)",
-  "INDd":  "Delhi (Kingsway)",
-  "INDdn": "Delhi-Nangli Poona",
-  "INDg":  "Gorakhpur",
-  "INDgt": "Gangtok",
-  "INDhy": "Hyderabad",
-  "INDim": "Imphal",
-  "INDit": "Itanagar",
-  "INDj":  "Jalandhar",
-  "INDja": "Jaipur",
-  "INDje": "Jeypore",
-  "INDjm": "Jammu",
-  "INDk":  "Kham Pur, Delhi 110036 (Khampur)",
-  "INDkc": "Kolkata-Chandi",
-  "INDkh": "Kohima",
-  "INDko": "Kolkata(Calcutta)-Chinsurah",
-  "INDku": "Kurseong",
-  "INDkv": "Kolkata Volmet",
-  "INDle": "Leh",
-  "INDlu": "Lucknow",
-  "INDm":  "Mumbai (Bombay)",
-  "INDmv": "Mumbai Volmet",
-  "INDn":  "Nagpur, Maharashtra",
-  "INDnj": "Najibabad, Uttar Pradesh",
-  "INDp":  "Panaji (Goa)",
-  "INDpb": "Port Blair-Brookshabad",
-  "INDr":  "Rajkot",
-  "INDra": "Ranchi",
-  "INDsg": "Shillong",
-  "INDsi": "Siliguri",
-  "INDsm": "Shimla",
-  "INDsr": "Srinagar",
-  "INDsu": "Suratgarh (Rajasthan)",
-  "INDt":  "Tuticorin (Tamil Nadu)",
-  "INDtv": "Thiruvananthapuram(Trivendrum)",
-  "INDv":  "Vijayanarayanam (Tamil Nadu)",
-  "INDvs": "Vishakapatnam (Andhra Pradesh)",
-  "INDw":  "Guwahati (1x200kW, 1x50kW)",
-  "INSam": "Ambon, Ambon Island, Maluku",
-  "INSap": "Amamapare, Papua",
-  "INSat": "Atapupu, Timor",
-  "INSba": "Banggai, Banggai Island, Sulawesi Tengah",
-  "INSbb": "Banabungi, Buton Island, Sulawesi Tenggara",
-  "INSbd": "Badas, Sumbawa Island, West Nusa Tenggara",
-  "INSbe": "Bade, Papua",
-  "INSbg": "Bagan Siapi-Api, Riau, Sumatra",
-  "INSbi": "Biak, Papua",
-  "INSbj": "Banjarmasin, Kalimantan Selatan",
-  "INSbk": "Bengkalis, Bengkalis Island, Riau",
-  "INSbl": "Batu Licin, Kalimantan Selatan",
-  "INSbm": "Batu Ampar, Batam Island next to Singapore",
-  "INSbn": "Bawean, Bawean Island, Jawa Timur",
-  "INSbo": "Benoa, Denpasar, Bali",
-  "INSbp": "Balikpapan, Kalimantan Timur",
-  "INSbt": "Benete, Sumbawa Island, West Nusa Tenggara",
-  "INSbu": "Bukittinggi, Sumatera Barat",
-  "INSbw": "Belawan, Medan, Sumatera Utara",
-  "INSby": "Biak, Biak Island, Papua",
-  "INSb2": "Bau-Bau, Buton Island, Sulawesi Tenggara",
-  "INSb3": "Bengkulu, Sumatra",
-  "INSb4": "Bima, Sumbawa Island, West Nusa Tenggara",
-  "INSb5": "Bintuni, Papua Barat",
-  "INSb6": "Bitung, Sulawesi Utara",
-  "INSb7": "Bontang, Kalimantan Timur",
-  "INScb": "Celukan Bawang, Bali",
-  "INScc": "Cilacap, Java",
-  "INSci": "Cigading, Merak, Banten, Java",
-  "INScr": "Cirebon, Jawa Barat",
-  "INSdg": "Donggala, Sulawesi Tengah",
-  "INSdm": "Dumai, Riau, Sumatra",
-  "INSdo": "Dobo, Wamar Island, Maluku",
-  "INSds": "Dabo Singkep, Singkep Island, Riau, Sumatra",
-  "INSen": "Ende, Flores Island, Nusa Tenggara Timur",
-  "INSf":  "Fakfak, Papua Barat",
-  "INSfj": "Fatujuring, Wokam Island, Maluku",
-  "INSg":  "Gorontalo, Sulawesi",
-  "INSgi": "Gilimanuk, Bali",
-  "INSgo": "Gorontalo port, Sulawesi",
-  "INSgr": "Gresik, Surabaya, Jawa Timur",
-  "INSgs": "Gunung Sitoli, Nias Island, Sumatera Utara",
-  "INSj":  "Jakarta (Cimanggis)",
-  "INSja": "Jambi PKC3",
-  "INSjb": "Jakarta BMG",
-  "INSjm": "Jambi, Sumatera",
-  "INSjp": "Jepara, Jawa Tengah",
-  "INSjs": "Jakarta, Sunda Kelapa port",
-  "INSjw": "Juwana, Jawa Tengah",
-  "INSjx": "Jakarta PKX",
-  "INSjy": "Jayapura, Papua",
-  "INSka": "Kaimana, Papua",
-  "INSkb": "Kalabahi, Alor Island, East Nusa Tenggara",
-  "INSkd": "Kendari, Sulawesi Tenggara",
-  "INSkg": "Kalianget, Sumenep, Madura Island, Jawa Timur",
-  "INSki": "Kumai, Kalimantan Tengah",
-  "INSkj": "Kijang, Bintan Island",
-  "INSkl": "Kolonodale, Sulawesi Tenggara",
-  "INSkm": "Karimunjawa Island, off Java",
-  "INSkn": "Kupang, Timor",
-  "INSko": "Kolaka, Sulawesi Tenggara",
-  "INSkp": "Ketapang, Kalimantan Barat",
-  "INSks": "Kota Langsa, Aceh, Sumatra",
-  "INSkt": "Kuala Tungkal, Jambi, Sumatra",
-  "INSku": "Kota Baru, Laut Island, Kalimantan Selatan",
-  "INSkw": "Kwandang, Gorontalo, Sulawesi",
-  "INSle": "Lembar, Lombok",
-  "INSlh": "Lhokseumawe, Aceh, Sumatra",
-  "INSlo": "Lombok",
-  "INSlu": "Luwuky, Sulawesi Tengah",
-  "INSma": "Manokwari, Papua Barat",
-  "INSmb": "Masalembo Island, Java Sea",
-  "INSmd": "Manado, Sulawesi Utara",
-  "INSme": "Meneng, Banyuwangi, Java",
-  "INSmk": "Manokwari, Irian Jaya Barat",
-  "INSmm": "Maumere, Flores, Nusa Tenggara Timur",
-  "INSmn": "Manado, Sulawesi Utara",
-  "INSmr": "Merauke, Papua",
-  "INSms": "Makassar, Sulawesi Selatan",
-  "INSmu": "Muntok, Bangka Island",
-  "INSn":  "Nabire, Papua",
-  "INSna": "Natuna, Tiga Island, Riau Islands",
-  "INSnu": "Nunukan, Nunukan Island, Kalimantan Utara",
-  "INSp":  "Palangkaraya, Kalimantan Tengah",
-  "INSpa": "Palu, Sulawesi Tengah",
-  "INSpb": "Padang Bai, Bali",
-  "INSpd": "Padang, Sumatera Barat",
-  "INSpe": "Pekalongan, Java",
-  "INSpf": "Pare-Pare, Sulawesi Selatan",
-  "INSpg": "Pangkal Baru, Bangkal Island",
-  "INSph": "Panipahan, Riau, Sumatra",
-  "INSpi": "Parigi, Sulawesi Tengah",
-  "INSpj": "Panjang, Lampung, Sumatra",
-  "INSpk": "Pontianak",
-  "INSpl": "Plaju, Palembang, Sumatera Selatan",
-  "INSpm": "Palembang, Sumatera Selatan",
-  "INSpo": "Pomalaa, Sulawesi Tenggara",
-  "INSpp": "Palopo, Sulawesi Selatan",
-  "INSpq": "Probolinggo, Jawa Timur",
-  "INSpr": "Panarukan, Jawa Timur",
-  "INSps": "Poso, Sulawesi Tengah",
-  "INSpt": "Pantoloan, Sulawesi Tengah",
-  "INSpu": "Pekanbaru, Riau, Sumatra",
-  "INSpv": "Pulau Sambu, Riau Islands",
-  "INSra": "Raha, Muna Island, Sulawesi Tenggara",
-  "INSre": "Rengat, Riau, Sumatra",
-  "INSro": "Reo, Flores",
-  "INSsa": "Sabang, We Island, Aceh",
-  "INSsb": "Seba, Sawu Island",
-  "INSse": "Serui, Japen Island, Papua",
-  "INSsg": "Semarang, Java",
-  "INSsh": "Susoh, Aceh, Sumatra",
-  "INSsi": "Sarmi, Papua",
-  "INSsj": "Selat Panjang, Tebingtinggi Island, Riau",
-  "INSsk": "Singkil, Aceh, Sumatra",
-  "INSsn": "Sanana, Sulabes Island, Maluku",
-  "INSso": "Sorong, Papua Barat",
-  "INSsp": "Sipange, Tapanuli, Sumatera Utara",
-  "INSsq": "Sibolga, Sumatera Utara",
-  "INSsr": "Samarinda, Kalimantan Timur",
-  "INSst": "Sampit, Kalimantan Tengah",
-  "INSsu": "Siau Island",
-  "INSsy": "Selayar, Sulawesi Selatan",
-  "INSs2": "Sinabang, Simeulue Island, Aceh",
-  "INSs3": "Sipura Island, Sumatera Barat",
-  "INSs4": "Surabaya, Jawa Timur",
-  "INSs8": "Sorong PKY8, Papua Barat",
-  "INSs9": "Sorong PKY9, Papua Barat",
-  "INSt":  "Ternate, Ternate Island, Maluku Utara",
-  "INSta": "Tahuna, Sulawesi Utara",
-  "INStb": "Tanjung Balai Karimun, Karimunbesar Island, Riau Islands",
-  "INStd": "Teluk Dalam, Dima Island, Sumatera Utara",
-  "INSte": "Tegal, Java",
-  "INStg": "Tanjung Selor, Kalimantan Utara",
-  "INStk": "Tarakan, Tarakan Island, Kalimantan Utara",
-  "INStl": "Tembilahan, Riau, Sumatra",
-  "INStm": "Tarempa, Siantan Island, Riau Islands",
-  "INSto": "Tobelo, Halmahera Island, Maluku Utara",
-  "INSts": "Tanjung Santan, Kalimantan Timur",
-  "INStt": "Toli-Toli, Sulawesi Tengah,",
-  "INStu": "Tanjung Uban, Bintan Island, Riau Islands",
-  "INStw": "Tual, Dullah Island, Maluku",
-  "INSty": "Taluk Bayur, Sumatera Barat",
-  "INSul": "Ulee-Lheue, Banda Aceh, Aceh, Sumatra",
-  "INSw":  "Wamena, Papua",
-  "INSwa": "Waingapu, Sumba Island, East Nusa Tenggara",
-  "IRLmh": "Malin Head, Co. Donegal",
-  "IRLs":  "Shannon",
-  "IRLsk": "Sheskin, Co. Donegal",
-  "IRLtr": "Tralee, Co. Kerry",
-  "IRLv":  "Valentia, Co. Kerry",
-  "IRNa":  "Ahwaz",
-  "IRNb":  "Bandar-e Torkeman",
-  "IRNba": "Bandar Abbas",
-  "IRNbb": "Bonab",
-  "IRNc":  "Chah Bahar",
-  "IRNj":  "Jolfa",
-  "IRNk":  "Kamalabad",
-  "IRNke": "Kish Island",
-  "IRNki": "Kiashar",
-  "IRNm":  "Mashhad",
-  "IRNmh": "Bandar-e Mahshahr",
-  "IRNq":  "Qasr Shirin",
-  "IRNs":  "Sirjan",
-  "IRNt":  "Tayebad",
-  "IRNte": "Tehran",
-  "IRNz":  "Zahedan",
-  "IRNzb": "Zabol",
-  "IRQd":  "Salah al-Din (Saladin)",
-  "IRQs":  "Sulaimaniya",
-  "ISLf":  "Fjallabyggd",
-  "ISLg":  "Keflavik/Grindavik",
-  "ISLgt": "Grindavik Thorbjöen",
-  "ISLhf": "Hornafjördur",
-  "ISLif": "Isafjördur",
-  "ISLn":  "Neskaupstadur",
-  "ISLr":  "Reykjavik Aero/HFDL",
-  "ISLrf": "Raufarhöfn",
-  "ISLrs": "Reykjavik-Seltjarjarnes",
-  "ISLs":  "Saudanes",
-  "ISLsh": "Stórhöfði",
-  "ISLv":  "Vestmannaeyjar",
-  "ISRh":  "Haifa",
-  "ISRL":  "Lod (Galei Zahal)",
-  "ISRsy": "She'ar-Yeshuv",
-  "ISRy":  "Yavne",
-  "Jao":   "Aonoyama Signal Station, Utazu (Kagawa)",
-  "Jas":   "Asahikawa AF JJU22",
-  "Jay":   "Ashiya AB JJZ59",
-  "Jc":    "Chiba Nagara",
-  "Jct":   "Chitose AB, Hokkaido JJR20",
-  "Jes":   "Esaki Signal Station (Osaka Bay), Awaji island (Hyogo)",
-  "Jf":    "Chofu Campus, Tokyo",
-  "Jfu":   "Fuchu AB JJT55",
-  "Jgf":   "Gifu AB JJV67",
-  "Jh":    "Mount Hagane",
-  "Jhf":   "Hofu / Bofu AB JJX36",
-  "Jhm":   "Hamamatsu AB JJV56",
-  "Jhy":   "Hyakurigahara AB JJT33",
-  "Jio":   "Imabari Ohama Vessel Station (Kurushima), Imabari (Ehime)",
-  "Jir":   "Iruma / Irumagawa AB JJT44",
-  "Jit":   "Itoman, Okinawa JFE",
-  "Jiw":   "Isewan Signal Station, Cape Irago, Tahara (Aichi)",
-  "Jk":    "Kagoshima JMH",
-  "Jkg":   "Kumagaya AB JJT66",
-  "Jki":   "Kisarazu AB JJT22",
-  "Jkk":   "Komaki AB (Nagoya) JJV23",
-  "Jkm":   "Kume Shima / Kumejina, Okinawa JJU66",
-  "Jkn":   "Kanmon Oseto Strait Signal Station,",
-  "Jko":   "Komatsu AB JJV90",
-  "Jks":   "Kasuga AB JJZ37",
-  "Jku":   "Kumamoto JJE20",
-  "Jky":   "Kyodo",
-  "Jkz":   "Kannonzaki Signal Station, Yokosuka (Kanagawa)",
-  "Jm":    "Miura",
-  "Jmh":   "Miho AB, Yonago JJX25",
-  "Jms":   "Misawa AB JJS21",
-  "Jmt":   "Matsushima AB JJS32",
-  "Jmu":   "Muroto (Kochi, Shikoku)",
-  "Jmz":   "Makurazaki (Kagoshima, Kyushu)",
-  "Jn":    "Nemuro",
-  "Jnh":   "Naha AB, Okinawa",
-  "Jnk":   "Nagoya Kinjo Signal Station, Nagoya (Aichi)",
-  "Jnr":   "Nara JJW24",
-  "Jny":   "Nyutabaru AB JJZ26",
-  "Jo":    "Mount Otakadoya",
-  "Joe":   "Okinoerabu JJZ44",
-  "Jok":   "Okinawa",
-  "Jos":   "Osaka JJD20",
-  "Jot":   "Otaru, Hokkaido JJS65",
-  "Jsa":   "Sapporo / Chitose AB JJA20",
-  "Jsg":   "Sodegaura (Kubota), Chiba",
-  "Jsn":   "Sendai / Kasuminome AB JJB20",
-  "Jsz":   "Shizuoka",
-  "Jtk":   "Tokyo / Tachikawa AF JJC20 JJT88",
-  "Jts":   "Tsuiki AB JJZ48",
-  "Jtv":   "Tokyo Volmet, Kagoshima Broadcasting Station",
-  "Jy":    "Yamata",
-  "Jyo":   "Yokota AFB",
-  "Jyz":   "Yozadake (Okinawa)",
-  "JORak": "Al Karanah / Qast Kherane",
-  "JORam": "Amman",
-  "KAZa":  "Almaty",
-  "KAZak": "Aktyubinsk/Aktöbe",
-  "KAZav": "Almaty Volmet",
-  "KAZn":  "Nursultan (Akmolinsk/Tselinograd/Astana)",
-  "KENny": "Nairobi 5YE",
-  "KGZb":  "Bishkek (Krasnaya Rechka)",
-  "KGZ":   "bk- Bishkek Beta",
-  "KORc":  "Chuncheon",
-  "KORd":  "Dangjin",
-  "KORdb": "Daebu-do (Ansan)",
-  "KORg":  "Goyang / Koyang, Gyeonggi-do / Kyonggi-do",
-  "KORh":  "Hwasung/Hwaseong",
-  "KORj":  "Jeju/Aewol HLAZ",
-  "KORk":  "Kimjae",
-  "KORm":  "Muan HFDL",
-  "KORn":  "Hwaseong?",
-  "KORo":  "Suwon-Osan/Hwaseong-Jeongnam",
-  "KORs":  "Seoul-Incheon HLKX",
-  "KORsg": "Seoul-Gangseo-gu",
-  "KORt":  "Taedok",
-  "KORw":  "Nowon Gyeonggi-do / Seoul-Taereung",
-  "KOSb":  "Camp Bondsteel",
-  "KREc":  "Chongjin",
-  "KREe":  "Hyesan",
-  "KREh":  "Hamhung",
-  "KREhw": "Hwadae/Kimchaek",
-  "KREj":  "Haeju",
-  "KREk":  "Kanggye",
-  "KREkn": "Kangnam",
-  "KREp":  "Pyongyang",
-  "KREs":  "Sariwon",
-  "KREsg": "Samgo",
-  "KREsn": "Sinuiju",
-  "KREsw": "Sangwon",
-  "KREu":  "Kujang",
-  "KREw":  "Wonsan",
-  "KREy":  "Pyongsong",
-  "KWTj":  "Jahra/Umm al-Rimam",
-  "KWTk":  "Kabd/Sulaibiyah",
-  "KWTkw": "Kuwait",
-  "LAOs":  "Sam Neua",
-  "LAOv":  "Vientiane",
-  "LBNbe": "Beirut",
-  "LBRe":  "Monrovia ELWA",
-  "LBRm":  "Monrovia Mamba Point",
-  "LBRs":  "Star Radio Monrovia",
-  "LBY":   "Sabrata",
-  "LTU":   "Sitkunai",
-  "LTUv":  "Viesintos",
-  "LUXj":  "Junglinster",
-  "LUXm":  "Marnach",
-  "LVA":   "Ulbroka",
-  "MAUm":  "Malherbes",
-  "MDA":   "Maiac near Grigoriopol",
-  "MDAca": "Cahul",
-  "MDAce": "Chisinau",
-  "MDAco": "Codru-Costiujeni",
-  "MDAed": "Edinet",
-  "MDG":   "Talata Volonondry",
-  "MDGa":  "Ambohidrano/Sabotsy",
-  "MDGm":  "Mahajanga (WCBC)",
-  "MDRps": "Porto Santo",
-  "MEXc":  "Cuauhtémoc, Mexico City",
-  "MEXe":  "Mexico City (Radio Educación)",
-  "MEXi":  "Iztacalco, Mexico City",
-  "MEXm":  "Merida",
-  "MEXpr": "Progreso",
-  "MEXs":  "San Luis Potosi",
-  "MEXp":  "Chiapas",
-  "MEXu":  "UNAM, Mexico City",
-  "MEXvh": "Villahermosa, Tabasco",
-  "MLAka": "Kajang",
-  "MLAkk": "Kota Kinabalu",
-  "MLAku": "Kuching-Stapok (closed 2011)",
-  "MLAl":  "Lumut",
-  "MLAs":  "Sibu",
-  "MLIc":  "CRI-Bamako",
-  "MLIk":  "Kati(Bamako)",
-  "MLTmr": "Malta Radio",
-  "MNEoc": "Ocas",
-  "MNGa":  "Altay",
-  "MNGm":  "Moron/Mörön",
-  "MNGu":  "Ulaanbaatar-Khonkhor",
-  "MRAm":  "Marpi, Saipan (KFBS)",
-  "MRAs":  "Saipan/Agingan Point (IBB)",
-  "MRAt":  "Tinian (IBB)",
-  "MRCag": "Agadir",
-  "MRCb":  "Briech (VoA/RL/RFE)",
-  "MRCca": "Casablanca",
-  "MRCL":  "Laayoune (UN 6678)",
-  "MRCn":  "Nador (RTM,Medi1)",
-  "MRCs":  "Safi",
-  "MRTfc": "Fort-de-France CROSS",
-  "MRTu":  "FUF Martinique",
-  "MTN":   "Nouakchott",
-  "MYAn":  "Naypyidaw",
-  "MYAp":  "Phin Oo Lwin, Mandalay",
-  "MYAt":  "Taunggyi(Kalaw)",
-  "MYAy":  "Yegu (Yangon/Rangoon)",
-  "NCLn":  "Nouméa - Ouen-Toro",
-  "NFK":   "Norfolk Island",
-  "NGR":   "Niamey",
-  "NIGa":  "Abuja-Gwagwalada",
-  "NIGb":  "Ibadan",
-  "NIGe":  "Enugu",
-  "NIGi":  "Ikorodu",
-  "NIGj":  "Abuja-Lugbe (new site, opened March 2012)",
-  "NIGk":  "Kaduna",
-  "NMBwb": "Walvis Bay",
-  "NORa":  "Andenes",
-  "NORas": "Andenes-Saura",
-  "NORat": "Andenes (Telenor site)",
-  "NORbe": "Bergen (LLE station, Erdal, Askoy Island)",
-  "NORbj": "Bjørnøya / Bear Island",
-  "NORbk": "Bergen-Kvarren",
-  "NORbo": "Bodø",
-  "NORbs": "Bodø-Seines",
-  "NORbv": "Berlevåg",
-  "NORe":  "Erdal",
-  "NORf":  "Florø",
-  "NORfs": "Farsund",
-  "NORhf": "Hammerfest",
-  "NORhp": "Hopen Island",
-  "NORjm": "Jan Mayen Island",
-  "NORly": "Longyearbyen, Svalbard",
-  "NORma": "Marøy",
-  "NORmg": "Molde-Gossen",
-  "NORmr": "Mågerø",
-  "NORnm": "Nordmela-Andøya",
-  "NORoh": "Oslo-Helgelandsmoen",
-  "NORor": "Ørlandet",
-  "NORro": "Rogaland (Vigreskogen)",
-  "NORsa": "Sandnessjøen",
-  "NORsr": "Sørreisa",
-  "NORst": "Stavanger-Ulsnes",
-  "NORva": "Vardø",
-  "NPL":   "Khumaltar",
-  "NZLa":  "Auckland (Wiroa Island)",
-  "NZLdu": "Dunedin",
-  "NZLr":  "Rangitaiki",
-  "NZLru": "Russell",
-  "NZLt":  "Taupo",
-  "OCEfa": "Faa'a airport",
-  "OCEma": "Mahina (Tahiti)",
-  "OMAa":  "A'Seela",
-  "OMAs":  "Seeb",
-  "OMAt":  "Thumrait",
-  "PAKi":  "Islamabad",
-  "PAKkv": "Karachi Volmet",
-  "PAKm":  "Multan",
-  "PAKp":  "Peshawar",
-  "PAKq":  "Quetta",
-  "PAKr":  "Rawalpindi",
-  "PHLb":  "Bocaue (FEBC)",
-  "PHLdv": "Davao City, Mindanao",
-  "PHLi":  "Iba (FEBC)",
-  "PHLko": "Koronadal City, Mindanao",
-  "PHLm":  "Marulas/Quezon City, Valenzuela (PBS 6170,9581)",
-  "PHLp":  "Palauig, Zembales (RVA)",
-  "PHLpo": "Poro",
-  "PHLsc": "Santiago City, Luzon",
-  "PHLt":  "Tinang (VoA)",
-  "PHLx":  "Tinang-2/portable 50kW (VoA)",
-  "PHLzm": "Zamboanga City, Mindanao",
-  "PLW":   "Koror-Babeldaob (Medorn)",
-  "PNGa":  "Alotau",
-  "PNGb":  "Bougainville/Buka-Kubu",
-  "PNGd":  "Daru",
-  "PNGg":  "Goroka",
-  "PNGka": "Kavieng",
-  "PNGkb": "Kimbe",
-  "PNGke": "Kerema",
-  "PNGki": "Kiunga",
-  "PNGku": "Kundiawa",
-  "PNGla": "Lae (Morobe)",
-  "PNGln": "Lae Nadzab airport",
-  "PNGlo": "Lorengau",
-  "PNGma": "Madang",
-  "PNGme": "Mendi",
-  "PNGmh": "Mount Hagen",
-  "PNGpm": "Port Moresby (Waigani)",
-  "PNGpr": "Port Moresby Maritime Radio",
-  "PNGpo": "Popondetta",
-  "PNGr":  "Rabaul",
-  "PNGv":  "Vanimo",
-  "PNGva": "Vanimo",
-  "PNGwa": "Port Moresby (Radio Wantok)",
-  "PNGww": "Wewak",
-  "PNRal": "Albrook, Panama City",
-  "POLb":  "Babice",
-  "POLp":  "Puchaly, in Falenty",
-  "POLsk": "Solec Kujawski",
-  "POLu":  "Ustka",
-  "POLw":  "Witowo",
-  "PORms": "Monsanto",
-  "PRGc":  "Capiatá",
-  "PRGf":  "Filadelfia",
-  "PRUar": "Arequipa",
-  "PRUat": "Atalaya",
-  "PRUbv": "Bolívar",
-  "PRUcc": "Chiclayo/Santa Ana (Carretera a Lambayeque)",
-  "PRUce": "Celendín",
-  "PRUch": "Chachapoyas",
-  "PRUcl": "Callalli",
-  "PRUcp": "Cerre de Pasco",
-  "PRUct": "Chota",
-  "PRUcu": "Cuzco-Cerro Oscollo",
-  "PRUcz": "Chazuta/Tarapoto, San Martin",
-  "PRUhb": "Huancabamba",
-  "PRUhc": "Huancayo/Viques",
-  "PRUho": "Huánuco",
-  "PRUht": "Huanta/Tirapampa",
-  "PRUhu": "Huanta/Vista Alegre (Pasaje Amauta)",
-  "PRUhv": "Huancavelica",
-  "PRUhz": "Huaraz",
-  "PRUin": "Chau Alto/Independencia, Huarez, Ancash (planned for 6090 kHz in 2015/16)",
-  "PRUiq": "Iquitos/Moronacocha",
-  "PRUja": "Jaén",
-  "PRUju": "Junín/Cuncush",
-  "PRUli": "Lima",
-  "PRUor": "La Oroya",
-  "PRUpc": "Paucartambo",
-  "PRUpm": "Puerto Maldonado",
-  "PRUqb": "Quillabamba/Macamango",
-  "PRUqt": "Quillabamba/Tiobamba Baja",
-  "PRUrm": "Rodrigues de Mendoza",
-  "PRUsc": "Santa Cruz (R Satelite)",
-  "PRUsi": "Sicuani",
-  "PRUsu": "Santiago de Chuco",
-  "PRUta": "Tarma/Cerro Penitencia",
-  "PRUtc": "Tacna",
-  "PRUur": "valle de Urubamba, Cusco",
-  "PRUvv": "Valle de Vitor, San Luís, Arequipa",
-  "PRUyu": "Yurimaguas",
-  "PTRi":  "Isabela",
-  "PTRs":  "Salinas, Camp Santiago",
-  "QATdr": "Doha Radio",
-  "REUsu": "Sainte-Suzanne",
-  "ROUb":  "Bucuresti/Bucharest airport",
-  "ROUc":  "Constanta",
-  "ROUg":  "Galbeni",
-  "ROUs":  "Saftica 100kW",
-  "ROUt":  "Tiganesti 300kW",
-  "RRW":   "Kigali",
-  "RUSa":  "Armavir/Tblisskaya/Krasnodar",
-  "RUSaf": "Astrakhan Fedorovka",
-  "RUSag": "Angarsk",
-  "RUSak": "Arkhangelsk Beta",
-  "RUSam": "Amderma",
-  "RUSan": "Astrakhan Narimanovo",
-  "RUSar": "Arkhangelsk",
-  "RUSas": "Astrakhan Military Base",
-  "RUSat": "Arkhangelsk-Talagi",
-  "RUSay": "Anadyr, Chukotka",
-  "RUSb":  "Blagoveshchensk (Amur)",
-  "RUSba": "Barnaul, Altay",
-  "RUSbg": "Belaya Gora, Sakha(Yakutia)",
-  "RUSbo": "Bolotnoye, Novosibirsk oblast",
-  "RUSB1": "Buzzer sites: Kerro (St Petersburg)",
-  "RUSB2": "Buzzer sites: Naro-Fominsk (Moscow)",
-  "RUSc":  "Chita (Atamanovka) (S Siberia)",
-  "RUScs": "Cherskiy, Yakutia",
-  "RUScy": "Chelyabinsk",
-  "RUSdi": "Dikson",
-  "RUSel": "Elista",
-  "RUSey": "Yeysk port",
-  "RUSge": "Gelendzhik",
-  "RUSgk": "Goryachiy Klyuch, Omsk",
-  "RUSgo": "Gorbusha",
-  "RUSgr": "Grozny",
-  "RUSi":  "Irkutsk (Angarsk) (S Siberia)",
-  "RUSig": "Igrim XMAO",
-  "RUSik": "Ivashka, Kamchatka",
-  "RUSir": "Irkutsk port",
-  "RUSiv": "Irkutsk Volmet",
-  "RUSiz": "Izhevsk sites",
-  "RUSk":  "Kaliningrad-Bolshakovo",
-  "RUSka": "Komsomolsk-na-Amur (Far East)",
-  "RUSkd": "Krasnodar Beta",
-  "RUSkf": "Krasnoyarsk HFDL site",
-  "RUSkg": "Kaliningrad Radio UIW23",
-  "RUSkh": "Khabarovsk (Far East)",
-  "RUSki": "Kirinskoye, Sakhalin",
-  "RUSkl": "Kaliningrad Military Base",
-  "RUSkm": "Khanty-Mansiysk",
-  "RUSko": "Korsakov, Sakhalin",
-  "RUSkp": "Krasnodar-Poltovskaya",
-  "RUSkr": "Krasnoyarsk",
-  "RUSkt": "Kotlas",
-  "RUSku": "Kurovskaya-Avsyunino (near Moscow)",
-  "RUSkv": "Kirensk Volmet",
-  "RUSkx": "Kamenka, Sakha",
-  "RUSky": "Kyzyl",
-  "RUSkz": "Kazan",
-  "RUSk1": "Krasnodar Pashkovsky",
-  "RUSk2": "Kamskoye Ustye, Tatarstan",
-  "RUSk3": "Kolpashevo, Tomsk",
-  "RUSk4": "Komsomolsk-na-Amure",
-  "RUSk5": "Kultayevo, Perm",
-  "RUSk6": "Kozmino, Cape Povorotny, Primorye",
-  "RUSL":  "Lesnoy (near Moscow)",
-  "RUSli": "Liski, Voronezh",
-  "RUSln": "Labytnangi, YNAO",
-  "RUSl2": "Labytnangi, YNAO Gazprom",
-  "RUSm":  "Moscow/Moskva (one of ku,L,se,t)",
-  "RUSma": "Magadan/Arman",
-  "RUSmg": "Magadan Military Base",
-  "RUSmi": "Mineralnye Vody",
-  "RUSmk": "Makhachkala, Dagestan",
-  "RUSmm": "Murmansk Meteo",
-  "RUSmp": "Maykop",
-  "RUSmr": "Moscow-Razdory",
-  "RUSmt": "MTUSI University, Moscow",
-  "RUSmu": "Murmansk/Monchegorsk",
-  "RUSmv": "Magadan Volmet",
-  "RUSmx": "Makhachkala, Dagestan",
-  "RUSmz": "Mozdok, North Ossetia",
-  "RUSm2": "Magadan Rosmorport",
-  "RUSm3": "Makhachkala, Dagestan",
-  "RUSm4": "Mezen, Arkhangelsk",
-  "RUSm5": "Murmansk MRCC",
-  "RUSn":  "Novosibirsk / Oyash, (500 kW, 1000 kW)",
-  "RUSnc": "Nalchik, Kabardino-Balkaria",
-  "RUSne": "Nevelsk, Sakhalin",
-  "RUSni": "Nizhnevartovsk",
-  "RUSnm": "Naryan-Mar",
-  "RUSnn": "Nizhni Novgorod sites",
-  "RUSno": "Novosibirsk City",
-  "RUSnp": "Novosibirsk city port",
-  "RUSnr": "Novorossiysk",
-  "RUSns": "Novosibirsk Shipping Canal",
-  "RUSnu": "Novy Urengoy",
-  "RUSnv": "Novosibirsk Volmet",
-  "RUSny": "Nadym",
-  "RUSoe": "Okhotskoye, Sakhalin",
-  "RUSog": "Orenburg-Gagarin airport",
-  "RUSok": "Oktyarbskiy, Kamchatka",
-  "RUSol": "Oleniy, Yamalo-Nenets",
-  "RUSom": "Omsk",
-  "RUSor": "Orenburg",
-  "RUSox": "Okhotsk Bulgin",
-  "RUSp":  "Petropavlovsk-Kamchatskiy (Yelizovo)",
-  "RUSpc": "Pechora",
-  "RUSpe": "Perm",
-  "RUSpk": "Petropavlovsk-Kamchatskij Military Base",
-  "RUSpm": "Perm airport",
-  "RUSpo": "Preobrazhenie, Primorye",
-  "RUSpp": "Petropavlovsk-Kamchatskiy Port",
-  "RUSpt": "Sankt Peterburg Military Base",
-  "RUSpu": "Puteyets, Pechora, Rep.Komi",
-  "RUSpv": "Sankt Peterburg Volmet / Pulkovo",
-  "RUSpy": "Peleduy, Sakha",
-  "RUSp2": "Petropavlovsk-Kamchatskiy Port",
-  "RUSp3": "Petropavlovsk-Kamchatskiy Commercial sea port",
-  "RUSp4": "Pevek, Chukotka",
-  "RUSp5": "Plastun, Primorye",
-  "RUSp6": "Poronaisk, Sakhalin",
-  "RUSrd": "Reydovo, Etorofu Island, Kuril",
-  "RUSre": "Revda",
-  "RUSro": "Rossosh, Voronezhskaya oblast",
-  "RUSrp": "Rostov-na-Donu",
-  "RUSru": "Russkoye Ustye",
-  "RUSrv": "Rostov Volmet, Rostov-na-Donu",
-  "RUSry": "Rybachi, Primorye",
-  "RUSs":  "Samara (Zhygulevsk)",
-  "RUSsa": "Samara Centre",
-  "RUSsb": "Sabetta, Yamalo-Nenets",
-  "RUSsd": "Severodvinsk",
-  "RUSse": "Sevastopol",
-  "RUSsh": "Salekhard",
-  "RUSsk": "Smolensk",
-  "RUSsl": "Seleznevo, Sakhalin",
-  "RUSsm": "Severomorsk/Arkhangelsk Military Base",
-  "RUSso": "Sochi",
-  "RUSsp": "St.Petersburg (Popovka/Krasnyj Bor)",
-  "RUSsr": "Sevastopol Radio",
-  "RUSst": "Saratov",
-  "RUSsu": "Surgut",
-  "RUSsv": "Samara airport",
-  "RUSsy": "Syktyvkar Volmet",
-  "RUSs1": "Saratov airport",
-  "RUSs2": "Stavropol airport",
-  "RUSs3": "St Petersburg port",
-  "RUSs4": "St Petersburg Shepelevo",
-  "RUSs5": "Sterlegova Cape, Taymyr, Krasnoyarski krai",
-  "RUSs6": "Stolbovoy Island, New Siberian Islands, Sakha",
-  "RUSs7": "Svobodny, Amur",
-  "RUSt":  "Taldom - Severnyj, Radiotsentr 3 (near Moscow)",
-  "RUStg": "Taganrog",
-  "RUSti": "Tiksi, Sakha",
-  "RUStm": "Tomsk",
-  "RUStr": "Temryuk, Krasnodar",
-  "RUSts": "Tarko-Sale",
-  "RUStu": "Tulagino, Sakha",
-  "RUStv": "Tavrichanka (Vladivostok, 549, 1377)",
-  "RUSty": "Tyumen Volmet",
-  "RUSt3": "Tiksi-3, Sakha",
-  "RUSu":  "Ulan-Ude",
-  "RUSub": "Ust-Barguzin, Buryatia",
-  "RUSuf": "Ufa",
-  "RUSug": "Uglegorsk, Sakhalin",
-  "RUSuk": "Ust-Kamchatsk, Kamchatka",
-  "RUSus": "Ulan-Ude/Selenginsk",
-  "RUSuu": "Ulan-Ude port",
-  "RUSuy": "Ustyevoye, Kamchatka",
-  "RUSv":  "Vladivostok Razdolnoye (Ussuriysk)",
-  "RUSva": "Vanino, Khabarovski kray",
-  "RUSvg": "Vologda",
-  "RUSvk": "Vorkuta",
-  "RUSvl": "Vladivostok Military Base",
-  "RUSvm": "Vzmorye, Kaliningrad",
-  "RUSvo": "Volgograd",
-  "RUSvp": "Vladivostok port",
-  "RUSvr": "Varandey, Nenets",
-  "RUSvv": "Veselo-Voznesenka",
-  "RUSvz": "Vladikavkaz Beslan, North Ossetia",
-  "RUSxe": "Khabarovsk-Elban",
-  "RUSxo": "Kholmsk, Sakhalin",
-  "RUSxv": "Khabarovsk Volmet",
-  "RUSya": "Yakutsk/Tulagino",
-  "RUSys": "Yuzhno-Sakhalinsk (Vestochka)",
-  "RUSyv": "Yekaterinburg Volmet (Koltsovo)",
-  "RUSyy": "Yakutsk Volmet",
-  "RUSza": "Zyryanka, Sakha",
-  "RUSzg": "Zhigalovo, Irkutsk region",
-  "RUSzp": "Zaporozhye, Kamchatka",
-  "RUSzy": "Zhatay, Yakutsk",
-  "Sb":    "Bjuröklubb",
-  "Sd":    "Delsbo",
-  "Sgr":   "Varberg-Grimeton",
-  "Sgs":   "Gislövshammar",
-  "Sh":    "Härnösand",
-  "Sj":    "Julita",
-  "Sk":    "Kvarnberget-Vallentuna",
-  "Ss":    "Sala",
-  "Sst":   "Stavsnäs",
-  "St":    "Tingstäde",
-  "Sv":    "Vaxholm, The Castle",
-  "SDNa":  "Al-Aitahab",
-  "SDNr":  "Reiba",
-  "SENr":  "Rufisque DIRISI",
-  "SENy":  "Dakar Yoff",
-  "SEYmh": "Mahe",
-  "SLM":   "Honiara",
-  "SNG":   "Kranji",
-  "SNGj":  "Jurong",
-  "SNGv":  "Singapore Volmet",
-  "SOMb":  "Baydhabo",
-  "SOMg":  "Garoowe",
-  "SOMh":  "Hargeisa",
-  "SOMma": "Mogadishu Airport",
-  "SRBbe": "Beograd/Belgrade",
-  "SRBs":  "Stubline",
-  "SSDn":  "Narus",
-  "STP":   "Pinheira",
-  "SUIbe": "Bern Radio HEB, Prangins",
-  "SUIge": "Geneva",
-  "SUIlu": "Luzern (approx; Ampegon?)",
-  "SURpm": "Paramaribo",
-  "SVK":   "Rimavska Sobota",
-  "SWZ":   "Manzini/Mpangela Ranch",
-  "SYR":   "Adra",
-  "TCD":   "N'Djamena-Gredia",
-  "THAb":  "Bangkok / Prathum Thani",
-  "THAbm": "Bangkok Meteo",
-  "THAbv": "Bangkok Volmet",
-  "THAhy": "Hat Yai",
-  "THAn":  "Nakhon Sawan",
-  "THAu":  "Udon Thani",
-  "TJKda": "Dushanbe airport",
-  "TJKy":  "Yangi Yul (Dushanbe)",
-  "TJKo":  "Orzu",
-  "TKMa":  "Asgabat",
-  "TKMas": "Ashgabat airport",
-  "TKMds": "Dasoguz/Dashoguz",
-  "TKMs":  "Seyda/Seidi",
-  "TKMtb": "Turkmenbashi",
-  "TRDnp": "North Post",
-  "TUNbz": "Bizerte",
-  "TUNgu": "La Goulette",
-  "TUNke": "Kelibia",
-  "TUNmh": "Mahdia",
-  "TUNs":  "Sfax",
-  "TUNsf": "Sfax",
-  "TUNtb": "Tabarka",
-  "TUNte": "Tunis",
-  "TUNtu": "Tunis",
-  "TUNzz": "Zarzis",
-  "TURa":  "Ankara",
-  "TURc":  "Cakirlar",
-  "TURe":  "Emirler",
-  "TURis": "Istanbul TAH",
-  "TURiz": "Izmir",
-  "TURm":  "Mersin",
-  "TWNf":  "Fangliao FAN",
-  "TWNh":  "Huwei (Yunlin province)",
-  "TWNk":  "Kouhu (Yunlin province)",
-  "TWNL":  "Lukang",
-  "TWNm":  "Minhsiung (Chiayi province)",
-  "TWNn":  "Tainan/Annan (Tainan city)",
-  "TWNp":  "Paochung/Baujong (Yunlin province) PAO/BAJ",
-  "TWNpe": "Penghu (Pescadores), Jiangmei",
-  "TWNs":  "Danshui/Tanshui/Tamsui (Taipei province)",
-  "TWNt":  "Taipei (Pali)",
-  "TWNw":  "Taipei, Mount Wufen (Central Weather Bureau)",
-  "TWNy":  "Kuanyin (Han Sheng)",
-  "TWNyl": "Yilin",
-  "TZAd":  "Daressalam",
-  "TZAz":  "Zanzibar/Dole",
-  "UAE":   "Dhabbaya",
-  "UAEaj": "Al-Abjan",
-  "UAEda": "Das Island",
-  "UAEmu": "Musaffah, Abu Dhabi",
-  "UAEsj": "Sharjah",
-  "UGAk":  "Kampala-Bugolobi",
-  "UGAm":  "Mukono",
-  "UKRbe": "Berdiansk",
-  "UKRc":  "Chernivtsi",
-  "UKRk":  "Kyyiv/Kiev/Brovary",
-  "UKRke": "Kiev",
-  "UKRL":  "Lviv (Krasne)",
-  "UKRlu": "Luch",
-  "UKRm":  "Mykolaiv (Kopani)",
-  "UKRod": "Odessa",
-  "UKRpe": "Petrivka",
-  "UKRrv": "Rivne",
-  "UKRx":  "Kharkiv (Taranivka)",
-  "UKRz":  "Zaporizhzhya",
-  "URGlp": "La Paloma",
-  "URGm":  "Montevideo",
-  "URGpc": "Punta Carretas",
-  "URGpe": "Punta del Este",
-  "URGrb": "Rio Branco",
-  "URGt":  "Tacuarembó",
-  "URGtr": "Trouville",
-  "USAa":  "Andrews AFB, MD",
-  "USAb":  "Birmingham / Vandiver, AL (WEWN)",
-  "USAba": "WBMD Baltimore, MD",
-  "USAbg": "Barnegat, NJ",
-  "USAbo": "Boston, MA",
-  "USAbt": "Bethel, PA (WMLK)",
-  "USAc":  "Cypress Creek, SC (WHRI)",
-  "USAch": "Chesapeake - Pungo Airfield, VA",
-  "USAcu": "Cutler, ME",
-  "USAds": "Destin, FL",
-  "USAdv": "Dover, NC (KNC)",
-  "USAdx": "Dixon, CA",
-  "USAej": "Ellijay, GA (KJM)",
-  "USAfa": "Fort Collins, CO",
-  "USAfb": "Fort Collins, CO",
-  "USAfc": "Fort Collins, CO",
-  "USAfd": "Fort Collins, CO",
-  "USAfe": "Fort Collins, CO",
-  "USAff": "Fort Collins, CO",
-  "USAfg": "Fort Collins, CO",
-  "USAfv": "Forest, VA",
-  "USAg":  "Greenville, NC",
-  "USAhw": "KWHW Altus, OK",
-  "USAjc": "Jim Creek, WA",
-  "USAk":  "Key Saddlebunch, FL",
-  "USAL":  "Lebanon, TN (WTWW)",
-  "USALL": "Lakeland, FL (WCY)",
-  "USAlm": "Lamoure, ND",
-  "USAm":  "Miami / Hialeah Gardens, FL (WRMI)",
-  "USAmi": "Milton, FL (WJHR)",
-  "USAmo": "Mobile, AL (WLO)",
-  "USAn":  "Nashville, TN (WWCR)",
-  "USAnm": "NMG New Orleans, LA",
-  "USAno": "New Orleans, LA (WRNO)",
-  "USAnp": "Newport, NC (WTJC)",
-  "USAo":  "Okeechobee, FL (WYFR)",
-  "USAob": "San Luis Obispo, CA",
-  "USAof": "Offutt AFB, NE",
-  "USAq":  "Monticello, ME (WBCQ)",
-  "USApg": "Punta Gorda, FL (KPK)",
-  "USApr": "Point Reyes, CA",
-  "USArh": "Riverhead, Long Island, NY ",
-  "USArl": "Red Lion (York), PA (WINB)",
-  "USArs": "Los Angeles / Rancho Simi, CA (KVOH)",
-  "USAsc": "KEBR Sacramento, CA",
-  "USAse": "Seattle, WA",
-  "USAuc": "University of California Davis",
-  "USAud": "University of California Davis",
-  "USAv":  "Vado, NM (KJES)",
-  "USAvs": "Vashon Island, WA",
-  "USAwa": "Washington, DC",
-  "USAwc": "'West Coast' Beale AFB Marysville, CA",
-  "USAwg": "WGM Fort Lauderdale, FL",
-  "USAws": "KOVR West Sacramento, CA",
-  "USAwx": "WHX Hillsboro, WV",
-  "UZB":   "Tashkent",
-  "UZBa":  "Tashkent Airport",
-  "UZBnu": "Nukus, Karakalpakstan",
-  "UZBs":  "Samarkand",
-  "UZBta": "Tashkent I/II",
-  "VENt":  "El Tigre",
-  "VENy":  "YVTO Caracas",
-  "VTNb":  "Buon Me Thuot, Daclac",
-  "VTNbt": "Ben Thuy",
-  "VTNcm": "Ca Mau",
-  "VTNco": "Cua Ong",
-  "VTNcr": "Cam Ranh",
-  "VTNct": "Can Tho",
-  "VTNdb": "Dien Bien",
-  "VTNdn": "Da Nang",
-  "VTNhc": "Ho Chi Minh City / Vung Tau",
-  "VTNhg": "Hon Gai (Ha Long)",
-  "VTNhp": "Hai Phong",
-  "VTNhu": "Hue",
-  "VTNkg": "Kien Giang",
-  "VTNL":  "Son La",
-  "VTNm":  "Hanoi-Metri",
-  "VTNmc": "Mong Cai",
-  "VTNmh": "My Hao",
-  "VTNnt": "Nha Trang",
-  "VTNpr": "Phan Rang",
-  "VTNpt": "Phan Tiet",
-  "VTNpy": "Phu Yen",
-  "VTNqn": "Quy Nhon",
-  "VTNs":  "Hanoi-Sontay",
-  "VTNt":  "Thoi Long / Thoi Hung",
-  "VTNth": "Thanh Hoa",
-  "VTNvt": "Vung Tau",
-  "VTNx":  "Xuan Mai",
-  "VUT":   "Empten Lagoon",
-  "YEMa":  "Al Hiswah/Aden",
-  "YEMs":  "Sanaa",
-  "ZMBL":  "Lusaka",
-  "ZMBm":  "Makeni Ranch",
-  "ZWE":   "Gweru/Guinea Fowl",
-}
+def __getattr__(name):
+    # the tables are big and rarely needed, so they live in their own module that is only imported on first access
+    if name in ["EIBI_Countries", "EIBI_Languages", "EIBI_Targets", "EIBI_Locations"]:
+        from owrx import eibitables
 
-EIBI_Locations = [
-  {"name": "Kabul / Pol-e-Charkhi", "code": "AFGk", "lat": 34.53333, "lon": 69.33333 },
-  {"name": "Khost", "code": "AFGx", "lat": 33.23333, "lon": 69.81667 },
-  {"name": "Kabul-Yakatut", "code": "AFGy", "lat": 34.53333, "lon": 69.21667 },
-  {"name": "Meyerton", "code": "AFS", "lat": -26.58333, "lon": 28.13333 },
-  {"name": "Cape Town", "code": "AFSct", "lat": -33.68333, "lon": 18.70000 },
-  {"name": "Johannesburg", "code": "AFSj", "lat": -26.12778, "lon": 28.20556 },
-  {"name": "Luena (Moxico)", "code": "AGLL", "lat": -11.78333, "lon": 19.92194 },
-  {"name": "Luanda Radio", "code": "AGLlu", "lat": -8.80000, "lon": 13.26667 },
-  {"name": "Luanda - Mulenvos", "code": "AGLm", "lat": -8.85000, "lon": 13.31667 },
-  {"name": "The Valley", "code": "AIA", "lat": 18.21667, "lon": -63.01667 },
-  {"name": "Cerrik (CRI)", "code": "ALBc", "lat": 41.00000, "lon": 20.00000 },
-  {"name": "Fllake (Durres, 500kW)", "code": "ALBf", "lat": 41.36667, "lon": 19.50000 },
-  {"name": "Shijiak (Radio Tirana) (1x100kW = 2x50kW)", "code": "ALBs", "lat": 41.33333, "lon": 19.55000 },
-  {"name": "Adrar", "code": "ALGad", "lat": 27.86667, "lon": -0.28333 },
-  {"name": "Algiers", "code": "ALGal", "lat": 36.76667, "lon": 3.05000 },
-  {"name": "Annaba", "code": "ALGan", "lat": 36.90000, "lon": 7.76667 },
-  {"name": "Béchar", "code": "ALGb", "lat": 31.56667, "lon": -2.35000 },
-  {"name": "F'Kirina (Aïn Beïda)", "code": "ALGfk", "lat": 35.73333, "lon": 7.35000 },
-  {"name": "Ouargla / Ourgla", "code": "ALGo", "lat": 31.91667, "lon": 5.06667 },
-  {"name": "Ouled Fayet", "code": "ALGof", "lat": 36.71667, "lon": 2.95000 },
-  {"name": "Oran 7TO", "code": "ALGor", "lat": 35.76667, "lon": -0.55000 },
-  {"name": "Reggane", "code": "ALGr", "lat": 26.70000, "lon": 0.16667 },
-  {"name": "In Salah (Ain Salih)", "code": "ALGs", "lat": 27.25000, "lon": 2.51667 },
-  {"name": "Tindouf (Rabbouni)", "code": "ALGt", "lat": 27.55000, "lon": -8.10000 },
-  {"name": "Timimoun", "code": "ALGtm", "lat": 29.26667, "lon": 0.23333 },
-  {"name": "Annette", "code": "ALSan", "lat": 55.05000, "lon": -131.56667 },
-  {"name": "Anchor Point", "code": "ALSap", "lat": 59.74944, "lon": -151.73222 },
-  {"name": "Barrow", "code": "ALSba", "lat": 71.25833, "lon": -156.57750 },
-  {"name": "Cold Bay", "code": "ALScb", "lat": 55.21667, "lon": -162.71667 },
-  {"name": "Elmendorf AFB", "code": "ALSe", "lat": 61.25111, "lon": -149.80639 },
-  {"name": "Gakona", "code": "ALSg", "lat": 62.39167, "lon": -145.14667 },
-  {"name": "Kodiak", "code": "ALSk", "lat": 57.77500, "lon": -152.53333 },
-  {"name": "King Salmon", "code": "ALSks", "lat": 58.68333, "lon": -156.66667 },
-  {"name": "Nome", "code": "ALSno", "lat": 64.51667, "lon": -165.41667 },
-  {"name": "Buenos Aires", "code": "ARGb", "lat": -34.62194, "lon": -58.35500 },
-  {"name": "Córdoba", "code": "ARGco", "lat": -31.30917, "lon": -64.22611 },
-  {"name": "Comodoro Rivadavia (Navy)", "code": "ARGcr", "lat": -45.88361, "lon": -67.50917 },
-  {"name": "Comodoro Rivadavia (Air)", "code": "ARGcv", "lat": -45.79139, "lon": -67.47944 },
-  {"name": "Ezeiza, Prov. Buenos Aires", "code": "ARGe", "lat": -34.83278, "lon": -58.53194 },
-  {"name": "General Pacheco", "code": "ARGg", "lat": -34.60000, "lon": -58.36667 },
-  {"name": "Mar del Plata, Prov. Buenos Aires", "code": "ARGmp", "lat": -38.05000, "lon": -57.53333 },
-  {"name": "Resistencia, Chaco", "code": "ARGr", "lat": -27.46417, "lon": -59.07056 },
-  {"name": "Gavar (formerly Kamo)", "code": "ARM", "lat": 40.41667, "lon": 45.20000 },
-  {"name": "Yerevan", "code": "ARMy", "lat": 40.16667, "lon": 44.50000 },
-  {"name": "Jeddah/Jiddah", "code": "ARSj", "lat": 21.25000, "lon": 39.16667 },
-  {"name": "Jiddah Radio", "code": "ARSjr", "lat": 21.38333, "lon": 39.16667 },
-  {"name": "Jazan", "code": "ARSjz", "lat": 16.88333, "lon": 42.56667 },
-  {"name": "Najran", "code": "ARSnj", "lat": 17.50000, "lon": 44.13333 },
-  {"name": "Riyadh", "code": "ARSr", "lat": 24.50000, "lon": 46.38333 },
-  {"name": "Ascension Island,", "code": "ASC", "lat": -7.90000, "lon": -14.38333 },
-  {"name": "Base Esperanza", "code": "ATAe", "lat": -63.40000, "lon": -57.00000 },
-  {"name": "Bahia Fildes, King George Island", "code": "ATAf", "lat": -62.20000, "lon": -58.96667 },
-  {"name": "Maramio Base, Seymour Island", "code": "ATAma", "lat": -64.23333, "lon": -56.63333 },
-  {"name": "Alice Springs NT", "code": "AUSa", "lat": -23.81667, "lon": 133.85000 },
-  {"name": "Cape Pallarenda (aero site)", "code": "AUSae", "lat": -19.201389, "lon": 146.768056 },
-  {"name": "Broken Hill (aero site)", "code": "AUSae", "lat": -31.927222, "lon": 141.482500 },
-  {"name": "Knuckeys Lagoon (aero site)", "code": "AUSae", "lat": -12.43111, "lon": 130.96417 },
-  {"name": "Alice Springs NT", "code": "AUSas", "lat": -23.79667, "lon": 133.87444 },
-  {"name": "Alice Springs NT", "code": "AUSat", "lat": -23.77917, "lon": 133.87361 },
-  {"name": "Brandon QL", "code": "AUSb", "lat": -19.51667, "lon": 147.33333 },
-  {"name": "Bendigo VIC", "code": "AUSbe", "lat": -36.59028, "lon": 144.24417 },
-  {"name": "Broadmeadows VIC", "code": "AUSbm", "lat": -37.69194, "lon": 144.94556 },
-  {"name": "Charleville QL", "code": "AUSc", "lat": -26.41667, "lon": 146.25000 },
-  {"name": "Exmouth WA", "code": "AUSex", "lat": -21.81667, "lon": 114.16667 },
-  {"name": "Gunnedah NSW", "code": "AUSg", "lat": -30.98333, "lon": 150.25000 },
-  {"name": "Humpty Doo NT", "code": "AUSh", "lat": -12.56667, "lon": 131.08333 },
-  {"name": "Hurlstone Park, Sydney NSW", "code": "AUShp", "lat": -33.90556, "lon": 151.13222 },
-  {"name": "Innisfail QL", "code": "AUSin", "lat": -17.53333, "lon": 146.05000 },
-  {"name": "Katherine NT", "code": "AUSka", "lat": -14.40000, "lon": 132.18333 },
-  {"name": "Sydney-Leppington NSW", "code": "AUSL", "lat": -33.96667, "lon": 150.80000 },
-  {"name": "Macleay Island QL", "code": "AUSm", "lat": -27.61667, "lon": 153.35000 },
-  {"name": "Manilla NSW", "code": "AUSma", "lat": -30.73972, "lon": 150.71556 },
-  {"name": "Ningi QL", "code": "AUSn", "lat": -27.06667, "lon": 153.05556 },
-  {"name": "Russell Island QL", "code": "AUSri", "lat": -27.66667, "lon": 153.35000 },
-  {"name": "Roma QL", "code": "AUSrm", "lat": -26.55000, "lon": 148.80000 },
-  {"name": "Razorback NSW", "code": "AUSrz", "lat": -34.15000, "lon": 150.66667 },
-  {"name": "Shepparton VIC", "code": "AUSs", "lat": -36.33333, "lon": 145.41667 },
-  {"name": "Schofields, western Sydney", "code": "AUSsf", "lat": -33.70000, "lon": 150.86667 },
-  {"name": "St Mary's, Sydney", "code": "AUSsm", "lat": -33.75000, "lon": 150.76667 },
-  {"name": "Tennant Creek NT", "code": "AUSt", "lat": -19.66667, "lon": 134.26667 },
-  {"name": "Wiluna WA", "code": "AUSw", "lat": -26.33333, "lon": 120.56667 },
-  {"name": "Wee Waa NSW", "code": "AUSww", "lat": -30.21528, "lon": 149.45722 },
-  {"name": "Moosbrunn", "code": "AUT", "lat": 48.00000, "lon": 16.46667 },
-  {"name": "Baku", "code": "AZEb", "lat": 40.46667, "lon": 50.05000 },
-  {"name": "Gäncä", "code": "AZEg", "lat": 40.60000, "lon": 46.33333 },
-  {"name": "Stepanakert", "code": "AZEs", "lat": 39.82639, "lon": 46.73972 },
-  {"name": "Horta", "code": "AZRho", "lat": 38.53333, "lon": -28.63333 },
-  {"name": "Lajes Field", "code": "AZRlj", "lat": 38.76667, "lon": 27.08333 },
-  {"name": "Santa Maria", "code": "AZRsm", "lat": 36.94722, "lon": -25.15833 },
-  {"name": "Porto Alegre, RS", "code": "Ba", "lat": -30.02361, "lon": -51.25528 },
-  {"name": "Araguaína, TO", "code": "Bag", "lat": -7.20000, "lon": -48.20000 },
-  {"name": "Amparo, SP", "code": "Bam", "lat": -22.70000, "lon": -46.76667 },
-  {"name": "Anápolis, GO", "code": "Ban", "lat": -16.25694, "lon": -49.01889 },
-  {"name": "Aparecida, SP", "code": "Bap", "lat": -22.84639, "lon": -45.22028 },
-  {"name": "Araraquara, SP", "code": "Bar", "lat": -21.80000, "lon": -48.18333 },
-  {"name": "Brasilia, Parque do Rodeador, DF", "code": "Bb", "lat": -15.61111, "lon": -48.13139 },
-  {"name": "Belém, PA", "code": "Bbe", "lat": -1.45000, "lon": -48.48333 },
-  {"name": "Belo Horizonte, Minas Gerais", "code": "Bbh", "lat": -19.91667, "lon": -43.93333 },
-  {"name": "Braganca, PA", "code": "Bbr", "lat": -1.06333, "lon": -46.77333 },
-  {"name": "Belém, PA (Ondas Tropicais 5045)", "code": "Bbt", "lat": -1.36667, "lon": -48.35000 },
-  {"name": "Boa Vista, RR", "code": "Bbv", "lat": 2.92194, "lon": -60.71056 },
-  {"name": "Contagem/Belo Horizonte, MG", "code": "Bc", "lat": -19.89972, "lon": -44.05444 },
-  {"name": "Campo Largo (Curitiba), PR", "code": "Bca", "lat": -25.43000, "lon": -49.39694 },
-  {"name": "Camboriú, SC", "code": "Bcb", "lat": -27.04028, "lon": -48.65472 },
-  {"name": "Cáceres, MT", "code": "Bcc", "lat": -16.07667, "lon": -57.64083 },
-  {"name": "Campo Grande, MS", "code": "Bcg", "lat": -20.52000, "lon": -54.58333 },
-  {"name": "Campo Grande, MS", "code": "BCg", "lat": -20.45000, "lon": -54.61667 },
-  {"name": "Campinas, SP", "code": "Bcm", "lat": -22.94778, "lon": -47.01806 },
-  {"name": "Congonhas, MG", "code": "Bcn", "lat": -20.50000, "lon": -43.86667 },
-  {"name": "Coari, AM", "code": "Bco", "lat": -4.11639, "lon": -63.12528 },
-  {"name": "Cachoeira Paulista, SP", "code": "Bcp", "lat": -22.64583, "lon": -45.07833 },
-  {"name": "Cachoeira Paulista, SP", "code": "BCp", "lat": -22.64417, "lon": -45.07722 },
-  {"name": "Cruzeiro do Sul, Estrada do Aeroporto, AC", "code": "Bcs", "lat": -7.63333, "lon": -72.66667 },
-  {"name": "Curitiba, PR", "code": "Bcu", "lat": -25.45222, "lon": -49.11389 },
-  {"name": "Cuiabá, MT", "code": "Bcv", "lat": -15.61861, "lon": -56.09778 },
-  {"name": "Curitiba, PR RB2", "code": "Bc2", "lat": -25.39278, "lon": -49.16778 },
-  {"name": "Esteio (Porto Alegre), RS", "code": "BE", "lat": -29.82806, "lon": -51.16500 },
-  {"name": "Esteio (Porto Alegre), RS", "code": "Be", "lat": -29.86639, "lon": -51.10306 },
-  {"name": "Foz do Iguacu, PR", "code": "Bf", "lat": -25.51750, "lon": -54.50833 },
-  {"name": "Florianópolis, SC", "code": "Bfl", "lat": -27.60250, "lon": -48.53083 },
-  {"name": "Florianópolis - Comboriú, SC", "code": "Bfp", "lat": -27.04000, "lon": -48.65472 },
-  {"name": "Guarujá, SP", "code": "Bg", "lat": -23.99306, "lon": -46.25639 },
-  {"name": "Guaíba (Porto Alegre), RS", "code": "Bgb", "lat": -29.99722, "lon": -51.28556 },
-  {"name": "Sao Gabriel de Cachoeira, AM", "code": "Bgc", "lat": -0.13333, "lon": -67.08333 },
-  {"name": "Guajará-Mirim, RO", "code": "Bgm", "lat": -10.78333, "lon": -65.33333 },
-  {"name": "Goiânia,", "code": "Bgo", "lat": -16.65833, "lon": -49.22722 },
-  {"name": "Guarulhos, SP", "code": "Bgu", "lat": -23.43333, "lon": -46.41667 },
-  {"name": "Belo Horizonte, MG", "code": "Bh", "lat": -19.97611, "lon": -43.93333 },
-  {"name": "Ibitinga, SP", "code": "Bib", "lat": -21.77222, "lon": -48.83611 },
-  {"name": "Itapevi, SP", "code": "Bit", "lat": -23.51083, "lon": -46.67611 },
-  {"name": "Londrina, PR", "code": "Bld", "lat": -23.33778, "lon": -51.22167 },
-  {"name": "Limeira, SP", "code": "Bli", "lat": -22.56083, "lon": -47.41889 },
-  {"name": "Lajeado, RS", "code": "Blj", "lat": -29.46667, "lon": -51.96667 },
-  {"name": "Londrina, PR", "code": "Blo", "lat": -23.40472, "lon": -51.15528 },
-  {"name": "Manaus AM", "code": "Bm", "lat": -3.10000, "lon": -60.03333 },
-  {"name": "Manaus - Radiodif.Amazonas, AM", "code": "Bma", "lat": -3.13778, "lon": -59.98139 },
-  {"name": "Macapá, AP", "code": "Bmc", "lat": 0.06389, "lon": -51.03889 },
-  {"name": "Manaus - Radio Globo, AM", "code": "Bmg", "lat": -3.13444, "lon": -59.97750 },
-  {"name": "Marília, SP", "code": "Bmi", "lat": -22.22583, "lon": -49.96278 },
-  {"name": "São Mateus do Maranhão, Maranhão", "code": "Bmm", "lat": -4.03333, "lon": -44.46667 },
-  {"name": "Mogi das Cruces, SP", "code": "Bmo", "lat": -23.51528, "lon": -46.20222 },
-  {"name": "Manaus - Radio Rio Mar, AM", "code": "Bmr", "lat": -3.12167, "lon": -60.04167 },
-  {"name": "Óbidos, PA", "code": "Bob", "lat": -1.91667, "lon": -55.51667 },
-  {"name": "Osasco, SP", "code": "Bos", "lat": -23.51417, "lon": -46.59417 },
-  {"name": "Parintins, AM", "code": "Bpa", "lat": -2.61667, "lon": -56.75000 },
-  {"name": "Pocos da Caldas, MG", "code": "Bpc", "lat": -21.79778, "lon": -46.54056 },
-  {"name": "Petrolina, PE", "code": "Bpe", "lat": -9.40000, "lon": -40.50000 },
-  {"name": "Piraquara (Curitiba), PR", "code": "Bpi", "lat": -25.39278, "lon": -49.16778 },
-  {"name": "Rio de Janeiro (Radio Globo), RJ", "code": "Br", "lat": -22.82333, "lon": -43.09694 },
-  {"name": "Rio Branco, AC", "code": "Brb", "lat": -9.96667, "lon": -67.81667 },
-  {"name": "Rio de Janeiro (Radio Capital), RJ", "code": "Brc", "lat": -22.77861, "lon": -43.01556 },
-  {"name": "Recife, PE", "code": "Bre", "lat": -8.06667, "lon": -34.96667 },
-  {"name": "Rio de Janeiro (Radio Relogio), RJ", "code": "Brj", "lat": -22.77806, "lon": -42.98389 },
-  {"name": "Rio de Janeiro, Observatório Nacional,", "code": "Bro", "lat": -22.89583, "lon": -43.22417 },
-  {"name": "Ribeirão Preto, SP", "code": "Brp", "lat": -21.18333, "lon": -47.80000 },
-  {"name": "Rio de Janeiro (Super Radio), RJ", "code": "Brs", "lat": -22.82278, "lon": -43.08917 },
-  {"name": "Rio de Janeiro PWZ", "code": "Brw", "lat": -22.95000, "lon": -42.91667 },
-  {"name": "Santarém, PA", "code": "Bsa", "lat": -2.44861, "lon": -54.73278 },
-  {"name": "Sao Paulo - Radio Bandeirantes, SP", "code": "Bsb", "lat": -23.64833, "lon": -46.60056 },
-  {"name": "Sao Paulo - Radio Cultura, SP", "code": "Bsc", "lat": -23.51167, "lon": -46.56139 },
-  {"name": "Senador Guiomard, AC", "code": "Bse", "lat": -10.05000, "lon": -67.61667 },
-  {"name": "Sao Paulo - Radio Globo, SP", "code": "Bsg", "lat": -23.60722, "lon": -46.43667 },
-  {"name": "Sao Paulo - Radio 9 de Julho, SP", "code": "Bsj", "lat": -23.54750, "lon": -46.63611 },
-  {"name": "Santa Maria, RS", "code": "Bsm", "lat": -29.73833, "lon": -53.55528 },
-  {"name": "Sorocaba, SP / Votorantim,", "code": "Bso", "lat": -23.55000, "lon": -47.43333 },
-  {"name": "Sao Paulo - Radio Record, SP", "code": "Bsr", "lat": -23.68389, "lon": -46.74306 },
-  {"name": "Sao Paulo PYB45", "code": "Bsy", "lat": -23.55000, "lon": -46.63333 },
-  {"name": "Sao Paulo - Radio Gazeta, SP", "code": "Bsz", "lat": -23.66944, "lon": -46.75000 },
-  {"name": "Taubaté, SP", "code": "Bta", "lat": -23.01667, "lon": -45.56667 },
-  {"name": "Teresina, PI", "code": "Bte", "lat": -5.08694, "lon": -42.76083 },
-  {"name": "Tefé, AM", "code": "Btf", "lat": -3.35417, "lon": -64.71139 },
-  {"name": "Vitória, ES", "code": "Bvi", "lat": -20.31667, "lon": -40.31667 },
-  {"name": "Xapuri, AC", "code": "Bx", "lat": -10.65000, "lon": -68.50000 },
-  {"name": "Unknown location in Maranhão,", "code": "Bxm", "lat": -2.50000, "lon": -44.25000 },
-  {"name": "Unknown location in Paraná,", "code": "Bxn", "lat": -25.00000, "lon": -52.00000 },
-  {"name": "Unknown location in Paraíba,", "code": "Bxp", "lat": -7.16667, "lon": -36.83333 },
-  {"name": "Oostende", "code": "BELo", "lat": 51.18333, "lon": 2.80000 },
-  {"name": "Wingene", "code": "BELw", "lat": 51.18333, "lon": 2.81667 },
-  {"name": "Cotonou", "code": "BENc", "lat": 6.46667, "lon": 2.35000 },
-  {"name": "Parakou", "code": "BENp", "lat": 9.33333, "lon": 2.63333 },
-  {"name": "Bermuda Harbour", "code": "BERh", "lat": 32.38333, "lon": -64.68333 },
-  {"name": "Bonaire", "code": "BES", "lat": 12.20000, "lon": -68.30000 },
-  {"name": "Ouagadougou", "code": "BFA", "lat": 12.43333, "lon": -1.55000 },
-  {"name": "Dhaka-Dhamrai", "code": "BGDd", "lat": 23.90000, "lon": 90.20000 },
-  {"name": "Dhaka-Khabirpur", "code": "BGDk", "lat": 24.00000, "lon": 90.25000 },
-  {"name": "Dhaka-Savar", "code": "BGDs", "lat": 23.86667, "lon": 90.26667 },
-  {"name": "Abu Hayan", "code": "BHRa", "lat": 26.03333, "lon": 50.61667 },
-  {"name": "Al Muharraq", "code": "BHRm", "lat": 26.26667, "lon": 50.65000 },
-  {"name": "Bijeljina", "code": "BIHb", "lat": 44.70000, "lon": 19.16667 },
-  {"name": "Zavidovici", "code": "BIHz", "lat": 44.43333, "lon": 18.15000 },
-  {"name": "Diego Garcia", "code": "BIO", "lat": -7.43333, "lon": 72.43333 },
-  {"name": "Sasnovy/Kalodziscy", "code": "BLRMinsk", "lat": 53.96667, "lon": 27.78333 },
-  {"name": "Brest", "code": "BLRb", "lat": 52.30000, "lon": 23.90000 },
-  {"name": "Hrodna/Grodno", "code": "BLRg", "lat": 53.66667, "lon": 23.83333 },
-  {"name": "Mahiliou/Mogilev ('Orsha')", "code": "BLRm", "lat": 53.61667, "lon": 30.33333 },
-  {"name": "Molodechno/Vileyka (43 Comm Center Russian Navy)", "code": "BLRmo", "lat": 54.46667, "lon": 26.78333 },
-  {"name": "Vitebsk", "code": "BLRvi", "lat": 55.13333, "lon": 30.35000 },
-  {"name": "Santa Ana del Yacuma", "code": "BOLay", "lat": -13.75000, "lon": -65.53333 },
-  {"name": "Cochabamba", "code": "BOLcb", "lat": -17.38333, "lon": -66.18333 },
-  {"name": "La Paz", "code": "BOLp", "lat": -16.50000, "lon": -68.13333 },
-  {"name": "Riberalta", "code": "BOLri", "lat": -10.99694, "lon": -66.06694 },
-  {"name": "Santa Cruz", "code": "BOLsc", "lat": -17.80000, "lon": -63.16667 },
-  {"name": "Santa Cruz Airport", "code": "BOLsz", "lat": -17.66667, "lon": -63.13333 },
-  {"name": "Uyuni", "code": "BOLuy", "lat": -20.46667, "lon": -66.81667 },
-  {"name": "Yura", "code": "BOLyu", "lat": -20.06667, "lon": -66.13333 },
-  {"name": "Mopeng Hill", "code": "BOT", "lat": -21.95000, "lon": 27.65000 },
-  {"name": "Thimphu", "code": "BTN", "lat": 27.46667, "lon": 89.65000 },
-  {"name": "Blagoevgrad (864)", "code": "BULbg", "lat": 42.05000, "lon": 23.05000 },
-  {"name": "Bankya", "code": "BULbk", "lat": 42.72667, "lon": 23.15917 },
-  {"name": "Doulovo (1161)", "code": "BULdo", "lat": 43.81667, "lon": 27.15000 },
-  {"name": "Kardjali (963)", "code": "BULkj", "lat": 41.60000, "lon": 25.36667 },
-  {"name": "Plovdiv-Padarsko", "code": "BULp", "lat": 42.38333, "lon": 24.86667 },
-  {"name": "Petrich", "code": "BULpe", "lat": 41.46667, "lon": 23.33333 },
-  {"name": "Sofia-Kostinbrod", "code": "BULs", "lat": 42.81667, "lon": 23.21667 },
-  {"name": "Samuil (864)", "code": "BULsa", "lat": 43.53500, "lon": 26.73694 },
-  {"name": "Salmanovo (747)", "code": "BULsl", "lat": 43.18333, "lon": 26.96667 },
-  {"name": "Targovishte (1161)", "code": "BULtv", "lat": 43.25000, "lon": 26.51667 },
-  {"name": "Varna", "code": "BULva", "lat": 43.06667, "lon": 27.78333 },
-  {"name": "Vidin", "code": "BULvi", "lat": 43.83333, "lon": 22.71667 },
-  {"name": "Vakarel (261)", "code": "BULvk", "lat": 42.56667, "lon": 23.70000 },
-  {"name": "Bangui", "code": "CAFba", "lat": 4.35000, "lon": 18.58333 },
-  {"name": "Boali", "code": "CAFbo", "lat": 4.65000, "lon": 18.20000 },
-  {"name": "Aldergrove BC, Matsqui Tx site", "code": "CANal", "lat": 49.10833, "lon": -122.24444 },
-  {"name": "Amphitrite Point BC", "code": "CANap", "lat": 48.92528, "lon": -125.54028 },
-  {"name": "Calgary AB", "code": "CANc", "lat": 50.90056, "lon": -113.87583 },
-  {"name": "Cambridge Bay, Victoria Island NU", "code": "CANcb", "lat": 69.11472, "lon": -105.01972 },
-  {"name": "Churchill MB", "code": "CANcc", "lat": 58.76167, "lon": -93.94417 },
-  {"name": "Coral Harbour NU", "code": "CANch", "lat": 64.15028, "lon": -83.37278 },
-  {"name": "Cap des Rosiers", "code": "CANcr", "lat": 48.86111, "lon": -64.21472 },
-  {"name": "Cartwright NL", "code": "CANcw", "lat": 53.70833, "lon": -57.02139 },
-  {"name": "Digby Island BC", "code": "CANdi", "lat": 54.29750, "lon": -130.41833 },
-  {"name": "Essex County (Harrow), near Detroit, ON", "code": "CANex", "lat": 42.04167, "lon": -82.97417 },
-  {"name": "CFG8525 ON", "code": "CANfg", "lat": 43.86667, "lon": -79.31667 },
-  {"name": "Gander NL", "code": "CANg", "lat": 48.96806, "lon": -54.67389 },
-  {"name": "Halifax NS", "code": "CANh", "lat": 44.68417, "lon": -63.60972 },
-  {"name": "Hopedale NL", "code": "CANhd", "lat": 55.45667, "lon": -60.20833 },
-  {"name": "Hunter Point BC", "code": "CANhp", "lat": 53.25861, "lon": -132.71472 },
-  {"name": "Hay River", "code": "CANhr", "lat": 60.84083, "lon": -115.77000 },
-  {"name": "Halifax CFH NS", "code": "CANhx", "lat": 44.96389, "lon": -63.98194 },
-  {"name": "Iqaluit NU", "code": "CANi", "lat": 63.73111, "lon": -68.54222 },
-  {"name": "Inuvik NWT", "code": "CANin", "lat": 68.32583, "lon": -133.59806 },
-  {"name": "St John's NL", "code": "CANj", "lat": 47.56944, "lon": -52.81444 },
-  {"name": "Killiniq/Killinek NU", "code": "CANk", "lat": 60.42417, "lon": -64.84167 },
-  {"name": "Kingsburg NS", "code": "CANki", "lat": 44.27556, "lon": -64.28750 },
-  {"name": "Lockeport NS", "code": "CANlp", "lat": 43.66361, "lon": -65.12972 },
-  {"name": "La Vernière, Îles-de-la-Madeleine QC", "code": "CANlv", "lat": 47.35722, "lon": -61.92667 },
-  {"name": "Natashquan QC", "code": "CANna", "lat": 50.15167, "lon": -61.79500 },
-  {"name": "Ottawa ON", "code": "CANo", "lat": 45.29472, "lon": -75.75806 },
-  {"name": "Port Caledonia NS", "code": "CANpc", "lat": 46.18722, "lon": -59.89972 },
-  {"name": "Resolute, Cornwallis Island NU", "code": "CANr", "lat": 74.74639, "lon": -95.00306 },
-  {"name": "St Anthony NL", "code": "CANsa", "lat": 51.50000, "lon": -55.82389 },
-  {"name": "St John's NL", "code": "CANsj", "lat": 47.61111, "lon": -52.66694 },
-  {"name": "St Lawrence NL", "code": "CANsl", "lat": 46.91917, "lon": -55.37917 },
-  {"name": "Sambro NS", "code": "CANsm", "lat": 44.47250, "lon": -63.62028 },
-  {"name": "Stephenville NL", "code": "CANsv", "lat": 48.55472, "lon": -58.75889 },
-  {"name": "Toronto (Mississauga/Clarkson) ON", "code": "CANt", "lat": 43.50639, "lon": -79.63361 },
-  {"name": "Trenton (Pointe Petre, Lake Ontario)", "code": "CANtr", "lat": 43.84417, "lon": -77.14639 },
-  {"name": "Trenton Receiver Site ON", "code": "CANtr2", "lat": 44.03222, "lon": -77.55056 },
-  {"name": "Vancouver BC", "code": "CANv", "lat": 49.13917, "lon": -123.19556 },
-  {"name": "Yarmouth/Chebogue NS", "code": "CANym", "lat": 43.74417, "lon": -66.12250 },
-  {"name": "Kandal", "code": "CBGka", "lat": 11.41667, "lon": 104.83333 },
-  {"name": "Antofagasta", "code": "CHLa", "lat": -23.66667, "lon": -70.40000 },
-  {"name": "Radio Esperanza", "code": "CHLe", "lat": -38.68333, "lon": -72.58333 },
-  {"name": "Bahia Felix", "code": "CHLfx", "lat": -52.96194, "lon": -74.08083 },
-  {"name": "Juan Fernández", "code": "CHLjf", "lat": -33.63333, "lon": -78.83333 },
-  {"name": "Punta Arenas", "code": "CHLpa", "lat": -53.16667, "lon": -70.90000 },
-  {"name": "Puerto Montt", "code": "CHLpm", "lat": -41.65556, "lon": -73.17333 },
-  {"name": "Santiago (Calera de Tango)", "code": "CHLs", "lat": -33.64333, "lon": -70.85056 },
-  {"name": "Talagante", "code": "CHLt", "lat": -33.66667, "lon": -70.93333 },
-  {"name": "Talahuano, Quiriquina Island", "code": "CHLtq", "lat": -36.61667, "lon": -73.06667 },
-  {"name": "Valparaiso 32S48-71W29 or", "code": "CHLv", "lat": -33.02028, "lon": -71.64222 },
-  {"name": "Wollaston Island", "code": "CHLw", "lat": -55.61667, "lon": -67.43333 },
-  {"name": "Baoji-Xinjie (Shaanxi; CRI 150 kW; CNR2 9820) '722'", "code": "CHNa", "lat": 34.50000, "lon": 107.16667 },
-  {"name": "Baoji-Sifangshan (Shaanxi; CNR1,8) '724'", "code": "CHNas", "lat": 37.45000, "lon": 107.68333 },
-  {"name": "Beijing-Matoucun '572' (100 kW CNR1)", "code": "CHNb", "lat": 39.75000, "lon": 116.81667 },
-  {"name": "Beijing-Chaoyang/Gaobeidian/Shuangqiao '491' (CNR2-8)", "code": "CHNB", "lat": 39.88333, "lon": 116.56667 },
-  {"name": "Beijing-Doudian (150/500 kW CRI) '564'", "code": "CHNbd", "lat": 39.63333, "lon": 116.08333 },
-  {"name": "Beijing BAF", "code": "CHNbm", "lat": 39.90000, "lon": 116.46667 },
-  {"name": "Beijing 3SD", "code": "CHNbs", "lat": 39.70000, "lon": 115.91667 },
-  {"name": "Basuo, Hainan", "code": "CHNb0", "lat": 19.09611, "lon": 108.63444 },
-  {"name": "Chengdu (Sichuan)", "code": "CHNc", "lat": 30.90000, "lon": 104.11667 },
-  {"name": "Changchun '523' (Jilin)", "code": "CHNcc", "lat": 44.02889, "lon": 125.41889 },
-  {"name": "Changzhou Henglinchen '623' (Jiangsu)", "code": "CHNch", "lat": 31.70917, "lon": 120.11222 },
-  {"name": "Dongfang (Hainan)", "code": "CHNd", "lat": 18.88333, "lon": 108.65000 },
-  {"name": "Dalian", "code": "CHNda", "lat": 38.91667, "lon": 121.65000 },
-  {"name": "Dongfang-Basuo", "code": "CHNdb", "lat": 19.10000, "lon": 108.61667 },
-  {"name": "Gejiu (Yunnan)", "code": "CHNe", "lat": 23.35000, "lon": 103.13333 },
-  {"name": "Beijing, Posolstvo", "code": "CHNeb", "lat": 39.91667, "lon": 116.45000 },
-  {"name": "Fuzhou (Fujian)", "code": "CHNf", "lat": 26.10000, "lon": 119.40000 },
-  {"name": "Fuzhou-Mawei XSL (Fujian)", "code": "CHNfz", "lat": 26.016667, "lon": 119.450000 },
-  {"name": "Tailu", "code": "CHNfz", "lat": 26.36861, "lon": 119.93944 },
-  {"name": "Gannan (Hezuo)", "code": "CHNg", "lat": 34.97500, "lon": 102.91667 },
-  {"name": "Gutian-Xincheng", "code": "CHNgu", "lat": 26.56667, "lon": 118.73333 },
-  {"name": "Guangzhou XSQ", "code": "CHNgx", "lat": 23.15750, "lon": 113.51417 },
-  {"name": "Guiyang", "code": "CHNgy", "lat": 26.41667, "lon": 106.60000 },
-  {"name": "Guangzhou-Huadu (Guangdong)", "code": "CHNgz", "lat": 23.40000, "lon": 113.23333 },
-  {"name": "Hohhot '694' (Nei Menggu, CRI)", "code": "CHNh", "lat": 40.80000, "lon": 111.78333 },
-  {"name": "Hailar (Nei Menggu)", "code": "CHNha", "lat": 49.18333, "lon": 119.71667 },
-  {"name": "Huadian '763' (Jilin)", "code": "CHNhd", "lat": 43.11667, "lon": 126.51667 },
-  {"name": "Hezuo", "code": "CHNhe", "lat": 34.97056, "lon": 102.90889 },
-  {"name": "Hohhot-Yijianfang (Nei Menggu, PBS NM)", "code": "CHNhh", "lat": 40.71667, "lon": 111.55000 },
-  {"name": "Haikou (Hainan) XSR", "code": "CHNhk", "lat": 20.06667, "lon": 110.70000 },
-  {"name": "Hutubi (Xinjiang)", "code": "CHNhu", "lat": 44.16667, "lon": 86.90000 },
-  {"name": "Jinhua", "code": "CHNj", "lat": 29.11667, "lon": 119.31667 },
-  {"name": "Kunming-Anning CRI (Yunnan)", "code": "CHNk", "lat": 24.88333, "lon": 102.50000 },
-  {"name": "Kashi (Kashgar) (Xinjiang)", "code": "CHNka", "lat": 39.35000, "lon": 75.76667 },
-  {"name": "Kunming-Lantao PBS (Yunnan)", "code": "CHNkl", "lat": 25.16667, "lon": 102.83333 },
-  {"name": "Lingshi '725' (Shanxi)", "code": "CHNL", "lat": 36.86667, "lon": 111.66667 },
-  {"name": "Lianyungang, Jiangsu", "code": "CHNly", "lat": 34.70111, "lon": 119.31250 },
-  {"name": "Nanning (Guangxi) '954'", "code": "CHNn", "lat": 22.78333, "lon": 108.18333 },
-  {"name": "Nanjing (Jiangsu)", "code": "CHNnj", "lat": 32.03333, "lon": 118.73333 },
-  {"name": "Pucheng (Shaanxi)", "code": "CHNp", "lat": 35.00000, "lon": 109.51667 },
-  {"name": "Putian (Fujian)", "code": "CHNpt", "lat": 25.46667, "lon": 119.16667 },
-  {"name": "Ge'ermu/Golmud '916' (Qinghai)", "code": "CHNq", "lat": 36.43333, "lon": 95.00000 },
-  {"name": "Quanzhou '641' (Fujian)", "code": "CHNqz", "lat": 24.88333, "lon": 118.80000 },
-  {"name": "Shijiazhuang '723' (Hebei; Nanpozhuang CRI 500 kW; Huikou CNR 100 kW)", "code": "CHNs", "lat": 38.21667, "lon": 114.10000 },
-  {"name": "Shanghai-Taopuzhen", "code": "CHNsg", "lat": 31.25000, "lon": 121.48333 },
-  {"name": "Shanghai XSG", "code": "CHNsh", "lat": 31.10000, "lon": 121.53333 },
-  {"name": "Sanya (Hainan)", "code": "CHNsn", "lat": 18.23333, "lon": 109.31667 },
-  {"name": "Shangqiu (Henan)", "code": "CHNsq", "lat": 34.94833, "lon": 109.54278 },
-  {"name": "Shantou (Guangdong)", "code": "CHNst", "lat": 23.36667, "lon": 116.70000 },
-  {"name": "Nanping-Shaowu (Fujian)", "code": "CHNsw", "lat": 27.08333, "lon": 117.28333 },
-  {"name": "Shuangyashan '128' (Heilongjiang)", "code": "CHNsy", "lat": 46.72194, "lon": 131.21111 },
-  {"name": "Tibet (Lhasa-Baiding '602')", "code": "CHNt", "lat": 29.65000, "lon": 91.25000 },
-  {"name": "Tianjin", "code": "CHNtj", "lat": 39.05000, "lon": 117.42500 },
-  {"name": "Urumqi (Xinjiang, CRI)", "code": "CHNu", "lat": 44.14639, "lon": 86.89528 },
-  {"name": "Urumqi-Changji (Xinjiang, PBS XJ)", "code": "CHNuc", "lat": 43.97389, "lon": 87.24889 },
-  {"name": "Xian-Xianyang '594' (Shaanxi)", "code": "CHNx", "lat": 34.20000, "lon": 108.90000 },
-  {"name": "Xichang (Sichuan)", "code": "CHNxc", "lat": 27.81667, "lon": 102.23333 },
-  {"name": "Xiamen-Xiangdian (Fujian) XSM", "code": "CHNxd", "lat": 24.504722, "lon": 118.143611 },
-  {"name": "Dong'an", "code": "CHNxd", "lat": 24.59833, "lon": 118.11833 },
-  {"name": "Xining (Qinghai)", "code": "CHNxg", "lat": 36.65000, "lon": 101.58333 },
-  {"name": "Xiamen (Fujian)", "code": "CHNxm", "lat": 24.49222, "lon": 118.07306 },
-  {"name": "Xiangtan (Hunan)", "code": "CHNxt", "lat": 27.50000, "lon": 112.50000 },
-  {"name": "Xuanwei (Yunnan)", "code": "CHNxw", "lat": 26.15000, "lon": 104.03333 },
-  {"name": "Xingyang (Henan)", "code": "CHNxy", "lat": 34.80000, "lon": 113.38333 },
-  {"name": "Xinzhaicun (Fujian)", "code": "CHNxz", "lat": 25.75000, "lon": 117.18333 },
-  {"name": "Yanbian-Yanji (Jilin)", "code": "CHNya", "lat": 42.79167, "lon": 129.48833 },
-  {"name": "Yantai (Shandong)", "code": "CHNyt", "lat": 37.70639, "lon": 121.13583 },
-  {"name": "Zhuhai '909' (Guangdong)", "code": "CHNzh", "lat": 22.38333, "lon": 113.55000 },
-  {"name": "Zhanjiang (Guangdong)", "code": "CHNzj", "lat": 21.18333, "lon": 110.40000 },
-  {"name": "Mount Putuo, Xiaohulu Island, Zhoushan", "code": "CHNzs", "lat": 30.00000, "lon": 122.38333 },
-  {"name": "Rarotonga", "code": "CKHrt", "lat": -21.20000, "lon": -159.81667 },
-  {"name": "Barranquilla", "code": "CLMb", "lat": 10.91667, "lon": -74.76667 },
-  {"name": "Buenaventura", "code": "CLMbu", "lat": 3.88333, "lon": -77.03333 },
-  {"name": "Puerto Lleras", "code": "CLMpl", "lat": 3.26667, "lon": -73.36667 },
-  {"name": "Rioblanco, Tolima", "code": "CLMr", "lat": 3.50000, "lon": -75.83333 },
-  {"name": "San Andrés Island (SAP)", "code": "CLMsa", "lat": 12.55000, "lon": -81.71667 },
-  {"name": "Ekala (SLBC,RJ)", "code": "CLNe", "lat": 7.10000, "lon": 79.90000 },
-  {"name": "Iranawila (IBB)", "code": "CLNi", "lat": 7.51667, "lon": 79.80000 },
-  {"name": "Puttalam", "code": "CLNp", "lat": 7.98333, "lon": 79.80000 },
-  {"name": "Trincomalee (DW)", "code": "CLNt", "lat": 8.73333, "lon": 81.16667 },
-  {"name": "Buea", "code": "CME", "lat": 4.15000, "lon": 9.23333 },
-  {"name": "Arrecife (Lanzarote)", "code": "CNRar", "lat": 29.13333, "lon": -13.51667 },
-  {"name": "Fuencaliente (Las Palmas)", "code": "CNRfc", "lat": 28.50889, "lon": -17.83944 },
-  {"name": "Gran Canaria airport", "code": "CNRgc", "lat": 27.95000, "lon": -15.38333 },
-  {"name": "Haría (Tenerife)", "code": "CNRhr", "lat": 29.14083, "lon": -13.51722 },
-  {"name": "Los Hoyos (Gran Canaria)", "code": "CNRhy", "lat": 28.04861, "lon": -15.44972 },
-  {"name": "Las Mesas (Las Palmas)", "code": "CNRlm", "lat": 28.48278, "lon": -16.26944 },
-  {"name": "Puerto del Rosario", "code": "CNRpr", "lat": 28.54361, "lon": -13.87806 },
-  {"name": "Bukavu", "code": "CODbk", "lat": -2.50000, "lon": 28.83333 },
-  {"name": "Bunia", "code": "CODbu", "lat": 1.53333, "lon": 30.18333 },
-  {"name": "Brazzaville-M'Pila", "code": "COGb", "lat": -4.25000, "lon": 15.30000 },
-  {"name": "Brazzaville Volmet", "code": "COGbv", "lat": -4.23306, "lon": 15.26167 },
-  {"name": "Pointe Noire", "code": "COGpn", "lat": -4.78333, "lon": 11.86667 },
-  {"name": "Abidjan", "code": "CTIa", "lat": 5.36667, "lon": -3.96667 },
-  {"name": "Cariari de Pococí (REE)", "code": "CTR", "lat": 10.41667, "lon": -83.71667 },
-  {"name": "Guápiles (Canton de Pococí, Prov.de Limón) ELCOR", "code": "CTRg", "lat": 10.21667, "lon": -83.78333 },
-  {"name": "La Habana sites Quivicán/Bejucal/Bauta", "code": "CUB", "lat": 23.00000, "lon": -82.50000 },
-  {"name": "Bauta (Centro Transmisor No.1)", "code": "CUBb", "lat": 22.95000, "lon": -82.55000 },
-  {"name": "Bejucal (Centro Transmisor No.2)", "code": "CUBbe", "lat": 22.86667, "lon": -82.33333 },
-  {"name": "Havana Radio", "code": "CUBhr", "lat": 23.16667, "lon": -82.31667 },
-  {"name": "Quivicán/Titan (Centro Transmisor No.3)", "code": "CUBq", "lat": 22.83333, "lon": -82.30000 },
-  {"name": "Santa Maria di Galeria", "code": "CVA", "lat": 42.05000, "lon": 12.31667 },
-  {"name": "Citta del Vaticano", "code": "CVAv", "lat": 41.90000, "lon": 12.45000 },
-  {"name": "Akrotiri (UK territory)", "code": "CYPa", "lat": 34.61667, "lon": 32.93333 },
-  {"name": "Cyprus Radio", "code": "CYPcr", "lat": 35.05000, "lon": 33.28333 },
-  {"name": "Cape Greco", "code": "CYPg", "lat": 34.95000, "lon": 34.08333 },
-  {"name": "Lady's Mile (UK territory)", "code": "CYPm", "lat": 34.61667, "lon": 33.00000 },
-  {"name": "Nicosia", "code": "CYPn", "lat": 35.16667, "lon": 33.35000 },
-  {"name": "Yeni Iskele", "code": "CYPy", "lat": 35.28333, "lon": 33.91667 },
-  {"name": "Brno-Dobrochov", "code": "CZEb", "lat": 49.38333, "lon": 17.13333 },
-  {"name": "Ceske Budejovice-Husova kolonie", "code": "CZEcb", "lat": 48.99278, "lon": 14.49361 },
-  {"name": "Dlouhá Louka", "code": "CZEdl", "lat": 50.64806, "lon": 13.65611 },
-  {"name": "Karlovy Vary-Stará Role", "code": "CZEkv", "lat": 50.23944, "lon": 12.82389 },
-  {"name": "Moravské Budejovice-Domamil", "code": "CZEmb", "lat": 49.07639, "lon": 15.70667 },
-  {"name": "Ostrava-Svinov", "code": "CZEos", "lat": 49.81139, "lon": 18.19333 },
-  {"name": "Praha", "code": "CZEp", "lat": 50.03333, "lon": 14.48333 },
-  {"name": "Praha-Liblice", "code": "CZEpl", "lat": 50.07861, "lon": 14.88694 },
-  {"name": "Pruhonice / Pruhonice", "code": "CZEpr", "lat": 49.99111, "lon": 14.53806 },
-  {"name": "Panská Ves", "code": "CZEpv", "lat": 50.52806, "lon": 14.56694 },
-  {"name": "Trebon / Trebon", "code": "CZEtr", "lat": 49.00000, "lon": 14.76667 },
-  {"name": "Vackov", "code": "CZEva", "lat": 50.23333, "lon": 12.38333 },
-  {"name": "Albersloh", "code": "Dal", "lat": 51.88639, "lon": 7.72194 },
-  {"name": "Biblis", "code": "Db", "lat": 49.68833, "lon": 8.49222 },
-  {"name": "Berlin-Britz", "code": "Dbe", "lat": 52.45000, "lon": 13.43333 },
-  {"name": "Berlin", "code": "Dbl", "lat": 52.51667, "lon": 13.38333 },
-  {"name": "Braunschweig", "code": "Dbr", "lat": 52.28333, "lon": 10.71667 },
-  {"name": "Burg", "code": "Dbu", "lat": 52.28694, "lon": 11.89694 },
-  {"name": "Bonn-Venusberg", "code": "Dbv", "lat": 50.70806, "lon": 7.09667 },
-  {"name": "Cuxhaven-Sahlenburg", "code": "Dcx", "lat": 53.86389, "lon": 8.62556 },
-  {"name": "Dillberg", "code": "Dd", "lat": 49.31667, "lon": 11.38333 },
-  {"name": "Dresden-Wilsdruff", "code": "Ddd", "lat": 51.05861, "lon": 13.50750 },
-  {"name": "Datteln", "code": "Ddt", "lat": 51.65000, "lon": 7.35000 },
-  {"name": "Erlangen-Tennenlohe", "code": "De", "lat": 49.58333, "lon": 11.00000 },
-  {"name": "Flensburg", "code": "Dfl", "lat": 54.79167, "lon": 9.50333 },
-  {"name": "Goehren", "code": "Dg", "lat": 53.53556, "lon": 11.61111 },
-  {"name": "Gera", "code": "Dge", "lat": 50.88333, "lon": 12.08333 },
-  {"name": "Hannover", "code": "Dha", "lat": 52.38333, "lon": 9.70000 },
-  {"name": "Hamburg-Curslack", "code": "Dhc", "lat": 53.45000, "lon": 10.21667 },
-  {"name": "Hannover/Hemmingen", "code": "Dhe", "lat": 52.32778, "lon": 9.73667 },
-  {"name": "Hamburg-Moorfleet", "code": "Dhh", "lat": 53.51917, "lon": 10.10278 },
-  {"name": "Hartenstein (Sachsen)", "code": "Dht", "lat": 50.66667, "lon": 12.66667 },
-  {"name": "Juliusruh", "code": "Djr", "lat": 54.62917, "lon": 13.37389 },
-  {"name": "Kall-Krekel", "code": "Dk", "lat": 50.47806, "lon": 6.52306 },
-  {"name": "Lampertheim", "code": "DL", "lat": 49.60472, "lon": 8.53889 },
-  {"name": "Langenberg", "code": "Dla", "lat": 51.35611, "lon": 7.13417 },
-  {"name": "Lingen", "code": "Dli", "lat": 52.53500, "lon": 7.35306 },
-  {"name": "Mainflingen", "code": "Dmf", "lat": 50.01556, "lon": 9.01194 },
-  {"name": "Nauen", "code": "Dn", "lat": 52.64861, "lon": 12.90917 },
-  {"name": "Neuharlingersiel DHJ59", "code": "Dnh", "lat": 53.67639, "lon": 7.61250 },
-  {"name": "Nuernberg", "code": "Dnu", "lat": 49.45000, "lon": 11.08333 },
-  {"name": "Oranienburg", "code": "Dor", "lat": 52.78333, "lon": 13.38333 },
-  {"name": "Pinneberg", "code": "Dpi", "lat": 53.67306, "lon": 9.80833 },
-  {"name": "Rohrbach", "code": "Dr", "lat": 48.60000, "lon": 11.55000 },
-  {"name": "Rhauderfehn", "code": "Drf", "lat": 53.08333, "lon": 7.61667 },
-  {"name": "Stade", "code": "Ds", "lat": 53.60000, "lon": 9.46667 },
-  {"name": "Wertachtal", "code": "Dw", "lat": 48.08694, "lon": 10.69500 },
-  {"name": "Winsen (Aller)", "code": "Dwa", "lat": 52.66667, "lon": 9.76667 },
-  {"name": "Wachenbrunn", "code": "Dwb", "lat": 50.48556, "lon": 10.55833 },
-  {"name": "Weenermoor", "code": "Dwe", "lat": 53.20000, "lon": 7.31667 },
-  {"name": "Djibouti", "code": "DJId", "lat": 11.50000, "lon": 43.00000 },
-  {"name": "Centre de Transmissions Interarmées FUV", "code": "DJIi", "lat": 11.53583, "lon": 43.15556 },
-  {"name": "Aarhus-Mårslet", "code": "DNKa", "lat": 56.15000, "lon": 10.21667 },
-  {"name": "Blaavand", "code": "DNKbl", "lat": 55.55000, "lon": 8.10000 },
-  {"name": "Bramming", "code": "DNKbr", "lat": 55.46667, "lon": 8.70000 },
-  {"name": "Bovbjerg", "code": "DNKbv", "lat": 56.51667, "lon": 8.16667 },
-  {"name": "Copenhagen OXT", "code": "DNKco", "lat": 55.83333, "lon": 11.41667 },
-  {"name": "Frederikshavn", "code": "DNKf", "lat": 57.43333, "lon": 10.53333 },
-  {"name": "Hillerod", "code": "DNKh", "lat": 55.90000, "lon": 12.26667 },
-  {"name": "Copenhagen Hvidovre", "code": "DNKhv", "lat": 55.65000, "lon": 12.48333 },
-  {"name": "Copenhagen Ishøj", "code": "DNKi", "lat": 55.61667, "lon": 12.35000 },
-  {"name": "Kalundborg", "code": "DNKk", "lat": 55.67639, "lon": 11.06944 },
-  {"name": "Randers", "code": "DNKra", "lat": 56.46667, "lon": 10.03333 },
-  {"name": "Ronne", "code": "DNKro", "lat": 55.03333, "lon": 15.10000 },
-  {"name": "Skagen", "code": "DNKsg", "lat": 57.73333, "lon": 10.56667 },
-  {"name": "Skamlebaek", "code": "DNKsk", "lat": 55.83333, "lon": 11.41667 },
-  {"name": "Santo Domingo", "code": "DOMsd", "lat": 18.46667, "lon": -69.88333 },
-  {"name": "Alfabia (Mallorca)", "code": "Eaf", "lat": 39.73750, "lon": 2.71806 },
-  {"name": "Aguilas", "code": "Eag", "lat": 37.49028, "lon": -1.56333 },
-  {"name": "Ares", "code": "Ear", "lat": 43.45278, "lon": -8.28333 },
-  {"name": "La Asomada", "code": "Eas", "lat": 37.63000, "lon": -0.96333 },
-  {"name": "Boal", "code": "Ebo", "lat": 43.45639, "lon": -6.82056 },
-  {"name": "Coruna", "code": "Ec", "lat": 43.36694, "lon": -8.45194 },
-  {"name": "Cabo de Gata - Sabinar", "code": "Ecg", "lat": 37.20806, "lon": -7.01833 },
-  {"name": "Chipiona", "code": "Ecp", "lat": 36.66667, "lon": -6.40000 },
-  {"name": "Finisterre", "code": "Efi", "lat": 42.90000, "lon": -9.26667 },
-  {"name": "Torreta de Guardamar, Guardamar del Segura", "code": "Egm", "lat": 38.07167, "lon": -0.66472 },
-  {"name": "Huelva", "code": "Eh", "lat": 37.20000, "lon": -7.01667 },
-  {"name": "'Huelva'", "code": "Ehv", "lat": 43.34472, "lon": -1.85583 },
-  {"name": "Jaizquibel", "code": "Ejq", "lat": 43.34472, "lon": -1.85583 },
-  {"name": "Madrid", "code": "Ema", "lat": 40.46667, "lon": -3.66667 },
-  {"name": "Muxía", "code": "Emu", "lat": 43.07722, "lon": -9.22500 },
-  {"name": "Marratxí", "code": "Emx", "lat": 39.63472, "lon": 2.67000 },
-  {"name": "Noblejas", "code": "En", "lat": 39.95000, "lon": -3.43333 },
-  {"name": "Palma de Mallorca", "code": "Epm", "lat": 39.36667, "lon": 2.78333 },
-  {"name": "Pastoriza", "code": "Epz", "lat": 42.34306, "lon": -8.71917 },
-  {"name": "Roquetas", "code": "Erq", "lat": 36.26611, "lon": -6.01333 },
-  {"name": "Rostrío/Cabo de Peñas", "code": "Ers", "lat": 43.47833, "lon": -5.85028 },
-  {"name": "Sabiner", "code": "Esb", "lat": 36.68333, "lon": -2.70000 },
-  {"name": "Tarifa", "code": "Eta", "lat": 36.05000, "lon": -5.55000 },
-  {"name": "Trijueque", "code": "Etj", "lat": 40.77861, "lon": -2.98528 },
-  {"name": "Torrejón de Ardoz (Pegaso, Pavon, Brujo)", "code": "Eto", "lat": 40.50000, "lon": -3.45000 },
-  {"name": "Vejer", "code": "Evj", "lat": 43.47833, "lon": -3.85028 },
-  {"name": "Abis", "code": "EGYa", "lat": 31.16667, "lon": 30.08333 },
-  {"name": "Alexandria / Al-Iskandaria", "code": "EGYal", "lat": 31.20000, "lon": 29.90000 },
-  {"name": "Cairo", "code": "EGYca", "lat": 30.06667, "lon": 31.21667 },
-  {"name": "El Arish", "code": "EGYea", "lat": 31.11194, "lon": 33.69972 },
-  {"name": "Abu Zaabal", "code": "EGYz", "lat": 30.26667, "lon": 31.36667 },
-  {"name": "Ambato", "code": "EQAa", "lat": -1.21667, "lon": -78.61667 },
-  {"name": "Pico Pichincha", "code": "EQAc", "lat": -0.18333, "lon": -78.53333 },
-  {"name": "Guayaquil", "code": "EQAg", "lat": -2.26667, "lon": -79.90000 },
-  {"name": "Ibarra", "code": "EQAi", "lat": 0.35000, "lon": -78.13333 },
-  {"name": "Otavalo", "code": "EQAo", "lat": 0.30000, "lon": -78.18333 },
-  {"name": "Pifo", "code": "EQAp", "lat": -0.23333, "lon": -78.33333 },
-  {"name": "Saraguro", "code": "EQAs", "lat": -3.70000, "lon": -79.30000 },
-  {"name": "Tena", "code": "EQAt", "lat": -1.00000, "lon": -77.80000 },
-  {"name": "Sucúa", "code": "EQAu", "lat": -2.46667, "lon": -78.16667 },
-  {"name": "Saladaro", "code": "ERIAsmara", "lat": 15.21667, "lon": 38.86667 },
-  {"name": "Tallinn Radio", "code": "ESTta", "lat": 59.45000, "lon": 24.75000 },
-  {"name": "Tartu", "code": "ESTtt", "lat": 58.41667, "lon": 27.10000 },
-  {"name": "Tallinn Volmet", "code": "ESTtv", "lat": 59.41667, "lon": 24.83333 },
-  {"name": "Addis Abeba", "code": "ETHa", "lat": 9.00000, "lon": 38.75000 },
-  {"name": "Adama", "code": "ETHad", "lat": 8.53333, "lon": 39.26667 },
-  {"name": "Bahir Dar", "code": "ETHb", "lat": 11.60000, "lon": 37.38333 },
-  {"name": "Geja Dera (HS)", "code": "ETHd", "lat": 8.76667, "lon": 38.66667 },
-  {"name": "Geja Jewe (FS)", "code": "ETHj", "lat": 8.71667, "lon": 38.63333 },
-  {"name": "Jijiga", "code": "ETHjj", "lat": 9.35000, "lon": 42.80000 },
-  {"name": "Mekele", "code": "ETHm", "lat": 13.48333, "lon": 39.48333 },
-  {"name": "Nekemte", "code": "ETHn", "lat": 9.08333, "lon": 36.55000 },
-  {"name": "Robe", "code": "ETHr", "lat": 7.11667, "lon": 40.00000 },
-  {"name": "Allouis", "code": "Fa", "lat": 47.16667, "lon": 2.20000 },
-  {"name": "Auros", "code": "Fau", "lat": 44.50000, "lon": -0.15000 },
-  {"name": "Avord", "code": "Fav", "lat": 47.05000, "lon": 2.46667 },
-  {"name": "Brest", "code": "Fbr", "lat": 48.42583, "lon": -4.24083 },
-  {"name": "Col de la Madone", "code": "Fcm", "lat": 43.78333, "lon": 7.41667 },
-  {"name": "Corsen", "code": "Fco", "lat": 48.41667, "lon": -4.78333 },
-  {"name": "La Garde (Toulon)", "code": "Fg", "lat": 43.10528, "lon": 5.98917 },
-  {"name": "Gris-Nez", "code": "Fgn", "lat": 50.86667, "lon": 1.58333 },
-  {"name": "Hyères Island", "code": "Fhy", "lat": 42.98444, "lon": 6.20667 },
-  {"name": "Issoudun", "code": "Fi", "lat": 46.93333, "lon": 1.90000 },
-  {"name": "Jobourg", "code": "Fjb", "lat": 49.68472, "lon": -1.90778 },
-  {"name": "Mont Angel/Fontbonne", "code": "Fma", "lat": 43.76667, "lon": 7.42500 },
-  {"name": "Ouessant", "code": "Foe", "lat": 48.46667, "lon": -5.05000 },
-  {"name": "Paris", "code": "Fp", "lat": 48.86667, "lon": 2.30000 },
-  {"name": "Rennes", "code": "Fr", "lat": 48.10000, "lon": -1.68333 },
-  {"name": "Roumoules", "code": "Fro", "lat": 43.78333, "lon": 6.15000 },
-  {"name": "Saissac (11)", "code": "Fsa", "lat": 43.39028, "lon": 2.09972 },
-  {"name": "Strasbourg", "code": "Fsb", "lat": 48.24972, "lon": 7.44361 },
-  {"name": "Saint Guénolé", "code": "Fsg", "lat": 47.81667, "lon": -4.38333 },
-  {"name": "Toulon", "code": "Fto", "lat": 43.13556, "lon": 6.05972 },
-  {"name": "Favières FAV", "code": "Fv", "lat": 48.53333, "lon": 1.23333 },
-  {"name": "Vernon", "code": "Fve", "lat": 49.08333, "lon": 1.50000 },
-  {"name": "Rosnay (HWU)", "code": "Fwu", "lat": 46.71667, "lon": 1.23333 },
-  {"name": "Hailuoto (Oulu)", "code": "FINha", "lat": 65.00000, "lon": 24.73333 },
-  {"name": "Helsinki", "code": "FINhe", "lat": 60.15000, "lon": 24.73333 },
-  {"name": "Mariehamn (Aland Islands)", "code": "FINmh", "lat": 60.10000, "lon": 19.93333 },
-  {"name": "Ovaniemi", "code": "FINo", "lat": 60.18028, "lon": 24.82639 },
-  {"name": "Pori", "code": "FINp", "lat": 61.46667, "lon": 21.58333 },
-  {"name": "Topeno, Loppi, near Riihimäki", "code": "FINt", "lat": 60.76667, "lon": 24.28333 },
-  {"name": "Virrat", "code": "FINv", "lat": 62.38333, "lon": 23.61667 },
-  {"name": "Vaasa", "code": "FINva", "lat": 63.08333, "lon": 21.60000 },
-  {"name": "Nadi-Enamanu", "code": "FJIn", "lat": -17.78722, "lon": 177.42222 },
-  {"name": "Tórshavn", "code": "FROt", "lat": 62.01667, "lon": -6.78333 },
-  {"name": "Pohnpei", "code": "FSM", "lat": 6.96667, "lon": 158.20000 },
-  {"name": "Aberdeen (Gregness)", "code": "Gab", "lat": 57.12750, "lon": -2.05361 },
-  {"name": "Aberdeen (Blaikie's Quay)", "code": "Gaq", "lat": 57.14444, "lon": -2.08778 },
-  {"name": "Anthorn", "code": "Gan", "lat": 54.91111, "lon": -3.28056 },
-  {"name": "Bangor (No.Ireland)", "code": "Gba", "lat": 54.66417, "lon": -5.66889 },
-  {"name": "Bridlington (East Yorkshire)", "code": "Gbd", "lat": 54.09389, "lon": -0.17583 },
-  {"name": "Collafirth Hill (Shetland)", "code": "Gcf", "lat": 60.53333, "lon": -1.39167 },
-  {"name": "Crimond (Aberdeenshire)", "code": "Gcm", "lat": 57.61667, "lon": -1.88333 },
-  {"name": "London-Crystal Palace", "code": "Gcp", "lat": 51.41667, "lon": -0.08333 },
-  {"name": "London-Croydon", "code": "Gcr", "lat": 51.41667, "lon": -0.08333 },
-  {"name": "Croughton (Northants)", "code": "Gct", "lat": 51.99722, "lon": -1.20917 },
-  {"name": "Cullercoats, Newcastle", "code": "Gcu", "lat": 55.07472, "lon": -1.46306 },
-  {"name": "Droitwich", "code": "Gd", "lat": 52.30000, "lon": -2.10000 },
-  {"name": "Dover", "code": "Gdv", "lat": 51.13306, "lon": 1.34333 },
-  {"name": "St.Eval (Cornwall)", "code": "Gev", "lat": 50.48333, "lon": -5.00000 },
-  {"name": "Fareham (Hampshire)", "code": "Gfh", "lat": 50.85833, "lon": -1.24972 },
-  {"name": "Falmouth Coastguard", "code": "Gfl", "lat": 50.14528, "lon": -5.04556 },
-  {"name": "Falmouth (Lizard)", "code": "Gfm", "lat": 49.96028, "lon": -5.20167 },
-  {"name": "Holyhead (Isle of Anglesey, Wales)", "code": "Ghh", "lat": 53.31639, "lon": -4.63250 },
-  {"name": "Humber (Flamborough)", "code": "Ghu", "lat": 54.11667, "lon": -0.07806 },
-  {"name": "Inskip (Lancashire)", "code": "Gic", "lat": 53.833333, "lon": -2.833333 },
-  {"name": "St.Eval (Cornwall)", "code": "Gic", "lat": 50.483333, "lon": -5.000000 },
-  {"name": "Crimond (Aberdeenshire)", "code": "Gic", "lat": 57.61667, "lon": -1.88333 },
-  {"name": "Inskip (Lancashire)", "code": "Gin", "lat": 53.83333, "lon": -2.83333 },
-  {"name": "London", "code": "Glo", "lat": 51.50000, "lon": -0.18333 },
-  {"name": "Lerwick (Shetland)", "code": "Glw", "lat": 60.14861, "lon": -1.14028 },
-  {"name": "Milford Haven, Wales", "code": "Gmh", "lat": 51.70778, "lon": -5.05250 },
-  {"name": "Niton Navtex, Isle of Wight", "code": "Gni", "lat": 50.58639, "lon": -1.25472 },
-  {"name": "Northwood", "code": "Gnw", "lat": 51.50000, "lon": -0.16667 },
-  {"name": "Orfordness", "code": "Go", "lat": 52.10000, "lon": 1.58333 },
-  {"name": "Portland", "code": "Gp", "lat": 50.60000, "lon": -2.45000 },
-  {"name": "Portpatrick Navtex (Dumfries and Galloway)", "code": "Gpp", "lat": 54.84417, "lon": -5.12444 },
-  {"name": "Rampisham", "code": "Gr", "lat": 50.80833, "lon": -2.64306 },
-  {"name": "Skelton", "code": "Gs", "lat": 54.73333, "lon": -2.90000 },
-  {"name": "Shetland (Lerwick)", "code": "Gsc", "lat": 60.40167, "lon": -1.22417 },
-  {"name": "St Mary's (Isles of Scilly)", "code": "Gsm", "lat": 49.92889, "lon": -6.30389 },
-  {"name": "Saint Peter Port (Guernsey)", "code": "Gsp", "lat": 49.45000, "lon": -2.53333 },
-  {"name": "Stornoway (Butt of Lewis)", "code": "Gst", "lat": 58.46139, "lon": -6.23111 },
-  {"name": "Stornoway port", "code": "Gsw", "lat": 58.20333, "lon": -6.37556 },
-  {"name": "Tiree (Inner Hebrides)", "code": "Gti", "lat": 56.50000, "lon": -6.80694 },
-  {"name": "Woofferton", "code": "Gw", "lat": 52.31667, "lon": -2.71667 },
-  {"name": "Washford (Somerset)", "code": "Gwa", "lat": 51.16056, "lon": -3.34861 },
-  {"name": "Moyabi", "code": "GAB", "lat": -1.66667, "lon": 13.51667 },
-  {"name": "Sukhumi", "code": "GEOs", "lat": 42.98833, "lon": 41.06611 },
-  {"name": "Bata", "code": "GNEb", "lat": 1.76667, "lon": 9.76667 },
-  {"name": "Malabo", "code": "GNEm", "lat": 3.75000, "lon": 8.78333 },
-  {"name": "Avlis", "code": "GRCa", "lat": 38.38333, "lon": 23.60000 },
-  {"name": "Iraklion", "code": "GRCi", "lat": 35.33333, "lon": 25.11667 },
-  {"name": "Kerkyra", "code": "GRCk", "lat": 39.61667, "lon": 19.91667 },
-  {"name": "Limnos (Myrina)", "code": "GRCL", "lat": 39.86667, "lon": 25.06667 },
-  {"name": "Olimpia", "code": "GRCo", "lat": 37.60750, "lon": 21.48750 },
-  {"name": "Rhodos", "code": "GRCr", "lat": 36.41667, "lon": 28.21667 },
-  {"name": "Aasiaat", "code": "GRLaa", "lat": 68.68333, "lon": -52.83333 },
-  {"name": "Ikerasassuaq (Prins Christian Sund)", "code": "GRLik", "lat": 60.05000, "lon": -43.15000 },
-  {"name": "Kook Island", "code": "GRLko", "lat": 64.06667, "lon": -52.00000 },
-  {"name": "Maniitsoq", "code": "GRLma", "lat": 65.40000, "lon": -52.86667 },
-  {"name": "Nuuk", "code": "GRLn", "lat": 64.06667, "lon": -52.00000 },
-  {"name": "Paamiut", "code": "GRLpa", "lat": 62.00000, "lon": -49.71667 },
-  {"name": "Qaqortoq", "code": "GRLqa", "lat": 60.68333, "lon": -46.60000 },
-  {"name": "Qeqertarsuaq", "code": "GRLqe", "lat": 69.23333, "lon": -53.51667 },
-  {"name": "Sisimiut", "code": "GRLsi", "lat": 66.93333, "lon": -53.66667 },
-  {"name": "Simiutaq", "code": "GRLsq", "lat": 60.68333, "lon": -46.60000 },
-  {"name": "Tasiilaq/Ammassalik", "code": "GRLt", "lat": 65.60000, "lon": -37.63333 },
-  {"name": "Upernavik", "code": "GRLup", "lat": 72.78333, "lon": -56.16667 },
-  {"name": "Uummannaq", "code": "GRLuu", "lat": 70.78333, "lon": -52.13333 },
-  {"name": "Montsinery", "code": "GUF", "lat": 4.90000, "lon": -52.48333 },
-  {"name": "Conakry-Sonfonia", "code": "GUIc", "lat": 9.68611, "lon": -13.53639 },
-  {"name": "Station KSDA, Agat,", "code": "GUMa", "lat": 13.34111, "lon": 144.64889 },
-  {"name": "Andersen Air Force Base", "code": "GUMan", "lat": 13.56667, "lon": 144.91667 },
-  {"name": "Barrigada", "code": "GUMb", "lat": 13.48333, "lon": 144.83333 },
-  {"name": "Agana HFDL site", "code": "GUMh", "lat": 13.46667, "lon": 144.80000 },
-  {"name": "Station KTWR, Agana/Merizo", "code": "GUMm", "lat": 13.27722, "lon": 144.67111 },
-  {"name": "Naval station NPN", "code": "GUMn", "lat": 13.43333, "lon": 144.65000 },
-  {"name": "Sparendaam", "code": "GUY", "lat": 6.81667, "lon": -58.08333 },
-  {"name": "Cape d'Aguilar", "code": "HKGa", "lat": 22.21667, "lon": 114.25000 },
-  {"name": "Marine Rescue Radio VRC", "code": "HKGm", "lat": 22.29000, "lon": 114.15333 },
-  {"name": "Tegucigalpa", "code": "HNDt", "lat": 14.06667, "lon": -87.21667 },
-  {"name": "Budapest", "code": "HNGb", "lat": 47.50000, "lon": 19.05000 },
-  {"name": "Lakihegy", "code": "HNGlh", "lat": 47.36667, "lon": 19.00000 },
-  {"name": "Alphen aan den Rijn", "code": "HOLa", "lat": 52.13333, "lon": 4.63333 },
-  {"name": "Borculo", "code": "HOLb", "lat": 52.11667, "lon": 6.51667 },
-  {"name": "Coast Guard Den Helder - Scheveningen", "code": "HOLcg", "lat": 52.10000, "lon": 4.25000 },
-  {"name": "Elburg", "code": "HOLe", "lat": 52.43333, "lon": 5.86667 },
-  {"name": "Heerde", "code": "HOLhe", "lat": 52.38333, "lon": 6.03333 },
-  {"name": "Klazienaveen", "code": "HOLk", "lat": 52.73333, "lon": 6.98333 },
-  {"name": "Margraten", "code": "HOLm", "lat": 50.80000, "lon": 5.80000 },
-  {"name": "Nijmegen", "code": "HOLn", "lat": 51.85000, "lon": 5.83333 },
-  {"name": "Ouddorp, Goeree-Overflakkee island", "code": "HOLo", "lat": 51.80000, "lon": 3.90000 },
-  {"name": "Overslag (Westdorpe)", "code": "HOLov", "lat": 51.20000, "lon": 3.86667 },
-  {"name": "Zwolle", "code": "HOLzw", "lat": 52.51667, "lon": 6.08333 },
-  {"name": "Deanovec", "code": "HRV", "lat": 45.65000, "lon": 16.45000 },
-  {"name": "WWVH", "code": "HWAa", "lat": 21.98917, "lon": -159.76444 },
-  {"name": "WWVH", "code": "HWAb", "lat": 21.98639, "lon": -159.76250 },
-  {"name": "WWVH", "code": "HWAc", "lat": 21.98833, "lon": -159.76417 },
-  {"name": "WWVH", "code": "HWAd", "lat": 21.98750, "lon": -159.76389 },
-  {"name": "Hickam AFB", "code": "HWAhi", "lat": 21.31667, "lon": -157.91667 },
-  {"name": "Honolulu/Iroquois Point", "code": "HWAho", "lat": 21.32306, "lon": -157.99333 },
-  {"name": "Moloka'i", "code": "HWAm", "lat": 21.18333, "lon": -157.18333 },
-  {"name": "Naalehu", "code": "HWAn", "lat": 19.01667, "lon": -155.66667 },
-  {"name": "NMO Honolulu/Maili", "code": "HWAnm", "lat": 21.42806, "lon": -158.15306 },
-  {"name": "Pearl Harbour", "code": "HWAp", "lat": 21.42806, "lon": -158.15306 },
-  {"name": "Andrate", "code": "Ia", "lat": 45.51667, "lon": 7.88333 },
-  {"name": "Ancona IPA", "code": "Ian", "lat": 43.60306, "lon": 13.47056 },
-  {"name": "Augusta IQA (Sicily)", "code": "Iau", "lat": 37.23722, "lon": 15.24056 },
-  {"name": "San Benedetto de Tronto IQP", "code": "Ib", "lat": 42.97083, "lon": 13.86528 },
-  {"name": "Bari IPB", "code": "Iba", "lat": 41.08917, "lon": 16.99556 },
-  {"name": "Cagliari IDC (Sardinia)", "code": "Icg", "lat": 39.22778, "lon": 9.23444 },
-  {"name": "Civitavecchia IPD", "code": "Icv", "lat": 42.03333, "lon": 11.83333 },
-  {"name": "Genova ICB", "code": "Ige", "lat": 44.42917, "lon": 8.93306 },
-  {"name": "Crotone IPC", "code": "Ikr", "lat": 39.05000, "lon": 17.13333 },
-  {"name": "Livorno-Montenero IPL", "code": "Ili", "lat": 43.49028, "lon": 10.36083 },
-  {"name": "Lampedusa-Ponente IQN", "code": "Ilm", "lat": 35.51750, "lon": 12.56611 },
-  {"name": "Messina IDF (Sicily)", "code": "Ime", "lat": 38.26833, "lon": 15.62194 },
-  {"name": "Monteparano (IPC)", "code": "Imp", "lat": 40.44194, "lon": 17.41889 },
-  {"name": "Mazara del Vallo IQQ", "code": "Imz", "lat": 37.67000, "lon": 12.61306 },
-  {"name": "Napoli-Posillipo IQH", "code": "Ina", "lat": 40.80056, "lon": 14.18333 },
-  {"name": "Padova", "code": "Ip", "lat": 45.15000, "lon": 11.70000 },
-  {"name": "Palermo-Punta Raisi IPP (Sicily)", "code": "Ipa", "lat": 38.19000, "lon": 13.10833 },
-  {"name": "Porto Torres IZN (Sardinia)", "code": "Ipt", "lat": 40.79778, "lon": 8.32528 },
-  {"name": "Roma", "code": "Ir", "lat": 41.80000, "lon": 12.51667 },
-  {"name": "Roma IMB", "code": "Ira", "lat": 41.78333, "lon": 12.46667 },
-  {"name": "Rome", "code": "Ire", "lat": 41.91667, "lon": 12.48333 },
-  {"name": "Sigonella (Sicilia)", "code": "Isi", "lat": 37.40000, "lon": 14.91667 },
-  {"name": "Santa Rosa (Maritele), Roma", "code": "Isr", "lat": 41.98333, "lon": 12.36667 },
-  {"name": "NSY", "code": "Isy", "lat": 37.11667, "lon": 14.43333 },
-  {"name": "Trieste (Monte Radio) IQX", "code": "It", "lat": 45.67667, "lon": 13.76917 },
-  {"name": "Viareggio, Toscana", "code": "Iv", "lat": 43.90000, "lon": 10.28333 },
-  {"name": "Aligarh (4x250kW)", "code": "INDa", "lat": 28.00000, "lon": 78.10000 },
-  {"name": "Ahmedabad", "code": "INDah", "lat": 22.86667, "lon": 72.61667 },
-  {"name": "Aizawl(10kW)", "code": "INDaz", "lat": 23.71667, "lon": 92.71667 },
-  {"name": "Bengaluru-Doddaballapur (Bangalore)", "code": "INDb", "lat": 13.23333, "lon": 77.50000 },
-  {"name": "Bhopal(50kW)", "code": "INDbh", "lat": 23.16667, "lon": 77.50000 },
-  {"name": "Chennai (Madras)", "code": "INDc", "lat": 13.13333, "lon": 80.11667 },
-  {"name": "Delhi (Kingsway)", "code": "INDd", "lat": 28.71667, "lon": 77.20000 },
-  {"name": "Delhi-Nangli Poona", "code": "INDdn", "lat": 28.76667, "lon": 77.13333 },
-  {"name": "Gorakhpur", "code": "INDg", "lat": 26.86667, "lon": 83.46667 },
-  {"name": "Gangtok", "code": "INDgt", "lat": 27.36667, "lon": 88.61667 },
-  {"name": "Hyderabad", "code": "INDhy", "lat": 17.33333, "lon": 78.55000 },
-  {"name": "Imphal", "code": "INDim", "lat": 24.61667, "lon": 93.90000 },
-  {"name": "Itanagar", "code": "INDit", "lat": 27.06667, "lon": 93.60000 },
-  {"name": "Jalandhar", "code": "INDj", "lat": 31.31667, "lon": 75.30000 },
-  {"name": "Jaipur", "code": "INDja", "lat": 26.90000, "lon": 75.75000 },
-  {"name": "Jeypore", "code": "INDje", "lat": 18.91667, "lon": 82.56667 },
-  {"name": "Jammu", "code": "INDjm", "lat": 32.75000, "lon": 75.00000 },
-  {"name": "Kham Pur, Delhi 110036 (Khampur)", "code": "INDk", "lat": 28.81667, "lon": 77.13333 },
-  {"name": "Kolkata-Chandi", "code": "INDkc", "lat": 22.36667, "lon": 88.28333 },
-  {"name": "Kohima", "code": "INDkh", "lat": 25.65000, "lon": 94.10000 },
-  {"name": "Kolkata(Calcutta)-Chinsurah", "code": "INDko", "lat": 23.01667, "lon": 88.35000 },
-  {"name": "Kurseong", "code": "INDku", "lat": 26.91667, "lon": 88.31667 },
-  {"name": "Kolkata Volmet", "code": "INDkv", "lat": 22.65000, "lon": 88.45000 },
-  {"name": "Leh", "code": "INDle", "lat": 34.13333, "lon": 77.48333 },
-  {"name": "Lucknow", "code": "INDlu", "lat": 26.88333, "lon": 81.05000 },
-  {"name": "Mumbai (Bombay)", "code": "INDm", "lat": 19.18333, "lon": 72.81667 },
-  {"name": "Mumbai Volmet", "code": "INDmv", "lat": 19.08333, "lon": 72.85000 },
-  {"name": "Nagpur, Maharashtra", "code": "INDn", "lat": 20.90000, "lon": 78.98333 },
-  {"name": "Najibabad, Uttar Pradesh", "code": "INDnj", "lat": 29.63333, "lon": 78.38333 },
-  {"name": "Panaji (Goa)", "code": "INDp", "lat": 15.51667, "lon": 73.86667 },
-  {"name": "Port Blair-Brookshabad", "code": "INDpb", "lat": 11.61667, "lon": 92.75000 },
-  {"name": "Rajkot", "code": "INDr", "lat": 22.36667, "lon": 70.68333 },
-  {"name": "Ranchi", "code": "INDra", "lat": 23.40000, "lon": 85.36667 },
-  {"name": "Shillong", "code": "INDsg", "lat": 25.43333, "lon": 91.81667 },
-  {"name": "Siliguri", "code": "INDsi", "lat": 26.76667, "lon": 88.43333 },
-  {"name": "Shimla", "code": "INDsm", "lat": 31.10000, "lon": 77.15000 },
-  {"name": "Srinagar", "code": "INDsr", "lat": 34.00000, "lon": 74.83333 },
-  {"name": "Suratgarh (Rajasthan)", "code": "INDsu", "lat": 29.30000, "lon": 73.91667 },
-  {"name": "Tuticorin (Tamil Nadu)", "code": "INDt", "lat": 8.81667, "lon": 78.08333 },
-  {"name": "Thiruvananthapuram(Trivendrum)", "code": "INDtv", "lat": 8.48333, "lon": 76.98333 },
-  {"name": "Vijayanarayanam (Tamil Nadu)", "code": "INDv", "lat": 8.38333, "lon": 77.75000 },
-  {"name": "Vishakapatnam (Andhra Pradesh)", "code": "INDvs", "lat": 17.71667, "lon": 83.30000 },
-  {"name": "Guwahati (1x200kW, 1x50kW)", "code": "INDw", "lat": 26.18333, "lon": 91.83333 },
-  {"name": "Ambon, Ambon Island, Maluku", "code": "INSam", "lat": -3.69694, "lon": 128.17472 },
-  {"name": "Amamapare, Papua", "code": "INSap", "lat": -4.88333, "lon": 136.80000 },
-  {"name": "Atapupu, Timor", "code": "INSat", "lat": -9.02500, "lon": 124.86111 },
-  {"name": "Banggai, Banggai Island, Sulawesi Tengah", "code": "INSba", "lat": -1.59028, "lon": 123.49889 },
-  {"name": "Banabungi, Buton Island, Sulawesi Tenggara", "code": "INSbb", "lat": -5.51389, "lon": 122.84444 },
-  {"name": "Badas, Sumbawa Island, West Nusa Tenggara", "code": "INSbd", "lat": -8.46222, "lon": 117.37722 },
-  {"name": "Bade, Papua", "code": "INSbe", "lat": -7.16444, "lon": 139.59694 },
-  {"name": "Bagan Siapi-Api, Riau, Sumatra", "code": "INSbg", "lat": 2.15250, "lon": 100.80278 },
-  {"name": "Biak, Papua", "code": "INSbi", "lat": -1.00000, "lon": 135.50000 },
-  {"name": "Banjarmasin, Kalimantan Selatan", "code": "INSbj", "lat": -3.33333, "lon": 114.58333 },
-  {"name": "Bengkalis, Bengkalis Island, Riau", "code": "INSbk", "lat": 1.45139, "lon": 102.10944 },
-  {"name": "Batu Licin, Kalimantan Selatan", "code": "INSbl", "lat": -3.43194, "lon": 116.00194 },
-  {"name": "Batu Ampar, Batam Island next to Singapore", "code": "INSbm", "lat": 1.18083, "lon": 104.01444 },
-  {"name": "Bawean, Bawean Island, Jawa Timur", "code": "INSbn", "lat": -5.85556, "lon": 112.65556 },
-  {"name": "Benoa, Denpasar, Bali", "code": "INSbo", "lat": -8.75611, "lon": 115.21667 },
-  {"name": "Balikpapan, Kalimantan Timur", "code": "INSbp", "lat": -1.26222, "lon": 116.82028 },
-  {"name": "Benete, Sumbawa Island, West Nusa Tenggara", "code": "INSbt", "lat": -8.90083, "lon": 116.74722 },
-  {"name": "Bukittinggi, Sumatera Barat", "code": "INSbu", "lat": -0.30000, "lon": 100.36667 },
-  {"name": "Belawan, Medan, Sumatera Utara", "code": "INSbw", "lat": 3.72139, "lon": 98.66889 },
-  {"name": "Biak, Biak Island, Papua", "code": "INSby", "lat": -1.18361, "lon": 136.07806 },
-  {"name": "Bau-Bau, Buton Island, Sulawesi Tenggara", "code": "INSb2", "lat": -5.48028, "lon": 122.58111 },
-  {"name": "Bengkulu, Sumatra", "code": "INSb3", "lat": -3.89972, "lon": 102.30889 },
-  {"name": "Bima, Sumbawa Island, West Nusa Tenggara", "code": "INSb4", "lat": -8.44056, "lon": 118.72556 },
-  {"name": "Bintuni, Papua Barat", "code": "INSb5", "lat": -2.11972, "lon": 133.50111 },
-  {"name": "Bitung, Sulawesi Utara", "code": "INSb6", "lat": 1.46472, "lon": 125.18417 },
-  {"name": "Bontang, Kalimantan Timur", "code": "INSb7", "lat": -0.13333, "lon": 117.50000 },
-  {"name": "Celukan Bawang, Bali", "code": "INScb", "lat": -8.18611, "lon": 114.83111 },
-  {"name": "Cilacap, Java", "code": "INScc", "lat": -7.73333, "lon": 109.00000 },
-  {"name": "Cigading, Merak, Banten, Java", "code": "INSci", "lat": -5.93333, "lon": 106.00000 },
-  {"name": "Cirebon, Jawa Barat", "code": "INScr", "lat": -6.71667, "lon": 108.56667 },
-  {"name": "Donggala, Sulawesi Tengah", "code": "INSdg", "lat": -0.67500, "lon": 119.74472 },
-  {"name": "Dumai, Riau, Sumatra", "code": "INSdm", "lat": 1.68611, "lon": 101.45556 },
-  {"name": "Dobo, Wamar Island, Maluku", "code": "INSdo", "lat": -5.75000, "lon": 134.23333 },
-  {"name": "Dabo Singkep, Singkep Island, Riau, Sumatra", "code": "INSds", "lat": -0.50000, "lon": 104.56667 },
-  {"name": "Ende, Flores Island, Nusa Tenggara Timur", "code": "INSen", "lat": -8.83889, "lon": 121.64389 },
-  {"name": "Fakfak, Papua Barat", "code": "INSf", "lat": -2.93333, "lon": 132.30000 },
-  {"name": "Fatujuring, Wokam Island, Maluku", "code": "INSfj", "lat": -6.01667, "lon": 134.15000 },
-  {"name": "Gorontalo, Sulawesi", "code": "INSg", "lat": 0.56667, "lon": 123.06667 },
-  {"name": "Gilimanuk, Bali", "code": "INSgi", "lat": -8.17806, "lon": 114.43472 },
-  {"name": "Gorontalo port, Sulawesi", "code": "INSgo", "lat": 0.50806, "lon": 123.06361 },
-  {"name": "Gresik, Surabaya, Jawa Timur", "code": "INSgr", "lat": -7.16417, "lon": 112.66028 },
-  {"name": "Gunung Sitoli, Nias Island, Sumatera Utara", "code": "INSgs", "lat": 1.30667, "lon": 97.60972 },
-  {"name": "Jakarta (Cimanggis)", "code": "INSj", "lat": -6.20000, "lon": 106.85000 },
-  {"name": "Jambi PKC3", "code": "INSja", "lat": -1.61389, "lon": 103.61417 },
-  {"name": "Jakarta BMG", "code": "INSjb", "lat": -6.28333, "lon": 106.86667 },
-  {"name": "Jambi, Sumatera", "code": "INSjm", "lat": -1.63333, "lon": 103.56667 },
-  {"name": "Jepara, Jawa Tengah", "code": "INSjp", "lat": -6.58639, "lon": 110.66139 },
-  {"name": "Jakarta, Sunda Kelapa port", "code": "INSjs", "lat": -6.12333, "lon": 106.80833 },
-  {"name": "Juwana, Jawa Tengah", "code": "INSjw", "lat": -6.70417, "lon": 111.15361 },
-  {"name": "Jakarta PKX", "code": "INSjx", "lat": -6.11889, "lon": 106.85417 },
-  {"name": "Jayapura, Papua", "code": "INSjy", "lat": -2.51944, "lon": 140.72278 },
-  {"name": "Kaimana, Papua", "code": "INSka", "lat": -3.66667, "lon": 133.76667 },
-  {"name": "Kalabahi, Alor Island, East Nusa Tenggara", "code": "INSkb", "lat": -8.22167, "lon": 124.51111 },
-  {"name": "Kendari, Sulawesi Tenggara", "code": "INSkd", "lat": -3.98333, "lon": 122.60000 },
-  {"name": "Kalianget, Sumenep, Madura Island, Jawa Timur", "code": "INSkg", "lat": -7.06667, "lon": 113.96667 },
-  {"name": "Kumai, Kalimantan Tengah", "code": "INSki", "lat": -2.75556, "lon": 111.71667 },
-  {"name": "Kijang, Bintan Island", "code": "INSkj", "lat": 0.85111, "lon": 104.60861 },
-  {"name": "Kolonodale, Sulawesi Tenggara", "code": "INSkl", "lat": -2.02111, "lon": 121.34111 },
-  {"name": "Karimunjawa Island, off Java", "code": "INSkm", "lat": -5.88333, "lon": 110.43333 },
-  {"name": "Kupang, Timor", "code": "INSkn", "lat": -10.20000, "lon": 123.61667 },
-  {"name": "Kolaka, Sulawesi Tenggara", "code": "INSko", "lat": -4.04861, "lon": 121.57833 },
-  {"name": "Ketapang, Kalimantan Barat", "code": "INSkp", "lat": -1.81667, "lon": 109.96667 },
-  {"name": "Kota Langsa, Aceh, Sumatra", "code": "INSks", "lat": 4.48333, "lon": 97.95000 },
-  {"name": "Kuala Tungkal, Jambi, Sumatra", "code": "INSkt", "lat": -0.82083, "lon": 103.46833 },
-  {"name": "Kota Baru, Laut Island, Kalimantan Selatan", "code": "INSku", "lat": -3.23333, "lon": 116.23333 },
-  {"name": "Kwandang, Gorontalo, Sulawesi", "code": "INSkw", "lat": 0.85778, "lon": 122.79222 },
-  {"name": "Lembar, Lombok", "code": "INSle", "lat": -8.72806, "lon": 116.07306 },
-  {"name": "Lhokseumawe, Aceh, Sumatra", "code": "INSlh", "lat": 5.21139, "lon": 97.03917 },
-  {"name": "Lombok", "code": "INSlo", "lat": -8.50167, "lon": 116.67833 },
-  {"name": "Luwuky, Sulawesi Tengah", "code": "INSlu", "lat": -0.89972, "lon": 122.79417 },
-  {"name": "Manokwari, Papua Barat", "code": "INSma", "lat": -0.86556, "lon": 134.07694 },
-  {"name": "Masalembo Island, Java Sea", "code": "INSmb", "lat": -5.58333, "lon": 114.43333 },
-  {"name": "Manado, Sulawesi Utara", "code": "INSmd", "lat": 1.20000, "lon": 124.90000 },
-  {"name": "Meneng, Banyuwangi, Java", "code": "INSme", "lat": -8.12500, "lon": 114.39722 },
-  {"name": "Manokwari, Irian Jaya Barat", "code": "INSmk", "lat": -0.80000, "lon": 134.00000 },
-  {"name": "Maumere, Flores, Nusa Tenggara Timur", "code": "INSmm", "lat": -8.61667, "lon": 122.21667 },
-  {"name": "Manado, Sulawesi Utara", "code": "INSmn", "lat": 1.54028, "lon": 124.83444 },
-  {"name": "Merauke, Papua", "code": "INSmr", "lat": -8.47972, "lon": 140.39389 },
-  {"name": "Makassar, Sulawesi Selatan", "code": "INSms", "lat": -5.10556, "lon": 119.44194 },
-  {"name": "Muntok, Bangka Island", "code": "INSmu", "lat": -2.05611, "lon": 105.15111 },
-  {"name": "Nabire, Papua", "code": "INSn", "lat": -3.23333, "lon": 135.58333 },
-  {"name": "Natuna, Tiga Island, Riau Islands", "code": "INSna", "lat": 3.66944, "lon": 108.12917 },
-  {"name": "Nunukan, Nunukan Island, Kalimantan Utara", "code": "INSnu", "lat": 4.12167, "lon": 117.68889 },
-  {"name": "Palangkaraya, Kalimantan Tengah", "code": "INSp", "lat": -0.18333, "lon": 113.90000 },
-  {"name": "Palu, Sulawesi Tengah", "code": "INSpa", "lat": -0.60000, "lon": 129.60000 },
-  {"name": "Padang Bai, Bali", "code": "INSpb", "lat": -8.52694, "lon": 115.50778 },
-  {"name": "Padang, Sumatera Barat", "code": "INSpd", "lat": -0.10000, "lon": 100.35000 },
-  {"name": "Pekalongan, Java", "code": "INSpe", "lat": -6.85972, "lon": 109.69167 },
-  {"name": "Pare-Pare, Sulawesi Selatan", "code": "INSpf", "lat": -4.01667, "lon": 119.61667 },
-  {"name": "Pangkal Baru, Bangkal Island", "code": "INSpg", "lat": -2.16667, "lon": 106.13333 },
-  {"name": "Panipahan, Riau, Sumatra", "code": "INSph", "lat": 2.41667, "lon": 100.33333 },
-  {"name": "Parigi, Sulawesi Tengah", "code": "INSpi", "lat": -0.82750, "lon": 120.17750 },
-  {"name": "Panjang, Lampung, Sumatra", "code": "INSpj", "lat": -5.47306, "lon": 105.31750 },
-  {"name": "Pontianak", "code": "INSpk", "lat": -0.02667, "lon": 109.28833 },
-  {"name": "Plaju, Palembang, Sumatera Selatan", "code": "INSpl", "lat": -3.00000, "lon": 104.83333 },
-  {"name": "Palembang, Sumatera Selatan", "code": "INSpm", "lat": -2.96667, "lon": 104.78333 },
-  {"name": "Pomalaa, Sulawesi Tenggara", "code": "INSpo", "lat": -4.18306, "lon": 121.64889 },
-  {"name": "Palopo, Sulawesi Selatan", "code": "INSpp", "lat": -2.98889, "lon": 120.20278 },
-  {"name": "Probolinggo, Jawa Timur", "code": "INSpq", "lat": -7.73333, "lon": 113.21667 },
-  {"name": "Panarukan, Jawa Timur", "code": "INSpr", "lat": -7.70000, "lon": 113.93333 },
-  {"name": "Poso, Sulawesi Tengah", "code": "INSps", "lat": -1.38333, "lon": 120.75000 },
-  {"name": "Pantoloan, Sulawesi Tengah", "code": "INSpt", "lat": -0.71667, "lon": 119.86667 },
-  {"name": "Pekanbaru, Riau, Sumatra", "code": "INSpu", "lat": 0.31667, "lon": 103.16667 },
-  {"name": "Pulau Sambu, Riau Islands", "code": "INSpv", "lat": 1.15833, "lon": 103.90000 },
-  {"name": "Raha, Muna Island, Sulawesi Tenggara", "code": "INSra", "lat": -4.83333, "lon": 122.71667 },
-  {"name": "Rengat, Riau, Sumatra", "code": "INSre", "lat": -0.46667, "lon": 102.68333 },
-  {"name": "Reo, Flores", "code": "INSro", "lat": -8.28611, "lon": 120.45222 },
-  {"name": "Sabang, We Island, Aceh", "code": "INSsa", "lat": 5.90000, "lon": 95.35000 },
-  {"name": "Seba, Sawu Island", "code": "INSsb", "lat": -10.50000, "lon": 121.83333 },
-  {"name": "Serui, Japen Island, Papua", "code": "INSse", "lat": -1.88333, "lon": 136.23333 },
-  {"name": "Semarang, Java", "code": "INSsg", "lat": -6.97639, "lon": 110.34722 },
-  {"name": "Susoh, Aceh, Sumatra", "code": "INSsh", "lat": 3.71917, "lon": 96.80944 },
-  {"name": "Sarmi, Papua", "code": "INSsi", "lat": -1.85000, "lon": 138.75000 },
-  {"name": "Selat Panjang, Tebingtinggi Island, Riau", "code": "INSsj", "lat": 1.02083, "lon": 102.71944 },
-  {"name": "Singkil, Aceh, Sumatra", "code": "INSsk", "lat": 2.30000, "lon": 97.75000 },
-  {"name": "Sanana, Sulabes Island, Maluku", "code": "INSsn", "lat": -2.05000, "lon": 125.96667 },
-  {"name": "Sorong, Papua Barat", "code": "INSso", "lat": -0.88333, "lon": 131.26667 },
-  {"name": "Sipange, Tapanuli, Sumatera Utara", "code": "INSsp", "lat": 1.20556, "lon": 99.37917 },
-  {"name": "Sibolga, Sumatera Utara", "code": "INSsq", "lat": 1.73333, "lon": 98.78333 },
-  {"name": "Samarinda, Kalimantan Timur", "code": "INSsr", "lat": -0.50833, "lon": 117.15417 },
-  {"name": "Sampit, Kalimantan Tengah", "code": "INSst", "lat": -2.55722, "lon": 112.95667 },
-  {"name": "Siau Island", "code": "INSsu", "lat": 2.73333, "lon": 125.40000 },
-  {"name": "Selayar, Sulawesi Selatan", "code": "INSsy", "lat": -6.11944, "lon": 120.45833 },
-  {"name": "Sinabang, Simeulue Island, Aceh", "code": "INSs2", "lat": 2.46667, "lon": 96.38333 },
-  {"name": "Sipura Island, Sumatera Barat", "code": "INSs3", "lat": -2.20000, "lon": 99.66667 },
-  {"name": "Surabaya, Jawa Timur", "code": "INSs4", "lat": -7.20000, "lon": 112.73333 },
-  {"name": "Sorong PKY8, Papua Barat", "code": "INSs8", "lat": -0.65000, "lon": 130.71667 },
-  {"name": "Sorong PKY9, Papua Barat", "code": "INSs9", "lat": -1.13333, "lon": 131.26667 },
-  {"name": "Ternate, Ternate Island, Maluku Utara", "code": "INSt", "lat": 0.78333, "lon": 127.36667 },
-  {"name": "Tahuna, Sulawesi Utara", "code": "INSta", "lat": 3.60556, "lon": 125.50417 },
-  {"name": "Tanjung Balai Karimun, Karimunbesar Island, Riau Islands", "code": "INStb", "lat": 0.98806, "lon": 103.43722 },
-  {"name": "Teluk Dalam, Dima Island, Sumatera Utara", "code": "INStd", "lat": 0.56667, "lon": 97.81667 },
-  {"name": "Tegal, Java", "code": "INSte", "lat": -6.85000, "lon": 109.13333 },
-  {"name": "Tanjung Selor, Kalimantan Utara", "code": "INStg", "lat": 2.80000, "lon": 117.36667 },
-  {"name": "Tarakan, Tarakan Island, Kalimantan Utara", "code": "INStk", "lat": 3.28889, "lon": 117.59028 },
-  {"name": "Tembilahan, Riau, Sumatra", "code": "INStl", "lat": -0.31694, "lon": 103.16139 },
-  {"name": "Tarempa, Siantan Island, Riau Islands", "code": "INStm", "lat": 3.21667, "lon": 106.21667 },
-  {"name": "Tobelo, Halmahera Island, Maluku Utara", "code": "INSto", "lat": 1.72500, "lon": 128.00861 },
-  {"name": "Tanjung Santan, Kalimantan Timur", "code": "INSts", "lat": -0.10222, "lon": 117.46417 },
-  {"name": "Toli-Toli, Sulawesi Tengah,", "code": "INStt", "lat": 1.05500, "lon": 120.80556 },
-  {"name": "Tanjung Uban, Bintan Island, Riau Islands", "code": "INStu", "lat": 1.06583, "lon": 104.22417 },
-  {"name": "Tual, Dullah Island, Maluku", "code": "INStw", "lat": -5.63333, "lon": 132.75000 },
-  {"name": "Taluk Bayur, Sumatera Barat", "code": "INSty", "lat": -1.04139, "lon": 100.38056 },
-  {"name": "Ulee-Lheue, Banda Aceh, Aceh, Sumatra", "code": "INSul", "lat": 5.56667, "lon": 95.28333 },
-  {"name": "Wamena, Papua", "code": "INSw", "lat": -4.10000, "lon": 138.93333 },
-  {"name": "Waingapu, Sumba Island, East Nusa Tenggara", "code": "INSwa", "lat": -9.66167, "lon": 120.25611 },
-  {"name": "Malin Head, Co. Donegal", "code": "IRLmh", "lat": 55.37194, "lon": -7.33917 },
-  {"name": "Shannon", "code": "IRLs", "lat": 52.74444, "lon": -8.92694 },
-  {"name": "Sheskin, Co. Donegal", "code": "IRLsk", "lat": 55.35222, "lon": -7.27389 },
-  {"name": "Tralee, Co. Kerry", "code": "IRLtr", "lat": 52.26667, "lon": -9.70000 },
-  {"name": "Valentia, Co. Kerry", "code": "IRLv", "lat": 51.86778, "lon": -10.33417 },
-  {"name": "Ahwaz", "code": "IRNa", "lat": 31.33333, "lon": 48.66667 },
-  {"name": "Bandar-e Torkeman", "code": "IRNb", "lat": 36.90000, "lon": 54.06667 },
-  {"name": "Bandar Abbas", "code": "IRNba", "lat": 27.10167, "lon": 56.06333 },
-  {"name": "Bonab", "code": "IRNbb", "lat": 37.30000, "lon": 46.05000 },
-  {"name": "Chah Bahar", "code": "IRNc", "lat": 25.48333, "lon": 60.53333 },
-  {"name": "Jolfa", "code": "IRNj", "lat": 38.93333, "lon": 45.60000 },
-  {"name": "Kamalabad", "code": "IRNk", "lat": 35.76667, "lon": 51.45000 },
-  {"name": "Kish Island", "code": "IRNke", "lat": 26.56667, "lon": 53.93333 },
-  {"name": "Kiashar", "code": "IRNki", "lat": 37.40000, "lon": 50.01667 },
-  {"name": "Mashhad", "code": "IRNm", "lat": 36.25000, "lon": 59.55000 },
-  {"name": "Bandar-e Mahshahr", "code": "IRNmh", "lat": 30.61667, "lon": 49.20000 },
-  {"name": "Qasr Shirin", "code": "IRNq", "lat": 34.45000, "lon": 45.61667 },
-  {"name": "Sirjan", "code": "IRNs", "lat": 29.45000, "lon": 55.68333 },
-  {"name": "Tayebad", "code": "IRNt", "lat": 34.73333, "lon": 60.80000 },
-  {"name": "Tehran", "code": "IRNte", "lat": 35.75000, "lon": 51.41667 },
-  {"name": "Zahedan", "code": "IRNz", "lat": 29.46667, "lon": 60.88333 },
-  {"name": "Zabol", "code": "IRNzb", "lat": 31.03333, "lon": 61.55000 },
-  {"name": "Salah al-Din (Saladin)", "code": "IRQd", "lat": 34.45000, "lon": 43.58333 },
-  {"name": "Sulaimaniya", "code": "IRQs", "lat": 35.55000, "lon": 45.43333 },
-  {"name": "Fjallabyggd", "code": "ISLf", "lat": 66.15000, "lon": -18.91667 },
-  {"name": "Keflavik/Grindavik", "code": "ISLg", "lat": 64.01667, "lon": -22.56667 },
-  {"name": "Grindavik Thorbjöen", "code": "ISLgt", "lat": 63.85222, "lon": -22.43333 },
-  {"name": "Hornafjördur", "code": "ISLhf", "lat": 64.25000, "lon": -15.21667 },
-  {"name": "Isafjördur", "code": "ISLif", "lat": 66.08333, "lon": -23.03333 },
-  {"name": "Neskaupstadur", "code": "ISLn", "lat": 65.15000, "lon": -13.70000 },
-  {"name": "Reykjavik Aero/HFDL", "code": "ISLr", "lat": 64.08333, "lon": -21.85000 },
-  {"name": "Raufarhöfn", "code": "ISLrf", "lat": 66.45000, "lon": -15.93333 },
-  {"name": "Reykjavik-Seltjarjarnes", "code": "ISLrs", "lat": 64.15083, "lon": -22.02778 },
-  {"name": "Saudanes", "code": "ISLs", "lat": 66.18556, "lon": -18.95139 },
-  {"name": "Stórhöfði", "code": "ISLsh", "lat": 63.39944, "lon": -20.28861 },
-  {"name": "Vestmannaeyjar", "code": "ISLv", "lat": 63.45000, "lon": -20.26667 },
-  {"name": "Haifa", "code": "ISRh", "lat": 32.81667, "lon": 35.00000 },
-  {"name": "Lod (Galei Zahal)", "code": "ISRL", "lat": 31.96667, "lon": 34.86667 },
-  {"name": "She'ar-Yeshuv", "code": "ISRsy", "lat": 33.21528, "lon": 35.64472 },
-  {"name": "Yavne", "code": "ISRy", "lat": 31.90000, "lon": 34.75000 },
-  {"name": "Aonoyama Signal Station, Utazu (Kagawa)", "code": "Jao", "lat": 34.30000, "lon": 133.81667 },
-  {"name": "Asahikawa AF JJU22", "code": "Jas", "lat": 43.80000, "lon": 142.36667 },
-  {"name": "Ashiya AB JJZ59", "code": "Jay", "lat": 33.88333, "lon": 130.65000 },
-  {"name": "Chiba Nagara", "code": "Jc", "lat": 35.46667, "lon": 140.21667 },
-  {"name": "Chitose AB, Hokkaido JJR20", "code": "Jct", "lat": 42.80000, "lon": 141.66667 },
-  {"name": "Esaki Signal Station (Osaka Bay), Awaji island (Hyogo)", "code": "Jes", "lat": 34.59833, "lon": 134.99222 },
-  {"name": "Chofu Campus, Tokyo", "code": "Jf", "lat": 35.65000, "lon": 139.55000 },
-  {"name": "Fuchu AB JJT55", "code": "Jfu", "lat": 35.68333, "lon": 139.50000 },
-  {"name": "Gifu AB JJV67", "code": "Jgf", "lat": 35.40000, "lon": 136.86667 },
-  {"name": "Mount Hagane", "code": "Jh", "lat": 33.46500, "lon": 130.17556 },
-  {"name": "Hofu / Bofu AB JJX36", "code": "Jhf", "lat": 34.03333, "lon": 131.55000 },
-  {"name": "Hamamatsu AB JJV56", "code": "Jhm", "lat": 34.75000, "lon": 137.70000 },
-  {"name": "Hyakurigahara AB JJT33", "code": "Jhy", "lat": 36.18333, "lon": 140.41667 },
-  {"name": "Imabari Ohama Vessel Station (Kurushima), Imabari (Ehime)", "code": "Jio", "lat": 34.09028, "lon": 132.98778 },
-  {"name": "Iruma / Irumagawa AB JJT44", "code": "Jir", "lat": 35.85000, "lon": 139.41667 },
-  {"name": "Itoman, Okinawa JFE", "code": "Jit", "lat": 26.15000, "lon": 127.66667 },
-  {"name": "Isewan Signal Station, Cape Irago, Tahara (Aichi)", "code": "Jiw", "lat": 34.58333, "lon": 137.01667 },
-  {"name": "Kagoshima JMH", "code": "Jk", "lat": 31.31667, "lon": 130.51667 },
-  {"name": "Kumagaya AB JJT66", "code": "Jkg", "lat": 36.16667, "lon": 139.31667 },
-  {"name": "Kisarazu AB JJT22", "code": "Jki", "lat": 35.40000, "lon": 139.91667 },
-  {"name": "Komaki AB (Nagoya) JJV23", "code": "Jkk", "lat": 35.25000, "lon": 136.91667 },
-  {"name": "Kume Shima / Kumejina, Okinawa JJU66", "code": "Jkm", "lat": 26.36667, "lon": 126.71667 },
-  {"name": "Kanmon Oseto Strait Signal Station,", "code": "Jkn", "lat": 33.91667, "lon": 130.93333 },
-  {"name": "Komatsu AB JJV90", "code": "Jko", "lat": 36.40000, "lon": 136.40000 },
-  {"name": "Kasuga AB JJZ37", "code": "Jks", "lat": 33.53333, "lon": 130.46667 },
-  {"name": "Kumamoto JJE20", "code": "Jku", "lat": 32.83333, "lon": 130.85000 },
-  {"name": "Kyodo", "code": "Jky", "lat": 36.18333, "lon": 139.85000 },
-  {"name": "Kannonzaki Signal Station, Yokosuka (Kanagawa)", "code": "Jkz", "lat": 35.25611, "lon": 139.74333 },
-  {"name": "Miura", "code": "Jm", "lat": 35.13972, "lon": 139.64222 },
-  {"name": "Miho AB, Yonago JJX25", "code": "Jmh", "lat": 35.50000, "lon": 133.23333 },
-  {"name": "Misawa AB JJS21", "code": "Jms", "lat": 40.70000, "lon": 141.36667 },
-  {"name": "Matsushima AB JJS32", "code": "Jmt", "lat": 38.40000, "lon": 141.21667 },
-  {"name": "Muroto (Kochi, Shikoku)", "code": "Jmu", "lat": 33.28333, "lon": 134.15000 },
-  {"name": "Makurazaki (Kagoshima, Kyushu)", "code": "Jmz", "lat": 31.26667, "lon": 130.30000 },
-  {"name": "Nemuro", "code": "Jn", "lat": 43.30000, "lon": 145.56667 },
-  {"name": "Naha AB, Okinawa", "code": "Jnh", "lat": 26.20000, "lon": 127.65000 },
-  {"name": "Nagoya Kinjo Signal Station, Nagoya (Aichi)", "code": "Jnk", "lat": 35.03500, "lon": 136.84639 },
-  {"name": "Nara JJW24", "code": "Jnr", "lat": 34.56667, "lon": 135.76667 },
-  {"name": "Nyutabaru AB JJZ26", "code": "Jny", "lat": 32.08333, "lon": 131.45000 },
-  {"name": "Mount Otakadoya", "code": "Jo", "lat": 37.37278, "lon": 140.84889 },
-  {"name": "Okinoerabu JJZ44", "code": "Joe", "lat": 27.43333, "lon": 128.70000 },
-  {"name": "Okinawa", "code": "Jok", "lat": 26.48333, "lon": 127.93333 },
-  {"name": "Osaka JJD20", "code": "Jos", "lat": 34.78333, "lon": 135.43333 },
-  {"name": "Otaru, Hokkaido JJS65", "code": "Jot", "lat": 43.18333, "lon": 141.00000 },
-  {"name": "Sapporo / Chitose AB JJA20", "code": "Jsa", "lat": 42.78333, "lon": 141.66667 },
-  {"name": "Sodegaura (Kubota), Chiba", "code": "Jsg", "lat": 35.44667, "lon": 140.01972 },
-  {"name": "Sendai / Kasuminome AB JJB20", "code": "Jsn", "lat": 38.23333, "lon": 140.91667 },
-  {"name": "Shizuoka", "code": "Jsz", "lat": 34.98333, "lon": 138.38333 },
-  {"name": "Tokyo / Tachikawa AF JJC20 JJT88", "code": "Jtk", "lat": 35.71667, "lon": 139.40000 },
-  {"name": "Tsuiki AB JJZ48", "code": "Jts", "lat": 33.68333, "lon": 131.03333 },
-  {"name": "Tokyo Volmet, Kagoshima Broadcasting Station", "code": "Jtv", "lat": 31.71667, "lon": 130.73333 },
-  {"name": "Yamata", "code": "Jy", "lat": 36.16667, "lon": 139.83333 },
-  {"name": "Yokota AFB", "code": "Jyo", "lat": 35.74861, "lon": 139.34861 },
-  {"name": "Yozadake (Okinawa)", "code": "Jyz", "lat": 26.13333, "lon": 127.70000 },
-  {"name": "Al Karanah / Qast Kherane", "code": "JORak", "lat": 31.73333, "lon": 36.43333 },
-  {"name": "Amman", "code": "JORam", "lat": 31.96667, "lon": 35.88333 },
-  {"name": "Almaty", "code": "KAZa", "lat": 43.25000, "lon": 76.91667 },
-  {"name": "Aktyubinsk/Aktöbe", "code": "KAZak", "lat": 50.25000, "lon": 57.21667 },
-  {"name": "Almaty Volmet", "code": "KAZav", "lat": 43.35000, "lon": 77.05000 },
-  {"name": "Nursultan (Akmolinsk/Tselinograd/Astana)", "code": "KAZn", "lat": 51.01667, "lon": 71.46667 },
-  {"name": "Nairobi 5YE", "code": "KENny", "lat": -1.25000, "lon": 36.86667 },
-  {"name": "Bishkek (Krasnaya Rechka)", "code": "KGZb", "lat": 42.88333, "lon": 74.98333 },
-  {"name": "bk- Bishkek Beta", "code": "KGZ", "lat": 43.06667, "lon": 73.65000 },
-  {"name": "Chuncheon", "code": "KORc", "lat": 37.93333, "lon": 127.76667 },
-  {"name": "Dangjin", "code": "KORd", "lat": 36.96667, "lon": 126.61667 },
-  {"name": "Daebu-do (Ansan)", "code": "KORdb", "lat": 37.22056, "lon": 126.55806 },
-  {"name": "Goyang / Koyang, Gyeonggi-do / Kyonggi-do", "code": "KORg", "lat": 37.60000, "lon": 126.85000 },
-  {"name": "Hwasung/Hwaseong", "code": "KORh", "lat": 37.21667, "lon": 126.78333 },
-  {"name": "Jeju/Aewol HLAZ", "code": "KORj", "lat": 33.48333, "lon": 126.38333 },
-  {"name": "Kimjae", "code": "KORk", "lat": 35.83333, "lon": 126.83333 },
-  {"name": "Muan HFDL", "code": "KORm", "lat": 35.03222, "lon": 126.23861 },
-  {"name": "Hwaseong?", "code": "KORn", "lat": 37.21667, "lon": 126.78333 },
-  {"name": "Suwon-Osan/Hwaseong-Jeongnam", "code": "KORo", "lat": 37.15000, "lon": 127.00000 },
-  {"name": "Seoul-Incheon HLKX", "code": "KORs", "lat": 37.41667, "lon": 126.75000 },
-  {"name": "Seoul-Gangseo-gu", "code": "KORsg", "lat": 37.56667, "lon": 126.96667 },
-  {"name": "Taedok", "code": "KORt", "lat": 36.38333, "lon": 127.36667 },
-  {"name": "Nowon Gyeonggi-do / Seoul-Taereung", "code": "KORw", "lat": 37.63333, "lon": 127.11667 },
-  {"name": "Camp Bondsteel", "code": "KOSb", "lat": 42.36667, "lon": 21.25000 },
-  {"name": "Chongjin", "code": "KREc", "lat": 41.78333, "lon": 129.83333 },
-  {"name": "Hyesan", "code": "KREe", "lat": 41.06667, "lon": 128.03333 },
-  {"name": "Hamhung", "code": "KREh", "lat": 39.93333, "lon": 127.65000 },
-  {"name": "Hwadae/Kimchaek", "code": "KREhw", "lat": 40.68333, "lon": 129.20000 },
-  {"name": "Haeju", "code": "KREj", "lat": 38.01667, "lon": 125.71667 },
-  {"name": "Kanggye", "code": "KREk", "lat": 40.96667, "lon": 126.60000 },
-  {"name": "Kangnam", "code": "KREkn", "lat": 38.90000, "lon": 125.65000 },
-  {"name": "Pyongyang", "code": "KREp", "lat": 39.08333, "lon": 125.38333 },
-  {"name": "Sariwon", "code": "KREs", "lat": 38.08333, "lon": 125.13333 },
-  {"name": "Samgo", "code": "KREsg", "lat": 38.03333, "lon": 126.53333 },
-  {"name": "Sinuiju", "code": "KREsn", "lat": 40.08333, "lon": 124.45000 },
-  {"name": "Sangwon", "code": "KREsw", "lat": 38.85000, "lon": 125.51667 },
-  {"name": "Kujang", "code": "KREu", "lat": 40.08333, "lon": 126.08333 },
-  {"name": "Wonsan", "code": "KREw", "lat": 39.08333, "lon": 127.41667 },
-  {"name": "Pyongsong", "code": "KREy", "lat": 40.08333, "lon": 124.40000 },
-  {"name": "Jahra/Umm al-Rimam", "code": "KWTj", "lat": 29.50000, "lon": 47.66667 },
-  {"name": "Kabd/Sulaibiyah", "code": "KWTk", "lat": 29.15000, "lon": 47.76667 },
-  {"name": "Kuwait", "code": "KWTkw", "lat": 29.38333, "lon": 47.65000 },
-  {"name": "Sam Neua", "code": "LAOs", "lat": 20.26667, "lon": 104.06667 },
-  {"name": "Vientiane", "code": "LAOv", "lat": 17.96667, "lon": 102.55000 },
-  {"name": "Beirut", "code": "LBNbe", "lat": 33.85000, "lon": 35.55000 },
-  {"name": "Monrovia ELWA", "code": "LBRe", "lat": 6.23333, "lon": -10.70000 },
-  {"name": "Monrovia Mamba Point", "code": "LBRm", "lat": 6.31667, "lon": -10.81667 },
-  {"name": "Star Radio Monrovia", "code": "LBRs", "lat": 6.30000, "lon": -10.78333 },
-  {"name": "Sabrata", "code": "LBY", "lat": 32.90000, "lon": 13.18333 },
-  {"name": "Sitkunai", "code": "LTU", "lat": 55.04361, "lon": 23.80778 },
-  {"name": "Viesintos", "code": "LTUv", "lat": 55.70000, "lon": 24.98333 },
-  {"name": "Junglinster", "code": "LUXj", "lat": 49.71667, "lon": 6.25000 },
-  {"name": "Marnach", "code": "LUXm", "lat": 50.05000, "lon": 6.08333 },
-  {"name": "Ulbroka", "code": "LVA", "lat": 56.93333, "lon": 24.28333 },
-  {"name": "Malherbes", "code": "MAUm", "lat": -20.34111, "lon": 57.51278 },
-  {"name": "Maiac near Grigoriopol", "code": "MDA", "lat": 47.28333, "lon": 29.40000 },
-  {"name": "Cahul", "code": "MDAca", "lat": 45.93333, "lon": 28.28333 },
-  {"name": "Chisinau", "code": "MDAce", "lat": 47.01667, "lon": 28.81667 },
-  {"name": "Codru-Costiujeni", "code": "MDAco", "lat": 46.95000, "lon": 28.83333 },
-  {"name": "Edinet", "code": "MDAed", "lat": 48.18333, "lon": 27.30000 },
-  {"name": "Talata Volonondry", "code": "MDG", "lat": -18.83333, "lon": 47.58333 },
-  {"name": "Ambohidrano/Sabotsy", "code": "MDGa", "lat": -18.91667, "lon": 47.53333 },
-  {"name": "Mahajanga (WCBC)", "code": "MDGm", "lat": -15.72722, "lon": 46.44583 },
-  {"name": "Porto Santo", "code": "MDRps", "lat": 33.06667, "lon": -16.35000 },
-  {"name": "Cuauhtémoc, Mexico City", "code": "MEXc", "lat": 19.43333, "lon": -99.15000 },
-  {"name": "Mexico City (Radio Educación)", "code": "MEXe", "lat": 19.26667, "lon": -99.05000 },
-  {"name": "Iztacalco, Mexico City", "code": "MEXi", "lat": 19.38333, "lon": -98.95000 },
-  {"name": "Merida", "code": "MEXm", "lat": 20.96667, "lon": -89.60000 },
-  {"name": "Progreso", "code": "MEXpr", "lat": 21.26667, "lon": -89.78333 },
-  {"name": "San Luis Potosi", "code": "MEXs", "lat": 22.16667, "lon": -101.00000 },
-  {"name": "Chiapas", "code": "MEXp", "lat": 17.00000, "lon": -92.00000 },
-  {"name": "UNAM, Mexico City", "code": "MEXu", "lat": 19.38333, "lon": -99.16667 },
-  {"name": "Villahermosa, Tabasco", "code": "MEXvh", "lat": 18.00000, "lon": -93.00000 },
-  {"name": "Kajang", "code": "MLAka", "lat": 3.01667, "lon": 101.76667 },
-  {"name": "Kota Kinabalu", "code": "MLAkk", "lat": 6.20000, "lon": 116.23333 },
-  {"name": "Kuching-Stapok (closed 2011)", "code": "MLAku", "lat": 1.55000, "lon": 110.33333 },
-  {"name": "Lumut", "code": "MLAl", "lat": 4.23333, "lon": 100.63333 },
-  {"name": "Sibu", "code": "MLAs", "lat": 2.30000, "lon": 111.81667 },
-  {"name": "CRI-Bamako", "code": "MLIc", "lat": 12.68333, "lon": -8.03333 },
-  {"name": "Kati(Bamako)", "code": "MLIk", "lat": 12.75000, "lon": -8.05000 },
-  {"name": "Malta Radio", "code": "MLTmr", "lat": 35.81667, "lon": 14.53333 },
-  {"name": "Ocas", "code": "MNEoc", "lat": 42.01667, "lon": 19.13333 },
-  {"name": "Altay", "code": "MNGa", "lat": 46.31667, "lon": 96.25000 },
-  {"name": "Moron/Mörön", "code": "MNGm", "lat": 49.61667, "lon": 100.16667 },
-  {"name": "Ulaanbaatar-Khonkhor", "code": "MNGu", "lat": 47.91667, "lon": 107.00000 },
-  {"name": "Marpi, Saipan (KFBS)", "code": "MRAm", "lat": 15.26667, "lon": 145.80000 },
-  {"name": "Saipan/Agingan Point (IBB)", "code": "MRAs", "lat": 15.11667, "lon": 145.68333 },
-  {"name": "Tinian (IBB)", "code": "MRAt", "lat": 15.05000, "lon": 145.60000 },
-  {"name": "Agadir", "code": "MRCag", "lat": 30.36667, "lon": -9.55000 },
-  {"name": "Briech (VoA/RL/RFE)", "code": "MRCb", "lat": 35.55000, "lon": -5.96667 },
-  {"name": "Casablanca", "code": "MRCca", "lat": 33.61667, "lon": -7.63333 },
-  {"name": "Laayoune (UN 6678)", "code": "MRCL", "lat": 27.15000, "lon": -13.21667 },
-  {"name": "Nador (RTM,Medi1)", "code": "MRCn", "lat": 34.96667, "lon": -2.91667 },
-  {"name": "Safi", "code": "MRCs", "lat": 32.30000, "lon": -9.23333 },
-  {"name": "Fort-de-France CROSS", "code": "MRTfc", "lat": 14.60000, "lon": -61.08333 },
-  {"name": "FUF Martinique", "code": "MRTu", "lat": 14.53194, "lon": -60.97889 },
-  {"name": "Nouakchott", "code": "MTN", "lat": 18.11667, "lon": -15.95000 },
-  {"name": "Naypyidaw", "code": "MYAn", "lat": 20.18333, "lon": 96.13333 },
-  {"name": "Phin Oo Lwin, Mandalay", "code": "MYAp", "lat": 22.01667, "lon": 96.55000 },
-  {"name": "Taunggyi(Kalaw)", "code": "MYAt", "lat": 20.63333, "lon": 96.58333 },
-  {"name": "Yegu (Yangon/Rangoon)", "code": "MYAy", "lat": 16.86667, "lon": 96.16667 },
-  {"name": "Nouméa - Ouen-Toro", "code": "NCLn", "lat": -22.30528, "lon": 166.45472 },
-  {"name": "Norfolk Island", "code": "NFK", "lat": -29.03333, "lon": 167.95000 },
-  {"name": "Niamey", "code": "NGR", "lat": 13.50000, "lon": 2.10000 },
-  {"name": "Abuja-Gwagwalada", "code": "NIGa", "lat": 8.93333, "lon": 7.06667 },
-  {"name": "Ibadan", "code": "NIGb", "lat": 7.38333, "lon": 3.90000 },
-  {"name": "Enugu", "code": "NIGe", "lat": 6.45000, "lon": 7.45000 },
-  {"name": "Ikorodu", "code": "NIGi", "lat": 6.60000, "lon": 3.50000 },
-  {"name": "Abuja-Lugbe (new site, opened March 2012)", "code": "NIGj", "lat": 8.96667, "lon": 7.35000 },
-  {"name": "Kaduna", "code": "NIGk", "lat": 10.51667, "lon": 7.41667 },
-  {"name": "Walvis Bay", "code": "NMBwb", "lat": -23.08750, "lon": 14.62500 },
-  {"name": "Andenes", "code": "NORa", "lat": 69.26889, "lon": 16.04056 },
-  {"name": "Andenes-Saura", "code": "NORas", "lat": 69.14000, "lon": 16.02000 },
-  {"name": "Andenes (Telenor site)", "code": "NORat", "lat": 69.28333, "lon": 16.05000 },
-  {"name": "Bergen (LLE station, Erdal, Askoy Island)", "code": "NORbe", "lat": 60.43333, "lon": 5.21667 },
-  {"name": "Bjørnøya / Bear Island", "code": "NORbj", "lat": 74.43333, "lon": 19.05000 },
-  {"name": "Bergen-Kvarren", "code": "NORbk", "lat": 60.38944, "lon": 5.25000 },
-  {"name": "Bodø", "code": "NORbo", "lat": 67.28333, "lon": 14.38333 },
-  {"name": "Bodø-Seines", "code": "NORbs", "lat": 67.20000, "lon": 14.36667 },
-  {"name": "Berlevåg", "code": "NORbv", "lat": 70.86667, "lon": 29.06667 },
-  {"name": "Erdal", "code": "NORe", "lat": 60.44889, "lon": 5.21639 },
-  {"name": "Florø", "code": "NORf", "lat": 61.60000, "lon": 5.03333 },
-  {"name": "Farsund", "code": "NORfs", "lat": 58.08333, "lon": 6.78333 },
-  {"name": "Hammerfest", "code": "NORhf", "lat": 70.66667, "lon": 23.68333 },
-  {"name": "Hopen Island", "code": "NORhp", "lat": 76.55000, "lon": 25.11667 },
-  {"name": "Jan Mayen Island", "code": "NORjm", "lat": 71.00000, "lon": -8.50000 },
-  {"name": "Longyearbyen, Svalbard", "code": "NORly", "lat": 78.06667, "lon": 13.61667 },
-  {"name": "Marøy", "code": "NORma", "lat": 60.70000, "lon": 4.88333 },
-  {"name": "Molde-Gossen", "code": "NORmg", "lat": 62.84167, "lon": 6.79306 },
-  {"name": "Mågerø", "code": "NORmr", "lat": 59.15000, "lon": 10.43333 },
-  {"name": "Nordmela-Andøya", "code": "NORnm", "lat": 69.12778, "lon": 15.63333 },
-  {"name": "Oslo-Helgelandsmoen", "code": "NORoh", "lat": 60.11667, "lon": 10.20000 },
-  {"name": "Ørlandet", "code": "NORor", "lat": 63.68333, "lon": 9.65000 },
-  {"name": "Rogaland (Vigreskogen)", "code": "NORro", "lat": 58.65000, "lon": 5.58333 },
-  {"name": "Sandnessjøen", "code": "NORsa", "lat": 66.01667, "lon": 12.63333 },
-  {"name": "Sørreisa", "code": "NORsr", "lat": 69.06667, "lon": 18.00000 },
-  {"name": "Stavanger-Ulsnes", "code": "NORst", "lat": 59.00000, "lon": 5.71667 },
-  {"name": "Vardø", "code": "NORva", "lat": 70.36667, "lon": 31.10000 },
-  {"name": "Khumaltar", "code": "NPL", "lat": 27.50000, "lon": 85.50000 },
-  {"name": "Auckland (Wiroa Island)", "code": "NZLa", "lat": -37.01667, "lon": 174.81667 },
-  {"name": "Dunedin", "code": "NZLdu", "lat": -45.86667, "lon": 170.50000 },
-  {"name": "Rangitaiki", "code": "NZLr", "lat": -38.83333, "lon": 176.41667 },
-  {"name": "Russell", "code": "NZLru", "lat": -35.28333, "lon": 174.11667 },
-  {"name": "Taupo", "code": "NZLt", "lat": -38.86667, "lon": 176.43333 },
-  {"name": "Faa'a airport", "code": "OCEfa", "lat": -17.55000, "lon": -149.61667 },
-  {"name": "Mahina (Tahiti)", "code": "OCEma", "lat": -17.50583, "lon": -149.48250 },
-  {"name": "A'Seela", "code": "OMAa", "lat": 21.91667, "lon": 59.61667 },
-  {"name": "Seeb", "code": "OMAs", "lat": 23.66667, "lon": 58.16667 },
-  {"name": "Thumrait", "code": "OMAt", "lat": 17.63333, "lon": 53.93333 },
-  {"name": "Islamabad", "code": "PAKi", "lat": 33.45000, "lon": 73.20000 },
-  {"name": "Karachi Volmet", "code": "PAKkv", "lat": 24.90000, "lon": 67.16667 },
-  {"name": "Multan", "code": "PAKm", "lat": 30.08944, "lon": 71.49167 },
-  {"name": "Peshawar", "code": "PAKp", "lat": 34.00000, "lon": 71.50000 },
-  {"name": "Quetta", "code": "PAKq", "lat": 30.25000, "lon": 67.00000 },
-  {"name": "Rawalpindi", "code": "PAKr", "lat": 33.50000, "lon": 73.00000 },
-  {"name": "Bocaue (FEBC)", "code": "PHLb", "lat": 14.80000, "lon": 120.91667 },
-  {"name": "Davao City, Mindanao", "code": "PHLdv", "lat": 7.08333, "lon": 125.60000 },
-  {"name": "Iba (FEBC)", "code": "PHLi", "lat": 15.33333, "lon": 119.96667 },
-  {"name": "Koronadal City, Mindanao", "code": "PHLko", "lat": 6.51667, "lon": 124.81667 },
-  {"name": "Marulas/Quezon City, Valenzuela (PBS 6170,9581)", "code": "PHLm", "lat": 14.68333, "lon": 120.96667 },
-  {"name": "Palauig, Zembales (RVA)", "code": "PHLp", "lat": 15.46667, "lon": 119.83333 },
-  {"name": "Poro", "code": "PHLpo", "lat": 16.43333, "lon": 120.28333 },
-  {"name": "Santiago City, Luzon", "code": "PHLsc", "lat": 16.70000, "lon": 121.60000 },
-  {"name": "Tinang (VoA)", "code": "PHLt", "lat": 15.35000, "lon": 120.61667 },
-  {"name": "Tinang-2/portable 50kW (VoA)", "code": "PHLx", "lat": 15.35000, "lon": 120.61667 },
-  {"name": "Zamboanga City, Mindanao", "code": "PHLzm", "lat": 6.91667, "lon": 122.11667 },
-  {"name": "Babeldaob (Medorn)", "code": "PLWKoror", "lat": 7.45611, "lon": 134.47333 },
-  {"name": "Alotau", "code": "PNGa", "lat": -10.30000, "lon": 150.46667 },
-  {"name": "Bougainville/Buka-Kubu", "code": "PNGb", "lat": -5.41667, "lon": 154.66667 },
-  {"name": "Daru", "code": "PNGd", "lat": -9.08333, "lon": 143.16667 },
-  {"name": "Goroka", "code": "PNGg", "lat": -6.03333, "lon": 145.36667 },
-  {"name": "Kavieng", "code": "PNGka", "lat": -2.56667, "lon": 150.80000 },
-  {"name": "Kimbe", "code": "PNGkb", "lat": -5.55000, "lon": 150.15000 },
-  {"name": "Kerema", "code": "PNGke", "lat": -7.98333, "lon": 145.76667 },
-  {"name": "Kiunga", "code": "PNGki", "lat": -6.11667, "lon": 141.30000 },
-  {"name": "Kundiawa", "code": "PNGku", "lat": -6.00000, "lon": 144.95000 },
-  {"name": "Lae (Morobe)", "code": "PNGla", "lat": -6.73333, "lon": 147.00000 },
-  {"name": "Lae Nadzab airport", "code": "PNGln", "lat": -6.56667, "lon": 146.73333 },
-  {"name": "Lorengau", "code": "PNGlo", "lat": -2.01667, "lon": 147.25000 },
-  {"name": "Madang", "code": "PNGma", "lat": -5.23333, "lon": 145.75000 },
-  {"name": "Mendi", "code": "PNGme", "lat": -6.21667, "lon": 143.65000 },
-  {"name": "Mount Hagen", "code": "PNGmh", "lat": -5.90000, "lon": 144.21667 },
-  {"name": "Port Moresby (Waigani)", "code": "PNGpm", "lat": -9.46667, "lon": 147.18333 },
-  {"name": "Port Moresby Maritime Radio", "code": "PNGpr", "lat": -9.46667, "lon": 147.18333 },
-  {"name": "Popondetta", "code": "PNGpo", "lat": -8.75000, "lon": 148.25000 },
-  {"name": "Rabaul", "code": "PNGr", "lat": -4.21667, "lon": 152.21667 },
-  {"name": "Vanimo", "code": "PNGv", "lat": -2.66667, "lon": 141.28333 },
-  {"name": "Vanimo", "code": "PNGva", "lat": -2.68333, "lon": 141.30000 },
-  {"name": "Port Moresby (Radio Wantok)", "code": "PNGwa", "lat": -9.46667, "lon": 147.18333 },
-  {"name": "Wewak", "code": "PNGww", "lat": -3.58333, "lon": 143.66667 },
-  {"name": "Albrook, Panama City", "code": "PNRal", "lat": 8.96889, "lon": -79.55083 },
-  {"name": "Babice", "code": "POLb", "lat": 52.25000, "lon": 20.83333 },
-  {"name": "Puchaly, in Falenty", "code": "POLp", "lat": 52.14361, "lon": 20.90000 },
-  {"name": "Solec Kujawski", "code": "POLsk", "lat": 53.02028, "lon": 18.26222 },
-  {"name": "Ustka", "code": "POLu", "lat": 54.58250, "lon": 16.83667 },
-  {"name": "Witowo", "code": "POLw", "lat": 54.55000, "lon": 16.53333 },
-  {"name": "Monsanto", "code": "PORms", "lat": 38.73333, "lon": -9.18333 },
-  {"name": "Capiatá", "code": "PRGc", "lat": -25.40000, "lon": -57.46667 },
-  {"name": "Filadelfia", "code": "PRGf", "lat": -22.35000, "lon": -60.03333 },
-  {"name": "Arequipa", "code": "PRUar", "lat": -16.41667, "lon": -71.53333 },
-  {"name": "Atalaya", "code": "PRUat", "lat": -10.73000, "lon": -73.75556 },
-  {"name": "Bolívar", "code": "PRUbv", "lat": -7.35000, "lon": -77.83333 },
-  {"name": "Chiclayo/Santa Ana (Carretera a Lambayeque)", "code": "PRUcc", "lat": -6.73333, "lon": -79.85000 },
-  {"name": "Celendín", "code": "PRUce", "lat": -6.88333, "lon": -78.15000 },
-  {"name": "Chachapoyas", "code": "PRUch", "lat": -6.23333, "lon": -77.86667 },
-  {"name": "Callalli", "code": "PRUcl", "lat": -15.50000, "lon": -71.43333 },
-  {"name": "Cerre de Pasco", "code": "PRUcp", "lat": -10.66667, "lon": -76.25000 },
-  {"name": "Chota", "code": "PRUct", "lat": -6.55000, "lon": -78.65000 },
-  {"name": "Cuzco-Cerro Oscollo", "code": "PRUcu", "lat": -13.51889, "lon": -72.01028 },
-  {"name": "Chazuta/Tarapoto, San Martin", "code": "PRUcz", "lat": -6.56667, "lon": -76.13333 },
-  {"name": "Huancabamba", "code": "PRUhb", "lat": -5.23333, "lon": -79.45000 },
-  {"name": "Huancayo/Viques", "code": "PRUhc", "lat": -12.20167, "lon": -75.21972 },
-  {"name": "Huánuco", "code": "PRUho", "lat": -9.93333, "lon": -76.23333 },
-  {"name": "Huanta/Tirapampa", "code": "PRUht", "lat": -12.95000, "lon": -74.25000 },
-  {"name": "Huanta/Vista Alegre (Pasaje Amauta)", "code": "PRUhu", "lat": -12.93667, "lon": -74.25278 },
-  {"name": "Huancavelica", "code": "PRUhv", "lat": -12.78333, "lon": -74.98333 },
-  {"name": "Huaraz", "code": "PRUhz", "lat": -9.51667, "lon": -77.53333 },
-  {"name": "Chau Alto/Independencia, Huarez, Ancash (planned for 6090 kHz in 2015/16)", "code": "PRUin", "lat": -9.51806, "lon": -77.54917 },
-  {"name": "Iquitos/Moronacocha", "code": "PRUiq", "lat": -3.75000, "lon": -73.26667 },
-  {"name": "Jaén", "code": "PRUja", "lat": -5.75000, "lon": -78.85000 },
-  {"name": "Junín/Cuncush", "code": "PRUju", "lat": -11.16667, "lon": -76.00000 },
-  {"name": "Lima", "code": "PRUli", "lat": -12.10000, "lon": -77.05000 },
-  {"name": "La Oroya", "code": "PRUor", "lat": -11.53333, "lon": -75.90000 },
-  {"name": "Paucartambo", "code": "PRUpc", "lat": -10.90000, "lon": -75.85000 },
-  {"name": "Puerto Maldonado", "code": "PRUpm", "lat": -12.60000, "lon": -69.16667 },
-  {"name": "Quillabamba/Macamango", "code": "PRUqb", "lat": -12.86667, "lon": -72.70000 },
-  {"name": "Quillabamba/Tiobamba Baja", "code": "PRUqt", "lat": -12.81667, "lon": -72.68333 },
-  {"name": "Rodrigues de Mendoza", "code": "PRUrm", "lat": -6.38333, "lon": -77.50000 },
-  {"name": "Santa Cruz (R Satelite)", "code": "PRUsc", "lat": -6.68333, "lon": -79.03333 },
-  {"name": "Sicuani", "code": "PRUsi", "lat": -14.26667, "lon": -71.23333 },
-  {"name": "Santiago de Chuco", "code": "PRUsu", "lat": -8.15000, "lon": -78.18333 },
-  {"name": "Tarma/Cerro Penitencia", "code": "PRUta", "lat": -11.40889, "lon": -75.69194 },
-  {"name": "Tacna", "code": "PRUtc", "lat": -18.00000, "lon": -70.21667 },
-  {"name": "valle de Urubamba, Cusco", "code": "PRUur", "lat": -13.35000, "lon": -72.11667 },
-  {"name": "Valle de Vitor, San Luís, Arequipa", "code": "PRUvv", "lat": -16.46833, "lon": -71.90389 },
-  {"name": "Yurimaguas", "code": "PRUyu", "lat": -5.90000, "lon": -76.11667 },
-  {"name": "Isabela", "code": "PTRi", "lat": 18.38333, "lon": -67.18333 },
-  {"name": "Salinas, Camp Santiago", "code": "PTRs", "lat": 17.98333, "lon": 66.30000 },
-  {"name": "Doha Radio", "code": "QATdr", "lat": 25.70000, "lon": 16.53333 },
-  {"name": "Sainte-Suzanne", "code": "REUsu", "lat": -20.91000, "lon": 55.58472 },
-  {"name": "Bucuresti/Bucharest airport", "code": "ROUb", "lat": 44.56667, "lon": 26.08333 },
-  {"name": "Constanta", "code": "ROUc", "lat": 44.10000, "lon": 28.61667 },
-  {"name": "Galbeni", "code": "ROUg", "lat": 46.75000, "lon": 26.68333 },
-  {"name": "Saftica 100kW", "code": "ROUs", "lat": 44.63333, "lon": 27.08333 },
-  {"name": "Tiganesti 300kW", "code": "ROUt", "lat": 44.75000, "lon": 26.08333 },
-  {"name": "Kigali", "code": "RRW", "lat": -1.91667, "lon": 30.11667 },
-  {"name": "Armavir/Tblisskaya/Krasnodar", "code": "RUSa", "lat": 45.48333, "lon": 40.11667 },
-  {"name": "Astrakhan Fedorovka", "code": "RUSaf", "lat": 45.84361, "lon": 47.64361 },
-  {"name": "Angarsk", "code": "RUSag", "lat": 56.13556, "lon": 101.63889 },
-  {"name": "Arkhangelsk Beta", "code": "RUSak", "lat": 64.40000, "lon": 41.53333 },
-  {"name": "Amderma", "code": "RUSam", "lat": 69.76667, "lon": 61.56667 },
-  {"name": "Astrakhan Narimanovo", "code": "RUSan", "lat": 46.28333, "lon": 48.00000 },
-  {"name": "Arkhangelsk", "code": "RUSar", "lat": 64.58333, "lon": 40.60000 },
-  {"name": "Astrakhan Military Base", "code": "RUSas", "lat": 47.41667, "lon": 47.91667 },
-  {"name": "Arkhangelsk-Talagi", "code": "RUSat", "lat": 64.60000, "lon": 40.71667 },
-  {"name": "Anadyr, Chukotka", "code": "RUSay", "lat": 64.74000, "lon": 177.50889 },
-  {"name": "Blagoveshchensk (Amur)", "code": "RUSb", "lat": 50.26667, "lon": 127.55000 },
-  {"name": "Barnaul, Altay", "code": "RUSba", "lat": 53.33333, "lon": 83.80000 },
-  {"name": "Belaya Gora, Sakha(Yakutia)", "code": "RUSbg", "lat": 68.53333, "lon": 146.18333 },
-  {"name": "Bolotnoye, Novosibirsk oblast", "code": "RUSbo", "lat": 55.75611, "lon": 84.44778 },
-  {"name": "Buzzer sites: Kerro (St Petersburg)", "code": "RUSB1", "lat": 60.31111, "lon": 30.27778 },
-  {"name": "Buzzer sites: Naro-Fominsk (Moscow)", "code": "RUSB2", "lat": 55.42639, "lon": 36.70917 },
-  {"name": "Chita (Atamanovka) (S Siberia)", "code": "RUSc", "lat": 51.83333, "lon": 113.71667 },
-  {"name": "Cherskiy, Yakutia", "code": "RUScs", "lat": 68.75000, "lon": 161.33333 },
-  {"name": "Chelyabinsk", "code": "RUScy", "lat": 55.30000, "lon": 61.50000 },
-  {"name": "Dikson", "code": "RUSdi", "lat": 73.50000, "lon": 80.53333 },
-  {"name": "Elista", "code": "RUSel", "lat": 46.36667, "lon": 44.33333 },
-  {"name": "Yeysk port", "code": "RUSey", "lat": 46.72361, "lon": 38.27611 },
-  {"name": "Gelendzhik", "code": "RUSge", "lat": 44.59889, "lon": 37.96444 },
-  {"name": "Goryachiy Klyuch, Omsk", "code": "RUSgk", "lat": 55.01778, "lon": 73.19222 },
-  {"name": "Gorbusha", "code": "RUSgo", "lat": 55.85778, "lon": 38.22944 },
-  {"name": "Grozny", "code": "RUSgr", "lat": 43.26667, "lon": 45.71667 },
-  {"name": "Irkutsk (Angarsk) (S Siberia)", "code": "RUSi", "lat": 52.41667, "lon": 103.66667 },
-  {"name": "Igrim XMAO", "code": "RUSig", "lat": 63.18333, "lon": 64.41667 },
-  {"name": "Ivashka, Kamchatka", "code": "RUSik", "lat": 58.56194, "lon": 162.30722 },
-  {"name": "Irkutsk port", "code": "RUSir", "lat": 52.32083, "lon": 104.28472 },
-  {"name": "Irkutsk Volmet", "code": "RUSiv", "lat": 52.26667, "lon": 104.38333 },
-  {"name": "Izhevsk sites", "code": "RUSiz", "lat": 56.83333, "lon": 53.25000 },
-  {"name": "Kaliningrad-Bolshakovo", "code": "RUSk", "lat": 54.90000, "lon": 21.71667 },
-  {"name": "Komsomolsk-na-Amur (Far East)", "code": "RUSka", "lat": 50.65000, "lon": 136.91667 },
-  {"name": "Krasnodar Beta", "code": "RUSkd", "lat": 44.60000, "lon": 39.56667 },
-  {"name": "Krasnoyarsk HFDL site", "code": "RUSkf", "lat": 56.10000, "lon": 92.30000 },
-  {"name": "Kaliningrad Radio UIW23", "code": "RUSkg", "lat": 54.71667, "lon": 20.73333 },
-  {"name": "Khabarovsk (Far East)", "code": "RUSkh", "lat": 48.55000, "lon": 135.25000 },
-  {"name": "Kirinskoye, Sakhalin", "code": "RUSki", "lat": 51.41667, "lon": 143.43333 },
-  {"name": "Kaliningrad Military Base", "code": "RUSkl", "lat": 54.65000, "lon": 19.91667 },
-  {"name": "Khanty-Mansiysk", "code": "RUSkm", "lat": 61.03333, "lon": 69.08333 },
-  {"name": "Korsakov, Sakhalin", "code": "RUSko", "lat": 46.61667, "lon": 142.76667 },
-  {"name": "Krasnodar-Poltovskaya", "code": "RUSkp", "lat": 45.40500, "lon": 38.15806 },
-  {"name": "Krasnoyarsk", "code": "RUSkr", "lat": 56.03333, "lon": 92.73333 },
-  {"name": "Kotlas", "code": "RUSkt", "lat": 61.23333, "lon": 46.70000 },
-  {"name": "Kurovskaya-Avsyunino (near Moscow)", "code": "RUSku", "lat": 55.56667, "lon": 39.15000 },
-  {"name": "Kirensk Volmet", "code": "RUSkv", "lat": 57.76667, "lon": 108.06667 },
-  {"name": "Kamenka, Sakha", "code": "RUSkx", "lat": 69.50000, "lon": 161.33333 },
-  {"name": "Kyzyl", "code": "RUSky", "lat": 51.68333, "lon": 94.60000 },
-  {"name": "Kazan", "code": "RUSkz", "lat": 55.60000, "lon": 49.28333 },
-  {"name": "Krasnodar Pashkovsky", "code": "RUSk1", "lat": 45.03333, "lon": 39.16667 },
-  {"name": "Kamskoye Ustye, Tatarstan", "code": "RUSk2", "lat": 55.19556, "lon": 49.28694 },
-  {"name": "Kolpashevo, Tomsk", "code": "RUSk3", "lat": 58.31833, "lon": 82.98611 },
-  {"name": "Komsomolsk-na-Amure", "code": "RUSk4", "lat": 50.53333, "lon": 137.03333 },
-  {"name": "Kultayevo, Perm", "code": "RUSk5", "lat": 57.91056, "lon": 55.91861 },
-  {"name": "Kozmino, Cape Povorotny, Primorye", "code": "RUSk6", "lat": 42.68056, "lon": 133.03611 },
-  {"name": "Lesnoy (near Moscow)", "code": "RUSL", "lat": 56.06667, "lon": 37.96667 },
-  {"name": "Liski, Voronezh", "code": "RUSli", "lat": 50.96833, "lon": 39.52139 },
-  {"name": "Labytnangi, YNAO", "code": "RUSln", "lat": 66.64361, "lon": 66.52972 },
-  {"name": "Labytnangi, YNAO Gazprom", "code": "RUSl2", "lat": 66.65833, "lon": 66.22417 },
-  {"name": "Moscow/Moskva (one of ku,L,se,t)", "code": "RUSm", "lat": 55.75000, "lon": 37.30000 },
-  {"name": "Magadan/Arman", "code": "RUSma", "lat": 59.69444, "lon": 150.15861 },
-  {"name": "Magadan Military Base", "code": "RUSmg", "lat": 59.70000, "lon": 150.16667 },
-  {"name": "Mineralnye Vody", "code": "RUSmi", "lat": 44.23333, "lon": 43.08333 },
-  {"name": "Makhachkala, Dagestan", "code": "RUSmk", "lat": 42.81667, "lon": 47.65000 },
-  {"name": "Murmansk Meteo", "code": "RUSmm", "lat": 68.86667, "lon": 33.07500 },
-  {"name": "Maykop", "code": "RUSmp", "lat": 44.66667, "lon": 40.03333 },
-  {"name": "Moscow-Razdory", "code": "RUSmr", "lat": 55.75000, "lon": 37.30000 },
-  {"name": "MTUSI University, Moscow", "code": "RUSmt", "lat": 55.75417, "lon": 37.71194 },
-  {"name": "Murmansk/Monchegorsk", "code": "RUSmu", "lat": 67.91667, "lon": 32.98333 },
-  {"name": "Magadan Volmet", "code": "RUSmv", "lat": 59.91667, "lon": 150.71667 },
-  {"name": "Makhachkala, Dagestan", "code": "RUSmx", "lat": 43.00361, "lon": 47.47028 },
-  {"name": "Mozdok, North Ossetia", "code": "RUSmz", "lat": 43.75000, "lon": 44.65000 },
-  {"name": "Magadan Rosmorport", "code": "RUSm2", "lat": 59.71222, "lon": 150.99417 },
-  {"name": "Makhachkala, Dagestan", "code": "RUSm3", "lat": 42.98333, "lon": 47.51667 },
-  {"name": "Mezen, Arkhangelsk", "code": "RUSm4", "lat": 65.90000, "lon": 44.26667 },
-  {"name": "Murmansk MRCC", "code": "RUSm5", "lat": 68.85278, "lon": 32.98750 },
-  {"name": "Novosibirsk / Oyash, (500 kW, 1000 kW)", "code": "RUSn", "lat": 55.51667, "lon": 83.75000 },
-  {"name": "Nalchik, Kabardino-Balkaria", "code": "RUSnc", "lat": 43.51667, "lon": 43.63333 },
-  {"name": "Nevelsk, Sakhalin", "code": "RUSne", "lat": 46.51667, "lon": 141.85000 },
-  {"name": "Nizhnevartovsk", "code": "RUSni", "lat": 60.95000, "lon": 76.48333 },
-  {"name": "Naryan-Mar", "code": "RUSnm", "lat": 67.63333, "lon": 53.11667 },
-  {"name": "Nizhni Novgorod sites", "code": "RUSnn", "lat": 56.18333, "lon": 43.96667 },
-  {"name": "Novosibirsk City", "code": "RUSno", "lat": 55.03333, "lon": 82.91667 },
-  {"name": "Novosibirsk city port", "code": "RUSnp", "lat": 55.01528, "lon": 82.91750 },
-  {"name": "Novorossiysk", "code": "RUSnr", "lat": 44.74611, "lon": 37.68583 },
-  {"name": "Novosibirsk Shipping Canal", "code": "RUSns", "lat": 54.84500, "lon": 83.04028 },
-  {"name": "Novy Urengoy", "code": "RUSnu", "lat": 66.06667, "lon": 76.51667 },
-  {"name": "Novosibirsk Volmet", "code": "RUSnv", "lat": 55.00444, "lon": 82.56222 },
-  {"name": "Nadym", "code": "RUSny", "lat": 65.48333, "lon": 72.70000 },
-  {"name": "Okhotskoye, Sakhalin", "code": "RUSoe", "lat": 46.87167, "lon": 143.15306 },
-  {"name": "Orenburg-Gagarin airport", "code": "RUSog", "lat": 51.80000, "lon": 55.45000 },
-  {"name": "Oktyarbskiy, Kamchatka", "code": "RUSok", "lat": 52.65722, "lon": 156.24472 },
-  {"name": "Oleniy, Yamalo-Nenets", "code": "RUSol", "lat": 72.59639, "lon": 77.65944 },
-  {"name": "Omsk", "code": "RUSom", "lat": 54.96667, "lon": 73.31667 },
-  {"name": "Orenburg", "code": "RUSor", "lat": 51.76667, "lon": 55.10000 },
-  {"name": "Okhotsk Bulgin", "code": "RUSox", "lat": 59.36667, "lon": 143.15000 },
-  {"name": "Petropavlovsk-Kamchatskiy (Yelizovo)", "code": "RUSp", "lat": 53.18333, "lon": 158.40000 },
-  {"name": "Pechora", "code": "RUSpc", "lat": 65.11667, "lon": 57.13333 },
-  {"name": "Perm", "code": "RUSpe", "lat": 58.05000, "lon": 56.23333 },
-  {"name": "Petropavlovsk-Kamchatskij Military Base", "code": "RUSpk", "lat": 53.16667, "lon": 158.45000 },
-  {"name": "Perm airport", "code": "RUSpm", "lat": 57.91667, "lon": 56.01667 },
-  {"name": "Preobrazhenie, Primorye", "code": "RUSpo", "lat": 42.89806, "lon": 133.89833 },
-  {"name": "Petropavlovsk-Kamchatskiy Port", "code": "RUSpp", "lat": 53.06306, "lon": 158.56917 },
-  {"name": "Sankt Peterburg Military Base", "code": "RUSpt", "lat": 60.00000, "lon": 30.00000 },
-  {"name": "Puteyets, Pechora, Rep.Komi", "code": "RUSpu", "lat": 65.16667, "lon": 57.08333 },
-  {"name": "Sankt Peterburg Volmet / Pulkovo", "code": "RUSpv", "lat": 59.78056, "lon": 30.24833 },
-  {"name": "Peleduy, Sakha", "code": "RUSpy", "lat": 59.61056, "lon": 112.74389 },
-  {"name": "Petropavlovsk-Kamchatskiy Port", "code": "RUSp2", "lat": 53.03306, "lon": 158.64222 },
-  {"name": "Petropavlovsk-Kamchatskiy Commercial sea port", "code": "RUSp3", "lat": 53.00639, "lon": 158.65417 },
-  {"name": "Pevek, Chukotka", "code": "RUSp4", "lat": 69.70083, "lon": 170.25722 },
-  {"name": "Plastun, Primorye", "code": "RUSp5", "lat": 44.72833, "lon": 136.31750 },
-  {"name": "Poronaisk, Sakhalin", "code": "RUSp6", "lat": 49.23167, "lon": 143.11444 },
-  {"name": "Reydovo, Etorofu Island, Kuril", "code": "RUSrd", "lat": 45.27778, "lon": 148.02500 },
-  {"name": "Revda", "code": "RUSre", "lat": 68.03556, "lon": 34.51667 },
-  {"name": "Rossosh, Voronezhskaya oblast", "code": "RUSro", "lat": 50.20000, "lon": 39.58333 },
-  {"name": "Rostov-na-Donu", "code": "RUSrp", "lat": 47.29944, "lon": 39.67361 },
-  {"name": "Russkoye Ustye", "code": "RUSru", "lat": 71.26667, "lon": 150.26667 },
-  {"name": "Rostov Volmet, Rostov-na-Donu", "code": "RUSrv", "lat": 47.25333, "lon": 39.81722 },
-  {"name": "Rybachi, Primorye", "code": "RUSry", "lat": 43.37500, "lon": 131.89444 },
-  {"name": "Samara (Zhygulevsk)", "code": "RUSs", "lat": 53.28333, "lon": 50.25000 },
-  {"name": "Samara Centre", "code": "RUSsa", "lat": 53.20000, "lon": 50.16667 },
-  {"name": "Sabetta, Yamalo-Nenets", "code": "RUSsb", "lat": 71.28333, "lon": 72.03333 },
-  {"name": "Severodvinsk", "code": "RUSsd", "lat": 64.56667, "lon": 39.85000 },
-  {"name": "Sevastopol", "code": "RUSse", "lat": 44.93333, "lon": 34.46667 },
-  {"name": "Salekhard", "code": "RUSsh", "lat": 66.58333, "lon": 66.60000 },
-  {"name": "Smolensk", "code": "RUSsk", "lat": 54.78333, "lon": 32.05000 },
-  {"name": "Seleznevo, Sakhalin", "code": "RUSsl", "lat": 46.60861, "lon": 141.83306 },
-  {"name": "Severomorsk/Arkhangelsk Military Base", "code": "RUSsm", "lat": 69.05000, "lon": 33.31667 },
-  {"name": "Sochi", "code": "RUSso", "lat": 43.45000, "lon": 39.95000 },
-  {"name": "St.Petersburg (Popovka/Krasnyj Bor)", "code": "RUSsp", "lat": 59.65000, "lon": 30.70000 },
-  {"name": "Sevastopol Radio", "code": "RUSsr", "lat": 44.56667, "lon": 33.53333 },
-  {"name": "Saratov", "code": "RUSst", "lat": 51.53333, "lon": 45.85000 },
-  {"name": "Surgut", "code": "RUSsu", "lat": 61.33333, "lon": 73.40000 },
-  {"name": "Samara airport", "code": "RUSsv", "lat": 53.50000, "lon": 50.15000 },
-  {"name": "Syktyvkar Volmet", "code": "RUSsy", "lat": 61.63806, "lon": 50.86361 },
-  {"name": "Saratov airport", "code": "RUSs1", "lat": 51.56667, "lon": 46.05000 },
-  {"name": "Stavropol airport", "code": "RUSs2", "lat": 45.11667, "lon": 42.11667 },
-  {"name": "St Petersburg port", "code": "RUSs3", "lat": 59.90000, "lon": 30.25000 },
-  {"name": "St Petersburg Shepelevo", "code": "RUSs4", "lat": 59.98500, "lon": 29.12694 },
-  {"name": "Sterlegova Cape, Taymyr, Krasnoyarski krai", "code": "RUSs5", "lat": 75.39861, "lon": 88.75944 },
-  {"name": "Stolbovoy Island, New Siberian Islands, Sakha", "code": "RUSs6", "lat": 74.16944, "lon": 135.46528 },
-  {"name": "Svobodny, Amur", "code": "RUSs7", "lat": 51.33528, "lon": 128.17583 },
-  {"name": "Taldom - Severnyj, Radiotsentr 3 (near Moscow)", "code": "RUSt", "lat": 56.73333, "lon": 37.63333 },
-  {"name": "Taganrog", "code": "RUStg", "lat": 47.20528, "lon": 38.95167 },
-  {"name": "Tiksi, Sakha", "code": "RUSti", "lat": 71.64111, "lon": 128.88000 },
-  {"name": "Tomsk", "code": "RUStm", "lat": 56.48944, "lon": 84.94528 },
-  {"name": "Temryuk, Krasnodar", "code": "RUStr", "lat": 45.33028, "lon": 37.22917 },
-  {"name": "Tarko-Sale", "code": "RUSts", "lat": 64.93333, "lon": 77.81667 },
-  {"name": "Tulagino, Sakha", "code": "RUStu", "lat": 62.23778, "lon": 129.81278 },
-  {"name": "Tavrichanka (Vladivostok, 549, 1377)", "code": "RUStv", "lat": 43.33333, "lon": 131.90000 },
-  {"name": "Tyumen Volmet", "code": "RUSty", "lat": 57.16667, "lon": 65.31667 },
-  {"name": "Tiksi-3, Sakha", "code": "RUSt3", "lat": 71.69333, "lon": 128.88083 },
-  {"name": "Ulan-Ude", "code": "RUSu", "lat": 51.73333, "lon": 107.43333 },
-  {"name": "Ust-Barguzin, Buryatia", "code": "RUSub", "lat": 53.42056, "lon": 109.01556 },
-  {"name": "Ufa", "code": "RUSuf", "lat": 54.56667, "lon": 55.88333 },
-  {"name": "Uglegorsk, Sakhalin", "code": "RUSug", "lat": 49.08333, "lon": 142.08333 },
-  {"name": "Ust-Kamchatsk, Kamchatka", "code": "RUSuk", "lat": 56.21778, "lon": 162.51333 },
-  {"name": "Ulan-Ude/Selenginsk", "code": "RUSus", "lat": 52.03333, "lon": 106.93333 },
-  {"name": "Ulan-Ude port", "code": "RUSuu", "lat": 51.83806, "lon": 107.57278 },
-  {"name": "Ustyevoye, Kamchatka", "code": "RUSuy", "lat": 54.15444, "lon": 155.84194 },
-  {"name": "Vladivostok Razdolnoye (Ussuriysk)", "code": "RUSv", "lat": 43.53333, "lon": 131.95000 },
-  {"name": "Vanino, Khabarovski kray", "code": "RUSva", "lat": 49.08333, "lon": 140.26667 },
-  {"name": "Vologda", "code": "RUSvg", "lat": 59.28333, "lon": 39.95000 },
-  {"name": "Vorkuta", "code": "RUSvk", "lat": 67.48333, "lon": 63.98333 },
-  {"name": "Vladivostok Military Base", "code": "RUSvl", "lat": 43.11667, "lon": 131.90000 },
-  {"name": "Vzmorye, Kaliningrad", "code": "RUSvm", "lat": 54.68333, "lon": 20.25000 },
-  {"name": "Volgograd", "code": "RUSvo", "lat": 48.78333, "lon": 44.35000 },
-  {"name": "Vladivostok port", "code": "RUSvp", "lat": 43.11667, "lon": 131.88333 },
-  {"name": "Varandey, Nenets", "code": "RUSvr", "lat": 68.80167, "lon": 57.98278 },
-  {"name": "Veselo-Voznesenka", "code": "RUSvv", "lat": 47.14167, "lon": 38.32806 },
-  {"name": "Vladikavkaz Beslan, North Ossetia", "code": "RUSvz", "lat": 43.20000, "lon": 44.60000 },
-  {"name": "Khabarovsk-Elban", "code": "RUSxe", "lat": 50.07333, "lon": 136.60667 },
-  {"name": "Kholmsk, Sakhalin", "code": "RUSxo", "lat": 47.03333, "lon": 142.05000 },
-  {"name": "Khabarovsk Volmet", "code": "RUSxv", "lat": 48.51667, "lon": 135.16667 },
-  {"name": "Yakutsk/Tulagino", "code": "RUSya", "lat": 62.01667, "lon": 129.80000 },
-  {"name": "Yuzhno-Sakhalinsk (Vestochka)", "code": "RUSys", "lat": 46.91667, "lon": 142.90000 },
-  {"name": "Yekaterinburg Volmet (Koltsovo)", "code": "RUSyv", "lat": 56.75000, "lon": 60.80000 },
-  {"name": "Yakutsk Volmet", "code": "RUSyy", "lat": 62.08333, "lon": 129.76667 },
-  {"name": "Zyryanka, Sakha", "code": "RUSza", "lat": 65.75722, "lon": 150.83917 },
-  {"name": "Zhigalovo, Irkutsk region", "code": "RUSzg", "lat": 54.80944, "lon": 105.16944 },
-  {"name": "Zaporozhye, Kamchatka", "code": "RUSzp", "lat": 51.50806, "lon": 156.49194 },
-  {"name": "Zhatay, Yakutsk", "code": "RUSzy", "lat": 62.17222, "lon": 129.80583 },
-  {"name": "Bjuröklubb", "code": "Sb", "lat": 64.46167, "lon": 21.59167 },
-  {"name": "Delsbo", "code": "Sd", "lat": 61.80000, "lon": 16.55000 },
-  {"name": "Varberg-Grimeton", "code": "Sgr", "lat": 57.10833, "lon": 12.39333 },
-  {"name": "Gislövshammar", "code": "Sgs", "lat": 55.48944, "lon": 14.31444 },
-  {"name": "Härnösand", "code": "Sh", "lat": 62.70667, "lon": 18.12972 },
-  {"name": "Julita", "code": "Sj", "lat": 59.13333, "lon": 16.05000 },
-  {"name": "Kvarnberget-Vallentuna", "code": "Sk", "lat": 59.50000, "lon": 18.13333 },
-  {"name": "Sala", "code": "Ss", "lat": 59.60694, "lon": 17.21222 },
-  {"name": "Stavsnäs", "code": "Sst", "lat": 59.28333, "lon": 18.68333 },
-  {"name": "Tingstäde", "code": "St", "lat": 57.72778, "lon": 18.59861 },
-  {"name": "Vaxholm, The Castle", "code": "Sv", "lat": 59.40000, "lon": 18.35000 },
-  {"name": "Al-Aitahab", "code": "SDNa", "lat": 15.58333, "lon": 32.43333 },
-  {"name": "Reiba", "code": "SDNr", "lat": 13.55000, "lon": 33.51667 },
-  {"name": "Rufisque DIRISI", "code": "SENr", "lat": 14.76028, "lon": -17.27389 },
-  {"name": "Dakar Yoff", "code": "SENy", "lat": 14.73333, "lon": -17.48333 },
-  {"name": "Mahe", "code": "SEYmh", "lat": -4.61667, "lon": 55.43333 },
-  {"name": "Honiara", "code": "SLM", "lat": -9.43333, "lon": 160.05000 },
-  {"name": "Kranji", "code": "SNG", "lat": 1.41667, "lon": 103.73333 },
-  {"name": "Jurong", "code": "SNGj", "lat": 1.26667, "lon": 103.66667 },
-  {"name": "Singapore Volmet", "code": "SNGv", "lat": 1.33639, "lon": 103.68611 },
-  {"name": "Baydhabo", "code": "SOMb", "lat": 3.11667, "lon": 43.65000 },
-  {"name": "Garoowe", "code": "SOMg", "lat": 8.40000, "lon": 48.48333 },
-  {"name": "Hargeisa", "code": "SOMh", "lat": 9.55000, "lon": 44.05000 },
-  {"name": "Mogadishu Airport", "code": "SOMma", "lat": 2.01667, "lon": 45.30000 },
-  {"name": "Beograd/Belgrade", "code": "SRBbe", "lat": 44.80000, "lon": 20.46667 },
-  {"name": "Stubline", "code": "SRBs", "lat": 44.56667, "lon": 20.15000 },
-  {"name": "Narus", "code": "SSDn", "lat": 4.76667, "lon": 33.58333 },
-  {"name": "Pinheira", "code": "STP", "lat": 0.30000, "lon": 6.70000 },
-  {"name": "Bern Radio HEB, Prangins", "code": "SUIbe", "lat": 46.40000, "lon": 6.25000 },
-  {"name": "Geneva", "code": "SUIge", "lat": 46.23333, "lon": 6.13333 },
-  {"name": "Luzern (approx; Ampegon?)", "code": "SUIlu", "lat": 46.83333, "lon": 8.40000 },
-  {"name": "Paramaribo", "code": "SURpm", "lat": 5.85000, "lon": -55.15000 },
-  {"name": "Rimavska Sobota", "code": "SVK", "lat": 48.40000, "lon": 20.13333 },
-  {"name": "Manzini/Mpangela Ranch", "code": "SWZ", "lat": -26.56667, "lon": 31.98333 },
-  {"name": "Adra", "code": "SYR", "lat": 33.45000, "lon": 36.50000 },
-  {"name": "Gredia", "code": "TCDN'Djamena", "lat": 12.13333, "lon": 15.05000 },
-  {"name": "Bangkok / Prathum Thani", "code": "THAb", "lat": 14.05000, "lon": 100.71667 },
-  {"name": "Bangkok Meteo", "code": "THAbm", "lat": 13.73333, "lon": 100.50000 },
-  {"name": "Bangkok Volmet", "code": "THAbv", "lat": 13.69444, "lon": 100.77056 },
-  {"name": "Hat Yai", "code": "THAhy", "lat": 6.93639, "lon": 100.38833 },
-  {"name": "Nakhon Sawan", "code": "THAn", "lat": 15.81667, "lon": 100.06667 },
-  {"name": "Udon Thani", "code": "THAu", "lat": 17.41667, "lon": 102.80000 },
-  {"name": "Dushanbe airport", "code": "TJKda", "lat": 38.53333, "lon": 68.81667 },
-  {"name": "Yangi Yul (Dushanbe)", "code": "TJKy", "lat": 38.48333, "lon": 68.80000 },
-  {"name": "Orzu", "code": "TJKo", "lat": 37.53333, "lon": 68.70000 },
-  {"name": "Asgabat", "code": "TKMa", "lat": 37.85000, "lon": 58.36667 },
-  {"name": "Ashgabat airport", "code": "TKMas", "lat": 37.98333, "lon": 58.36667 },
-  {"name": "Dasoguz/Dashoguz", "code": "TKMds", "lat": 41.76667, "lon": 59.83333 },
-  {"name": "Seyda/Seidi", "code": "TKMs", "lat": 39.47111, "lon": 62.71861 },
-  {"name": "Turkmenbashi", "code": "TKMtb", "lat": 40.05000, "lon": 53.00000 },
-  {"name": "North Post", "code": "TRDnp", "lat": 10.75000, "lon": -61.56667 },
-  {"name": "Bizerte", "code": "TUNbz", "lat": 37.28333, "lon": 9.88333 },
-  {"name": "La Goulette", "code": "TUNgu", "lat": 36.81667, "lon": 10.30000 },
-  {"name": "Kelibia", "code": "TUNke", "lat": 36.83333, "lon": 11.08333 },
-  {"name": "Mahdia", "code": "TUNmh", "lat": 35.51667, "lon": 11.06667 },
-  {"name": "Sfax", "code": "TUNs", "lat": 34.80000, "lon": 10.88333 },
-  {"name": "Sfax", "code": "TUNsf", "lat": 34.73333, "lon": 10.73333 },
-  {"name": "Tabarka", "code": "TUNtb", "lat": 36.95000, "lon": 8.75000 },
-  {"name": "Tunis", "code": "TUNte", "lat": 36.83333, "lon": 10.18333 },
-  {"name": "Tunis", "code": "TUNtu", "lat": 36.90000, "lon": 10.18333 },
-  {"name": "Zarzis", "code": "TUNzz", "lat": 33.50000, "lon": 11.10000 },
-  {"name": "Ankara", "code": "TURa", "lat": 39.91667, "lon": 32.85000 },
-  {"name": "Cakirlar", "code": "TURc", "lat": 39.96667, "lon": 32.66667 },
-  {"name": "Emirler", "code": "TURe", "lat": 39.48333, "lon": 32.85000 },
-  {"name": "Istanbul TAH", "code": "TURis", "lat": 40.98333, "lon": 28.81667 },
-  {"name": "Izmir", "code": "TURiz", "lat": 38.41667, "lon": 27.15000 },
-  {"name": "Mersin", "code": "TURm", "lat": 36.80000, "lon": 34.63333 },
-  {"name": "Fangliao FAN", "code": "TWNf", "lat": 22.38333, "lon": 120.56667 },
-  {"name": "Huwei (Yunlin province)", "code": "TWNh", "lat": 23.71667, "lon": 120.41667 },
-  {"name": "Kouhu (Yunlin province)", "code": "TWNk", "lat": 23.53333, "lon": 120.16667 },
-  {"name": "Lukang", "code": "TWNL", "lat": 24.05000, "lon": 120.41667 },
-  {"name": "Minhsiung (Chiayi province)", "code": "TWNm", "lat": 23.56667, "lon": 120.41667 },
-  {"name": "Tainan/Annan (Tainan city)", "code": "TWNn", "lat": 23.03333, "lon": 120.16667 },
-  {"name": "Paochung/Baujong (Yunlin province) PAO/BAJ", "code": "TWNp", "lat": 23.71667, "lon": 120.30000 },
-  {"name": "Penghu (Pescadores), Jiangmei", "code": "TWNpe", "lat": 23.63333, "lon": 119.60000 },
-  {"name": "Danshui/Tanshui/Tamsui (Taipei province)", "code": "TWNs", "lat": 25.18333, "lon": 121.41667 },
-  {"name": "Taipei (Pali)", "code": "TWNt", "lat": 25.10000, "lon": 121.43333 },
-  {"name": "Taipei, Mount Wufen (Central Weather Bureau)", "code": "TWNw", "lat": 25.15000, "lon": 121.56667 },
-  {"name": "Kuanyin (Han Sheng)", "code": "TWNy", "lat": 25.03333, "lon": 121.10000 },
-  {"name": "Yilin", "code": "TWNyl", "lat": 24.75000, "lon": 121.73333 },
-  {"name": "Daressalam", "code": "TZAd", "lat": -6.83333, "lon": 39.23333 },
-  {"name": "Zanzibar/Dole", "code": "TZAz", "lat": -6.08333, "lon": 39.23333 },
-  {"name": "Dhabbaya", "code": "UAE", "lat": 24.18333, "lon": 54.23333 },
-  {"name": "Al-Abjan", "code": "UAEaj", "lat": 24.59750, "lon": 55.39750 },
-  {"name": "Das Island", "code": "UAEda", "lat": 25.15444, "lon": 52.87667 },
-  {"name": "Musaffah, Abu Dhabi", "code": "UAEmu", "lat": 24.38278, "lon": 54.51444 },
-  {"name": "Sharjah", "code": "UAEsj", "lat": 25.35000, "lon": 55.38333 },
-  {"name": "Kampala-Bugolobi", "code": "UGAk", "lat": 0.33333, "lon": 32.60000 },
-  {"name": "Mukono", "code": "UGAm", "lat": 0.35000, "lon": 32.76667 },
-  {"name": "Berdiansk", "code": "UKRbe", "lat": 46.63333, "lon": 36.76667 },
-  {"name": "Chernivtsi", "code": "UKRc", "lat": 48.30000, "lon": 25.83333 },
-  {"name": "Kyyiv/Kiev/Brovary", "code": "UKRk", "lat": 50.51667, "lon": 30.76667 },
-  {"name": "Kiev", "code": "UKRke", "lat": 50.43333, "lon": 30.53333 },
-  {"name": "Lviv (Krasne)", "code": "UKRL", "lat": 49.85000, "lon": 24.66667 },
-  {"name": "Luch", "code": "UKRlu", "lat": 46.81667, "lon": 32.21667 },
-  {"name": "Mykolaiv (Kopani)", "code": "UKRm", "lat": 46.81667, "lon": 32.23333 },
-  {"name": "Odessa", "code": "UKRod", "lat": 46.48333, "lon": 30.73333 },
-  {"name": "Petrivka", "code": "UKRpe", "lat": 46.90000, "lon": 30.71667 },
-  {"name": "Rivne", "code": "UKRrv", "lat": 50.61667, "lon": 26.25000 },
-  {"name": "Kharkiv (Taranivka)", "code": "UKRx", "lat": 49.63333, "lon": 36.11667 },
-  {"name": "Zaporizhzhya", "code": "UKRz", "lat": 47.83333, "lon": 35.13333 },
-  {"name": "La Paloma", "code": "URGlp", "lat": -34.65000, "lon": -54.13333 },
-  {"name": "Montevideo", "code": "URGm", "lat": -34.83333, "lon": -56.25000 },
-  {"name": "Punta Carretas", "code": "URGpc", "lat": -34.80000, "lon": -56.35000 },
-  {"name": "Punta del Este", "code": "URGpe", "lat": -34.96667, "lon": -54.85000 },
-  {"name": "Rio Branco", "code": "URGrb", "lat": -32.56667, "lon": -53.38333 },
-  {"name": "Tacuarembó", "code": "URGt", "lat": -31.63333, "lon": -55.96667 },
-  {"name": "Trouville", "code": "URGtr", "lat": -34.86667, "lon": -56.30000 },
-  {"name": "Andrews AFB, MD", "code": "USAa", "lat": 38.81083, "lon": -76.86694 },
-  {"name": "Birmingham / Vandiver, AL (WEWN)", "code": "USAb", "lat": 33.50361, "lon": -86.47417 },
-  {"name": "WBMD Baltimore, MD", "code": "USAba", "lat": 39.32389, "lon": -76.54889 },
-  {"name": "Barnegat, NJ", "code": "USAbg", "lat": 39.75000, "lon": -74.39167 },
-  {"name": "Boston, MA", "code": "USAbo", "lat": 41.70833, "lon": -70.55000 },
-  {"name": "Bethel, PA (WMLK)", "code": "USAbt", "lat": 40.47944, "lon": -76.27972 },
-  {"name": "Cypress Creek, SC (WHRI)", "code": "USAc", "lat": 32.68417, "lon": -81.13056 },
-  {"name": "Chesapeake - Pungo Airfield, VA", "code": "USAch", "lat": 36.67778, "lon": -76.02778 },
-  {"name": "Cutler, ME", "code": "USAcu", "lat": 44.63333, "lon": -67.28333 },
-  {"name": "Destin, FL", "code": "USAds", "lat": 30.38333, "lon": -86.43333 },
-  {"name": "Dover, NC (KNC)", "code": "USAdv", "lat": 35.21694, "lon": -77.43833 },
-  {"name": "Dixon, CA", "code": "USAdx", "lat": 38.37944, "lon": -121.76389 },
-  {"name": "Ellijay, GA (KJM)", "code": "USAej", "lat": 34.63556, "lon": -84.46222 },
-  {"name": "Fort Collins, CO", "code": "USAfa", "lat": 40.68194, "lon": -105.04194 },
-  {"name": "Fort Collins, CO", "code": "USAfb", "lat": 40.67833, "lon": -105.04028 },
-  {"name": "Fort Collins, CO", "code": "USAfc", "lat": 40.68000, "lon": -105.04028 },
-  {"name": "Fort Collins, CO", "code": "USAfd", "lat": 40.67917, "lon": -105.04028 },
-  {"name": "Fort Collins, CO", "code": "USAfe", "lat": 40.68139, "lon": -105.04139 },
-  {"name": "Fort Collins, CO", "code": "USAff", "lat": 40.67806, "lon": -105.04694 },
-  {"name": "Fort Collins, CO", "code": "USAfg", "lat": 40.68083, "lon": -105.04250 },
-  {"name": "Forest, VA", "code": "USAfv", "lat": 37.39500, "lon": -79.20972 },
-  {"name": "Greenville, NC", "code": "USAg", "lat": 35.46667, "lon": -77.20000 },
-  {"name": "KWHW Altus, OK", "code": "USAhw", "lat": 34.62639, "lon": -99.33611 },
-  {"name": "Jim Creek, WA", "code": "USAjc", "lat": 48.20000, "lon": -121.91667 },
-  {"name": "Key Saddlebunch, FL", "code": "USAk", "lat": 24.65000, "lon": -81.60000 },
-  {"name": "Lebanon, TN (WTWW)", "code": "USAL", "lat": 36.27639, "lon": -86.09944 },
-  {"name": "Lakeland, FL (WCY)", "code": "USALL", "lat": 27.98139, "lon": -82.05139 },
-  {"name": "Lamoure, ND", "code": "USAlm", "lat": 46.36667, "lon": -98.33333 },
-  {"name": "Miami / Hialeah Gardens, FL (WRMI)", "code": "USAm", "lat": 25.90000, "lon": -80.36361 },
-  {"name": "Milton, FL (WJHR)", "code": "USAmi", "lat": 30.65083, "lon": -87.09083 },
-  {"name": "Mobile, AL (WLO)", "code": "USAmo", "lat": 30.59500, "lon": -88.22139 },
-  {"name": "Nashville, TN (WWCR)", "code": "USAn", "lat": 36.20833, "lon": -86.89389 },
-  {"name": "NMG New Orleans, LA", "code": "USAnm", "lat": 29.88444, "lon": -89.94528 },
-  {"name": "New Orleans, LA (WRNO)", "code": "USAno", "lat": 29.83611, "lon": -90.11583 },
-  {"name": "Newport, NC (WTJC)", "code": "USAnp", "lat": 34.77806, "lon": -76.87694 },
-  {"name": "Okeechobee, FL (WYFR)", "code": "USAo", "lat": 27.45833, "lon": -80.93333 },
-  {"name": "San Luis Obispo, CA", "code": "USAob", "lat": 35.216667, "lon": -120.866667 },
-  {"name": "Ragged Point, San Luis Obispo, CA", "code": "USAob", "lat": 35.783333, "lon": -121.333333 },
-  {"name": "Vandenberg, San Luis Obispo, CA", "code": "USAob", "lat": 34.58333, "lon": -120.65000 },
-  {"name": "Offutt AFB, NE", "code": "USAof", "lat": 41.11361, "lon": -95.92833 },
-  {"name": "Monticello, ME (WBCQ)", "code": "USAq", "lat": 46.34167, "lon": -67.82778 },
-  {"name": "Punta Gorda, FL (KPK)", "code": "USApg", "lat": 26.89417, "lon": -82.05972 },
-  {"name": "Point Reyes, CA", "code": "USApr", "lat": 37.92556, "lon": -122.73111 },
-  {"name": "Riverhead, Long Island, NY ", "code": "USArh", "lat": 40.88333, "lon": -72.63333 },
-  {"name": "Red Lion (York), PA (WINB)", "code": "USArl", "lat": 39.90611, "lon": -76.58222 },
-  {"name": "Los Angeles / Rancho Simi, CA (KVOH)", "code": "USArs", "lat": 34.25639, "lon": -118.64139 },
-  {"name": "KEBR Sacramento, CA", "code": "USAsc", "lat": 38.46278, "lon": -121.13028 },
-  {"name": "Seattle, WA", "code": "USAse", "lat": 48.12556, "lon": -122.25056 },
-  {"name": "UC Davis, Bodega Bay", "code": "USAuc", "lat": 38.316667, "lon": -123.066667 },
-  {"name": "UC Davis, Jenner", "code": "USAuc", "lat": 38.566667, "lon": -123.333333 },
-  {"name": "UC Davis, Inverness", "code": "USAuc", "lat": 38.046944, "lon": -122.988889 },
-  {"name": "UC Davis, Muir Beach", "code": "USAuc", "lat": 37.866667, "lon": -122.600000 },
-  {"name": "UC Davis, Sausalito", "code": "USAuc", "lat": 37.816667, "lon": -122.533333 },
-  {"name": "UC Davis, Inverness", "code": "USAuc", "lat": 38.02806, "lon": -122.96111 },
-  {"name": "UC Davis, Bodega Bay", "code": "USAud", "lat": 38.316667, "lon": -123.066667 },
-  {"name": "UC Davis, Fort Bragg", "code": "USAud", "lat": 39.433333, "lon": -123.816667 },
-  {"name": "UC Davis, Point Arena", "code": "USAud", "lat": 39.933333, "lon": -123.733333 },
-  {"name": "UC Davis, Trinidad", "code": "USAud", "lat": 41.066667, "lon": -124.150000 },
-  {"name": "UC Davis, Samoa", "code": "USAud", "lat": 40.76667, "lon": -124.21667 },
-  {"name": "Vado, NM (KJES)", "code": "USAv", "lat": 32.13389, "lon": -106.59000 },
-  {"name": "Vashon Island, WA", "code": "USAvs", "lat": 47.37083, "lon": -122.48778 },
-  {"name": "Washington, DC", "code": "USAwa", "lat": 38.91667, "lon": -77.05000 },
-  {"name": "'West Coast' Beale AFB Marysville, CA", "code": "USAwc", "lat": 39.13333, "lon": -121.43333 },
-  {"name": "WGM Fort Lauderdale, FL", "code": "USAwg", "lat": 26.56667, "lon": -80.08333 },
-  {"name": "KOVR West Sacramento, CA", "code": "USAws", "lat": 38.58333, "lon": -121.55000 },
-  {"name": "WHX Hillsboro, WV", "code": "USAwx", "lat": 38.26861, "lon": -80.26861 },
-  {"name": "Tashkent", "code": "UZB", "lat": 41.21667, "lon": 69.15000 },
-  {"name": "Tashkent Airport", "code": "UZBa", "lat": 41.26667, "lon": 69.28333 },
-  {"name": "Nukus, Karakalpakstan", "code": "UZBnu", "lat": 42.48333, "lon": 59.61667 },
-  {"name": "Samarkand", "code": "UZBs", "lat": 39.70000, "lon": 66.98333 },
-  {"name": "Tashkent I/II", "code": "UZBta", "lat": 41.31667, "lon": 69.25000 },
-  {"name": "El Tigre", "code": "VENt", "lat": 8.88333, "lon": -64.26667 },
-  {"name": "YVTO Caracas", "code": "VENy", "lat": 10.50361, "lon": -66.92889 },
-  {"name": "Buon Me Thuot, Daclac", "code": "VTNb", "lat": 12.63333, "lon": 108.01667 },
-  {"name": "Ben Thuy", "code": "VTNbt", "lat": 18.81667, "lon": 105.71667 },
-  {"name": "Ca Mau", "code": "VTNcm", "lat": 9.18972, "lon": 105.13361 },
-  {"name": "Cua Ong", "code": "VTNco", "lat": 21.02611, "lon": 107.36694 },
-  {"name": "Cam Ranh", "code": "VTNcr", "lat": 12.07972, "lon": 109.18194 },
-  {"name": "Can Tho", "code": "VTNct", "lat": 10.07167, "lon": 105.75889 },
-  {"name": "Dien Bien", "code": "VTNdb", "lat": 21.36667, "lon": 103.00000 },
-  {"name": "Da Nang", "code": "VTNdn", "lat": 16.05472, "lon": 108.15778 },
-  {"name": "Ho Chi Minh City / Vung Tau", "code": "VTNhc", "lat": 10.39472, "lon": 107.14500 },
-  {"name": "Hon Gai (Ha Long)", "code": "VTNhg", "lat": 20.95000, "lon": 107.06667 },
-  {"name": "Hai Phong", "code": "VTNhp", "lat": 20.85028, "lon": 106.73361 },
-  {"name": "Hue", "code": "VTNhu", "lat": 16.55056, "lon": 107.64111 },
-  {"name": "Kien Giang", "code": "VTNkg", "lat": 9.99139, "lon": 105.10250 },
-  {"name": "Son La", "code": "VTNL", "lat": 21.33333, "lon": 103.91667 },
-  {"name": "Hanoi-Metri", "code": "VTNm", "lat": 21.00000, "lon": 105.78333 },
-  {"name": "Mong Cai", "code": "VTNmc", "lat": 21.52583, "lon": 107.96639 },
-  {"name": "My Hao", "code": "VTNmh", "lat": 20.91667, "lon": 106.08333 },
-  {"name": "Nha Trang", "code": "VTNnt", "lat": 12.22194, "lon": 109.18056 },
-  {"name": "Phan Rang", "code": "VTNpr", "lat": 11.56667, "lon": 109.01667 },
-  {"name": "Phan Tiet", "code": "VTNpt", "lat": 10.91778, "lon": 108.10611 },
-  {"name": "Phu Yen", "code": "VTNpy", "lat": 13.10611, "lon": 109.31139 },
-  {"name": "Quy Nhon", "code": "VTNqn", "lat": 13.77778, "lon": 109.23917 },
-  {"name": "Hanoi-Sontay", "code": "VTNs", "lat": 21.20000, "lon": 105.36667 },
-  {"name": "Thoi Long / Thoi Hung", "code": "VTNt", "lat": 10.11667, "lon": 105.56667 },
-  {"name": "Thanh Hoa", "code": "VTNth", "lat": 19.34944, "lon": 105.79333 },
-  {"name": "Vung Tau", "code": "VTNvt", "lat": 10.39472, "lon": 107.14500 },
-  {"name": "Xuan Mai", "code": "VTNx", "lat": 20.71667, "lon": 105.55000 },
-  {"name": "Empten Lagoon", "code": "VUT", "lat": -17.75000, "lon": 168.36667 },
-  {"name": "Al Hiswah/Aden", "code": "YEMa", "lat": 12.83333, "lon": 45.03333 },
-  {"name": "Sanaa", "code": "YEMs", "lat": 15.36667, "lon": 44.18333 },
-  {"name": "Lusaka", "code": "ZMBL", "lat": -15.50000, "lon": 28.25000 },
-  {"name": "Makeni Ranch", "code": "ZMBm", "lat": -15.53333, "lon": 28.00000 },
-  {"name": "Gweru/Guinea Fowl", "code": "ZWE", "lat": -19.43333, "lon": 29.85000 },
-]
+        return getattr(eibitables, name)
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
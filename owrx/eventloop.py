@@ -0,0 +1,406 @@
+from owrx.http import RequestHandler
+from owrx.controllers.websocket import WebSocketController
+from owrx.connection import HandshakeMessageHandler, PoisonPill
+from owrx.websocket import (
+    WebSocketConnection,
+    WebSocketMetrics,
+    WebSocketException,
+    PerMessageDeflate,
+    ProtocolError,
+    MessageTooBig,
+    Frame,
+    MAX_MESSAGE_SIZE,
+    OPCODE_TEXT_MESSAGE,
+    OPCODE_BINARY_MESSAGE,
+    OPCODE_CLOSE,
+    OPCODE_PING,
+    OPCODE_PONG,
+)
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import asyncio
+import threading
+import io
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def unmask(data: bytes, key: bytes) -> bytes:
+    length = len(data)
+    mask = (key * (length // 4 + 1))[:length]
+    return (int.from_bytes(data, "big") ^ int.from_bytes(mask, "big")).to_bytes(length, "big")
+
+
+class AsyncRequestHandler(RequestHandler):
+    """
+    Request handler for requests that have been read by the event loop.
+
+    Controllers are still written against the BaseHTTPRequestHandler interface, so this handler provides it on top of
+    in-memory buffers. Responses are collected in wfile and written back by the event loop.
+    """
+
+    # maximum request body size accepted by the event loop (image uploads are the biggest thing we expect)
+    maxBodySize = 16 * 1024 * 1024
+
+    def __init__(self, head: bytes, client_address):
+        # deliberately not calling super().__init__(), since that would start reading from a socket
+        self.client_address = client_address
+        self.rfile = io.BytesIO(head)
+        self.wfile = io.BytesIO()
+        self.close_connection = True
+        self.raw_requestline = self.rfile.readline(65537)
+
+    def getOutput(self) -> bytes:
+        output = self.wfile.getvalue()
+        self.wfile = io.BytesIO()
+        return output
+
+    def dispatch(self):
+        method = getattr(self, "do_" + self.command, None)
+        if method is None:
+            self.send_error(501, "Unsupported method ({0})".format(self.command))
+            return
+        method()
+
+
+class AsyncWebSocketConnection(object):
+    """
+    Websocket connection running on the event loop of the AsyncHttpServer.
+
+    Offers the same interface as WebSocketConnection to the handlers. send() and close() may be called from any
+    thread, everything else runs on the event loop. Message handlers are run on the executor, one message at a time.
+    """
+
+    # the transport stops taking messages from the send queue above this
+    writeBufferHigh = 64 * 1024
+    # clients that have more than this waiting in the transport are considered lost
+    writeBufferLimit = 4 * 1024 * 1024
+
+    def __init__(self, loop, executor, reader, writer, messageHandler, deflate: PerMessageDeflate = None):
+        self.loop = loop
+        self.executor = executor
+        self.reader = reader
+        self.writer = writer
+        self.writer.transport.set_write_buffer_limits(high=AsyncWebSocketConnection.writeBufferHigh)
+        self.messageHandler = None
+        self.setMessageHandler(messageHandler)
+        self.deflate = deflate
+        self.metrics = WebSocketMetrics.getSharedInstance()
+        self.open = True
+        self.socketError = False
+        # status code for the close frame, if the connection is closed because of the client
+        self.closeCode = None
+        self.readTask = None
+        self.pingHandle = None
+
+        # frames sent from other threads are collected here and written in one go on the loop
+        self.outbox = deque()
+        self.outboxLock = threading.Lock()
+        self.flushScheduled = False
+
+        self.sendQueue = None
+        self.drainScheduled = False
+        self.waitingForDrain = False
+
+    def setMessageHandler(self, messageHandler):
+        self.messageHandler = messageHandler
+
+    def _callSoon(self, callback):
+        try:
+            self.loop.call_soon_threadsafe(callback)
+        except RuntimeError:
+            # loop has been closed, nothing left to do
+            pass
+
+    def send(self, data):
+        if not isinstance(data, Frame):
+            data = Frame(data)
+        if self.deflate is not None:
+            data = self.deflate.compress(data)
+        self._sendBytes(data.header, data.payload)
+
+    def _sendBytes(self, *buffers):
+        if self.socketError:
+            logger.warning("_sendBytes() after socket error, ignoring")
+            return
+        with self.outboxLock:
+            self.outbox.append(buffers)
+            if self.flushScheduled:
+                return
+            self.flushScheduled = True
+        self._callSoon(self._flush)
+
+    def _write(self, *buffers):
+        self.writer.writelines(buffers)
+        self.metrics.framesCounter.inc()
+        self.metrics.bytesCounter.inc(sum(memoryview(b).nbytes for b in buffers))
+
+    def _flush(self):
+        with self.outboxLock:
+            items = list(self.outbox)
+            self.outbox.clear()
+            self.flushScheduled = False
+        if self.writer.is_closing():
+            return
+        for buffers in items:
+            self._write(*buffers)
+        self._checkBuffer()
+
+    def _checkBuffer(self):
+        if self.writer.transport.get_write_buffer_size() > AsyncWebSocketConnection.writeBufferLimit:
+            logger.debug("write buffer limit exceeded; closing")
+            self.close(socketError=True)
+
+    def attachSendQueue(self, queue):
+        self.sendQueue = queue
+        queue.setListener(self._scheduleDrain)
+        self._scheduleDrain()
+
+    def _scheduleDrain(self):
+        with self.outboxLock:
+            if self.drainScheduled:
+                return
+            self.drainScheduled = True
+        self._callSoon(self._drainQueue)
+
+    def _drainQueue(self):
+        with self.outboxLock:
+            self.drainScheduled = False
+        if self.sendQueue is None or self.waitingForDrain:
+            return
+        # only take as much from the queue as the socket can take, so that the queue can apply its dropping policy
+        while self.writer.transport.get_write_buffer_size() < AsyncWebSocketConnection.writeBufferHigh:
+            data = self.sendQueue.get(block=False)
+            if data is None:
+                return
+            if data is PoisonPill:
+                self.sendQueue = None
+                return
+            if self.writer.is_closing():
+                continue
+            try:
+                frame = data if isinstance(data, Frame) else Frame(data)
+            except ValueError:
+                logger.exception("unable to encode queued message")
+                continue
+            if self.deflate is not None:
+                frame = self.deflate.compress(frame)
+            self._write(frame.header, frame.payload)
+        self.waitingForDrain = True
+        self.loop.create_task(self._waitForDrain())
+
+    async def _waitForDrain(self):
+        try:
+            await self.writer.drain()
+        except ConnectionError:
+            self.close(socketError=True)
+            return
+        finally:
+            self.waitingForDrain = False
+        self._drainQueue()
+
+    def close(self, socketError: bool = False):
+        # only set flag if it is True
+        if socketError:
+            self.socketError = True
+        if not self.open:
+            return
+        self.open = False
+        self._callSoon(self._interrupt)
+
+    def _interrupt(self):
+        if self.readTask is not None:
+            self.readTask.cancel()
+
+    def cancelPing(self):
+        if self.pingHandle is not None:
+            self.pingHandle.cancel()
+            self.pingHandle = None
+
+    def resetPing(self):
+        self.cancelPing()
+        if not self.open:
+            return
+        self.pingHandle = self.loop.call_later(30, self.sendPing)
+
+    def sendPing(self):
+        self._sendBytes(Frame.get_header(0, OPCODE_PING))
+        self.resetPing()
+
+    def sendPong(self):
+        self._sendBytes(Frame.get_header(0, OPCODE_PONG))
+
+    async def _runHandler(self, method, *args):
+        try:
+            await self.loop.run_in_executor(self.executor, method, *args)
+        except Exception:
+            logger.exception("Exception in websocket handler %s()", method.__name__)
+
+    async def handle(self):
+        WebSocketConnection.connections.append(self)
+        self.readTask = asyncio.current_task()
+        self.resetPing()
+        try:
+            await self.read_loop()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            logger.debug("websocket loop ended; shutting down")
+            self.readTask = None
+            self.open = False
+            self.cancelPing()
+
+            await self._runHandler(self.messageHandler.handleClose)
+
+            if self.socketError:
+                logger.debug("websocket closed in error, skipping close frame")
+            else:
+                logger.debug("websocket loop ended; sending close frame")
+                self._flush()
+                if self.closeCode is None:
+                    self._write(Frame.get_header(0, OPCODE_CLOSE))
+                else:
+                    self._write(Frame.get_header(2, OPCODE_CLOSE), self.closeCode.to_bytes(2, "big"))
+
+            try:
+                WebSocketConnection.connections.remove(self)
+            except ValueError:
+                pass
+
+    async def read_loop(self):
+        while self.open:
+            try:
+                header = await self.reader.readexactly(2)
+                opcode = header[0] & 0x0F
+                compressed = header[0] & 0x40
+                length = header[1] & 0x7F
+                mask = (header[1] & 0x80) >> 7
+                if length == 126:
+                    length = int.from_bytes(await self.reader.readexactly(2), "big")
+                elif length == 127:
+                    length = int.from_bytes(await self.reader.readexactly(8), "big")
+                if length > MAX_MESSAGE_SIZE:
+                    raise MessageTooBig("message exceeds {0} bytes".format(MAX_MESSAGE_SIZE))
+                if mask:
+                    masking_key = await self.reader.readexactly(4)
+                    data = unmask(await self.reader.readexactly(length), masking_key)
+                else:
+                    data = await self.reader.readexactly(length)
+            except ProtocolError as e:
+                logger.warning("%s; closing connection", e)
+                self.closeCode = e.code
+                return
+            except asyncio.IncompleteReadError:
+                logger.warning("incomplete read on websocket; closing connection")
+                self.socketError = True
+                return
+            except OSError:
+                logger.exception("OSError while reading data; closing connection")
+                self.socketError = True
+                return
+
+            self.resetPing()
+            if compressed:
+                try:
+                    data = PerMessageDeflate.inflate(self.deflate, data)
+                except ProtocolError as e:
+                    logger.warning("%s; closing connection", e)
+                    self.closeCode = e.code
+                    return
+            if opcode == OPCODE_TEXT_MESSAGE:
+                await self._runHandler(self.messageHandler.handleTextMessage, self, data.decode("utf-8"))
+            elif opcode == OPCODE_BINARY_MESSAGE:
+                await self._runHandler(self.messageHandler.handleBinaryMessage, self, data)
+            elif opcode == OPCODE_PING:
+                self.sendPong()
+            elif opcode == OPCODE_PONG:
+                # since every read resets the ping timer, there's nothing to do here.
+                pass
+            elif opcode == OPCODE_CLOSE:
+                logger.debug("websocket close frame received; closing connection")
+                return
+            else:
+                logger.warning("unsupported opcode: {0}".format(opcode))
+
+
+class AsyncHttpServer(object):
+    """
+    HTTP and websocket server running all connections on a single asyncio event loop.
+
+    Plain HTTP requests are read by the loop and then routed to the controllers on a thread pool, so the number of
+    threads does not grow with the number of connections.
+    """
+
+    def __init__(self, address, sslContext=None, workers: int = 32):
+        self.address = address
+        self.sslContext = sslContext
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="http_worker")
+        self.loop = None
+
+    def serve_forever(self):
+        try:
+            asyncio.run(self._serve())
+        finally:
+            self.executor.shutdown(wait=False)
+
+    async def _serve(self):
+        self.loop = asyncio.get_running_loop()
+        (host, port) = self.address
+        server = await asyncio.start_server(self.handleConnection, host, port, ssl=self.sslContext, backlog=1024)
+        async with server:
+            await server.serve_forever()
+
+    async def handleConnection(self, reader, writer):
+        try:
+            await self._handleRequest(reader, writer)
+        except (ConnectionError, asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        except Exception:
+            logger.exception("Exception while handling request")
+        finally:
+            writer.close()
+
+    async def _handleRequest(self, reader, writer):
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), RequestHandler.timeout)
+        handler = AsyncRequestHandler(head, writer.get_extra_info("peername"))
+        if not handler.parse_request():
+            writer.write(handler.getOutput())
+            await writer.drain()
+            return
+        # parse_request() may already have produced some output, i.e. "100 Continue"
+        writer.write(handler.getOutput())
+
+        length = int(handler.headers.get("Content-Length", 0))
+        if length > AsyncRequestHandler.maxBodySize:
+            handler.send_error(413, "Request body too large")
+            writer.write(handler.getOutput())
+            await writer.drain()
+            return
+        body = await asyncio.wait_for(reader.readexactly(length), RequestHandler.timeout) if length > 0 else b""
+        handler.rfile = io.BytesIO(body)
+
+        route = handler.router.find_route(handler._build_request(handler.command))
+        if route is not None and issubclass(route.getController(), WebSocketController):
+            await self._handleWebSocket(handler, reader, writer)
+        else:
+            await self.loop.run_in_executor(self.executor, handler.dispatch)
+            writer.write(handler.getOutput())
+            await writer.drain()
+
+    async def _handleWebSocket(self, handler, reader, writer):
+        deflate = PerMessageDeflate.negotiate(handler.headers)
+        try:
+            writer.write(WebSocketConnection.getHandshakeResponse(handler.headers, deflate))
+        except WebSocketException as e:
+            handler.send_error(400, str(e))
+            writer.write(handler.getOutput())
+            await writer.drain()
+            return
+        conn = AsyncWebSocketConnection(self.loop, self.executor, reader, writer, HandshakeMessageHandler(), deflate)
+        await conn.handle()
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
@@ -1,10 +1,10 @@
 from owrx.storage import Storage
 from csdr.module import ThreadModule
+from owrx.message import Message
+from owrx.framer import Framer
 from pycsdr.types import Format
 from datetime import datetime
 import base64
-import pickle
-import os
 
 import logging
 
@@ -15,7 +15,7 @@ class FaxParser(ThreadModule):
         self.service   = service
         self.frequency = 0
         self.file      = None
-        self.data      = bytearray(b'')
+        self.data      = Framer()
         self.width     = 0
         self.height    = 0
         self.depth     = 0
@@ -37,7 +37,7 @@ class FaxParser(ThreadModule):
                 self.file = None
                 if self.height==0 or self.line<self.height:
                     logger.debug("Deleting short bitmap file '%s'." % self.fileName)
-                    os.unlink(self.fileName)
+                    Storage().deleteFile(self.fileName)
                 else:
                     # Convert file from BMP to PNG
                     logger.debug("Converting '%s' to PNG..." % self.fileName)
@@ -56,6 +56,7 @@ class FaxParser(ThreadModule):
             self.fileName = Storage().getFilePath(fileName + ".bmp")
             logger.debug("Opening bitmap file '%s'..." % self.fileName)
             self.file = open(self.fileName, "wb")
+            Storage().storeFile(self.fileName, True)
 
         except Exception as e:
             logger.debug("Exception opening file: %s" % str(e))
@@ -128,13 +129,13 @@ class FaxParser(ThreadModule):
                 self.doRun = False
                 break
             # Add read data to the buffer
-            self.data = self.data + inp.tobytes()
+            self.data.append(inp)
             # Process buffer contents
             out = self.process()
             # Keep processing while there is input to parse
             while out is not None:
                 if len(out)>0:
-                    self.writer.write(pickle.dumps(out))
+                    self.writer.write(Message.encode(out))
                 out = self.process()
 
     def process(self):
@@ -150,22 +151,20 @@ class FaxParser(ThreadModule):
             # Search for BMP header and comments first, in case
             # previous bitmap terminates early
             ll = min(l, len(self.data)) if l>0 else len(self.data)
-            ph = self.data[0:ll].find(b'BM')
-            pc = self.data[0:ll].find(b' [')
+            ph = self.data.find(b'BM', 0, ll)
+            pc = self.data.find(b' [', 0, ll)
 
             #
             # If comment found, and we are not receiving an image...
             #
             if pc>=0 and (ph<0 or pc<ph) and l==0:
                 # Skip everything until ' ['
-                del self.data[0:pc]
+                self.data.skip(pc)
                 # Look for the closing bracket
-                pc = self.data[0:ll].find(b']')
+                pc = self.data.find(b']', 0, ll)
                 if pc>=0:
-                    # Extract message contents
-                    msg = self.data[2:pc].decode()
-                    # Remove parsed data
-                    del self.data[0:pc+1]
+                    # Remove parsed data, extract message contents
+                    msg = self.data.take(pc+1)[2:pc].decode()
                     # Log message
                     logger.debug("%s says [%s]" % (self.myName(), msg))
                     # If running as a service...
@@ -185,7 +184,7 @@ class FaxParser(ThreadModule):
             #
             elif ph>=0 and ph+14<ll and self.data[ph+14]==40:
                 # Skip everything until 'BM'
-                del self.data[0:ph]
+                self.data.skip(ph)
                 # If got the entire header...
                 if len(self.data)>=54+4*256:
                     self.width  = self.data[18] + (self.data[19]<<8) + (self.data[20]<<16) + (self.data[21]<<24)
@@ -199,9 +198,11 @@ class FaxParser(ThreadModule):
                     self.line   = 0
                     # Find total header size
                     headerSize = 54 + (4*256 if self.depth==8 else 0)
+                    # Remove parsed data
+                    header = self.data.take(headerSize)
                     # 256x4 palette follows the header
                     if headerSize>54:
-                        self.colors = self.data[54:headerSize]
+                        self.colors = header[54:headerSize]
                     else:
                         self.colors = None
                     # Find mode name and time
@@ -216,7 +217,7 @@ class FaxParser(ThreadModule):
                     if self.service:
                         # Create a new image file and write BMP header
                         self.newFile(fileName)
-                        self.writeFile(self.data[0:headerSize])
+                        self.writeFile(header)
                         # Empty result
                         out = {}
                     else:
@@ -231,8 +232,6 @@ class FaxParser(ThreadModule):
                             "filename":  fileName,
                             "frequency": self.frequency
                         }
-                    # Remove parsed data
-                    del self.data[0:headerSize]
 
             #
             # If currently receiving image...
@@ -242,12 +241,14 @@ class FaxParser(ThreadModule):
                     #logger.debug("%s got line %d of %d/%d pixels" % (
                     #    self.myName(), self.line, w, len(self.data)/b
                     #))
+                    # Remove scanline from input
+                    pixels = self.data.take(l)
                     # Advance scanline
                     self.line = self.line + 1
                     # If running as a service...
                     if self.service:
                         # Write a scanline into open image file
-                        self.writeFile(self.data[0:l])
+                        self.writeFile(pixels)
                         # Close once the last scanline reached
                         if self.line>=self.height:
                             self.closeFile()
@@ -255,7 +256,7 @@ class FaxParser(ThreadModule):
                         out = {}
                     else:
                         # Compose result
-                        #rle = self.applyRLE(self.data[0:l])
+                        #rle = self.applyRLE(pixels)
                         out = {
                             "mode":   "Fax",
                             "line":   self.line-1,
@@ -263,7 +264,7 @@ class FaxParser(ThreadModule):
                             "height": self.height,
                             "depth":  self.depth,
                             "rle":    False,
-                            "pixels": base64.b64encode(self.data[0:l]).decode(),
+                            "pixels": base64.b64encode(pixels).decode(),
                         }
                     # If we reached the end of frame, finish scan
                     if self.line>=self.height:
@@ -274,8 +275,6 @@ class FaxParser(ThreadModule):
                         self.ioc    = 0
                         self.lpm    = 0
                         self.colors = None
-                    # Remove parsed data
-                    del self.data[0:l]
 
             #
             # If not receiving anything...
@@ -283,7 +282,7 @@ class FaxParser(ThreadModule):
             else:
                 # Skip all data, but leave some since we may have 'BM ...'
                 l = ph if ph>=0 and ph+14>=len(self.data) else len(self.data)-1
-                del self.data[0:l]
+                self.data.skip(l)
 
         except Exception as e:
             logger.debug("%s: Exception parsing: %s" % (self.myName(), str(e)))
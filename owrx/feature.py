@@ -2,13 +2,16 @@ import subprocess
 from functools import reduce
 from operator import and_
 import re
-from distutils.version import LooseVersion, StrictVersion
 import inspect
 from owrx.config.core import CoreConfig
 from owrx.config import Config
 import shlex
 import os
-from datetime import datetime, timedelta
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import shutil
+import json
 
 import logging
 
@@ -16,37 +19,117 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
+def _looseVersion(version):
+    # distutils is slow to import, so it is only imported once the checks are running
+    from distutils.version import LooseVersion
+
+    return LooseVersion(version)
+
+
+def _strictVersion(version):
+    from distutils.version import StrictVersion
+
+    return StrictVersion(version)
+
+
 class UnknownFeatureException(Exception):
     pass
 
 
 class FeatureCache(object):
+    """
+    Keeps the results of the requirement checks.
+
+    Along with every result, the fingerprints (path and modification time) of the binaries a check has run are stored.
+    Those results are persisted in the data directory and remain valid across restarts until one of the fingerprints
+    changes. Checks that do not run any binaries are not persisted.
+    """
+
     sharedInstance = None
+    creationLock = threading.Lock()
 
     @staticmethod
     def getSharedInstance():
-        if FeatureCache.sharedInstance is None:
-            FeatureCache.sharedInstance = FeatureCache()
+        with FeatureCache.creationLock:
+            if FeatureCache.sharedInstance is None:
+                FeatureCache.sharedInstance = FeatureCache()
         return FeatureCache.sharedInstance
 
+    @staticmethod
+    def fingerprint(dependency):
+        """
+        Dependencies are either "binary:<command>", which is looked up on the $PATH, or "path:<absolute path>".
+        """
+        kind, name = dependency.split(":", 1)
+        path = shutil.which(name) if kind == "binary" else name
+        if path is None:
+            return None
+        try:
+            return [path, os.stat(path).st_mtime]
+        except OSError:
+            return None
+
     def __init__(self):
         self.cache = {}
+        self.lock = threading.Lock()
+        # all checks are validated in the background after this time
         self.cachetime = timedelta(hours=2)
+        self._load()
 
-    def has(self, feature):
-        if feature not in self.cache:
-            return False
-        now = datetime.now()
-        if self.cache[feature]["valid_to"] < now:
+    def _getCacheFile(self):
+        return "{data_directory}/features.json".format(data_directory=CoreConfig().get_data_directory())
+
+    def _load(self):
+        try:
+            with open(self._getCacheFile(), "r") as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            logger.warning("could not read persisted feature checks, starting from scratch")
+            return
+        if not isinstance(stored, dict) or stored.get("version") != 1:
+            return
+        for feature, entry in stored["requirements"].items():
+            if FeatureCache._isCurrent(entry["dependencies"]):
+                self.cache[feature] = entry
+        logger.debug("loaded %i persisted feature checks", len(self.cache))
+
+    def store(self):
+        with self.lock:
+            requirements = {k: v for k, v in self.cache.items() if v["dependencies"] is not None}
+        file = self._getCacheFile()
+        try:
+            # write to a temporary file first so that readers never see a partial file
+            with open(file + ".tmp", "w") as f:
+                json.dump({"version": 1, "requirements": requirements}, f)
+            os.replace(file + ".tmp", file)
+        except OSError:
+            logger.warning("could not persist feature checks to %s", file)
+
+    @staticmethod
+    def _isCurrent(dependencies):
+        if dependencies is None:
             return False
-        return True
+        return all(FeatureCache.fingerprint(d) == fp for d, fp in dependencies.items())
+
+    def has(self, feature):
+        return feature in self.cache
+
+    def isValid(self, feature):
+        """
+        Returns True if the feature has been checked, and none of the binaries it depends on have changed since.
+        """
+        with self.lock:
+            entry = self.cache.get(feature)
+        return entry is not None and FeatureCache._isCurrent(entry["dependencies"])
 
     def get(self, feature):
         return self.cache[feature]["value"]
 
-    def set(self, feature, value):
-        valid_to = datetime.now() + self.cachetime
-        self.cache[feature] = {"value": value, "valid_to": valid_to}
+    def set(self, feature, value, dependencies=None):
+        with self.lock:
+            self.cache[feature] = {"value": value, "dependencies": dependencies}
 
 
 class FeatureDetector(object):
@@ -92,6 +175,63 @@ class FeatureDetector(object):
         "png": ["imagemagick"],
     }
 
+    # number of checks run concurrently by detectAll()
+    detectionWorkers = 8
+    # dependencies recorded by the check running on the current thread
+    local = threading.local()
+    # output of "SoapySDRUtil --info", shared by all soapy driver checks of a detection run
+    soapyInfo = None
+    soapyLock = threading.Lock()
+    refreshTimer = None
+    refreshLock = threading.Lock()
+
+    @staticmethod
+    def startRefresh():
+        """
+        Validates all requirement checks in the background periodically, so that requests never wait for checks.
+        """
+        with FeatureDetector.refreshLock:
+            if FeatureDetector.refreshTimer is not None:
+                FeatureDetector.refreshTimer.cancel()
+            delay = FeatureCache.getSharedInstance().cachetime.total_seconds()
+            FeatureDetector.refreshTimer = threading.Timer(delay, FeatureDetector._refresh)
+            FeatureDetector.refreshTimer.daemon = True
+            FeatureDetector.refreshTimer.start()
+
+    @staticmethod
+    def stopRefresh():
+        with FeatureDetector.refreshLock:
+            if FeatureDetector.refreshTimer is not None:
+                FeatureDetector.refreshTimer.cancel()
+                FeatureDetector.refreshTimer = None
+
+    @staticmethod
+    def _refresh():
+        try:
+            FeatureDetector().detectAll()
+        except Exception:
+            logger.exception("error while refreshing feature checks")
+        FeatureDetector.startRefresh()
+
+    def detectAll(self):
+        """
+        Checks all requirements concurrently, skipping those with valid results, and persists the results.
+        """
+        cache = FeatureCache.getSharedInstance()
+        requirements = {r for requirements in FeatureDetector.features.values() for r in requirements}
+        pending = [r for r in requirements if not cache.isValid(r)]
+        if not pending:
+            return
+        logger.debug("checking %i requirements", len(pending))
+        with FeatureDetector.soapyLock:
+            FeatureDetector.soapyInfo = None
+        with ThreadPoolExecutor(max_workers=FeatureDetector.detectionWorkers) as executor:
+            futures = {r: executor.submit(self._detect, r) for r in pending}
+        for requirement, future in futures.items():
+            if future.exception() is not None:
+                logger.error("feature check for %s failed", requirement, exc_info=future.exception())
+        cache.store()
+
     def feature_availability(self):
         return {name: self.is_available(name) for name in FeatureDetector.features}
 
@@ -141,25 +281,39 @@ class FeatureDetector(object):
         cache = FeatureCache.getSharedInstance()
         if cache.has(requirement):
             return cache.get(requirement)
+        return self._detect(requirement)
 
+    def _detect(self, requirement):
         logger.debug("performing feature check for %s", requirement)
         method = self._get_requirement_method(requirement)
         result = False
-        if method is not None:
-            result = method()
-        else:
-            logger.error("detection of requirement {0} not implement. please fix in code!".format(requirement))
+        dependencies = {}
+        previous = getattr(FeatureDetector.local, "dependencies", None)
+        FeatureDetector.local.dependencies = dependencies
+        try:
+            if method is not None:
+                result = method()
+            else:
+                logger.error("detection of requirement {0} not implement. please fix in code!".format(requirement))
+        finally:
+            FeatureDetector.local.dependencies = previous
         logger.debug("feature check for %s complete. result: %s", requirement, result)
 
-        cache.set(requirement, result)
+        FeatureCache.getSharedInstance().set(requirement, result, dependencies if dependencies else None)
         return result
 
+    def _addDependency(self, dependency):
+        dependencies = getattr(FeatureDetector.local, "dependencies", None)
+        if dependencies is not None:
+            dependencies[dependency] = FeatureCache.fingerprint(dependency)
+
     def get_requirement_description(self, requirement):
         return inspect.getdoc(self._get_requirement_method(requirement))
 
     def command_is_runnable(self, command, expected_result=None):
         tmp_dir = CoreConfig().get_temporary_directory()
         cmd = shlex.split(command)
+        self._addDependency("binary:" + cmd[0])
         env = os.environ.copy()
         # prevent X11 programs from opening windows if called from a GUI shell
         env.pop("DISPLAY", None)
@@ -188,15 +342,15 @@ class FeatureDetector(object):
         In addition, the [pycsdr](https://github.com/jketterl/pycsdr) package must be installed to provide
         python bindings for the csdr library.
         """
-        required_version = LooseVersion("0.18.0")
+        required_version = _looseVersion("0.18.0")
 
         try:
             from pycsdr.modules import csdr_version
             from pycsdr.modules import version as pycsdr_version
 
             return (
-                LooseVersion(csdr_version) >= required_version and
-                LooseVersion(pycsdr_version) >= required_version
+                _looseVersion(csdr_version) >= required_version and
+                _looseVersion(pycsdr_version) >= required_version
             )
         except ImportError:
             return False
@@ -239,35 +393,36 @@ class FeatureDetector(object):
         If you have an older verison of digiham installed, please update it along with openwebrx.
         As of now, we require version 0.6 of digiham.
         """
-        required_version = LooseVersion("0.6")
+        required_version = _looseVersion("0.6")
 
         try:
             from digiham.modules import digiham_version as digiham_version
             from digiham.modules import version as pydigiham_version
 
             return (
-                LooseVersion(digiham_version) >= required_version
-                and LooseVersion(pydigiham_version) >= required_version
+                _looseVersion(digiham_version) >= required_version
+                and _looseVersion(pydigiham_version) >= required_version
             )
         except ImportError:
             return False
 
     def _check_connector(self, command, required_version):
         owrx_connector_version_regex = re.compile("^{} version (.*)$".format(re.escape(command)))
+        self._addDependency("binary:" + command)
 
         try:
             process = subprocess.Popen([command, "--version"], stdout=subprocess.PIPE)
             matches = owrx_connector_version_regex.match(process.stdout.readline().decode())
             if matches is None:
                 return False
-            version = LooseVersion(matches.group(1))
+            version = _looseVersion(matches.group(1))
             process.wait(1)
             return version >= required_version
         except FileNotFoundError:
             return False
 
     def _check_owrx_connector(self, command):
-        return self._check_connector(command, LooseVersion("0.5"))
+        return self._check_connector(command, _looseVersion("0.5"))
 
     def has_rtl_connector(self):
         """
@@ -296,20 +451,40 @@ class FeatureDetector(object):
         """
         return self._check_owrx_connector("soapy_connector")
 
-    def _has_soapy_driver(self, driver):
+    def _get_soapy_info(self):
+        with FeatureDetector.soapyLock:
+            if FeatureDetector.soapyInfo is None:
+                FeatureDetector.soapyInfo = self._run_soapy_info()
+            return FeatureDetector.soapyInfo
+
+    def _run_soapy_info(self):
+        drivers = []
+        # module directories and files, so that installing or updating a driver is noticed
+        paths = []
         try:
             process = subprocess.Popen(["SoapySDRUtil", "--info"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
             factory_regex = re.compile("^Available factories\\.\\.\\. ?(.*)$")
+            path_regex = re.compile("^(Search path|Module found): +(\\S+)")
 
-            drivers = []
             for line in process.stdout:
-                matches = factory_regex.match(line.decode())
+                line = line.decode()
+                matches = factory_regex.match(line)
                 if matches:
                     drivers = [s.strip() for s in matches.group(1).split(", ")]
-
-            return driver in drivers
+                matches = path_regex.match(line)
+                if matches:
+                    paths.append(matches.group(2))
+            process.wait()
         except FileNotFoundError:
-            return False
+            pass
+        return drivers, paths
+
+    def _has_soapy_driver(self, driver):
+        self._addDependency("binary:SoapySDRUtil")
+        drivers, paths = self._get_soapy_info()
+        for path in paths:
+            self._addDependency("path:" + path)
+        return driver in drivers
 
     def has_soapy_rtl_sdr(self):
         """
@@ -441,13 +616,14 @@ class FeatureDetector(object):
 
     def _has_wsjtx_version(self, required_version):
         wsjt_version_regex = re.compile("^WSJT-X (.*)$")
+        self._addDependency("binary:wsjtx_app_version")
 
         try:
             process = subprocess.Popen(["wsjtx_app_version", "--version"], stdout=subprocess.PIPE)
             matches = wsjt_version_regex.match(process.stdout.readline().decode())
             if matches is None:
                 return False
-            version = LooseVersion(matches.group(1))
+            version = _looseVersion(matches.group(1))
             process.wait(1)
             return version >= required_version
         except FileNotFoundError:
@@ -457,13 +633,13 @@ class FeatureDetector(object):
         """
         Newer digital modes (e.g. FST4, FST4) require WSJT-X in at least version 2.3.
         """
-        return self.has_wsjtx() and self._has_wsjtx_version(LooseVersion("2.3"))
+        return self.has_wsjtx() and self._has_wsjtx_version(_looseVersion("2.3"))
 
     def has_wsjtx_2_4(self):
         """
         WSJT-X version 2.4 introduced the Q65 mode.
         """
-        return self.has_wsjtx() and self._has_wsjtx_version(LooseVersion("2.4"))
+        return self.has_wsjtx() and self._has_wsjtx_version(_looseVersion("2.4"))
 
     def has_msk144decoder(self):
         """
@@ -487,7 +663,7 @@ class FeatureDetector(object):
         The js8py library is used to decode binary JS8 messages into readable text. More information is available on
         [its github page](https://github.com/jketterl/js8py).
         """
-        required_version = StrictVersion("0.1")
+        required_version = _strictVersion("0.1")
         try:
             from js8py.version import strictversion
 
@@ -537,7 +713,7 @@ class FeatureDetector(object):
 
         You can find more information [here](https://github.com/jketterl/sddc_connector).
         """
-        return self._check_connector("sddc_connector", LooseVersion("0.1"))
+        return self._check_connector("sddc_connector", _looseVersion("0.1"))
 
     def has_hpsdr_connector(self):
         """
@@ -552,7 +728,7 @@ class FeatureDetector(object):
 
         You can find more information [here](https://github.com/jketterl/runds_connector).
         """
-        return self._check_connector("runds_connector", LooseVersion("0.2"))
+        return self._check_connector("runds_connector", _looseVersion("0.2"))
 
     def has_codecserver_ambe(self):
         """
@@ -0,0 +1,59 @@
+class Framer(object):
+    """
+    Splits decoder output into lines or records as it arrives. Data is appended to the end and taken from the front,
+    but taken data stays in the buffer until it outweighs the rest, so the buffer is only compacted now and then
+    instead of being copied on every read or every record.
+
+    Offsets given to and returned by the methods are relative to the first byte that has not been taken yet.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        # start of the data that has not been taken yet
+        self.start = 0
+        # everything before this has been searched for line ends already
+        self.scanned = 0
+
+    def __len__(self):
+        return len(self.buffer) - self.start
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < len(self):
+            raise IndexError("framer index out of range")
+        return self.buffer[self.start + index]
+
+    def append(self, data) -> None:
+        if self.start and self.start * 2 >= len(self.buffer):
+            del self.buffer[: self.start]
+            self.scanned = max(self.scanned - self.start, 0)
+            self.start = 0
+        self.buffer += data
+
+    def lines(self) -> list:
+        """
+        Takes all complete lines in one pass, without their line ends.
+        """
+        end = self.buffer.rfind(b"\n", max(self.start, self.scanned))
+        self.scanned = len(self.buffer)
+        if end < 0:
+            return []
+        with memoryview(self.buffer) as view:
+            lines = view[self.start : end].tobytes().split(b"\n")
+        self.start = end + 1
+        return lines
+
+    def find(self, sub: bytes, start: int = 0, end: int = None) -> int:
+        end = len(self.buffer) if end is None else self.start + max(end, 0)
+        pos = self.buffer.find(sub, self.start + max(start, 0), end)
+        return pos - self.start if pos >= 0 else -1
+
+    def take(self, length: int) -> bytearray:
+        """
+        Takes the next length bytes, or less if there are not as many.
+        """
+        start = self.start
+        self.start = min(start + max(length, 0), len(self.buffer))
+        return self.buffer[start : self.start]
+
+    def skip(self, length: int) -> None:
+        self.start = min(self.start + max(length, 0), len(self.buffer))
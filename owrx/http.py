@@ -1,31 +1,13 @@
 from owrx.controllers.status import StatusController
 from owrx.controllers.template import IndexController, MapController, PolicyController
-from owrx.controllers.feature import FeatureController
 from owrx.controllers.file import FilesController, FileController
 from owrx.controllers.assets import OwrxAssetsController, AprsSymbolsController, CompiledAssetsController
 from owrx.controllers.websocket import WebSocketController
-from owrx.controllers.api import ApiController
-from owrx.controllers.metrics import MetricsController
-from owrx.controllers.settings import SettingsController
-from owrx.controllers.settings.general import GeneralSettingsController
-from owrx.controllers.settings.sdr import (
-    SdrDeviceListController,
-    SdrDeviceController,
-    SdrProfileController,
-    NewSdrDeviceController,
-    NewProfileController,
-)
-from owrx.controllers.settings.reporting import ReportingController
-from owrx.controllers.settings.backgrounddecoding import BackgroundDecodingController
-from owrx.controllers.settings.decoding import DecodingSettingsController
-from owrx.controllers.settings.bookmarks import BookmarksController
-from owrx.controllers.session import SessionController
-from owrx.controllers.profile import ProfileController
-from owrx.controllers.imageupload import ImageUploadController
 from owrx.controllers.robots import RobotsController
 from owrx.storage import Storage
 from http.server import BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
+import importlib
 import re
 from abc import ABC, abstractmethod
 from http.cookies import SimpleCookie
@@ -54,10 +36,17 @@ class Request(object):
 
 class Route(ABC):
     def __init__(self, controller, method="GET", options=None):
+        # controllers can also be given by their qualified name, in which case they are imported on first use
         self.controller = controller
         self.controllerOptions = options if options is not None else {}
         self.method = method
 
+    def getController(self):
+        if isinstance(self.controller, str):
+            module, name = self.controller.rsplit(".", 1)
+            self.controller = getattr(importlib.import_module(module), name)
+        return self.controller
+
     @abstractmethod
     def matches(self, request):
         pass
@@ -97,74 +86,126 @@ class Router(object):
             RegexRoute("^(/favicon.ico)$", OwrxAssetsController),
             StaticRoute("/map", MapController),
             StaticRoute("/policy", PolicyController),
-            StaticRoute("/features", FeatureController),
+            StaticRoute("/features", "owrx.controllers.feature.FeatureController"),
             StaticRoute("/files", FilesController),
             RegexRoute("^/files/(%s)$" % Storage().getNamePattern(), FileController),
-            StaticRoute("/api/features", ApiController),
-            StaticRoute("/metrics", MetricsController, options={"action": "prometheusAction"}),
-            StaticRoute("/metrics.json", MetricsController),
-            StaticRoute("/settings", SettingsController),
-            StaticRoute("/settings/general", GeneralSettingsController),
+            StaticRoute("/api/features", "owrx.controllers.api.ApiController"),
             StaticRoute(
-                "/settings/general", GeneralSettingsController, method="POST", options={"action": "processFormData"}
+                "/metrics", "owrx.controllers.metrics.MetricsController", options={"action": "prometheusAction"}
             ),
-            StaticRoute("/settings/sdr", SdrDeviceListController),
-            StaticRoute("/settings/newsdr", NewSdrDeviceController),
+            StaticRoute("/metrics.json", "owrx.controllers.metrics.MetricsController"),
+            StaticRoute("/settings", "owrx.controllers.settings.SettingsController"),
+            StaticRoute("/settings/general", "owrx.controllers.settings.general.GeneralSettingsController"),
             StaticRoute(
-                "/settings/newsdr", NewSdrDeviceController, method="POST", options={"action": "processFormData"}
+                "/settings/general",
+                "owrx.controllers.settings.general.GeneralSettingsController",
+                method="POST",
+                options={"action": "processFormData"},
             ),
-            RegexRoute("^/settings/sdr/([^/]+)$", SdrDeviceController),
+            StaticRoute("/settings/sdr", "owrx.controllers.settings.sdr.SdrDeviceListController"),
+            StaticRoute("/settings/newsdr", "owrx.controllers.settings.sdr.NewSdrDeviceController"),
+            StaticRoute(
+                "/settings/newsdr",
+                "owrx.controllers.settings.sdr.NewSdrDeviceController",
+                method="POST",
+                options={"action": "processFormData"},
+            ),
+            RegexRoute("^/settings/sdr/([^/]+)$", "owrx.controllers.settings.sdr.SdrDeviceController"),
             RegexRoute(
-                "^/settings/sdr/([^/]+)$", SdrDeviceController, method="POST", options={"action": "processFormData"}
+                "^/settings/sdr/([^/]+)$",
+                "owrx.controllers.settings.sdr.SdrDeviceController",
+                method="POST",
+                options={"action": "processFormData"},
             ),
-            RegexRoute("^/settings/deletesdr/([^/]+)$", SdrDeviceController, options={"action": "deleteDevice"}),
-            RegexRoute("^/settings/sdr/([^/]+)/newprofile$", NewProfileController),
+            RegexRoute(
+                "^/settings/deletesdr/([^/]+)$",
+                "owrx.controllers.settings.sdr.SdrDeviceController",
+                options={"action": "deleteDevice"},
+            ),
+            RegexRoute("^/settings/sdr/([^/]+)/newprofile$", "owrx.controllers.settings.sdr.NewProfileController"),
             RegexRoute(
                 "^/settings/sdr/([^/]+)/newprofile$",
-                NewProfileController,
+                "owrx.controllers.settings.sdr.NewProfileController",
                 method="POST",
                 options={"action": "processFormData"},
             ),
-            RegexRoute("^/settings/sdr/([^/]+)/profile/([^/]+)$", SdrProfileController),
+            RegexRoute("^/settings/sdr/([^/]+)/profile/([^/]+)$", "owrx.controllers.settings.sdr.SdrProfileController"),
             RegexRoute(
                 "^/settings/sdr/([^/]+)/profile/([^/]+)$",
-                SdrProfileController,
+                "owrx.controllers.settings.sdr.SdrProfileController",
                 method="POST",
                 options={"action": "processFormData"},
             ),
             RegexRoute(
                 "^/settings/sdr/([^/]+)/deleteprofile/([^/]+)$",
-                SdrProfileController,
+                "owrx.controllers.settings.sdr.SdrProfileController",
                 options={"action": "deleteProfile"},
             ),
-            StaticRoute("/settings/bookmarks", BookmarksController),
-            StaticRoute("/settings/bookmarks", BookmarksController, method="POST", options={"action": "new"}),
-            RegexRoute("^/settings/bookmarks/(.+)$", BookmarksController, method="POST", options={"action": "update"}),
+            StaticRoute("/settings/bookmarks", "owrx.controllers.settings.bookmarks.BookmarksController"),
+            StaticRoute(
+                "/settings/bookmarks",
+                "owrx.controllers.settings.bookmarks.BookmarksController",
+                method="POST",
+                options={"action": "new"},
+            ),
+            RegexRoute(
+                "^/settings/bookmarks/(.+)$",
+                "owrx.controllers.settings.bookmarks.BookmarksController",
+                method="POST",
+                options={"action": "update"},
+            ),
             RegexRoute(
-                "^/settings/bookmarks/(.+)$", BookmarksController, method="DELETE", options={"action": "delete"}
+                "^/settings/bookmarks/(.+)$",
+                "owrx.controllers.settings.bookmarks.BookmarksController",
+                method="DELETE",
+                options={"action": "delete"},
             ),
-            StaticRoute("/settings/reporting", ReportingController),
+            StaticRoute("/settings/reporting", "owrx.controllers.settings.reporting.ReportingController"),
             StaticRoute(
-                "/settings/reporting", ReportingController, method="POST", options={"action": "processFormData"}
+                "/settings/reporting",
+                "owrx.controllers.settings.reporting.ReportingController",
+                method="POST",
+                options={"action": "processFormData"},
+            ),
+            StaticRoute(
+                "/settings/backgrounddecoding",
+                "owrx.controllers.settings.backgrounddecoding.BackgroundDecodingController",
             ),
-            StaticRoute("/settings/backgrounddecoding", BackgroundDecodingController),
             StaticRoute(
                 "/settings/backgrounddecoding",
-                BackgroundDecodingController,
+                "owrx.controllers.settings.backgrounddecoding.BackgroundDecodingController",
+                method="POST",
+                options={"action": "processFormData"},
+            ),
+            StaticRoute("/settings/decoding", "owrx.controllers.settings.decoding.DecodingSettingsController"),
+            StaticRoute(
+                "/settings/decoding",
+                "owrx.controllers.settings.decoding.DecodingSettingsController",
                 method="POST",
                 options={"action": "processFormData"},
             ),
-            StaticRoute("/settings/decoding", DecodingSettingsController),
+            StaticRoute("/login", "owrx.controllers.session.SessionController", options={"action": "loginAction"}),
             StaticRoute(
-                "/settings/decoding", DecodingSettingsController, method="POST", options={"action": "processFormData"}
-            ),
-            StaticRoute("/login", SessionController, options={"action": "loginAction"}),
-            StaticRoute("/login", SessionController, method="POST", options={"action": "processLoginAction"}),
-            StaticRoute("/logout", SessionController, options={"action": "logoutAction"}),
-            StaticRoute("/pwchange", ProfileController),
-            StaticRoute("/pwchange", ProfileController, method="POST", options={"action": "processPwChange"}),
-            StaticRoute("/imageupload", ImageUploadController),
-            StaticRoute("/imageupload", ImageUploadController, method="POST", options={"action": "processImage"}),
+                "/login",
+                "owrx.controllers.session.SessionController",
+                method="POST",
+                options={"action": "processLoginAction"},
+            ),
+            StaticRoute("/logout", "owrx.controllers.session.SessionController", options={"action": "logoutAction"}),
+            StaticRoute("/pwchange", "owrx.controllers.profile.ProfileController"),
+            StaticRoute(
+                "/pwchange",
+                "owrx.controllers.profile.ProfileController",
+                method="POST",
+                options={"action": "processPwChange"},
+            ),
+            StaticRoute("/imageupload", "owrx.controllers.imageupload.ImageUploadController"),
+            StaticRoute(
+                "/imageupload",
+                "owrx.controllers.imageupload.ImageUploadController",
+                method="POST",
+                options={"action": "processImage"},
+            ),
         ]
 
     def find_route(self, request):
@@ -175,7 +216,7 @@ class Router(object):
     def route(self, handler, request):
         route = self.find_route(request)
         if route is not None:
-            controller = route.controller
+            controller = route.getController()
             controller(handler, request, route.controllerOptions).handle_request()
         else:
             handler.send_error(404, "Not Found", "The page you requested could not be found.")
@@ -31,6 +31,12 @@ class Js8Profile(AudioChopperProfile, metaclass=ABCMeta):
     def decoder_commandline(self, file):
         return ["js8", "--js8", "-b", self.get_sub_mode(), "-d", str(self.decoding_depth()), file]
 
+    def supportsBatching(self):
+        return True
+
+    def getMode(self):
+        return "JS8"
+
     @abstractmethod
     def get_sub_mode(self):
         pass
@@ -1,7 +1,10 @@
 from datetime import datetime, timedelta
 from owrx.config import Config
 from owrx.bands import Band
+from itertools import count
 import threading
+import heapq
+import math
 import time
 import sys
 
@@ -15,11 +18,69 @@ class Location(object):
     def __dict__(self):
         return {}
 
+    def getLatLon(self):
+        """
+        Returns the (lat, lon) tuple used for spatial indexing, or None if the location can not be placed.
+        """
+        return None
+
+
+class PositionRecord(object):
+    __slots__ = ["location", "updated", "mode", "band", "hops", "tile"]
+
+    def __init__(self, location: Location, updated: datetime, mode: str, band, hops: list, tile):
+        self.location = location
+        self.updated = updated
+        self.mode = mode
+        self.band = band
+        self.hops = hops
+        self.tile = tile
+
+
+class Viewport(object):
+    """
+    Set of map tiles that a map client can currently see.
+    """
+
+    def __init__(self, tiles: set = None):
+        self.tiles = set() if tiles is None else tiles
+
+    @staticmethod
+    def fromBounds(north: float, south: float, east: float, west: float):
+        tiles = set()
+        if north < south:
+            north, south = south, north
+        rows = range(Map.getTileRow(south), Map.getTileRow(north) + 1)
+        first = Map.getTileColumn(west)
+        last = Map.getTileColumn(east)
+        if east - west >= 360:
+            columns = range(0, Map.tileColumns)
+        elif west <= east:
+            columns = range(first, last + 1)
+        else:
+            # viewport is crossing the antimeridian
+            columns = list(range(first, Map.tileColumns)) + list(range(0, last + 1))
+        for row in rows:
+            for column in columns:
+                tiles.add((row, column))
+        # locations without coordinates are always visible
+        tiles.add(None)
+        return Viewport(tiles)
+
+    def __contains__(self, tile):
+        return tile in self.tiles
+
 
 class Map(object):
     sharedInstance = None
     creationLock = threading.Lock()
 
+    # size of the spatial index tiles, in degrees
+    tileSize = 5
+    tileColumns = 360 // tileSize
+    # updates are collected and sent to the clients in batches, at most once per interval (in seconds)
+    broadcastInterval = 0.5
+
     @staticmethod
     def getSharedInstance():
         with Map.creationLock:
@@ -27,56 +88,176 @@ class Map(object):
                 Map.sharedInstance = Map()
         return Map.sharedInstance
 
+    @staticmethod
+    def getTileRow(lat: float):
+        return int(math.floor((min(max(lat, -90), 90 - 1e-9) + 90) / Map.tileSize))
+
+    @staticmethod
+    def getTileColumn(lon: float):
+        return int(math.floor(((lon + 180) % 360) / Map.tileSize))
+
+    @staticmethod
+    def getTile(loc: Location):
+        try:
+            coords = loc.getLatLon()
+        except Exception:
+            logger.exception("error while calculating location coordinates")
+            coords = None
+        if coords is None:
+            return None
+        lat, lon = coords
+        return Map.getTileRow(lat), Map.getTileColumn(lon)
+
     def __init__(self):
-        self.clients = []
+        # client -> Viewport, or None for clients that receive all updates
+        self.clients = {}
         self.positions = {}
+        # spatial index: tile -> set of callsigns. locations without coordinates go into tile None.
+        self.tiles = {}
+        # time-ordered expiry heap of (updated, sequence, callsign). entries are invalidated by newer updates and
+        # discarded lazily.
+        self.expiry = []
+        self.expirySequence = count()
+        self.removals = 0
         self.positionsLock = threading.Lock()
+        # client -> {callsign: serialized update, or None for removals}
+        self.pending = {}
+        # viewport client -> callsigns it has been sent, so that it gets moves and removals outside of its viewport
+        self.known = {}
+        self.pendingLock = threading.Lock()
+        self.flushTimer = None
 
         def removeLoop():
-            loops = 0
             while True:
                 try:
                     self.removeOldPositions()
                 except Exception:
                     logger.exception("error while removing old map positions")
-                loops += 1
-                # rebuild the positions dictionary every once in a while, it consumes lots of memory otherwise
-                if loops == 60:
+                # rebuild the positions dictionary after lots of removals, it consumes lots of memory otherwise
+                if self.removals > len(self.positions):
                     try:
                         self.rebuildPositions()
                     except Exception:
                         logger.exception("error while rebuilding positions")
-                    loops = 0
                 time.sleep(60)
 
         threading.Thread(target=removeLoop, daemon=True, name="map_removeloop").start()
         super().__init__()
 
-    def broadcast(self, update):
-        for c in self.clients:
-            c.write_update(update)
-
-    def addClient(self, client):
-        self.clients.append(client)
-        client.write_update(
-            [
-                {
-                    "callsign": callsign,
-                    "location": record["location"].__dict__(),
-                    "lastseen": record["updated"].timestamp() * 1000,
-                    "mode": record["mode"],
-                    "band": record["band"].getName() if record["band"] is not None else None,
-                    "hops": record["hops"],
-                }
-                for (callsign, record) in self.positions.items()
+    def broadcast(self, callsign, update, tile=None):
+        """
+        Queues an update (or a removal, if update is None) for all clients that can see the given tile, and for all
+        clients that have been sent the callsign before.
+        """
+        self.broadcastAll([(callsign, update, tile)])
+
+    def broadcastAll(self, items: list):
+        """
+        Queues a list of (callsign, update, tile) tuples, like broadcast(), in one go.
+        """
+        with self.pendingLock:
+            for c, viewport in list(self.clients.items()):
+                known = self.known.get(c, set())
+                for callsign, update, tile in items:
+                    if viewport is not None:
+                        if callsign in known:
+                            if update is None:
+                                known.discard(callsign)
+                        elif update is not None and tile in viewport:
+                            known.add(callsign)
+                        else:
+                            continue
+                    if c not in self.pending:
+                        self.pending[c] = {}
+                    # later updates supersede earlier ones for the same callsign
+                    self.pending[c][callsign] = update
+            if self.pending and self.flushTimer is None:
+                self.flushTimer = threading.Timer(Map.broadcastInterval, self.flush)
+                self.flushTimer.daemon = True
+                self.flushTimer.start()
+
+    def flush(self):
+        with self.pendingLock:
+            pending = self.pending
+            self.pending = {}
+            self.flushTimer = None
+        for c, items in pending.items():
+            updates = [update for update in items.values() if update is not None]
+            removals = [callsign for callsign, update in items.items() if update is None]
+            try:
+                if updates:
+                    c.write_update(updates)
+                if removals:
+                    c.write_removal(removals)
+            except Exception:
+                logger.exception("error while sending map updates")
+
+    def _serialize(self, callsign, record: PositionRecord):
+        return {
+            "callsign": callsign,
+            "location": record.location.__dict__(),
+            "lastseen": record.updated.timestamp() * 1000,
+            "mode": record.mode,
+            "band": record.band.getName() if record.band is not None else None,
+            "hops": record.hops,
+        }
+
+    def addClient(self, client, viewport: bool = False):
+        """
+        Registers a map client. Clients that support viewports will only receive data once they have called
+        setViewport(), all other clients receive the complete map right away.
+        """
+        if viewport:
+            with self.pendingLock:
+                self.known[client] = set()
+            self.clients[client] = Viewport()
+            return
+        with self.positionsLock:
+            update = [self._serialize(callsign, record) for (callsign, record) in self.positions.items()]
+        self.clients[client] = None
+        client.write_update(update)
+
+    def setViewport(self, client, north: float, south: float, east: float, west: float):
+        """
+        Updates the area that is visible to a client, and sends all locations in the tiles that have become visible.
+        """
+        if client not in self.clients:
+            return
+        viewport = Viewport.fromBounds(north, south, east, west)
+        previous = self.clients[client]
+        added = viewport.tiles if previous is None else viewport.tiles - previous.tiles
+        with self.positionsLock:
+            update = [
+                self._serialize(callsign, self.positions[callsign])
+                for tile in added if tile in self.tiles
+                for callsign in self.tiles[tile]
             ]
-        )
+            self.clients[client] = viewport
+        with self.pendingLock:
+            if client in self.known:
+                self.known[client].update(u["callsign"] for u in update)
+        if update:
+            client.write_update(update)
 
     def removeClient(self, client):
-        try:
-            self.clients.remove(client)
-        except ValueError:
-            pass
+        self.clients.pop(client, None)
+        with self.pendingLock:
+            self.pending.pop(client, None)
+            self.known.pop(client, None)
+
+    def _index(self, callsign, record: PositionRecord):
+        tile = record.tile
+        if tile not in self.tiles:
+            self.tiles[tile] = set()
+        self.tiles[tile].add(callsign)
+        heapq.heappush(self.expiry, (record.updated, next(self.expirySequence), callsign))
+
+    def _unindex(self, callsign, record: PositionRecord):
+        tile = record.tile
+        if tile in self.tiles:
+            self.tiles[tile].discard(callsign)
+            if not self.tiles[tile]:
+                del self.tiles[tile]
 
     def updateLocation(self, callsign, loc: Location, mode: str, band: Band = None, hops: list[str] = [], permanent: bool = False):
         pm = Config.get()
@@ -89,55 +270,96 @@ class Map(object):
         if permanent:
             ts = ts + timedelta(weeks=1000)
 
+        tile = Map.getTile(loc)
+
         with self.positionsLock:
             # ignore indirect reports if ignoreIndirect set
             if not ignoreIndirect or len(hops)==0:
                 # prefer messages with shorter hop count unless preferRecent set
-                if preferRecent or callsign not in self.positions or len(hops) <= len(self.positions[callsign]["hops"]):
-                    self.positions[callsign] = {"location": loc, "updated": ts, "mode": mode, "band": band, "hops": hops }
+                if preferRecent or callsign not in self.positions or len(hops) <= len(self.positions[callsign].hops):
+                    if callsign in self.positions:
+                        self._unindex(callsign, self.positions[callsign])
+                    record = PositionRecord(loc, ts, mode, band, hops, tile)
+                    self.positions[callsign] = record
+                    self._index(callsign, record)
                     needBroadcast = True
 
         if needBroadcast:
-            self.broadcast(
-                [
-                    {
-                        "callsign": callsign,
-                        "location": loc.__dict__(),
-                        "lastseen": ts.timestamp() * 1000,
-                        "mode": mode,
-                        "band": band.getName() if band is not None else None,
-                        "hops": hops,
-                    }
-                ]
-            )
+            self.broadcast(callsign, self._serialize(callsign, record), tile)
+
+    def updateLocations(self, locations: list, permanent: bool = False):
+        """
+        Updates a list of (callsign, location, mode) tuples at once, e.g. from a database. These are direct reports,
+        so they always replace previous positions.
+        """
+        ts = datetime.now()
+        if permanent:
+            ts = ts + timedelta(weeks=1000)
+        items = []
+        with self.positionsLock:
+            for callsign, loc, mode in locations:
+                if callsign in self.positions:
+                    self._unindex(callsign, self.positions[callsign])
+                record = PositionRecord(loc, ts, mode, None, [], Map.getTile(loc))
+                self.positions[callsign] = record
+                self._index(callsign, record)
+                items.append((callsign, self._serialize(callsign, record), record.tile))
+        self.broadcastAll(items)
 
     def touchLocation(self, callsign):
         # not implemented on the client side yet, so do not use!
         ts = datetime.now()
         with self.positionsLock:
-            if callsign in self.positions:
-                self.positions[callsign]["updated"] = ts
-        self.broadcast([{"callsign": callsign, "lastseen": ts.timestamp() * 1000}])
+            if callsign not in self.positions:
+                return
+            record = self.positions[callsign]
+            record.updated = ts
+            heapq.heappush(self.expiry, (ts, next(self.expirySequence), callsign))
+        self.broadcast(callsign, {"callsign": callsign, "lastseen": ts.timestamp() * 1000}, record.tile)
 
     def removeLocation(self, callsign):
+        self.removeLocations([callsign])
+
+    def removeLocations(self, callsigns: list):
+        items = []
         with self.positionsLock:
-            del self.positions[callsign]
-            # TODO broadcast removal to clients
+            for callsign in callsigns:
+                record = self.positions.pop(callsign, None)
+                if record is None:
+                    continue
+                self._unindex(callsign, record)
+                self.removals += 1
+                items.append((callsign, None, record.tile))
+        self.broadcastAll(items)
 
     def removeOldPositions(self):
         pm = Config.get()
         retention = timedelta(seconds=pm["map_position_retention_time"])
         cutoff = datetime.now() - retention
 
-        to_be_removed = [callsign for (callsign, pos) in self.positions.items() if pos["updated"] < cutoff]
-        for callsign in to_be_removed:
-            self.removeLocation(callsign)
+        to_be_removed = []
+        with self.positionsLock:
+            while self.expiry and self.expiry[0][0] < cutoff:
+                updated, _, callsign = heapq.heappop(self.expiry)
+                # only entries that still match the position are valid, everything else has been superseded
+                if callsign in self.positions and self.positions[callsign].updated == updated:
+                    to_be_removed.append(callsign)
+            # drop superseded entries once they make up the majority of the heap
+            if len(self.expiry) > 2 * len(self.positions) + 1024:
+                self.expiry = [
+                    (record.updated, next(self.expirySequence), callsign)
+                    for callsign, record in self.positions.items()
+                ]
+                heapq.heapify(self.expiry)
+
+        self.removeLocations(to_be_removed)
 
     def rebuildPositions(self):
         logger.debug("rebuilding map storage; size before: %i", sys.getsizeof(self.positions))
         with self.positionsLock:
             p = {key: value for key, value in self.positions.items()}
             self.positions = p
+            self.removals = 0
         logger.debug("rebuild complete; size after: %i", sys.getsizeof(self.positions))
 
 
@@ -150,6 +372,9 @@ class LatLngLocation(Location):
         res = {"type": "latlon", "lat": self.lat, "lon": self.lon}
         return res
 
+    def getLatLon(self):
+        return self.lat, self.lon
+
 
 class LocatorLocation(Location):
     def __init__(self, locator: str):
@@ -158,3 +383,10 @@ class LocatorLocation(Location):
     def __dict__(self):
         return {"type": "locator", "locator": self.locator}
 
+    def getLatLon(self):
+        # center of the 4-character grid square
+        loc = self.locator.upper()
+        lat = (ord(loc[1]) - ord("A")) * 10 + int(loc[3]) - 90 + 0.5
+        lon = (ord(loc[0]) - ord("A")) * 20 + int(loc[2]) * 2 - 180 + 1
+        return lat, lon
+
@@ -1,10 +1,10 @@
 from owrx.config.core import CoreConfig
 from owrx.map import Map, Location
-from owrx.aprs import getSymbolData
-from json import JSONEncoder
-from owrx.eibi import EIBI_Locations
+from owrx.compact import CompactTable
+from concurrent.futures import ThreadPoolExecutor
 
-import urllib
+import urllib.request
+import urllib.error
 import threading
 import logging
 import json
@@ -16,11 +16,6 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 
-class MyJSONEncoder(JSONEncoder):
-    def default(self, obj):
-        return obj.toJSON()
-
-
 class MarkerLocation(Location):
     def __init__(self, attrs):
         self.attrs = attrs
@@ -31,6 +26,11 @@ class MarkerLocation(Location):
     def getMode(self):
         return self.attrs["mode"]
 
+    def getLatLon(self):
+        if "lat" in self.attrs and "lon" in self.attrs:
+            return self.attrs["lat"], self.attrs["lon"]
+        return None
+
     def __dict__(self):
         return self.attrs
 
@@ -59,6 +59,12 @@ class Markers(object):
 
     @staticmethod
     def _getCachedMarkersFile():
+        coreConfig = CoreConfig()
+        return "{data_directory}/markers.cache".format(data_directory=coreConfig.get_data_directory())
+
+    @staticmethod
+    def _getLegacyMarkersFile():
+        # scraped markers used to be cached as JSON
         coreConfig = CoreConfig()
         return "{data_directory}/markers.json".format(data_directory=coreConfig.get_data_directory())
 
@@ -66,6 +72,13 @@ class Markers(object):
         self.refreshPeriod = 60*60*24
         self.event = threading.Event()
         self.markers = {}
+        # markers from local files, and scraped markers as last cached
+        self.local = {}
+        self.cache = {}
+        # url -> (ETag, Last-Modified) and url -> markers, as of the last successful fetch
+        self.validators = {}
+        self.scraped = {}
+        self.timeout = 30
         self.thread = None
         # Known database files
         self.fileList = [
@@ -101,42 +114,45 @@ class Markers(object):
     def _refreshThread(self):
         logger.debug("Starting marker database thread...")
 
-        # No markers yet
-        self.markers = {}
-
         # Load markers from local files
+        self.local = {}
         for file in self.fileList:
             if os.path.isfile(file):
                 logger.debug("Loading markers from '{0}'...".format(file))
-                self.markers.update(self.loadMarkers(file))
+                self.local.update(self.loadMarkers(file))
 
         # Load markers from the EIBI database
         #logger.debug("Loading EIBI transmitter locations...")
-        #self.markers.update(self.loadEIBI())
+        #self.local.update(self.loadEIBI())
 
         # This file contains cached database
         file = self._getCachedMarkersFile()
+        if not os.path.isfile(file) and os.path.isfile(self._getLegacyMarkersFile()):
+            file = self._getLegacyMarkersFile()
         ts   = os.path.getmtime(file) if os.path.isfile(file) else 0
 
         # Try loading cached database from file first, unless stale
         if time.time() - ts < self.refreshPeriod:
             logger.debug("Loading cached markers from '{0}'...".format(file))
-            self.markers.update(self.loadMarkers(file))
+            self.cache = self.loadMarkers(file)
         else:
             # Add scraped data to the database
-            self.markers.update(self.updateCache())
+            self.cache = self.updateCache()
+
+        # Update map with markers
+        logger.debug("Updating map...")
+        self.markers = self._combine()
+        self.updateMap()
 
         while not self.event.is_set():
-            # Update map with markers
-            logger.debug("Updating map...")
-            self.updateMap()
             # Sleep until it is time to update schedule
             self.event.wait(self.refreshPeriod)
             # If not terminated yet...
             if not self.event.is_set():
-                # Scrape data, updating cache
+                # Scrape data, updating cache and map
                 logger.debug("Refreshing marker database...")
-                self.markers.update(self.updateCache())
+                self.cache = self.updateCache()
+                self.setMarkers(self._combine())
 
         # Done with the thread
         logger.debug("Stopped marker database thread.")
@@ -144,14 +160,17 @@ class Markers(object):
 
     # Load markers from a given file
     def loadMarkers(self, fileName: str):
-        # Load markers list from JSON file
         try:
+            if CompactTable.isCompact(fileName):
+                # Cached markers, keyed by their IDs. All of them go onto the map, so materialize them right away.
+                return {attrs["id"]: MarkerLocation(attrs) for attrs in CompactTable.load(fileName)}
+            # Load markers list from JSON file
             with open(fileName, "r") as f:
                 db = json.load(f)
                 f.close()
         except Exception as e:
             logger.debug("loadMarkers() exception: {0}".format(e))
-            return
+            return {}
 
         # Process markers list
         result = {}
@@ -162,28 +181,57 @@ class Markers(object):
         # Done
         return result
 
-    # Update markers on the map
+    # Scraped markers take precedence over local ones
+    def _combine(self):
+        result = dict(self.local)
+        result.update(self.cache)
+        return result
+
+    # Put all markers on the map
     def updateMap(self):
-        for r in self.markers.values():
-            Map.getSharedInstance().updateLocation(r.getId(), r, r.getMode(), permanent=True)
+        Map.getSharedInstance().updateLocations(
+            [(r.getId(), r, r.getMode()) for r in self.markers.values()], permanent=True
+        )
+
+    # Replace markers, updating the map with the differences only
+    def setMarkers(self, markers: dict):
+        old = self.markers
+        self.markers = markers
+        changed = [r for key, r in markers.items() if key not in old or old[key].attrs != r.attrs]
+        removed = [r.getId() for key, r in old.items() if key not in markers]
+        logger.debug("{0} markers added or changed, {1} removed".format(len(changed), len(removed)))
+        if changed:
+            Map.getSharedInstance().updateLocations([(r.getId(), r, r.getMode()) for r in changed], permanent=True)
+        if removed:
+            Map.getSharedInstance().removeLocations(removed)
 
     # Scrape online databases, updating cache file
     def updateCache(self):
-        # Scrape websites for data
+        # Scrape websites for data, all at once
         file  = self._getCachedMarkersFile()
+        logger.debug("Scraping KiwiSDR, WebSDR and OpenWebRX websites...")
+        scrapers = [self.scrapeKiwiSDR, self.scrapeWebSDR, self.scrapeOWRX]
+        # Modes of the markers coming from each website
+        sources  = [
+            lambda mode: mode == "KiwiSDR",
+            lambda mode: mode == "WebSDR",
+            lambda mode: mode not in ["KiwiSDR", "WebSDR"],
+        ]
+        with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+            results = list(executor.map(lambda scrape: scrape(), scrapers))
         cache = {}
-        logger.debug("Scraping KiwiSDR website...")
-        cache.update(self.scrapeKiwiSDR())
-        logger.debug("Scraping WebSDR website...")
-        cache.update(self.scrapeWebSDR())
-        logger.debug("Scraping OpenWebRX website...")
-        cache.update(self.scrapeOWRX())
+        for result, isSource in zip(results, sources):
+            if result is not None:
+                cache.update(result)
+            else:
+                # Keep the markers we have for websites that could not be scraped
+                cache.update({k: r for k, r in self.cache.items() if isSource(r.getMode())})
         # Save parsed data into a file
         logger.debug("Saving {0} markers to '{1}'...".format(len(cache), file))
         try:
-            with open(file, "w") as f:
-                json.dump(cache, f, cls=MyJSONEncoder, indent=2)
-                f.close()
+            CompactTable.store(file, [r.toJSON() for r in cache.values()])
+            if os.path.isfile(self._getLegacyMarkersFile()):
+                os.remove(self._getLegacyMarkersFile())
         except Exception as e:
             logger.debug("updateCache() exception: {0}".format(e))
         # Done
@@ -194,6 +242,8 @@ class Markers(object):
     #
 
     def loadEIBI(self):
+        from owrx.eibitables import EIBI_Locations
+
         #url = "https://www.short-wave.info/index.php?txsite="
         url = "https://www.google.com/search?q="
         result = {}
@@ -212,128 +262,155 @@ class Markers(object):
         # Done
         return result
 
-    def scrapeOWRX(self, url: str = "https://www.receiverbook.de/map"):
-        patternJson = re.compile(r"^\s*var\s+receivers\s+=\s+(\[.*\]);\s*$")
-        result = {}
+    # Fetch given URL, returning None if it has not changed since the last successful fetch
+    def _fetch(self, url: str):
+        headers = {}
+        if url in self.scraped:
+            etag, modified = self.validators.get(url, (None, None))
+            if etag is not None:
+                headers["If-None-Match"] = etag
+            if modified is not None:
+                headers["If-Modified-Since"] = modified
+        request = urllib.request.Request(url, headers=headers)
         try:
-            data = None
-            for line in urllib.request.urlopen(url).readlines():
-                # Convert read bytes to a string
-                line = line.decode('utf-8')
-                # When we encounter a URL...
-                m = patternJson.match(line)
-                if m:
-                    data = json.loads(m.group(1))
-                    break
-            if data is not None:
-                for entry in data:
-                    lat = entry["location"]["coordinates"][1]
-                    lon = entry["location"]["coordinates"][0]
-                    for r in entry["receivers"]:
-                        if "version" in r:
-                            dev = r["type"] + " " + r["version"]
-                        else:
-                            dev = r["type"]
-                        rl = MarkerLocation({
-                            "type"    : "feature",
-                            "mode"    : r["type"],
-                            "id"      : re.sub(r"^.*://(.*?)(/.*)?$", r"\1", r["url"]),
-                            "lat"     : lat,
-                            "lon"     : lon,
-                            "comment" : r["label"],
-                            "url"     : r["url"],
-                            "device"  : dev
-                        })
-                        result[rl.getId()] = rl
-                        # Offset colocated receivers by ~500m
-                        lon = lon + 0.0005
-
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                data = response.read()
+                self.validators[url] = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+                return data
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None
+            raise
+
+    # Scrape given URL with given parser. Returns the previous result if the
+    # page has not changed or can not be scraped, None if there is none.
+    def _scrape(self, url: str, parse):
+        try:
+            data = self._fetch(url)
+            if data is None:
+                logger.debug("'{0}' has not changed".format(url))
+                return self.scraped[url]
+            result = parse(data)
+            self.scraped[url] = result
+            return result
         except Exception as e:
-            logger.debug("scrapeOWRX() exception: {0}".format(e))
+            logger.debug("_scrape('{0}') exception: {1}".format(url, e))
+            return self.scraped.get(url)
 
-        # Done
-        return result
+    def scrapeOWRX(self, url: str = "https://www.receiverbook.de/map"):
+        return self._scrape(url, self.parseOWRX)
 
     def scrapeWebSDR(self, url: str = "http://websdr.ewi.utwente.nl/~~websdrlistk?v=1&fmt=2&chseq=0"):
+        return self._scrape(url, self.parseWebSDR)
+
+    def scrapeKiwiSDR(self, url: str = "http://kiwisdr.com/public/"):
+        return self._scrape(url, self.parseKiwiSDR)
+
+    def parseOWRX(self, data: bytes):
+        patternJson = re.compile(r"^\s*var\s+receivers\s+=\s+(\[.*\]);\s*$")
         result = {}
-        try:
-            data = urllib.request.urlopen(url).read().decode('utf-8')
-            data = json.loads(re.sub("^\s*//.*", "", data, flags=re.MULTILINE))
-
-            for entry in data:
-                if "lat" in entry and "lon" in entry and "url" in entry:
-                    # Save accumulated attributes, use hostname as key
-                    lat = entry["lat"]
-                    lon = entry["lon"]
-                    rl  = MarkerLocation({
+        receivers = None
+        for line in data.decode('utf-8').splitlines():
+            # When we encounter a URL...
+            m = patternJson.match(line)
+            if m:
+                receivers = json.loads(m.group(1))
+                break
+        if receivers is not None:
+            for entry in receivers:
+                lat = entry["location"]["coordinates"][1]
+                lon = entry["location"]["coordinates"][0]
+                for r in entry["receivers"]:
+                    if "version" in r:
+                        dev = r["type"] + " " + r["version"]
+                    else:
+                        dev = r["type"]
+                    rl = MarkerLocation({
                         "type"    : "feature",
-                        "mode"    : "WebSDR",
-                        "id"      : re.sub(r"^.*://(.*?)(/.*)?$", r"\1", entry["url"]),
+                        "mode"    : r["type"],
+                        "id"      : re.sub(r"^.*://(.*?)(/.*)?$", r"\1", r["url"]),
                         "lat"     : lat,
                         "lon"     : lon,
-                        "comment" : entry["desc"],
-                        "url"     : entry["url"],
-                        "users"   : int(entry["users"]),
-                        "device"  : "WebSDR"
+                        "comment" : r["label"],
+                        "url"     : r["url"],
+                        "device"  : dev
                     })
                     result[rl.getId()] = rl
+                    # Offset colocated receivers by ~500m
+                    lon = lon + 0.0005
 
-        except Exception as e:
-            logger.debug("scrapeWebSDR() exception: {0}".format(e))
+        # Done
+        return result
+
+    def parseWebSDR(self, data: bytes):
+        result = {}
+        data = json.loads(re.sub(r"^\s*//.*", "", data.decode('utf-8'), flags=re.MULTILINE))
+
+        for entry in data:
+            if "lat" in entry and "lon" in entry and "url" in entry:
+                # Save accumulated attributes, use hostname as key
+                lat = entry["lat"]
+                lon = entry["lon"]
+                rl  = MarkerLocation({
+                    "type"    : "feature",
+                    "mode"    : "WebSDR",
+                    "id"      : re.sub(r"^.*://(.*?)(/.*)?$", r"\1", entry["url"]),
+                    "lat"     : lat,
+                    "lon"     : lon,
+                    "comment" : entry["desc"],
+                    "url"     : entry["url"],
+                    "users"   : int(entry["users"]),
+                    "device"  : "WebSDR"
+                })
+                result[rl.getId()] = rl
 
         # Done
         return result
 
-    def scrapeKiwiSDR(self, url: str = "http://kiwisdr.com/public/"):
+    def parseKiwiSDR(self, data: bytes):
         result = {}
-        try:
-            patternAttr = re.compile(r".*<!--\s+(\S+)=(.*)\s+-->.*")
-            patternUrl  = re.compile(r".*<a\s+href=['\"](\S+?)['\"].*>.*</a>.*")
-            patternGps  = re.compile(r"\(\s*(-?\d+\.\d+)\s*,\s*(-?\d+\.\d+)\s*\)")
-            entry = {}
-
-            for line in urllib.request.urlopen(url).readlines():
-                # Convert read bytes to a string
-                line = line.decode('utf-8')
-                # When we encounter a URL...
-                m = patternUrl.match(line)
-                if m is not None:
-                    # Add URL attribute
-                    entry["url"] = m.group(1)
-                    # Must have "gps" attribut with latitude / longitude
-                    if "gps" in entry and "url" in entry:
-                        m = patternGps.match(entry["gps"])
-                        if m is not None:
-                            # Save accumulated attributes, use hostname as key
-                            lat = float(m.group(1))
-                            lon = float(m.group(2))
-                            rl = MarkerLocation({
-                                "type"    : "feature",
-                                "mode"    : "KiwiSDR",
-                                "id"      : re.sub(r"^.*://(.*?)(/.*)?$", r"\1", entry["url"]),
-                                "lat"     : lat,
-                                "lon"     : lon,
-                                "comment" : entry["name"],
-                                "url"     : entry["url"],
-                                "users"   : int(entry["users"]),
-                                "maxusers": int(entry["users_max"]),
-                                "loc"     : entry["loc"],
-                                "altitude": int(entry["asl"]),
-                                "antenna" : entry["antenna"],
-                                "device"  : re.sub("_v", " ", entry["sw_version"])
-                            })
-                            result[rl.getId()] = rl
-                    # Clear current entry
-                    entry = {}
-                else:
-                    # Save all parsed attributes in the current entry
-                    m = patternAttr.match(line)
+        patternAttr = re.compile(r".*<!--\s+(\S+)=(.*)\s+-->.*")
+        patternUrl  = re.compile(r".*<a\s+href=['\"](\S+?)['\"].*>.*</a>.*")
+        patternGps  = re.compile(r"\(\s*(-?\d+\.\d+)\s*,\s*(-?\d+\.\d+)\s*\)")
+        entry = {}
+
+        for line in data.decode('utf-8').splitlines():
+            # When we encounter a URL...
+            m = patternUrl.match(line)
+            if m is not None:
+                # Add URL attribute
+                entry["url"] = m.group(1)
+                # Must have "gps" attribut with latitude / longitude
+                if "gps" in entry and "url" in entry:
+                    m = patternGps.match(entry["gps"])
                     if m is not None:
-                        # Save attribute in the current entry
-                        entry[m.group(1).lower()] = m.group(2)
-
-        except Exception as e:
-            logger.debug("scrapeKiwiSDR() exception: {0}".format(e))
+                        # Save accumulated attributes, use hostname as key
+                        lat = float(m.group(1))
+                        lon = float(m.group(2))
+                        rl = MarkerLocation({
+                            "type"    : "feature",
+                            "mode"    : "KiwiSDR",
+                            "id"      : re.sub(r"^.*://(.*?)(/.*)?$", r"\1", entry["url"]),
+                            "lat"     : lat,
+                            "lon"     : lon,
+                            "comment" : entry["name"],
+                            "url"     : entry["url"],
+                            "users"   : int(entry["users"]),
+                            "maxusers": int(entry["users_max"]),
+                            "loc"     : entry["loc"],
+                            "altitude": int(entry["asl"]),
+                            "antenna" : entry["antenna"],
+                            "device"  : re.sub("_v", " ", entry["sw_version"])
+                        })
+                        result[rl.getId()] = rl
+                # Clear current entry
+                entry = {}
+            else:
+                # Save all parsed attributes in the current entry
+                m = patternAttr.match(line)
+                if m is not None:
+                    # Save attribute in the current entry
+                    entry[m.group(1).lower()] = m.group(2)
 
         # Done
         return result
@@ -0,0 +1,255 @@
+from owrx.jsons import Encoder
+from owrx.websocket import Frame
+from abc import ABC, abstractmethod
+from io import BytesIO
+import struct
+import pickle
+import json
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class MessageType(ABC):
+    """
+    A kind of message passed between decoder modules, and on to the clients, together with its wire encoding.
+    """
+
+    def __init__(self, id: int, name: str):
+        self.id = id
+        self.name = name
+
+    @abstractmethod
+    def encode(self, value) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, payload: bytes):
+        pass
+
+    def toJson(self, payload: bytes) -> bytes:
+        return json.dumps(self.decode(payload), allow_nan=False, cls=Encoder).encode("utf-8")
+
+
+class JsonMessageType(MessageType):
+    """
+    Anything that ends up with the clients. The payload is forwarded to them as it is.
+    """
+
+    def encode(self, value) -> bytes:
+        # allow_nan = False disallows NaN and Infinty to be encoded. Browser JSON will not parse them anyway.
+        return json.dumps(value, allow_nan=False, cls=Encoder).encode("utf-8")
+
+    def decode(self, payload: bytes):
+        return json.loads(payload)
+
+    def toJson(self, payload: bytes) -> bytes:
+        return payload
+
+
+class TextMessageType(MessageType):
+    def encode(self, value) -> bytes:
+        return value.encode("utf-8") if isinstance(value, str) else bytes(value)
+
+    def decode(self, payload: bytes):
+        return payload.decode("utf-8", "replace")
+
+
+class BytesMessageType(MessageType):
+    def encode(self, value) -> bytes:
+        return bytes(value)
+
+    def decode(self, payload: bytes):
+        return payload
+
+
+class RecordMessageType(MessageType):
+    """
+    Flat records with a fixed set of fields, for data that JSON can't carry. Fields are given as (name, kind) with kind
+    being one of "str", "bytes" or "strlist".
+
+    The payload starts with the number of items and their lengths, followed by the items, in the order of the schema.
+    A list is stored as an item count (in place of a length) followed by its items.
+    """
+
+    count = struct.Struct("<H")
+
+    def __init__(self, id: int, name: str, fields: list):
+        super().__init__(id, name)
+        self.fields = fields
+
+    def encode(self, value) -> bytes:
+        lengths = []
+        items = []
+        for name, kind in self.fields:
+            field = value[name]
+            if kind == "str":
+                items.append(field.encode("utf-8"))
+            elif kind == "bytes":
+                items.append(bytes(field))
+            else:
+                lengths.append(len(field))
+                for item in field:
+                    item = item.encode("utf-8")
+                    lengths.append(len(item))
+                    items.append(item)
+                continue
+            lengths.append(len(items[-1]))
+        return struct.pack("<H{0}I".format(len(lengths)), len(lengths), *lengths) + b"".join(items)
+
+    def decode(self, payload: bytes):
+        (count,) = RecordMessageType.count.unpack_from(payload)
+        lengths = struct.unpack_from("<{0}I".format(count), payload, RecordMessageType.count.size)
+        offset = RecordMessageType.count.size + 4 * count
+        index = 0
+        record = {}
+        for name, kind in self.fields:
+            length = lengths[index]
+            index += 1
+            if kind == "strlist":
+                items = []
+                for itemLength in lengths[index : index + length]:
+                    items.append(payload[offset : offset + itemLength].decode("utf-8"))
+                    offset += itemLength
+                index += length
+                record[name] = items
+                continue
+            item = payload[offset : offset + length]
+            offset += length
+            record[name] = item if kind == "bytes" else item.decode("utf-8")
+        return record
+
+
+class MessageTypes(object):
+    types = {}
+
+    @staticmethod
+    def register(messageType: MessageType) -> MessageType:
+        if not 0 < messageType.id < 256:
+            raise ValueError("message type ids must fit into one byte")
+        if messageType.id in MessageTypes.types:
+            raise ValueError("message type id {0} already in use".format(messageType.id))
+        MessageTypes.types[messageType.id] = messageType
+        return messageType
+
+    @staticmethod
+    def get(id: int) -> MessageType:
+        return MessageTypes.types.get(id)
+
+    @staticmethod
+    def forValue(value) -> MessageType:
+        if isinstance(value, str):
+            return MessageTypes.text
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return MessageTypes.bytes
+        return MessageTypes.json
+
+
+MessageTypes.json = MessageTypes.register(JsonMessageType(1, "json"))
+MessageTypes.text = MessageTypes.register(TextMessageType(2, "text"))
+MessageTypes.bytes = MessageTypes.register(BytesMessageType(3, "bytes"))
+
+
+class Message(object):
+    """
+    A message as read from a buffer. The value is only decoded when it is needed, and the JSON and websocket frames
+    for the clients are only created once, no matter how many clients the message goes to.
+
+    On the wire, every message is a header (magic, type id, payload length) followed by the payload.
+    """
+
+    header = struct.Struct("<BBI")
+    # neither part of UTF-8 text nor the start of a pickle, which are the other things found in decoder output
+    magic = 0xFE
+    # anything larger is garbage
+    maxLength = 1 << 24
+
+    __slots__ = ["type", "payload", "json", "frames"]
+
+    @staticmethod
+    def encode(value, messageType: MessageType = None) -> bytes:
+        if messageType is None:
+            messageType = MessageTypes.forValue(value)
+        payload = messageType.encode(value)
+        return Message.header.pack(Message.magic, messageType.id, len(payload)) + payload
+
+    def __init__(self, messageType: MessageType, payload: bytes):
+        self.type = messageType
+        self.payload = payload
+        self.json = None
+        self.frames = None
+
+    def getValue(self):
+        return self.type.decode(self.payload)
+
+    def getJson(self) -> bytes:
+        if self.json is None:
+            self.json = self.type.toJson(self.payload)
+        return self.json
+
+    def getFrame(self, t: str):
+        """
+        Returns a websocket frame with this message as the value of a message of type t.
+        """
+        if self.frames is None:
+            self.frames = {}
+        if t not in self.frames:
+            self.frames[t] = Frame.text(b'{"type":"' + t.encode() + b'","value":' + self.getJson() + b"}")
+        return self.frames[t]
+
+
+class MessageReader(object):
+    """
+    Splits what is read from a buffer into messages. Messages can be split across reads, so incomplete data is kept
+    until the rest has arrived.
+
+    Some native decoders write pickles instead, or plain text; both are turned into messages as well. Pickles carry no
+    length, so they are expected to arrive in one piece.
+    """
+
+    def __init__(self):
+        self.pending = b""
+
+    def feed(self, data) -> list:
+        data = self.pending + bytes(data) if self.pending else bytes(data)
+        messages = []
+        header = Message.header
+        end = len(data)
+        pos = 0
+        while pos < end:
+            if data[pos] == Message.magic:
+                if end - pos < header.size:
+                    break
+                _, typeId, length = header.unpack_from(data, pos)
+                start = pos + header.size
+                if length > Message.maxLength:
+                    logger.warning("discarding message with invalid length %i", length)
+                    pos += 1
+                    continue
+                if end - start < length:
+                    break
+                messageType = MessageTypes.get(typeId)
+                if messageType is None:
+                    logger.warning("discarding message of unknown type %i", typeId)
+                else:
+                    messages.append(Message(messageType, data[start : start + length]))
+                pos = start + length
+            elif data[pos] == 0x80 and pos + 1 < end and 3 <= data[pos + 1] <= pickle.HIGHEST_PROTOCOL:
+                io = BytesIO(data[pos:])
+                try:
+                    while io.tell() < end - pos:
+                        value = pickle.load(io)
+                        messageType = MessageTypes.forValue(value)
+                        messages.append(Message(messageType, messageType.encode(value)))
+                except (EOFError, pickle.UnpicklingError, ValueError):
+                    pass
+                pos = end
+            else:
+                text = data.find(Message.magic, pos)
+                if text < 0:
+                    text = end
+                messages.append(Message(MessageTypes.text, data[pos:text]))
+                pos = text
+        self.pending = data[pos:]
+        return messages
@@ -1,14 +1,14 @@
 import json
 import logging
 import threading
-import pickle
 import re
 from abc import ABC, ABCMeta, abstractmethod
 from datetime import datetime, timedelta
 from urllib import request
 from urllib.error import HTTPError
 
-from csdr.module import PickleModule
+from csdr.module import MessageModule
+from owrx.message import Message
 from owrx.aprs import AprsParser, AprsLocation
 from owrx.config import Config
 from owrx.map import Map, LatLngLocation
@@ -209,7 +209,7 @@ class DStarEnricher(DigihamEnricher):
         return meta
 
 
-class MetaParser(PickleModule):
+class MetaParser(MessageModule):
     def __init__(self):
         self.enrichers = {
             "DMR": DmrEnricher(self),
@@ -233,7 +233,7 @@ class MetaParser(PickleModule):
         # we may have moved on in the meantime
         if meta is not self.currentMetaData:
             return
-        self.writer.write(pickle.dumps(meta))
+        self.writer.write(Message.encode(meta))
 
     def setDialFrequency(self, freq):
         self.band = Bandplan.getSharedInstance().findBand(freq)
@@ -18,6 +18,31 @@ class CounterMetric(Metric):
         return {"count": self.counter}
 
 
+class HistogramMetric(Metric):
+    def __init__(self, buckets):
+        self.buckets = sorted(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bucket in enumerate(self.buckets):
+            if value <= bucket:
+                self.counts[i] += 1
+                break
+
+    def getValue(self):
+        # buckets are cumulative, as expected by prometheus
+        cumulative = 0
+        buckets = {}
+        for bucket, count in zip(self.buckets, self.counts):
+            cumulative += count
+            buckets[str(bucket)] = cumulative
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
 class DirectMetric(Metric):
     def __init__(self, getter):
         self.getter = getter
@@ -39,26 +64,32 @@ class Metrics(object):
 
     def __init__(self):
         self.metrics = {}
+        self.lock = threading.Lock()
         self.addMetric("openwebrx.users", DirectMetric(ClientRegistry.getSharedInstance().clientCount))
 
     def addMetric(self, name, metric):
-        self.metrics[name] = metric
+        with self.lock:
+            self.metrics[name] = metric
+
+    def removeMetric(self, name):
+        with self.lock:
+            self.metrics.pop(name, None)
 
     def hasMetric(self, name):
         return name in self.metrics
 
     def getMetric(self, name):
-        if not self.hasMetric(name):
-            return None
-        return self.metrics[name]
+        return self.metrics.get(name)
 
     def getFlatMetrics(self):
-        return self.metrics
+        # a copy, since metrics can be added and removed while it is iterated
+        with self.lock:
+            return dict(self.metrics)
 
     def getHierarchicalMetrics(self):
         result = {}
 
-        for (key, metric) in self.metrics.items():
+        for (key, metric) in self.getFlatMetrics().items():
             partial = result
             keys = key.split(".")
             for keypart in keys[0:-1]:
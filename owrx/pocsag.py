@@ -1,4 +1,4 @@
-from csdr.module import PickleModule
+from csdr.module import MessageModule
 from owrx.bands import Bandplan
 from owrx.metrics import Metrics, CounterMetric
 import logging
@@ -6,7 +6,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-class PocsagParser(PickleModule):
+class PocsagParser(MessageModule):
     def __init__(self):
         self.band = None
         super().__init__()
@@ -0,0 +1,136 @@
+from importlib.abc import MetaPathFinder
+from contextlib import contextmanager
+import threading
+import time
+import sys
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TimedLoader(object):
+    """
+    Wraps the loader of a module spec to measure the time spent executing the module.
+    """
+
+    def __init__(self, loader, profiler: "StartupProfiler"):
+        self.loader = loader
+        self.profiler = profiler
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.profiler.enterImport(module.__name__)
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.profiler.leaveImport()
+
+    def __getattr__(self, item):
+        return getattr(self.loader, item)
+
+
+class ImportTimer(MetaPathFinder):
+    def __init__(self, profiler: "StartupProfiler"):
+        self.profiler = profiler
+        self.local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        # ask the other finders, but don't recurse into ourselves
+        if getattr(self.local, "searching", False):
+            return None
+        self.local.searching = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self.local.searching = False
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = TimedLoader(spec.loader, self.profiler)
+        return spec
+
+
+class StartupProfiler(object):
+    """
+    Measures the startup of the receiver: the time spent importing every module (excluding the modules it imports
+    itself), and the duration of the individual startup phases.
+
+    Only modules imported after startProfiling() are covered.
+    """
+
+    def __init__(self):
+        self.startTime = None
+        self.finder = ImportTimer(self)
+        # module name -> [self time, cumulative time]
+        self.imports = {}
+        # imports are only timed on the main thread, so that background threads do not distort the numbers
+        self.thread = None
+        self.stack = []
+        # time spent in imports that were not triggered by another timed import
+        self.importTime = 0
+        self.phases = []
+
+    def startProfiling(self):
+        self.startTime = time.perf_counter()
+        self.thread = threading.current_thread()
+        sys.meta_path.insert(0, self.finder)
+
+    def stopProfiling(self):
+        if self.finder in sys.meta_path:
+            sys.meta_path.remove(self.finder)
+        return time.perf_counter() - self.startTime
+
+    def enterImport(self, name):
+        if threading.current_thread() is self.thread:
+            self.stack.append([name, time.perf_counter(), 0])
+
+    def leaveImport(self):
+        if threading.current_thread() is not self.thread:
+            return
+        name, start, children = self.stack.pop()
+        cumulative = time.perf_counter() - start
+        self.imports[name] = [cumulative - children, cumulative]
+        if self.stack:
+            self.stack[-1][2] += cumulative
+        else:
+            self.importTime += cumulative
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        importStart = self.importTime
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start, self.importTime - importStart))
+
+    def report(self, top: int = 25):
+        total = self.stopProfiling()
+        logger.info(
+            "startup profile: %.1f ms until listening, %.1f ms of that importing", total * 1000, self.importTime * 1000
+        )
+
+        logger.info("startup phases (total / importing):")
+        for name, duration, importDuration in self.phases:
+            logger.info("  %-40s %10.1f ms %10.1f ms", name, duration * 1000, importDuration * 1000)
+
+        packages = {}
+        for name, (selfTime, _) in self.imports.items():
+            package = ".".join(name.split(".")[:2]) if name.startswith("owrx.") else name.split(".")[0]
+            packages[package] = packages.get(package, 0) + selfTime
+        logger.info("import time by package (top %i):", top)
+        for package, duration in sorted(packages.items(), key=lambda x: x[1], reverse=True)[:top]:
+            logger.info("  %-40s %10.1f ms", package, duration * 1000)
+
+        logger.info("import time by module (top %i, self / cumulative):", top)
+        modules = sorted(self.imports.items(), key=lambda x: x[1][0], reverse=True)[:top]
+        for name, (selfTime, cumulative) in modules:
+            logger.info("  %-40s %10.1f ms %10.1f ms", name, selfTime * 1000, cumulative * 1000)
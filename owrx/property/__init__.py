@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from owrx.property.validators import Validator
 from owrx.property.filter import Filter, ByPropertyName
+import threading
+import time
 import logging
 
 logger = logging.getLogger(__name__)
@@ -36,9 +38,78 @@ class Subscription(object):
         self.subscriptee.unwire(self)
 
 
+class FollowerSubscription(Subscription):
+    def __init__(self, subscriptee, follower, subscriber):
+        super().__init__(subscriptee, None, subscriber)
+        self.follower = follower
+
+
+class DispatchMetrics(object):
+    """
+    Collects the cost of event dispatch while debug logging is enabled for this module. Nothing is collected before
+    start() has been called: the metrics depend on the config, which dispatches events itself while it is set up.
+    """
+
+    sharedInstance = None
+    creationLock = threading.Lock()
+
+    @staticmethod
+    def getSharedInstance():
+        # never creates the instance, see start()
+        return DispatchMetrics.sharedInstance
+
+    @staticmethod
+    def start():
+        with DispatchMetrics.creationLock:
+            if DispatchMetrics.sharedInstance is None:
+                DispatchMetrics.sharedInstance = DispatchMetrics()
+
+    def __init__(self):
+        # imported here since the metrics depend on the config, which depends on this module
+        from owrx.metrics import Metrics, HistogramMetric
+
+        metrics = Metrics.getSharedInstance()
+        self.durationMetric = HistogramMetric([0.0001, 0.001, 0.01, 0.1, 1])
+        metrics.addMetric("property.dispatch.duration", self.durationMetric)
+        self.callbacksMetric = HistogramMetric([1, 10, 100, 1000, 10000])
+        metrics.addMetric("property.dispatch.callbacks", self.callbacksMetric)
+        # events fire further events on other managers, so only the outermost dispatch per thread is measured
+        self.local = threading.local()
+
+    def enter(self):
+        depth = getattr(self.local, "depth", 0)
+        self.local.depth = depth + 1
+        if depth == 0:
+            self.local.callbacks = 0
+            self.local.start = time.perf_counter()
+
+    def count(self, callbacks):
+        if getattr(self.local, "depth", 0):
+            self.local.callbacks += callbacks
+
+    def leave(self):
+        self.local.depth -= 1
+        if self.local.depth == 0:
+            self.durationMetric.observe(time.perf_counter() - self.local.start)
+            self.callbacksMetric.observe(self.local.callbacks)
+
+
 class PropertyManager(ABC):
     def __init__(self):
+        # subscribers to all changes
         self.subscribers = []
+        # subscribers to a single property, indexed by property name
+        self.propertySubscribers = {}
+        # shared by all PropertyFilters on top of this manager
+        self.filterDispatcher = None
+        # changes held back by open transactions
+        self.transactionLock = threading.Lock()
+        self.transactionDepth = 0
+        self.pendingChanges = {}
+        # subscribers that keep their own state in sync with this manager, see follow()
+        self.followers = []
+        # followers that have been put into a transaction by the currently open one
+        self.transactionFollowers = []
 
     @abstractmethod
     def __getitem__(self, item):
@@ -81,43 +152,151 @@ class PropertyManager(ABC):
     def readonly(self):
         return PropertyReadOnly(self)
 
+    def transaction(self):
+        """
+        Returns a context manager that holds back all change events of this manager while it is open. The changes are
+        merged and fired as a single event when the outermost transaction is closed. Transactions can be nested.
+
+        Writes are not rolled back if the block raises an exception; the changes made up to that point are still fired.
+
+        Stacks this manager is a layer of see the changes right away, but hold back their own events until the
+        transaction is closed.
+        """
+        return PropertyTransaction(self)
+
+    def _beginTransaction(self):
+        with self.transactionLock:
+            self.transactionDepth += 1
+            if self.transactionDepth > 1:
+                return
+            followers = [sub.follower for sub in self.followers]
+            self.transactionFollowers = followers
+        for follower in followers:
+            follower._beginTransaction()
+
+    def _commitTransaction(self):
+        with self.transactionLock:
+            self.transactionDepth -= 1
+            if self.transactionDepth > 0:
+                return
+            changes = self.pendingChanges
+            self.pendingChanges = {}
+            followers = self.transactionFollowers
+            self.transactionFollowers = []
+        # the followers have seen the changes already
+        self._fireCallbacks(changes, False)
+        for follower in followers:
+            follower._commitTransaction()
+
     def wire(self, callback):
         sub = Subscription(self, None, callback)
-        self.subscribers.append(sub)
+        self._addSubscription(sub)
+        return sub
+
+    def follow(self, follower: "PropertyManager", callback):
+        """
+        Like wire(), but the callback also receives the changes made during a transaction right away. The follower is
+        put into a transaction of its own instead, so its events are still held back.
+        """
+        sub = FollowerSubscription(self, follower, callback)
+        self._addSubscription(sub)
         return sub
 
     def wireProperty(self, name, callback):
         sub = Subscription(self, name, callback)
-        self.subscribers.append(sub)
+        self._addSubscription(sub)
         if name in self:
             sub.call(self[name])
         return sub
 
+    def _addSubscription(self, sub):
+        name = sub.getName()
+        if isinstance(sub, FollowerSubscription):
+            self.followers.append(sub)
+        elif name is None:
+            self.subscribers.append(sub)
+        elif name in self.propertySubscribers:
+            self.propertySubscribers[name].append(sub)
+        else:
+            self.propertySubscribers[name] = [sub]
+
+    def hasSubscribers(self):
+        return bool(self.subscribers or self.propertySubscribers or self.followers)
+
     def unwire(self, sub):
+        name = sub.getName()
         try:
-            self.subscribers.remove(sub)
-        except ValueError:
+            if isinstance(sub, FollowerSubscription):
+                self.followers.remove(sub)
+            elif name is None:
+                self.subscribers.remove(sub)
+            else:
+                self.propertySubscribers[name].remove(sub)
+                if not self.propertySubscribers[name]:
+                    del self.propertySubscribers[name]
+        except (ValueError, KeyError):
             # happens when already removed before
             pass
         return self
 
-    def _fireCallbacks(self, changes):
+    def _fireCallbacks(self, changes, toFollowers=True):
         if not changes:
             return
-        subscribers = self.subscribers.copy()
+        # unlocked check first, to keep the common case cheap
+        if self.transactionDepth:
+            with self.transactionLock:
+                pending = self.transactionDepth > 0
+                if pending:
+                    # later changes to the same key replace earlier ones
+                    self.pendingChanges.update(changes)
+            if pending:
+                self._dispatchTo(self.followers.copy(), changes)
+                return
+        metrics = DispatchMetrics.getSharedInstance() if logger.isEnabledFor(logging.DEBUG) else None
+        if metrics is not None:
+            metrics.enter()
+            try:
+                metrics.count(self._dispatch(changes, toFollowers))
+            finally:
+                metrics.leave()
+        else:
+            self._dispatch(changes, toFollowers)
+
+    def _dispatchTo(self, subscribers, changes):
         for c in subscribers:
             try:
-                if c.getName() is None:
-                    c.call(changes)
+                c.call(changes)
             except Exception:
                 logger.exception("exception while firing changes")
-        for name in changes:
-            for c in subscribers:
+
+    def _dispatch(self, changes, toFollowers=True):
+        # take a snapshot of all relevant subscribers before calling any of them
+        subscribers = self.followers + self.subscribers if toFollowers else self.subscribers.copy()
+        propertySubscribers = [
+            (name, self.propertySubscribers[name].copy()) for name in changes if name in self.propertySubscribers
+        ]
+        calls = len(subscribers)
+        self._dispatchTo(subscribers, changes)
+        for name, subs in propertySubscribers:
+            calls += len(subs)
+            for c in subs:
                 try:
-                    if c.getName() == name:
-                        c.call(changes[name])
+                    c.call(changes[name])
                 except Exception:
                     logger.exception("exception while firing changes")
+        return calls
+
+
+class PropertyTransaction(object):
+    def __init__(self, pm: PropertyManager):
+        self.pm = pm
+
+    def __enter__(self):
+        self.pm._beginTransaction()
+        return self.pm
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.pm._commitTransaction()
 
 
 class PropertyLayer(PropertyManager):
@@ -155,12 +334,95 @@ class PropertyLayer(PropertyManager):
         return self.properties.items()
 
 
+class FilterDispatcher(object):
+    """
+    Forwards the events of a PropertyManager to all PropertyFilters on top of it, using a single subscription.
+
+    Filters by property name only receive events that contain one of their properties, all other filters receive
+    every event.
+    """
+
+    creationLock = threading.Lock()
+
+    def __init__(self, pm: PropertyManager):
+        self.pm = pm
+        self.filtersByName = {}
+        self.filters = []
+        self.subscription = None
+        self.lock = threading.Lock()
+
+    def add(self, propertyFilter: "PropertyFilter"):
+        names = propertyFilter.getPropertyNames()
+        with self.lock:
+            if names is None:
+                self.filters.append(propertyFilter)
+            else:
+                for name in names:
+                    if name not in self.filtersByName:
+                        self.filtersByName[name] = []
+                    self.filtersByName[name].append(propertyFilter)
+            if self.subscription is None:
+                self.subscription = self.pm.wire(self.receiveEvent)
+
+    def remove(self, propertyFilter: "PropertyFilter"):
+        names = propertyFilter.getPropertyNames()
+        with self.lock:
+            if names is None:
+                self.filters.remove(propertyFilter)
+            else:
+                for name in names:
+                    self.filtersByName[name].remove(propertyFilter)
+                    if not self.filtersByName[name]:
+                        del self.filtersByName[name]
+            if not self.filters and not self.filtersByName and self.subscription is not None:
+                self.subscription.cancel()
+                self.subscription = None
+
+    def receiveEvent(self, changes):
+        with self.lock:
+            # dict keeps the order and makes sure every filter is only called once
+            targets = dict.fromkeys(self.filters)
+            for name in changes:
+                if name in self.filtersByName:
+                    targets.update(dict.fromkeys(self.filtersByName[name]))
+        for propertyFilter in targets:
+            propertyFilter.receiveEvent(changes)
+
+
 class PropertyFilter(PropertyManager):
     def __init__(self, pm: PropertyManager, filter: Filter):
         super().__init__()
         self.pm = pm
         self._filter = filter
-        self.pm.wire(self.receiveEvent)
+        self.attached = False
+
+    def getPropertyNames(self):
+        """
+        Returns the property names this filter lets through, or None if that can not be determined up front.
+        """
+        if isinstance(self._filter, ByPropertyName):
+            return set(self._filter.props)
+        return None
+
+    def _getDispatcher(self) -> FilterDispatcher:
+        with FilterDispatcher.creationLock:
+            if self.pm.filterDispatcher is None:
+                self.pm.filterDispatcher = FilterDispatcher(self.pm)
+        return self.pm.filterDispatcher
+
+    def _addSubscription(self, sub):
+        super()._addSubscription(sub)
+        # events from upstream are only needed while there is someone to forward them to
+        if not self.attached:
+            self.attached = True
+            self._getDispatcher().add(self)
+
+    def unwire(self, sub):
+        super().unwire(sub)
+        if self.attached and not self.hasSubscribers():
+            self.attached = False
+            self._getDispatcher().remove(self)
+        return self
 
     def receiveEvent(self, changes):
         changesToForward = {name: value for name, value in changes.items() if self._filter.apply(name)}
@@ -273,7 +535,11 @@ class PropertyReadOnly(PropertyDelegator):
 class PropertyStack(PropertyManager):
     def __init__(self):
         super().__init__()
+        # layers, ordered by priority. layers of equal priority are kept in the order they were added.
         self.layers = []
+        # resolved index: key -> the top layer containing that key
+        self.index = {}
+        self.layerSequence = 0
 
     def addLayer(self, priority: int, pm: PropertyManager):
         """
@@ -281,28 +547,52 @@ class PropertyStack(PropertyManager):
         """
         self._fireCallbacks(self._addLayer(priority, pm))
 
+    def _getRank(self, layer):
+        return layer["priority"], layer["sequence"]
+
+    def _resolve(self, key):
+        """
+        Looks up the top layer for a key from scratch and updates the index accordingly.
+        """
+        for layer in self.layers:
+            if key in layer["props"]:
+                self.index[key] = layer
+                return layer
+        self.index.pop(key, None)
+        return None
+
     def _addLayer(self, priority: int, pm: PropertyManager):
-        changes = {}
-        for key in pm.keys():
-            if key not in self or self[key] != pm[key]:
-                changes[key] = pm[key]
+        layer = {"priority": priority, "sequence": self.layerSequence, "props": pm}
+        self.layerSequence += 1
 
         def eventClosure(changes):
-            self.receiveEvent(pm, changes)
+            self.receiveEvent(layer, changes)
 
-        sub = pm.wire(eventClosure)
+        # the index needs to be kept up to date even while the layer is in a transaction
+        layer["sub"] = pm.follow(self, eventClosure)
+        rank = self._getRank(layer)
+        position = next((i for i, la in enumerate(self.layers) if self._getRank(la) > rank), len(self.layers))
+        self.layers.insert(position, layer)
 
-        self.layers.append({"priority": priority, "props": pm, "sub": sub})
+        changes = {}
+        for key in pm.keys():
+            current = self.index.get(key)
+            if current is not None and self._getRank(current) < rank:
+                continue
+            value = pm[key]
+            if current is None or current["props"][key] != value:
+                changes[key] = value
+            self.index[key] = layer
 
         return changes
 
     def removeLayerByPriority(self, priority):
-        for layer in self.layers:
+        for layer in self.layers.copy():
             if layer["priority"] == priority:
                 self.removeLayer(layer["props"])
 
     def removeLayer(self, pm: PropertyManager):
-        for layer in self.layers:
+        for layer in self.layers.copy():
             if layer["props"] == pm:
                 self._fireCallbacks(self._removeLayer(layer))
 
@@ -312,11 +602,13 @@ class PropertyStack(PropertyManager):
         changes = {}
         pm = layer["props"]
         for key in pm.keys():
-            if key in self:
-                if self[key] != pm[key]:
-                    changes[key] = self[key]
-            else:
+            if self.index.get(key) is not layer:
+                continue
+            top = self._resolve(key)
+            if top is None:
                 changes[key] = PropertyDeleted
+            elif top["props"][key] != pm[key]:
+                changes[key] = top["props"][key]
         return changes
 
     def replaceLayer(self, priority: int, pm: PropertyManager):
@@ -330,29 +622,34 @@ class PropertyStack(PropertyManager):
 
         self._fireCallbacks(changes)
 
-    def receiveEvent(self, layer, changes):
-        changesToForward = {name: value for name, value in changes.items() if layer == self._getTopLayer(name)}
-        # deletions need to be handled separately:
-        # * send a deletion if the key was deleted in all layers
-        # * send lower value if the key is still present in a lower layer
-        deletionsToForward = {
-            name: PropertyDeleted if self._getTopLayer(name, False) is None else self[name]
-            for name, value in changes.items()
-            if value is PropertyDeleted
-        }
-        self._fireCallbacks({**changesToForward, **deletionsToForward})
+    def receiveEvent(self, source, changes):
+        changesToForward = {}
+        for name, value in changes.items():
+            current = self.index.get(name)
+            if value is PropertyDeleted:
+                # deletions need to be handled separately:
+                # * send a deletion if the key was deleted in all layers
+                # * send lower value if the key is still present in a lower layer
+                top = self._resolve(name) if current is source else current
+                changesToForward[name] = PropertyDeleted if top is None else top["props"][name]
+            elif current is None or current is source or self._getRank(source) < self._getRank(current):
+                self.index[name] = source
+                changesToForward[name] = value
+        self._fireCallbacks(changesToForward)
 
     def _getTopLayer(self, item, fallback=True):
-        layers = [la["props"] for la in sorted(self.layers, key=lambda l: l["priority"])]
-        for m in layers:
-            if item in m:
-                return m
+        if item in self.index:
+            return self.index[item]["props"]
         # return top layer as fallback
-        if fallback and layers:
-            return layers[0]
+        if fallback and self.layers:
+            return self.layers[0]["props"]
 
     def __getitem__(self, item):
+        if item in self.index:
+            return self.index[item]["props"][item]
         layer = self._getTopLayer(item)
+        if layer is None:
+            raise KeyError(item)
         return layer.__getitem__(item)
 
     def __setitem__(self, key, value):
@@ -360,24 +657,21 @@ class PropertyStack(PropertyManager):
         return layer.__setitem__(key, value)
 
     def __contains__(self, item):
-        layer = self._getTopLayer(item)
-        if layer:
-            return layer.__contains__(item)
-        return False
+        return item in self.index
 
     def __dict__(self):
-        return {k: self.__getitem__(k) for k in self.keys()}
+        return {k: layer["props"][k] for k, layer in self.index.items()}
 
     def __delitem__(self, key):
-        for layer in self.layers:
+        for layer in self.layers.copy():
             if layer["props"].__contains__(key):
                 layer["props"].__delitem__(key)
 
     def keys(self):
-        return set([key for l in self.layers for key in l["props"].keys()])
+        return self.index.keys()
 
     def values(self):
-        return [self.__getitem__(k) for k in self.keys()]
+        return [layer["props"][k] for k, layer in self.index.items()]
 
     def items(self):
         return self.__dict__().items()
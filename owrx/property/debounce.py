@@ -0,0 +1,45 @@
+import threading
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Debouncer(object):
+    """
+    Callable wrapper for expensive reactions to property changes.
+
+    A burst of calls results in a single call of the wrapped callback, once no further calls have arrived for the given
+    delay. The arguments of the individual calls are dropped, so the callback must read the current state itself.
+    """
+
+    def __init__(self, callback, delay: float = 1):
+        self.callback = callback
+        self.delay = delay
+        self.timer = None
+        self.lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.delay, self._run)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def _run(self):
+        with self.lock:
+            if self.timer is None or self.timer is not threading.current_thread():
+                # cancelled or superseded in the meantime
+                return
+            self.timer = None
+        try:
+            self.callback()
+        except Exception:
+            logger.exception("exception in debounced callback")
+
+    def cancel(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
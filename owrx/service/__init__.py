@@ -5,6 +5,7 @@ from owrx.bands import Bandplan
 from owrx.config import Config
 from owrx.source.resampler import Resampler
 from owrx.property import PropertyLayer, PropertyDeleted
+from owrx.property.debounce import Debouncer
 from owrx.service.schedule import ServiceScheduler
 from owrx.service.chain import ServiceDemodulatorChain
 from owrx.modes import Modes, DigitalMode
@@ -28,6 +29,8 @@ class ServiceHandler(SdrSourceEventClient):
         props = self.source.getProps()
         self.enabledSub = props.wireProperty("services", self._receiveEvent)
         self.decodersSub = None
+        # saving the settings can change the decoder selection several times in a row
+        self.decodersDebouncer = Debouncer(self.onDecodersChange)
         # need to call _start() manually if property is not set since the default is True, but the initial call is only
         # made if the property is present
         if "services" not in props:
@@ -49,7 +52,7 @@ class ServiceHandler(SdrSourceEventClient):
         self.source.addClient(self)
         props = self.source.getProps()
         self.activitySub = props.filter("center_freq", "samp_rate").wire(self.onFrequencyChange)
-        self.decodersSub = Config.get().wireProperty("services_decoders", self.onFrequencyChange)
+        self.decodersSub = Config.get().filter("services_decoders").wire(self.decodersDebouncer)
         if self.source.isAvailable():
             self._scheduleServiceStartup()
 
@@ -60,6 +63,7 @@ class ServiceHandler(SdrSourceEventClient):
         if self.decodersSub is not None:
             self.decodersSub.cancel()
             self.decodersSub = None
+        self.decodersDebouncer.cancel()
         self._cancelStartupTimer()
         self.source.removeClient(self)
         self.stopServices()
@@ -111,6 +115,9 @@ class ServiceHandler(SdrSourceEventClient):
             return
         self._scheduleServiceStartup()
 
+    def onDecodersChange(self):
+        self.onFrequencyChange(None)
+
     def _cancelStartupTimer(self):
         if self.startupTimer:
             self.startupTimer.cancel()
@@ -272,7 +279,7 @@ class ServiceHandler(SdrSourceEventClient):
 
         chain = ServiceDemodulatorChain(demod, secondaryDemod, sampleRate, dial["frequency"] - center_freq)
         chain.setBandPass(bandpass.low_cut, bandpass.high_cut)
-        chain.setReader(source.getBuffer().getReader())
+        chain.setChannelizer(source.getChannelizer())
 
         # dummy buffer, we don't use the output right now
         buffer = Buffer(chain.getOutputFormat())
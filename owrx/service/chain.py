@@ -1,5 +1,6 @@
 from csdr.chain import Chain
 from csdr.chain.selector import Selector
+from csdr.chain.channelizer import Channelizer
 from csdr.chain.demodulator import BaseDemodulatorChain, ServiceDemodulator
 from pycsdr.types import Format
 
@@ -21,3 +22,6 @@ class ServiceDemodulatorChain(Chain):
 
     def setBandPass(self, lowCut, highCut):
         self.selector.setBandpass(lowCut, highCut)
+
+    def setChannelizer(self, channelizer: Channelizer) -> None:
+        self.selector.setChannelizer(channelizer)
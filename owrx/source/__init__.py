@@ -21,6 +21,7 @@ from owrx.feature import FeatureDetector
 from typing import List
 from enum import Enum
 
+from csdr.chain.channelizer import Channelizer
 from pycsdr.modules import TcpSource, Buffer
 from pycsdr.types import Format
 
@@ -114,6 +115,7 @@ class SdrSource(ABC):
         self.commandMapper = None
         self.tcpSource = None
         self.buffer = None
+        self.channelizer = None
 
         self.props = PropertyStack()
         self.profileCarousel = SdrProfileCarousel(props)
@@ -305,6 +307,14 @@ class SdrSource(ABC):
             self._getTcpSource().setWriter(self.buffer)
         return self.buffer
 
+    def getChannelizer(self):
+        """
+        Returns the channelizer that all selectors reading from this source should share.
+        """
+        if self.channelizer is None:
+            self.channelizer = Channelizer(self.getBuffer())
+        return self.channelizer
+
     def getCommandValues(self):
         dict = self.sdrProps.__dict__()
         if "lfo_offset" in dict and dict["lfo_offset"] is not None:
@@ -453,6 +463,9 @@ class SdrSource(ABC):
                 self.tcpSource.stop()
                 self.tcpSource = None
                 self.buffer = None
+            if self.channelizer is not None:
+                self.channelizer.stop()
+                self.channelizer = None
 
     def shutdown(self):
         self.stop()
@@ -522,8 +535,13 @@ class SdrSource(ABC):
                 self.spectrumThread = None
 
     def writeSpectrumData(self, data):
-        for c in self.spectrumClients:
-            c.write_spectrum_data(data)
+        clients = list(self.spectrumClients)
+        if not clients:
+            return
+        # the websocket frame is built only once, all clients share the same immutable buffer
+        frame = clients[0].encode_spectrum_data(data)
+        for c in clients:
+            c.write_spectrum_data(frame)
 
     def getState(self) -> SdrSourceState:
         return self.state
@@ -1,10 +1,10 @@
 from owrx.storage import Storage
 from csdr.module import ThreadModule
+from owrx.message import Message
+from owrx.framer import Framer
 from pycsdr.types import Format
 from datetime import datetime
 import base64
-import pickle
-import os
 
 import logging
 
@@ -61,7 +61,7 @@ class SstvParser(ThreadModule):
         self.service   = service
         self.frequency = 0
         self.file      = None
-        self.data      = bytearray(b'')
+        self.data      = Framer()
         self.width     = 0
         self.height    = 0
         self.line      = 0
@@ -80,7 +80,7 @@ class SstvParser(ThreadModule):
                 self.file = None
                 if self.height==0 or self.line<self.height:
                     logger.debug("Deleting short bitmap file '%s'." % self.fileName)
-                    os.unlink(self.fileName)
+                    Storage().deleteFile(self.fileName)
                 else:
                     # Convert file from BMP to PNG
                     logger.debug("Converting '%s' to PNG..." % self.fileName)
@@ -99,6 +99,7 @@ class SstvParser(ThreadModule):
             self.fileName = Storage().getFilePath(fileName + ".bmp")
             logger.debug("Opening bitmap file '%s'..." % self.fileName)
             self.file = open(self.fileName, "wb")
+            Storage().storeFile(self.fileName, True)
 
         except Exception as exptn:
             logger.debug("Exception opening file: %s" % str(exptn))
@@ -138,13 +139,13 @@ class SstvParser(ThreadModule):
                 self.doRun = False
                 break
             # Add read data to the buffer
-            self.data = self.data + inp.tobytes()
+            self.data.append(inp)
             # Process buffer contents
             out = self.process()
             # Keep processing while there is input to parse
             while out is not None:
                 if len(out)>0:
-                    self.writer.write(pickle.dumps(out))
+                    self.writer.write(Message.encode(out))
                 out = self.process()
 
     def process(self):
@@ -156,12 +157,14 @@ class SstvParser(ThreadModule):
             if self.width>0:
                 w = self.width * 3
                 if len(self.data)>=w:
+                    # Remove scanline from input
+                    pixels = self.data.take(w)
                     # Advance scanline
                     self.line = self.line + 1
                     # If running as a service...
                     if self.service:
                         # Write a scanline into open image file
-                        self.writeFile(self.data[0:w])
+                        self.writeFile(pixels)
                         # Close once the last scanline reached
                         if self.line>=self.height:
                             self.closeFile()
@@ -171,7 +174,7 @@ class SstvParser(ThreadModule):
                         # Compose result
                         out = {
                             "mode":   "SSTV",
-                            "pixels": base64.b64encode(self.data[0:w]).decode(),
+                            "pixels": base64.b64encode(pixels).decode(),
                             "line":   self.line-1,
                             "width":  self.width,
                             "height": self.height
@@ -182,8 +185,6 @@ class SstvParser(ThreadModule):
                         self.height = 0
                         self.line   = 0
                         self.mode   = 0
-                    # Remove parsed data
-                    del self.data[0:w]
 
             else:
                 # Search for the leading 'BM' or ' ['
@@ -192,17 +193,15 @@ class SstvParser(ThreadModule):
                 # If not found...
                 if w<0 and d<0:
                     # Skip all but last character (may have 'B')
-                    del self.data[0:len(self.data)-1]
+                    self.data.skip(len(self.data)-1)
                 elif w<0 or (d>=0 and d<w):
                     # Skip everything until ' ['
-                    del self.data[0:d]
+                    self.data.skip(d)
                     # Look for the closing bracket
                     w = self.data.find(b']')
                     if w>=0:
-                        # Extract message contents
-                        msg = self.data[2:w].decode()
-                        # Remove parsed data
-                        del self.data[0:w+1]
+                        # Remove parsed data, extract message contents
+                        msg = self.data.take(w+1)[2:w].decode()
                         # Log message
                         logger.debug("%s says [%s]" % (self.myName(), msg))
                         # If running as a service...
@@ -218,7 +217,7 @@ class SstvParser(ThreadModule):
                             }
                 else:
                     # Skip everything until 'BM'
-                    del self.data[0:w]
+                    self.data.skip(w)
                     # If got the entire header...
                     if len(self.data)>=54:
                         self.width  = self.data[18] + (self.data[19]<<8) + (self.data[20]<<16) + (self.data[21]<<24)
@@ -227,6 +226,8 @@ class SstvParser(ThreadModule):
                         self.height = 0x100000000 - self.height
                         # SSTV mode is passed via reserved area at offset 6
                         self.mode   = self.data[6]
+                        # Remove parsed data
+                        header = self.data.take(54)
                         self.line   = 0
                         # Find mode name and time
                         modeName  = modeNames.get(self.mode) if self.mode in modeNames else "Unknown Mode %d" % self.mode
@@ -240,7 +241,7 @@ class SstvParser(ThreadModule):
                         if self.service:
                             # Create a new image file and write BMP header
                             self.newFile(fileName)
-                            self.writeFile(self.data[0:54])
+                            self.writeFile(header)
                             # Empty result
                             out = {}
                         else:
@@ -254,8 +255,6 @@ class SstvParser(ThreadModule):
                                 "filename":  fileName,
                                 "frequency": self.frequency
                             }
-                        # Remove parsed data
-                        del self.data[0:54]
 
         except Exception as exptn:
             logger.debug("%s: Exception parsing: %s" % (self.myName(), str(exptn)))
@@ -1,8 +1,10 @@
 from owrx.config.core import CoreConfig
 from owrx.config import Config
 from datetime import datetime
+from bisect import bisect_left, insort
 
 import subprocess
+import threading
 import os
 import re
 
@@ -30,26 +32,42 @@ class Storage(object):
     def getFilePath(self, filename: str):
         return os.path.join(CoreConfig().get_temporary_directory(), filename)
 
-    # Get list of stored files, sorted in reverse alphabetic order
-    # (so that newer files appear first)
-    def getStoredFiles(self):
-        dir = CoreConfig().get_temporary_directory()
-        files = [os.path.join(dir, f) for f in os.listdir(dir) if re.match(self.filePattern, f)]
-        files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-        return [os.path.basename(f) for f in files]
+    # Get list of stored files, sorted by modification time in
+    # reverse order (so that newer files appear first), optionally
+    # skipping <offset> newest files and returning at most <limit>
+    def getStoredFiles(self, offset: int = 0, limit: int = None):
+        return FileIndex.getSharedInstance().list(offset, limit)
 
-    # Delete all stored files except for <keep_files> newest ones
+    # Get number of stored files
+    def countStoredFiles(self):
+        return len(FileIndex.getSharedInstance())
+
+    # Add a stored file to the index, or update its size once it has
+    # been written. Files that are still open are never cleaned up.
+    def storeFile(self, filePath: str, isOpen: bool = False):
+        FileIndex.getSharedInstance().add(os.path.basename(filePath), isOpen)
+
+    # Delete a stored file and remove it from the index
+    def deleteFile(self, filePath: str):
+        FileIndex.getSharedInstance().remove(os.path.basename(filePath))
+        try:
+            os.unlink(filePath)
+        except Exception as e:
+            logger.debug("deleteFile(): " + str(e))
+
+    # Delete oldest stored files until no more than <keep_files> are
+    # left, and they take no more than <keep_files_size> megabytes
     def cleanStoredFiles(self):
-        pm    = Config.get()
-        keep  = pm["keep_files"]
-        dir   = CoreConfig().get_temporary_directory()
-        files = [os.path.join(dir, f) for f in os.listdir(dir) if re.match(self.filePattern, f)]
-        files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-
-        for f in files[keep:]:
-            logger.debug("Deleting stored file '%s'." % os.path.basename(f))
+        pm       = Config.get()
+        keep     = pm["keep_files"]
+        maxBytes = pm["keep_files_size"] * 1024 * 1024
+
+        index    = FileIndex.getSharedInstance()
+
+        for f in index.expire(keep, maxBytes):
+            logger.debug("Deleting stored file '%s'." % f)
             try:
-                os.unlink(f)
+                os.unlink(os.path.join(index.directory, f))
             except Exception as e:
                 logger.debug("cleanStoredFiles(): " + str(e))
 
@@ -66,6 +84,123 @@ class Storage(object):
             params = ['convert', inFile, outFile]
             subprocess.check_call(params)
             # If conversion was successful, delete original file
-            os.unlink(inFile)
+            self.deleteFile(inFile)
+            self.storeFile(outFile)
         except Exception as e:
             logger.debug("convertImage(): " + str(e))
+            # Keep the original file otherwise
+            self.storeFile(inFile)
+
+
+class FileIndex(object):
+    """
+    Index of the stored files, seeded from the storage directory once and then kept up to date as files are created
+    and deleted, so that listing and cleaning up the files does not need to scan the directory and stat every file.
+
+    Files are sorted by modification time, oldest first, so finding a file is a bisection and the files to clean up
+    are taken from the front.
+    """
+
+    sharedInstance = None
+    creationLock = threading.Lock()
+
+    @staticmethod
+    def getSharedInstance():
+        with FileIndex.creationLock:
+            if FileIndex.sharedInstance is None:
+                FileIndex.sharedInstance = FileIndex(
+                    CoreConfig().get_temporary_directory(), Storage().getNamePattern()
+                )
+        return FileIndex.sharedInstance
+
+    def __init__(self, directory: str, pattern: str):
+        self.directory = directory
+        self.pattern = re.compile(pattern)
+        self.lock = threading.Lock()
+        # (modification time, file name), sorted
+        self.keys = []
+        # file name -> (key, size)
+        self.files = {}
+        # files that are still being written
+        self.open = set()
+        self.size = 0
+        self._seed()
+
+    def _seed(self):
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if self.pattern.match(entry.name) and entry.is_file():
+                        stat = entry.stat()
+                        self.files[entry.name] = ((stat.st_mtime, entry.name), stat.st_size)
+                        self.size += stat.st_size
+        except OSError as e:
+            logger.warning("could not index stored files: %s", str(e))
+        self.keys = sorted(key for key, _ in self.files.values())
+        logger.debug("indexed %i stored files", len(self.keys))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def add(self, name: str, isOpen: bool = False) -> None:
+        try:
+            stat = os.stat(os.path.join(self.directory, name))
+        except OSError:
+            self.remove(name)
+            return
+        key = (stat.st_mtime, name)
+        with self.lock:
+            self._remove(name)
+            # new files are the newest ones, so this is usually an append
+            if not self.keys or key > self.keys[-1]:
+                self.keys.append(key)
+            else:
+                insort(self.keys, key)
+            self.files[name] = (key, stat.st_size)
+            self.size += stat.st_size
+            if isOpen:
+                self.open.add(name)
+
+    def remove(self, name: str) -> None:
+        with self.lock:
+            self._remove(name)
+
+    def _remove(self, name: str) -> None:
+        self.open.discard(name)
+        if name not in self.files:
+            return
+        key, size = self.files.pop(name)
+        del self.keys[bisect_left(self.keys, key)]
+        self.size -= size
+
+    def list(self, offset: int = 0, limit: int = None) -> list:
+        """
+        Returns file names, newest first.
+        """
+        with self.lock:
+            end = len(self.keys) - max(offset, 0)
+            start = 0 if limit is None else end - limit
+            return [name for _, name in reversed(self.keys[max(start, 0) : max(end, 0)])]
+
+    def expire(self, maxCount: int, maxBytes: int = 0) -> list:
+        """
+        Removes the oldest files from the index until there are no more than maxCount files left, taking no more than
+        maxBytes (unless maxBytes is 0), and returns their names. Files that are still open are kept.
+        """
+        with self.lock:
+            count = len(self.keys)
+            expired = []
+            kept = []
+            index = 0
+            while index < len(self.keys) and (count > maxCount or 0 < maxBytes < self.size):
+                key = self.keys[index]
+                index += 1
+                if key[1] in self.open:
+                    kept.append(key)
+                    continue
+                _, size = self.files.pop(key[1])
+                self.size -= size
+                count -= 1
+                expired.append(key[1])
+            self.keys[0:index] = kept
+            return expired
@@ -3,9 +3,10 @@ from owrx.aprs import getSymbolData
 from owrx.storage import Storage
 from owrx.config import Config
 from csdr.module import ThreadModule
+from owrx.message import Message, MessageTypes
+from owrx.framer import Framer
 from pycsdr.types import Format
 from datetime import datetime
-import pickle
 import os
 import re
 import json
@@ -25,7 +26,7 @@ class TextParser(ThreadModule):
         ]
         self.service   = service
         self.frequency = 0
-        self.data      = bytearray(b'')
+        self.data      = Framer()
         self.filePfx   = filePrefix
         self.file      = None
         self.maxLines  = 10000
@@ -43,6 +44,8 @@ class TextParser(ThreadModule):
                 logger.debug("Closing log file '%s'." % self.fileName)
                 self.file.close()
                 self.file = None
+                # Update file size in storage index
+                Storage().storeFile(self.fileName)
                 # Delete excessive files from storage
                 logger.debug("Performing storage cleanup...")
                 Storage().cleanStoredFiles()
@@ -57,6 +60,7 @@ class TextParser(ThreadModule):
             self.fileName = Storage().getFilePath(fileName + ".txt")
             logger.debug("Opening log file '%s'..." % self.fileName)
             self.file = open(self.fileName, "wb")
+            Storage().storeFile(self.fileName, True)
             self.cntLines = 0
 
         except Exception as exptn:
@@ -136,51 +140,39 @@ class TextParser(ThreadModule):
                 self.doRun = False
                 break
             # Add read data to the buffer
-            self.data = self.data + inp.tobytes()
-            # Process buffer contents
-            out = self.process()
-            # Keep processing while there is input to parse
-            while out is not None:
-                if len(out)>0:
-                    if isinstance(out, bytes):
-                        self.writer.write(out)
-                    elif isinstance(out, str):
-                        self.writer.write(bytes(out, 'utf-8'))
+            self.data.append(inp)
+            # Process all complete lines at once
+            for line in self.data.lines():
+                out = self.process(line)
+                if out is not None and len(out)>0:
+                    if isinstance(out, (bytes, str)):
+                        self.writer.write(Message.encode(out, MessageTypes.text))
                     else:
-                        self.writer.write(pickle.dumps(out))
-                out = self.process()
+                        self.writer.write(Message.encode(out))
 
-    def process(self):
+    def process(self, line: bytes):
         # No result yet
         out = None
 
-        # Search for end-of-line
-        eol = self.data.find(b'\n')
-
-        # If found end-of-line...
-        if eol>=0:
-            try:
-                msg = self.data[0:eol].decode(encoding="utf-8", errors="replace")
-                logger.debug("%s: %s" % (self.myName(), msg))
-                # If running as a service...
-                if self.service:
-                    # Write message into open log file, including end-of-line
-                    self.writeFile(self.data[0:eol+1])
-                    # Optionally, parse and report location
-                    self.updateLocation(msg)
-                    # Empty result
-                    out = {}
-                else:
-                    # Let parse() function do its thing
-                    out = self.parse(msg)
-
-            except Exception as exptn:
-                logger.debug("%s: Exception parsing: %s" % (self.myName(), str(exptn)))
+        try:
+            msg = line.decode(encoding="utf-8", errors="replace")
+            logger.debug("%s: %s" % (self.myName(), msg))
+            # If running as a service...
+            if self.service:
+                # Write message into open log file, including end-of-line
+                self.writeFile(line + b'\n')
+                # Optionally, parse and report location
+                self.updateLocation(msg)
+                # Empty result
+                out = {}
+            else:
+                # Let parse() function do its thing
+                out = self.parse(msg)
 
-            # Remove parsed message from input, including end-of-line
-            del self.data[0:eol+1]
+        except Exception as exptn:
+            logger.debug("%s: Exception parsing: %s" % (self.myName(), str(exptn)))
 
-        # Return parsed result or None if no result yet
+        # Return parsed result or None if nothing to report
         return out
 
 
@@ -1,5 +1,11 @@
-from distutils.version import LooseVersion
-
 _versionstring = "1.2.23"
-looseversion = LooseVersion(_versionstring)
-openwebrx_version = "v{0}".format(looseversion)
+openwebrx_version = "v{0}".format(_versionstring)
+
+
+def __getattr__(name):
+    # distutils is slow to import, and only setup.py needs the parsed version
+    if name == "looseversion":
+        from distutils.version import LooseVersion
+
+        return LooseVersion(_versionstring)
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
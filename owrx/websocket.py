@@ -1,10 +1,14 @@
 from owrx.jsons import Encoder
+from owrx.metrics import Metrics, CounterMetric, DirectMetric
 import base64
 import hashlib
 import json
 from multiprocessing import Pipe
 import select
+import socket
+import ssl
 import threading
+import zlib
 from abc import ABC, abstractmethod
 
 import logging
@@ -17,6 +21,9 @@ OPCODE_CLOSE = 0x08
 OPCODE_PING = 0x09
 OPCODE_PONG = 0x0A
 
+# messages from clients are small, anything larger than this (after inflating) is refused
+MAX_MESSAGE_SIZE = 1024 * 1024
+
 
 class WebSocketException(IOError):
     pass
@@ -30,6 +37,48 @@ class Drained(WebSocketException):
     pass
 
 
+class ProtocolError(WebSocketException):
+    # close status code, RFC 6455 section 7.4.1
+    code = 1002
+
+
+class MessageTooBig(ProtocolError):
+    code = 1009
+
+
+class WebSocketMetrics(object):
+    sharedInstance = None
+    creationLock = threading.Lock()
+
+    @staticmethod
+    def getSharedInstance():
+        with WebSocketMetrics.creationLock:
+            if WebSocketMetrics.sharedInstance is None:
+                WebSocketMetrics.sharedInstance = WebSocketMetrics()
+        return WebSocketMetrics.sharedInstance
+
+    def __init__(self):
+        metrics = Metrics.getSharedInstance()
+        self.bytesCounter = CounterMetric()
+        metrics.addMetric("websocket.sent.bytes", self.bytesCounter)
+        self.framesCounter = CounterMetric()
+        metrics.addMetric("websocket.sent.frames", self.framesCounter)
+        self.syscallCounter = CounterMetric()
+        metrics.addMetric("websocket.sent.syscalls", self.syscallCounter)
+        self.blockedCounter = CounterMetric()
+        metrics.addMetric("websocket.sent.blocked", self.blockedCounter)
+        self.deflateInCounter = CounterMetric()
+        metrics.addMetric("websocket.deflate.in", self.deflateInCounter)
+        self.deflateOutCounter = CounterMetric()
+        metrics.addMetric("websocket.deflate.out", self.deflateOutCounter)
+        metrics.addMetric("websocket.deflate.ratio", DirectMetric(self.getCompressionRatio))
+
+    def getCompressionRatio(self):
+        if not self.deflateInCounter.counter:
+            return 1.0
+        return self.deflateOutCounter.counter / self.deflateInCounter.counter
+
+
 class Handler(ABC):
     @abstractmethod
     def handleTextMessage(self, connection, message: str):
@@ -44,52 +93,68 @@ class Handler(ABC):
         pass
 
 
-class WebSocketConnection(object):
-    connections = []
+class Frame(object):
+    """
+    A websocket message, encoded once into its wire format.
 
-    @staticmethod
-    def closeAll():
-        for c in WebSocketConnection.connections:
-            try:
-                c.close()
-            except:
-                logger.exception("exception while shutting down websocket connections")
+    Frames are immutable, so the same frame can be handed to any number of connections.
+    """
 
-    def __init__(self, handler, messageHandler: Handler):
-        self.handler = handler
-        self.handler.connection.setblocking(0)
-        self.messageHandler = None
-        self.setMessageHandler(messageHandler)
-        (self.interruptPipeRecv, self.interruptPipeSend) = Pipe(duplex=False)
-        self.open = True
-        self.socketError = False
-        self.sendLock = threading.Lock()
+    __slots__ = ["opcode", "header", "payload", "deflated"]
 
-        headers = {key.lower(): value for key, value in self.handler.headers.items()}
-        if "upgrade" not in headers:
-            raise WebSocketException("Upgrade header not found")
-        if headers["upgrade"].lower() != "websocket":
-            raise WebSocketException("Upgrade header does not contain expected value")
-        if "sec-websocket-key" not in headers:
-            raise WebSocketException("Websocket key not provided")
+    def __init__(self, data):
+        # convenience
+        if type(data) == dict:
+            # allow_nan = False disallows NaN and Infinty to be encoded. Browser JSON will not parse them anyway.
+            data = json.dumps(data, allow_nan=False, cls=Encoder)
 
-        ws_key = headers["sec-websocket-key"]
-        shakey = hashlib.sha1()
-        shakey.update("{ws_key}258EAFA5-E914-47DA-95CA-C5AB0DC85B11".format(ws_key=ws_key).encode())
-        ws_key_toreturn = base64.b64encode(shakey.digest())
-        self.handler.wfile.write(
-            "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\nSec-WebSocket-Accept: {0}\r\nCQ-CQ-de: HA5KFU\r\n\r\n".format(
-                ws_key_toreturn.decode()
-            ).encode()
-        )
-        self.pingTimer = None
-        self.resetPing()
+        # string-type messages are sent as text frames
+        if type(data) == str:
+            self.payload = memoryview(data.encode("utf-8"))
+            self.opcode = OPCODE_TEXT_MESSAGE
+        # anything else as binary
+        else:
+            self.payload = memoryview(data).cast("B")
+            self.opcode = OPCODE_BINARY_MESSAGE
 
-    def setMessageHandler(self, messageHandler: Handler):
-        self.messageHandler = messageHandler
+        self.header = Frame.get_header(self.payload.nbytes, self.opcode)
+        self.deflated = None
 
-    def get_header(self, size, opcode):
+    @staticmethod
+    def text(data: bytes) -> "Frame":
+        """
+        Creates a text frame from data that is UTF-8 encoded already.
+        """
+        frame = Frame.__new__(Frame)
+        frame.opcode = OPCODE_TEXT_MESSAGE
+        frame.payload = memoryview(data).cast("B")
+        frame.header = Frame.get_header(frame.payload.nbytes, frame.opcode)
+        frame.deflated = None
+        return frame
+
+    def getDeflated(self, windowBits: int) -> "Frame":
+        # since the compressor does not keep any context, the compressed frame can be shared, too
+        if self.deflated is not None and self.deflated[0] == windowBits:
+            return self.deflated[1]
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -windowBits)
+        data = compressor.compress(self.payload) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        # RFC 7692 section 7.2.1: remove the empty block at the end
+        if data[-4:] == b"\x00\x00\xff\xff":
+            data = data[:-4]
+        frame = Frame.__new__(Frame)
+        frame.opcode = self.opcode
+        frame.payload = memoryview(data)
+        frame.header = Frame.get_header(frame.payload.nbytes, self.opcode, compressed=True)
+        frame.deflated = None
+        self.deflated = (windowBits, frame)
+        return frame
+
+    @staticmethod
+    def get_header(size, opcode, compressed=False):
         ws_first_byte = 0b10000000 | (opcode & 0x0F)
+        if compressed:
+            # RSV1 marks compressed messages
+            ws_first_byte |= 0b01000000
         if size > 2 ** 16 - 1:
             # frame size can be increased up to 2^64 by setting the size to 127
             # anything beyond that would need to be segmented into frames. i don't really think we'll need more.
@@ -114,53 +179,196 @@ class WebSocketConnection(object):
             # 125 bytes binary message in a single unmasked frame
             return bytes([ws_first_byte, size])
 
-    def send(self, data):
-        # convenience
-        if type(data) == dict:
-            # allow_nan = False disallows NaN and Infinty to be encoded. Browser JSON will not parse them anyway.
-            data = json.dumps(data, allow_nan=False, cls=Encoder)
 
-        # string-type messages are sent as text frames
-        if type(data) == str:
-            header = self.get_header(len(data), OPCODE_TEXT_MESSAGE)
-            data_to_send = header + data.encode("utf-8")
-        # anything else as binary
-        else:
-            header = self.get_header(len(data), OPCODE_BINARY_MESSAGE)
-            data_to_send = header + data
+class PerMessageDeflate(object):
+    """
+    RFC 7692 permessage-deflate extension.
+
+    Only text (JSON) messages are compressed, binary messages carry audio and FFT data that is already compressed (or
+    doesn't compress well). The server does not keep a compression context across messages, so compressed frames can be
+    shared between connections the same way uncompressed ones are.
+    """
+
+    # text messages smaller than this are not worth the effort
+    minSize = 128
+
+    @staticmethod
+    def negotiate(requestHeaders):
+        """
+        Returns a PerMessageDeflate instance if the client has offered an acceptable configuration, None otherwise.
+        """
+        extensions = ",".join(v for k, v in requestHeaders.items() if k.lower() == "sec-websocket-extensions")
+        for offer in extensions.split(","):
+            params = [p.strip() for p in offer.split(";")]
+            if params[0] != "permessage-deflate":
+                continue
+            windowBits = 15
+            acceptable = True
+            for param in params[1:]:
+                (key, _, value) = param.partition("=")
+                key = key.strip()
+                value = value.strip().strip('"')
+                if key == "server_max_window_bits":
+                    # zlib does not support a window size of 2^8 for raw deflate streams
+                    if not value.isdigit() or not 9 <= int(value) <= 15:
+                        acceptable = False
+                    else:
+                        windowBits = int(value)
+                elif key not in ["server_no_context_takeover", "client_no_context_takeover", "client_max_window_bits"]:
+                    acceptable = False
+            if acceptable:
+                return PerMessageDeflate(windowBits)
+        return None
+
+    def __init__(self, windowBits: int = 15):
+        self.windowBits = windowBits
+        # the client may keep its context, so inbound messages need a persistent decompressor
+        self.decompressor = zlib.decompressobj(-15)
+        self.metrics = WebSocketMetrics.getSharedInstance()
+
+    def getResponseHeader(self) -> str:
+        response = "permessage-deflate; server_no_context_takeover"
+        if self.windowBits < 15:
+            response += "; server_max_window_bits={0}".format(self.windowBits)
+        return response
+
+    def compress(self, frame: Frame) -> Frame:
+        if frame.opcode != OPCODE_TEXT_MESSAGE or frame.payload.nbytes < PerMessageDeflate.minSize:
+            return frame
+        deflated = frame.getDeflated(self.windowBits)
+        self.metrics.deflateInCounter.inc(frame.payload.nbytes)
+        self.metrics.deflateOutCounter.inc(deflated.payload.nbytes)
+        return deflated
+
+    def decompress(self, data: bytes) -> bytes:
+        data = self.decompressor.decompress(data + b"\x00\x00\xff\xff", MAX_MESSAGE_SIZE)
+        if self.decompressor.unconsumed_tail:
+            raise MessageTooBig("inflated message exceeds {0} bytes".format(MAX_MESSAGE_SIZE))
+        return data
+
+    @staticmethod
+    def inflate(deflate: "PerMessageDeflate", data: bytes) -> bytes:
+        """
+        Decompresses a message that has been marked as compressed, on a connection that may not have negotiated it.
+        """
+        if deflate is None:
+            raise ProtocolError("compressed message, but compression has not been negotiated")
+        return deflate.decompress(data)
+
+
+class WebSocketConnection(object):
+    connections = []
+
+    @staticmethod
+    def closeAll():
+        for c in WebSocketConnection.connections:
+            try:
+                c.close()
+            except:
+                logger.exception("exception while shutting down websocket connections")
+
+    @staticmethod
+    def getHandshakeResponse(requestHeaders, deflate: PerMessageDeflate = None) -> bytes:
+        headers = {key.lower(): value for key, value in requestHeaders.items()}
+        if "upgrade" not in headers:
+            raise WebSocketException("Upgrade header not found")
+        if headers["upgrade"].lower() != "websocket":
+            raise WebSocketException("Upgrade header does not contain expected value")
+        if "sec-websocket-key" not in headers:
+            raise WebSocketException("Websocket key not provided")
 
-        self._sendBytes(data_to_send)
+        ws_key = headers["sec-websocket-key"]
+        shakey = hashlib.sha1()
+        shakey.update("{ws_key}258EAFA5-E914-47DA-95CA-C5AB0DC85B11".format(ws_key=ws_key).encode())
+        ws_key_toreturn = base64.b64encode(shakey.digest())
+        extensions = ""
+        if deflate is not None:
+            extensions = "Sec-WebSocket-Extensions: {0}\r\n".format(deflate.getResponseHeader())
+        return "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\nSec-WebSocket-Accept: {0}\r\n{1}CQ-CQ-de: HA5KFU\r\n\r\n".format(
+            ws_key_toreturn.decode(), extensions
+        ).encode()
 
-    def _sendBytes(self, data_to_send):
-        def chunks(input, n):
-            """Yield successive n-sized chunks from input."""
-            for i in range(0, len(input), n):
-                yield input[i: i + n]
+    def __init__(self, handler, messageHandler: Handler):
+        self.handler = handler
+        self.socket = self.handler.connection
+        self.socket.setblocking(0)
+        # SSL sockets do not implement sendmsg(), so buffers have to be joined before they are sent
+        self.vectored = hasattr(socket.socket, "sendmsg") and not isinstance(self.socket, ssl.SSLSocket)
+        self.metrics = WebSocketMetrics.getSharedInstance()
+        self.messageHandler = None
+        self.setMessageHandler(messageHandler)
+        (self.interruptPipeRecv, self.interruptPipeSend) = Pipe(duplex=False)
+        self.open = True
+        self.socketError = False
+        # status code for the close frame, if the connection is closed because of the client
+        self.closeCode = None
+        self.sendLock = threading.Lock()
+
+        self.deflate = PerMessageDeflate.negotiate(self.handler.headers)
+        self.handler.wfile.write(WebSocketConnection.getHandshakeResponse(self.handler.headers, self.deflate))
+        self.pingTimer = None
+        self.resetPing()
 
+    def setMessageHandler(self, messageHandler: Handler):
+        self.messageHandler = messageHandler
+
+    def get_header(self, size, opcode):
+        return Frame.get_header(size, opcode)
+
+    def send(self, data):
+        if not isinstance(data, Frame):
+            data = Frame(data)
+        if self.deflate is not None:
+            data = self.deflate.compress(data)
+        # header and payload are handed to the socket separately, so the payload never has to be copied
+        self._sendBytes(data.header, data.payload)
+
+    def _sendBytes(self, *buffers):
         with self.sendLock:
             if self.socketError:
                 logger.warning("_sendBytes() after socket error, ignoring")
-            else:
-                try:
-                    for chunk in chunks(data_to_send, 1024):
-                        (_, write, _) = select.select([], [self.handler.wfile], [], 10)
-                        if self.handler.wfile in write:
-                            written = self.handler.wfile.write(chunk)
-                            if written != len(chunk):
-                                logger.error("incomplete write! closing socket!")
-                                self.close(socketError=True)
-                                break
+                return
+
+            views = [memoryview(b).cast("B") for b in buffers]
+            size = sum(v.nbytes for v in views)
+            if not self.vectored and len(views) > 1:
+                views = [memoryview(b"".join(views))]
+
+            try:
+                while views:
+                    try:
+                        if self.vectored:
+                            written = self.socket.sendmsg(views)
                         else:
+                            written = self.socket.send(views[0])
+                        self.metrics.syscallCounter.inc()
+                    except (BlockingIOError, ssl.SSLWantWriteError):
+                        # only wait for the socket if it cannot take any more data right now
+                        self.metrics.blockedCounter.inc()
+                        (_, write, _) = select.select([], [self.socket], [], 10)
+                        if self.socket not in write:
                             logger.debug("socket not returned from select; closing")
                             self.close(socketError=True)
-                            break
-                # these exception happen when the socket is closed
-                except OSError:
-                    logger.exception("OSError while writing data")
-                    self.close(socketError=True)
-                except ValueError:
-                    logger.exception("ValueError while writing data")
-                    self.close(socketError=True)
+                            return
+                        continue
+
+                    # advance over whatever the kernel has accepted
+                    while views and written >= views[0].nbytes:
+                        written -= views.pop(0).nbytes
+                    if written:
+                        views[0] = views[0][written:]
+            # these exception happen when the socket is closed
+            except OSError:
+                logger.exception("OSError while writing data")
+                self.close(socketError=True)
+                return
+            except ValueError:
+                logger.exception("ValueError while writing data")
+                self.close(socketError=True)
+                return
+
+            self.metrics.framesCounter.inc()
+            self.metrics.bytesCounter.inc(size)
 
     def interrupt(self):
         if self.interruptPipeSend is None:
@@ -183,8 +391,10 @@ class WebSocketConnection(object):
             else:
                 logger.debug("websocket loop ended; sending close frame")
 
-                header = self.get_header(0, OPCODE_CLOSE)
-                self._sendBytes(header)
+                if self.closeCode is None:
+                    self._sendBytes(self.get_header(0, OPCODE_CLOSE))
+                else:
+                    self._sendBytes(self.get_header(2, OPCODE_CLOSE), self.closeCode.to_bytes(2, "big"))
 
             try:
                 WebSocketConnection.connections.remove(self)
@@ -210,6 +420,7 @@ class WebSocketConnection(object):
                     try:
                         header = protected_read(2)
                         opcode = header[0] & 0x0F
+                        compressed = header[0] & 0x40
                         length = header[1] & 0x7F
                         mask = (header[1] & 0x80) >> 7
                         if length == 126:
@@ -221,6 +432,8 @@ class WebSocketConnection(object):
                             data = bytes([b ^ masking_key[index % 4] for (index, b) in enumerate(data)])
                         else:
                             data = protected_read(length)
+                        if compressed:
+                            data = PerMessageDeflate.inflate(self.deflate, data)
                         if opcode == OPCODE_TEXT_MESSAGE:
                             message = data.decode("utf-8")
                             try:
@@ -248,6 +461,10 @@ class WebSocketConnection(object):
                         logger.warning("incomplete read on websocket; closing connection")
                         self.socketError = True
                         self.open = False
+                    except ProtocolError as e:
+                        logger.warning("%s; closing connection", e)
+                        self.closeCode = e.code
+                        self.open = False
                     except OSError:
                         logger.exception("OSError while reading data; closing connection")
                         self.socketError = True
@@ -37,6 +37,10 @@ class WsjtProfile(AudioChopperProfile, metaclass=ABCMeta):
     def getFileTimestampFormat(self):
         return "%y%m%d_" + self.getTimestampFormat()
 
+    def supportsBatching(self):
+        # jt9 decodes all the files it is given in sequence
+        return True
+
     @abstractmethod
     def getMode(self):
         pass
@@ -128,6 +132,10 @@ class WsprProfile(WsjtProfile):
         cmd += [file]
         return cmd
 
+    def supportsBatching(self):
+        # wsprd only accepts a single file
+        return False
+
     def getMode(self):
         return "WSPR"
 
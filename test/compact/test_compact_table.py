@@ -0,0 +1,118 @@
+from unittest import TestCase
+from owrx.compact import CompactTable
+import tempfile
+import struct
+import os
+
+
+class CompactTableTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.fileName = os.path.join(self.directory.name, "table.cache")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def roundTrip(self, rows):
+        CompactTable.store(self.fileName, rows)
+        return CompactTable.load(self.fileName)
+
+    def readFile(self):
+        with open(self.fileName, "rb") as f:
+            return bytearray(f.read())
+
+    def testRoundTrip(self):
+        rows = [
+            {"freq": 6000000, "name": "DW", "lat": 52.5, "days": "1234567"},
+            {"freq": 7000000, "name": "VOA", "lat": -10, "days": "12345.."},
+        ]
+        table = self.roundTrip(rows)
+        self.assertTrue(CompactTable.isCompact(self.fileName))
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table[1], rows[1])
+        self.assertEqual(table[-2], rows[0])
+        self.assertEqual(list(table), rows)
+        self.assertEqual(table[0:1], rows[0:1])
+        with self.assertRaises(IndexError):
+            table[2]
+
+    def testAbsentAndNone(self):
+        rows = [{"id": 1, "comment": "first"}, {"id": 2}, {"id": 3, "comment": None}]
+        table = self.roundTrip(rows)
+        # rows one by one, and all rows at once, take different paths
+        self.assertEqual([table[i] for i in range(3)], rows)
+        self.assertEqual(list(self.roundTrip(rows)), rows)
+        self.assertEqual(table.getColumn("comment"), ["first", None, None])
+
+    def testAbsentStrings(self):
+        rows = [{"id": 1, "url": "http://example.com/"}, {"id": 2}]
+        table = self.roundTrip(rows)
+        self.assertEqual(table[1], rows[1])
+        self.assertEqual(list(self.roundTrip(rows)), rows)
+
+    def testJsonAndBoolColumns(self):
+        rows = [
+            {"hops": ["WIDE1-1", "WIDE2-1"], "enabled": True, "attrs": {"a": 1}},
+            {"hops": [], "enabled": False, "attrs": {}},
+        ]
+        table = self.roundTrip(rows)
+        self.assertEqual(list(table), rows)
+        self.assertIs(table[0]["enabled"], True)
+        self.assertIs(self.roundTrip(rows)[1]["enabled"], False)
+
+    def testMixedNumbers(self):
+        rows = [{"value": 1}, {"value": 2.5}, {"value": -3}]
+        table = self.roundTrip(rows)
+        self.assertEqual(list(table), rows)
+        self.assertTrue(all(type(row["value"]) is float for row in table))
+
+    def testLargeInts(self):
+        rows = [{"value": 2**63}, {"value": 1}]
+        self.assertEqual(list(self.roundTrip(rows)), rows)
+
+    def testEmpty(self):
+        table = self.roundTrip([])
+        self.assertEqual(len(table), 0)
+        self.assertEqual(list(table), [])
+        self.assertEqual(table.getColumnNames(), [])
+
+    def testGetColumn(self):
+        rows = [{"freq": i * 1000, "name": "station {0}".format(i % 3), "lat": i / 2} for i in range(10)]
+        rows[4]["extra"] = [1, 2]
+        table = self.roundTrip(rows)
+        for name in ["freq", "name", "lat", "extra"]:
+            self.assertEqual(table.getColumn(name), [row.get(name) for row in rows])
+        # no rows have been materialized for that
+        self.assertFalse(any(table.isMaterialized(i) for i in range(len(table))))
+        self.assertEqual(list(table), rows)
+
+    def testRejectsWrongMagic(self):
+        self.roundTrip([{"id": 1}])
+        data = self.readFile()
+        data[0:4] = b"JSON"
+        with open(self.fileName, "wb") as f:
+            f.write(data)
+        self.assertFalse(CompactTable.isCompact(self.fileName))
+        with self.assertRaises(ValueError):
+            CompactTable(bytes(data))
+
+    def testRejectsWrongVersion(self):
+        self.roundTrip([{"id": 1}])
+        data = self.readFile()
+        struct.pack_into("=H", data, 4, CompactTable.version + 1)
+        with self.assertRaises(ValueError):
+            CompactTable(bytes(data))
+
+    def testRejectsWrongByteOrder(self):
+        self.roundTrip([{"id": 1}])
+        data = self.readFile()
+        struct.pack_into("=H", data, 6, 0x0201)
+        with self.assertRaises(ValueError):
+            CompactTable(bytes(data))
+
+    def testRejectsTruncatedFile(self):
+        self.roundTrip([{"id": i, "name": "station {0}".format(i)} for i in range(100)])
+        data = self.readFile()
+        for length in [0, 10, len(data) // 2, len(data) - 1]:
+            with self.assertRaises(ValueError):
+                CompactTable(bytes(data[:length]))
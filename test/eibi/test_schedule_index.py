@@ -0,0 +1,86 @@
+from unittest import TestCase
+from owrx.eibi import EIBI, ScheduleIndex
+from datetime import datetime
+
+
+def entry(freq: int, time1: int, time2: int, days: str = "1234567", src: str = "DW"):
+    return {"freq": freq, "time1": time1, "time2": time2, "days": days, "itu": "D", "src": src, "name": src}
+
+
+def minute(day: int, hhmm: int):
+    # day 0 is Monday
+    return day * ScheduleIndex.minutesPerDay + hhmm // 100 * 60 + hhmm % 100
+
+
+class ScheduleIndexTest(TestCase):
+    def testDaily(self):
+        index = ScheduleIndex([entry(6000000, 1200, 1300)])
+        self.assertEqual(len(index.findActive(5000000, 7000000, minute(2, 1230))), 1)
+        self.assertEqual(index.findActive(5000000, 7000000, minute(2, 1300)), [])
+        self.assertEqual(index.findActive(5000000, 7000000, minute(2, 1159)), [])
+
+    def testFrequencyRange(self):
+        schedule = [entry(7000000, 0, 0), entry(5000000, 0, 0), entry(6000000, 0, 0)]
+        index = ScheduleIndex(schedule)
+        found = index.findActive(5500000, 7000000, minute(0, 1200))
+        self.assertEqual([e["freq"] for e in found], [6000000, 7000000])
+        self.assertEqual(index.findActive(7500000, 8000000, minute(0, 1200)), [])
+
+    def testWrapPastMidnight(self):
+        index = ScheduleIndex([entry(6000000, 2300, 100, "..3....")])
+        self.assertEqual(len(index.findActive(0, 10000000, minute(2, 2330))), 1)
+        self.assertEqual(len(index.findActive(0, 10000000, minute(3, 30))), 1)
+        self.assertEqual(index.findActive(0, 10000000, minute(3, 100)), [])
+        self.assertEqual(index.findActive(0, 10000000, minute(2, 30)), [])
+
+    def testSundayIntoMonday(self):
+        index = ScheduleIndex([entry(6000000, 2200, 200, "......7")])
+        self.assertEqual(len(index.findActive(0, 10000000, minute(6, 2300))), 1)
+        self.assertEqual(len(index.findActive(0, 10000000, minute(0, 130))), 1)
+        self.assertEqual(index.findActive(0, 10000000, minute(0, 200)), [])
+        self.assertEqual(index.findActive(0, 10000000, minute(5, 2300)), [])
+
+    def testDayMasks(self):
+        schedule = [entry(6000000, 1200, 1300, "1.3.5.."), entry(6100000, 1200, 1300, ".....67")]
+        index = ScheduleIndex(schedule)
+        for day in range(7):
+            found = [e["freq"] for e in index.findActive(0, 10000000, minute(day, 1230))]
+            expected = [6000000] if day in [0, 2, 4] else [6100000] if day in [5, 6] else []
+            self.assertEqual(found, expected, "day {0}".format(day))
+
+    def testOverlappingDays(self):
+        # Friday's broadcast runs into Saturday's
+        index = ScheduleIndex([entry(6000000, 1200, 1200, "....56.")])
+        self.assertEqual(len(index.findActive(0, 10000000, minute(5, 1300))), 1)
+        self.assertEqual(len(index.findActive(0, 10000000, minute(6, 1100))), 1)
+        self.assertEqual(index.findActive(0, 10000000, minute(6, 1200)), [])
+
+    def testFindBySource(self):
+        schedule = [entry(6000000, 1200, 1300, src="DW"), entry(6100000, 1400, 1500, src="DW")]
+        index = ScheduleIndex(schedule + [entry(6200000, 1200, 1300, src="VOA")])
+        self.assertEqual([e["freq"] for e in index.findBySource("DDW", minute(1, 1230))], [6000000])
+        self.assertEqual(index.findBySource("DVOA", minute(1, 1430)), [])
+
+    def testMinuteOfWeek(self):
+        # 2026-10-18 is a Sunday
+        self.assertEqual(ScheduleIndex.getMinuteOfWeek(datetime(2026, 10, 18, 23, 59)), ScheduleIndex.minutesPerWeek - 1)
+        self.assertEqual(ScheduleIndex.getMinuteOfWeek(datetime(2026, 10, 19, 0, 0)), 0)
+
+
+class ConvertDaysTest(TestCase):
+    def testConvertDays(self):
+        eibi = EIBI()
+        cases = {
+            "": "1234567",
+            "Mo": "1......",
+            "7": "......7",
+            "135": "1.3.5..",
+            "Sa,Su": ".....67",
+            "Mo-Fr": "12345..",
+            "1-3,6": "123..6.",
+            "Sa-Mo": "1....67",
+            "irr": "1234567",
+            "15Mar": "1234567",
+        }
+        for days, expected in cases.items():
+            self.assertEqual(eibi.convertDays(days), expected, days)
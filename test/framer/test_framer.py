@@ -0,0 +1,54 @@
+from unittest import TestCase
+from owrx.framer import Framer
+
+
+class FramerTest(TestCase):
+    def testLines(self):
+        framer = Framer()
+        framer.append(b"first\nsecond\nthi")
+        self.assertEqual(framer.lines(), [b"first", b"second"])
+        self.assertEqual(framer.lines(), [])
+        framer.append(memoryview(b"rd\n\nfourth"))
+        self.assertEqual(framer.lines(), [b"third", b""])
+        self.assertEqual(len(framer), 6)
+
+    def testLinesSplitAcrossReads(self):
+        data = b"".join(b"line %i\n" % i for i in range(1000))
+        framer = Framer()
+        lines = []
+        for i in range(0, len(data), 7):
+            framer.append(data[i : i + 7])
+            lines += framer.lines()
+        self.assertEqual(lines, data.split(b"\n")[:-1])
+        self.assertEqual(len(framer), 0)
+
+    def testRecords(self):
+        framer = Framer()
+        framer.append(b"xxBM0123456789")
+        self.assertEqual(framer.find(b"BM"), 2)
+        self.assertEqual(framer.find(b"BM", 0, 3), -1)
+        framer.skip(2)
+        self.assertEqual(framer[0], ord("B"))
+        self.assertEqual(framer.take(4), b"BM01")
+        self.assertEqual(framer.find(b"9"), 7)
+        self.assertEqual(framer.take(100), b"23456789")
+        self.assertEqual(len(framer), 0)
+        with self.assertRaises(IndexError):
+            framer[0]
+
+    def testSkipIsBounded(self):
+        framer = Framer()
+        framer.append(b"abc")
+        framer.skip(-1)
+        self.assertEqual(len(framer), 3)
+        framer.skip(10)
+        self.assertEqual(len(framer), 0)
+        framer.append(b"def\n")
+        self.assertEqual(framer.lines(), [b"def"])
+
+    def testCompaction(self):
+        framer = Framer()
+        for i in range(100):
+            framer.append(b"%04i" % i)
+            self.assertEqual(framer.take(4), b"%04i" % i)
+        self.assertLess(len(framer.buffer), 16)
@@ -0,0 +1,57 @@
+from unittest import TestCase
+from owrx.map import Map, LatLngLocation
+
+
+class Client(object):
+    def __init__(self):
+        self.updates = []
+        self.removals = []
+
+    def write_update(self, updates):
+        self.updates += [u["callsign"] for u in updates]
+
+    def write_removal(self, removals):
+        self.removals += removals
+
+
+class ViewportTest(TestCase):
+    def setUp(self):
+        self.map = Map()
+
+    def update(self, callsign, lat, lon):
+        self.map.updateLocations([(callsign, LatLngLocation(lat, lon), "APRS")])
+        self.map.flush()
+
+    def testOnlyVisibleTiles(self):
+        client = Client()
+        self.map.addClient(client, True)
+        self.map.setViewport(client, 55, 45, 15, 5)
+        self.update("DL1ABC", 50, 10)
+        self.update("W1AW", 41, -72)
+        self.assertEqual(client.updates, ["DL1ABC"])
+
+    def testMovesOutOfView(self):
+        client = Client()
+        self.map.addClient(client, True)
+        self.map.setViewport(client, 55, 45, 15, 5)
+        self.update("DL1ABC", 50, 10)
+        self.update("DL1ABC", 41, -72)
+        self.assertEqual(client.updates, ["DL1ABC", "DL1ABC"])
+        # the client still shows the marker, so it keeps getting its moves
+        self.update("DL1ABC", 42, -72)
+        self.assertEqual(client.updates, ["DL1ABC", "DL1ABC", "DL1ABC"])
+
+    def testRemovalOutsideOfView(self):
+        client = Client()
+        self.map.addClient(client, True)
+        self.map.setViewport(client, 55, 45, 15, 5)
+        self.update("DL1ABC", 50, 10)
+        self.map.setViewport(client, 45, 35, -65, -75)
+        self.map.removeLocation("DL1ABC")
+        self.map.flush()
+        self.assertEqual(client.removals, ["DL1ABC"])
+        # removals of callsigns the client has never seen are not sent
+        self.map.updateLocations([("W1AW", LatLngLocation(50, 10), "APRS")])
+        self.map.removeLocation("W1AW")
+        self.map.flush()
+        self.assertEqual(client.removals, ["DL1ABC"])
@@ -0,0 +1,228 @@
+from unittest import TestCase
+from unittest.mock import patch
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from functools import partial
+from owrx.markers import Markers
+import tempfile
+import threading
+import time
+import json
+import os
+
+
+KIWISDR_PAGE = """
+<html><body>
+<!-- name=First Kiwi -->
+<!-- gps=(52.100000, 5.200000) -->
+<!-- users=1 -->
+<!-- users_max=4 -->
+<!-- loc=Utrecht -->
+<!-- asl=10 -->
+<!-- antenna=Dipole -->
+<!-- sw_version=KiwiSDR_v1.600 -->
+<a href='http://kiwi1.example.com:8073'>First Kiwi</a>
+<!-- name=Second Kiwi -->
+<!-- gps=(-33.900000, 18.400000) -->
+<!-- users=0 -->
+<!-- users_max=8 -->
+<!-- loc=Cape Town -->
+<!-- asl=200 -->
+<!-- antenna=Loop -->
+<!-- sw_version=KiwiSDR_v1.600 -->
+<a href='http://kiwi2.example.com:8073'>Second Kiwi</a>
+</body></html>
+"""
+
+WEBSDR_PAGE = """
+// list of WebSDRs
+[
+{"lat": 52.2, "lon": 6.8, "url": "http://websdr.example.org:8901/", "desc": "Twente", "users": 100},
+{"lat": 51.5, "lon": -0.1, "url": "http://websdr.example.co.uk/", "desc": "London", "users": 3}
+]
+"""
+
+RECEIVERBOOK_PAGE = """
+<html><script>
+var receivers = [{"location": {"coordinates": [8.5, 47.3]}, "receivers": [{"type": "OpenWebRX", "version": "1.2", "url": "https://owrx.example.net/", "label": "Zurich"}]}];
+</script></html>
+"""
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, dict(self.headers)))
+        time.sleep(server.delay)
+        if self.path in server.failing:
+            self.send_error(500)
+            return
+        if self.path not in server.pages:
+            self.send_error(404)
+            return
+        body, etag, modified = server.pages[self.path]
+        if (etag is not None and self.headers.get("If-None-Match") == etag) or (
+            modified is not None and self.headers.get("If-Modified-Since") == modified
+        ):
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        if etag is not None:
+            self.send_header("ETag", etag)
+        if modified is not None:
+            self.send_header("Last-Modified", modified)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MarkersRefreshTest(TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        self.server.pages = {}
+        self.server.requests = []
+        self.server.failing = set()
+        self.server.delay = 0
+        self.setPage("/kiwi", KIWISDR_PAGE, etag='"kiwi-1"')
+        self.setPage("/websdr", WEBSDR_PAGE, etag='"websdr-1"')
+        self.setPage("/receiverbook", RECEIVERBOOK_PAGE, modified="Mon, 02 Oct 2023 10:00:00 GMT")
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+
+        self.directory = tempfile.TemporaryDirectory()
+        cacheFile = os.path.join(self.directory.name, "markers.cache")
+        self.patches = [
+            patch.object(Markers, "_getCachedMarkersFile", staticmethod(lambda: cacheFile)),
+            patch.object(Markers, "_getLegacyMarkersFile", staticmethod(lambda: cacheFile + ".json")),
+            patch("owrx.markers.Map"),
+        ]
+        self.map = [p.start() for p in self.patches][2].getSharedInstance()
+        self.markers = self.createMarkers()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+    def createMarkers(self):
+        base = "http://127.0.0.1:{0}".format(self.server.server_address[1])
+        markers = Markers()
+        markers.scrapeKiwiSDR = partial(markers.scrapeKiwiSDR, url=base + "/kiwi")
+        markers.scrapeWebSDR = partial(markers.scrapeWebSDR, url=base + "/websdr")
+        markers.scrapeOWRX = partial(markers.scrapeOWRX, url=base + "/receiverbook")
+        return markers
+
+    def setPage(self, path, body, etag=None, modified=None):
+        self.server.pages[path] = (body.encode("utf-8"), etag, modified)
+
+    def refresh(self):
+        self.markers.cache = self.markers.updateCache()
+        self.markers.setMarkers(self.markers._combine())
+
+    def getRequests(self, path):
+        return [headers for p, headers in self.server.requests if p == path]
+
+    def testScrapesAllSources(self):
+        self.refresh()
+        self.assertEqual(
+            set(self.markers.markers.keys()),
+            {
+                "kiwi1.example.com:8073",
+                "kiwi2.example.com:8073",
+                "websdr.example.org:8901",
+                "websdr.example.co.uk",
+                "owrx.example.net",
+            },
+        )
+        kiwi = self.markers.markers["kiwi2.example.com:8073"].attrs
+        self.assertEqual(kiwi["lat"], -33.9)
+        self.assertEqual(kiwi["maxusers"], 8)
+        self.assertEqual(kiwi["device"], "KiwiSDR 1.600")
+        self.assertEqual(self.markers.markers["owrx.example.net"].attrs["device"], "OpenWebRX 1.2")
+
+    def testCacheIsStored(self):
+        self.refresh()
+        self.assertEqual(
+            {k: v.attrs for k, v in self.markers.loadMarkers(Markers._getCachedMarkersFile()).items()},
+            {k: v.attrs for k, v in self.markers.markers.items()},
+        )
+
+    def testScrapesConcurrently(self):
+        self.server.delay = 0.5
+        start = time.monotonic()
+        self.markers.updateCache()
+        self.assertLess(time.monotonic() - start, 1.4)
+
+    def testSendsValidators(self):
+        self.refresh()
+        self.refresh()
+        kiwi = self.getRequests("/kiwi")
+        self.assertNotIn("If-None-Match", kiwi[0])
+        self.assertEqual(kiwi[1]["If-None-Match"], '"kiwi-1"')
+        receiverbook = self.getRequests("/receiverbook")
+        self.assertEqual(receiverbook[1]["If-Modified-Since"], "Mon, 02 Oct 2023 10:00:00 GMT")
+
+    def testUnchangedPagesDoNotUpdateMap(self):
+        self.refresh()
+        self.map.reset_mock()
+        self.refresh()
+        self.assertEqual(len(self.markers.markers), 5)
+        self.map.updateLocations.assert_not_called()
+        self.map.removeLocations.assert_not_called()
+
+    def testMapReceivesDifferencesOnly(self):
+        self.refresh()
+        self.map.reset_mock()
+        self.setPage("/kiwi", KIWISDR_PAGE.replace("<!-- users=0 -->", "<!-- users=5 -->"), etag='"kiwi-2"')
+        websdr = json.loads(WEBSDR_PAGE.split("\n", 2)[2])
+        websdr = websdr[:1] + [{"lat": 40.4, "lon": -3.7, "url": "http://madrid.example.es/", "desc": "Madrid", "users": 0}]
+        self.setPage("/websdr", json.dumps(websdr), etag='"websdr-2"')
+        self.refresh()
+
+        self.map.updateLocations.assert_called_once()
+        updated = self.map.updateLocations.call_args[0][0]
+        self.assertEqual({callsign for callsign, _, _ in updated}, {"kiwi2.example.com:8073", "madrid.example.es"})
+        self.assertEqual(self.markers.markers["kiwi2.example.com:8073"].attrs["users"], 5)
+        self.map.removeLocations.assert_called_once_with(["websdr.example.co.uk"])
+
+    def testFailingSourceKeepsMarkers(self):
+        self.refresh()
+        self.map.reset_mock()
+        self.server.failing.add("/websdr")
+        self.refresh()
+        self.assertIn("websdr.example.co.uk", self.markers.markers)
+        self.map.removeLocations.assert_not_called()
+
+    def testFailingSourceKeepsCachedMarkers(self):
+        # as loaded from the cache file at startup, before any scraping
+        self.refresh()
+        cached = self.markers.markers
+        self.markers = self.createMarkers()
+        self.markers.cache = dict(cached)
+        self.markers.markers = dict(cached)
+        self.server.failing.add("/receiverbook")
+        self.map.reset_mock()
+        self.refresh()
+        self.assertIn("owrx.example.net", self.markers.markers)
+        self.map.removeLocations.assert_not_called()
+
+    def testFailingSourceDoesNotKeepOtherStaleMarkers(self):
+        # as loaded from the cache file at startup, including a receiver the WebSDR list has dropped since
+        self.refresh()
+        cached = dict(self.markers.markers)
+        self.setPage("/websdr", WEBSDR_PAGE.replace("websdr.example.co.uk", "websdr2.example.co.uk"), etag='"websdr-2"')
+        self.markers = self.createMarkers()
+        self.markers.cache = dict(cached)
+        self.markers.markers = dict(cached)
+        self.server.failing.add("/kiwi")
+        self.map.reset_mock()
+        self.refresh()
+        self.assertIn("kiwi1.example.com:8073", self.markers.markers)
+        self.assertIn("websdr2.example.co.uk", self.markers.markers)
+        self.assertNotIn("websdr.example.co.uk", self.markers.markers)
+        self.assertNotIn("websdr.example.co.uk", self.markers.loadMarkers(Markers._getCachedMarkersFile()))
+        self.map.removeLocations.assert_called_once_with(["websdr.example.co.uk"])
@@ -0,0 +1,59 @@
+from unittest import TestCase
+from owrx.message import Message, MessageReader, MessageTypes, RecordMessageType
+import pickle
+import json
+
+
+class MessageTest(TestCase):
+    def testRoundtrip(self):
+        for value in [{"mode": "APRS", "lat": 52.1, "path": ["WIDE1-1*"]}, "CQ DX", b"\x00\x01\xfe"]:
+            messages = MessageReader().feed(Message.encode(value))
+            self.assertEqual(len(messages), 1)
+            self.assertEqual(messages[0].getValue(), value)
+
+    def testJsonIsForwardedAsEncoded(self):
+        data = Message.encode({"freq": 14074000, "msg": "CQ DL1ABC JO62"})
+        message, = MessageReader().feed(data)
+        self.assertEqual(message.getJson(), data[Message.header.size :])
+
+    def testFrame(self):
+        message, = MessageReader().feed(Message.encode({"msg": "ü"}))
+        frame = message.getFrame("secondary_demod")
+        self.assertIs(frame, message.getFrame("secondary_demod"))
+        self.assertEqual(json.loads(bytes(frame.payload)), {"type": "secondary_demod", "value": {"msg": "ü"}})
+
+    def testSplitAcrossReads(self):
+        data = b"".join(Message.encode({"index": i}) for i in range(10))
+        reader = MessageReader()
+        messages = []
+        for i in range(0, len(data), 7):
+            messages += reader.feed(memoryview(data)[i : i + 7])
+        self.assertEqual([m.getValue() for m in messages], [{"index": i} for i in range(10)])
+
+    def testText(self):
+        messages = MessageReader().feed(b"RYRYRY " + Message.encode({"a": 1}) + b"DE DL1ABC")
+        self.assertEqual([m.getValue() for m in messages], ["RYRYRY ", {"a": 1}, "DE DL1ABC"])
+        self.assertEqual(json.loads(messages[0].getJson()), "RYRYRY ")
+
+    def testPickle(self):
+        data = pickle.dumps({"address": 1234, "message": "test"}) + pickle.dumps({"address": 5678})
+        messages = MessageReader().feed(data)
+        self.assertEqual([m.getValue() for m in messages], [{"address": 1234, "message": "test"}, {"address": 5678}])
+
+    def testUnknownType(self):
+        data = bytes([Message.magic, 250, 3, 0, 0, 0]) + b"abc" + Message.encode("ok")
+        messages = MessageReader().feed(data)
+        self.assertEqual([m.getValue() for m in messages], ["ok"])
+
+    def testRecord(self):
+        recordType = MessageTypes.get(200) or MessageTypes.register(
+            RecordMessageType(200, "test", [("name", "str"), ("path", "strlist"), ("data", "bytes")])
+        )
+        value = {"name": "DL1ABC-9", "path": ["WIDE1-1", "WIDE2-1*"], "data": b"!5210.00N/00510.00E>"}
+        message, = MessageReader().feed(Message.encode(value, recordType))
+        self.assertIs(message.type, recordType)
+        self.assertEqual(message.getValue(), value)
+
+    def testRegisterDuplicate(self):
+        with self.assertRaises(ValueError):
+            MessageTypes.register(RecordMessageType(MessageTypes.json.id, "duplicate", []))
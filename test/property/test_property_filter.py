@@ -80,3 +80,23 @@ class PropertyFilterTest(TestCase):
         pf.wire(mock.method)
         del pf["testkey"]
         mock.method.assert_called_once_with({"testkey": PropertyDeleted})
+
+    def testSharesUpstreamSubscription(self):
+        pm = PropertyLayer()
+        first = pm.filter("testkey")
+        second = pm.filter("otherkey")
+        firstMock = Mock()
+        secondMock = Mock()
+        first.wire(firstMock.method)
+        second.wire(secondMock.method)
+        self.assertEqual(len(pm.subscribers), 1)
+        pm["testkey"] = "testvalue"
+        firstMock.method.assert_called_once_with({"testkey": "testvalue"})
+        secondMock.method.assert_not_called()
+
+    def testDetachesWhenUnwired(self):
+        pm = PropertyLayer()
+        sub = pm.filter("testkey").wire(Mock().method)
+        self.assertEqual(len(pm.subscribers), 1)
+        sub.cancel()
+        self.assertEqual(len(pm.subscribers), 0)
@@ -1,6 +1,7 @@
-from owrx.property import PropertyLayer, PropertyDeleted
+from owrx.property import PropertyLayer, PropertyDeleted, DispatchMetrics
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+import logging
 
 
 class PropertyLayerTest(TestCase):
@@ -91,3 +92,31 @@ class PropertyLayerTest(TestCase):
         with self.assertRaises(KeyError):
             del pm["testkey"]
         mock.method.assert_not_called()
+
+    def testPropertySubscriberOnlyCalledForItsProperty(self):
+        pm = PropertyLayer()
+        mock = Mock()
+        pm.wireProperty("testkey", mock.method)
+        pm["otherkey"] = "othervalue"
+        mock.method.assert_not_called()
+        pm["testkey"] = "testvalue"
+        mock.method.assert_called_once_with("testvalue")
+
+    def testUnwiredPropertySubscriber(self):
+        pm = PropertyLayer()
+        mock = Mock()
+        sub = pm.wireProperty("testkey", mock.method)
+        sub.cancel()
+        pm["testkey"] = "testvalue"
+        mock.method.assert_not_called()
+        self.assertFalse(pm.hasSubscribers())
+
+    def testDispatchDoesNotSetUpMetrics(self):
+        pm = PropertyLayer()
+        mock = Mock()
+        pm.wire(mock.method)
+        logger = logging.getLogger("owrx.property")
+        with patch.object(DispatchMetrics, "sharedInstance", None), patch.object(logger, "isEnabledFor", return_value=True):
+            pm["testkey"] = "testvalue"
+            self.assertIsNone(DispatchMetrics.getSharedInstance())
+        mock.method.assert_called_once_with({"testkey": "testvalue"})
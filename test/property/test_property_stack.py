@@ -238,3 +238,53 @@ class PropertyStackTest(TestCase):
         ps.wire(mock.method)
         del high_pm["testkey"]
         mock.method.assert_called_once_with({"testkey": "lowvalue"})
+
+    def testNoEventWhenAddingLowerLayer(self):
+        ps = PropertyStack()
+        high_pm = PropertyLayer(testkey="highvalue")
+        ps.addLayer(0, high_pm)
+        mock = Mock()
+        ps.wire(mock.method)
+        ps.addLayer(1, PropertyLayer(testkey="lowvalue"))
+        mock.method.assert_not_called()
+        self.assertEqual(ps["testkey"], "highvalue")
+
+    def testNoEventOnLowerLayerChange(self):
+        ps = PropertyStack()
+        low_pm = PropertyLayer(testkey="lowvalue")
+        ps.addLayer(0, PropertyLayer(testkey="highvalue"))
+        ps.addLayer(1, low_pm)
+        mock = Mock()
+        ps.wire(mock.method)
+        low_pm["testkey"] = "new lowvalue"
+        mock.method.assert_not_called()
+        self.assertEqual(ps["testkey"], "highvalue")
+
+    def testEqualPriorityKeepsInsertionOrder(self):
+        ps = PropertyStack()
+        ps.addLayer(0, PropertyLayer(testkey="first"))
+        ps.addLayer(0, PropertyLayer(testkey="second"))
+        self.assertEqual(ps["testkey"], "first")
+
+    def testKeyAddedToHigherLayer(self):
+        ps = PropertyStack()
+        high_pm = PropertyLayer()
+        ps.addLayer(1, PropertyLayer(testkey="lowvalue"))
+        ps.addLayer(0, high_pm)
+        mock = Mock()
+        ps.wire(mock.method)
+        high_pm["testkey"] = "highvalue"
+        mock.method.assert_called_once_with({"testkey": "highvalue"})
+        self.assertEqual(ps["testkey"], "highvalue")
+        del high_pm["testkey"]
+        self.assertEqual(ps["testkey"], "lowvalue")
+
+    def testKeysAfterLayerRemoval(self):
+        ps = PropertyStack()
+        pm = PropertyLayer(testkey="value", otherkey="value")
+        ps.addLayer(0, PropertyLayer(testkey="value"))
+        ps.addLayer(1, pm)
+        ps.removeLayer(pm)
+        self.assertEqual(set(ps.keys()), {"testkey"})
+        self.assertNotIn("otherkey", ps)
+        self.assertEqual(ps.__dict__(), {"testkey": "value"})
@@ -0,0 +1,155 @@
+from unittest import TestCase
+from unittest.mock import Mock
+from owrx.property import PropertyLayer, PropertyStack, PropertyDeleted
+
+
+class PropertyTransactionTest(TestCase):
+    def testEventsAreHeldBack(self):
+        pm = PropertyLayer(testkey="initial")
+        mock = Mock()
+        pm.wire(mock.method)
+        with pm.transaction():
+            pm["testkey"] = "value"
+            mock.method.assert_not_called()
+        mock.method.assert_called_once_with({"testkey": "value"})
+
+    def testChangesAreCoalesced(self):
+        pm = PropertyLayer()
+        mock = Mock()
+        pm.wire(mock.method)
+        with pm.transaction():
+            pm["testkey"] = "first value"
+            pm["otherkey"] = "other value"
+            pm["testkey"] = "second value"
+            del pm["otherkey"]
+        mock.method.assert_called_once_with({"testkey": "second value", "otherkey": PropertyDeleted})
+
+    def testValuesAreReadableWithinTransaction(self):
+        pm = PropertyLayer()
+        with pm.transaction():
+            pm["testkey"] = "value"
+            self.assertEqual(pm["testkey"], "value")
+
+    def testNestedTransactions(self):
+        pm = PropertyLayer()
+        mock = Mock()
+        pm.wire(mock.method)
+        with pm.transaction():
+            with pm.transaction():
+                pm["testkey"] = "value"
+            mock.method.assert_not_called()
+            pm["otherkey"] = "other value"
+        mock.method.assert_called_once_with({"testkey": "value", "otherkey": "other value"})
+
+    def testEmptyTransactionDoesNotFire(self):
+        pm = PropertyLayer(testkey="value")
+        mock = Mock()
+        pm.wire(mock.method)
+        with pm.transaction():
+            pm["testkey"] = "value"
+        mock.method.assert_not_called()
+
+    def testChangesAreFiredOnException(self):
+        pm = PropertyLayer()
+        mock = Mock()
+        pm.wire(mock.method)
+        with self.assertRaises(ValueError):
+            with pm.transaction():
+                pm["testkey"] = "value"
+                raise ValueError()
+        mock.method.assert_called_once_with({"testkey": "value"})
+
+    def testPropertySubscriptionsAreCalledOnce(self):
+        pm = PropertyLayer(testkey="initial")
+        mock = Mock()
+        pm.wireProperty("testkey", mock.method)
+        mock.method.reset_mock()
+        with pm.transaction():
+            pm["testkey"] = "first value"
+            pm["testkey"] = "second value"
+        mock.method.assert_called_once_with("second value")
+
+    def testStackTransaction(self):
+        low = PropertyLayer(testkey="low value", otherkey="other value")
+        high = PropertyLayer()
+        stack = PropertyStack()
+        stack.addLayer(1, low)
+        stack.addLayer(0, high)
+        mock = Mock()
+        stack.wire(mock.method)
+        with stack.transaction():
+            stack["otherkey"] = "new value"
+            high["testkey"] = "high value"
+            self.assertEqual(stack["testkey"], "high value")
+            mock.method.assert_not_called()
+        mock.method.assert_called_once_with({"otherkey": "new value", "testkey": "high value"})
+
+    def testStackTransactionReachesFilters(self):
+        layer = PropertyLayer(testkey="initial")
+        stack = PropertyStack()
+        stack.addLayer(0, layer)
+        mock = Mock()
+        stack.filter("testkey").wire(mock.method)
+        with stack.transaction():
+            stack["testkey"] = "first value"
+            stack["unrelated"] = "value"
+            stack["testkey"] = "second value"
+        mock.method.assert_called_once_with({"testkey": "second value"})
+
+    def testLayerTransactionIsVisibleThroughStack(self):
+        layer = PropertyLayer(testkey="initial", otherkey="other value")
+        stack = PropertyStack()
+        stack.addLayer(0, layer)
+        mock = Mock()
+        stack.wire(mock.method)
+        with layer.transaction():
+            layer["newkey"] = "new value"
+            del layer["otherkey"]
+            self.assertIn("newkey", stack)
+            self.assertEqual(stack["newkey"], "new value")
+            self.assertNotIn("otherkey", stack)
+            self.assertEqual(stack.__dict__(), {"testkey": "initial", "newkey": "new value"})
+            mock.method.assert_not_called()
+        mock.method.assert_called_once_with({"newkey": "new value", "otherkey": PropertyDeleted})
+
+    def testLayerTransactionRevealsLowerLayer(self):
+        low = PropertyLayer(testkey="low value")
+        high = PropertyLayer(testkey="high value")
+        stack = PropertyStack()
+        stack.addLayer(1, low)
+        stack.addLayer(0, high)
+        mock = Mock()
+        stack.wire(mock.method)
+        with high.transaction():
+            del high["testkey"]
+            self.assertEqual(stack["testkey"], "low value")
+        mock.method.assert_called_once_with({"testkey": "low value"})
+
+    def testLayerTransactionIsVisibleThroughNestedStacks(self):
+        layer = PropertyLayer()
+        inner = PropertyStack()
+        inner.addLayer(0, layer)
+        outer = PropertyStack()
+        outer.addLayer(0, inner)
+        mock = Mock()
+        outer.wire(mock.method)
+        with layer.transaction():
+            layer["testkey"] = "first value"
+            layer["testkey"] = "second value"
+            self.assertEqual(outer["testkey"], "second value")
+            mock.method.assert_not_called()
+        mock.method.assert_called_once_with({"testkey": "second value"})
+
+    def testRemovedLayerEndsTransaction(self):
+        layer = PropertyLayer()
+        stack = PropertyStack()
+        stack.addLayer(0, layer)
+        mock = Mock()
+        stack.wire(mock.method)
+        with layer.transaction():
+            layer["testkey"] = "value"
+            stack.removeLayer(layer)
+        mock.method.assert_called_once_with({"testkey": PropertyDeleted})
+        mock.method.reset_mock()
+        stack.addLayer(0, PropertyLayer(otherkey="value"))
+        mock.method.assert_called_once_with({"otherkey": "value"})
@@ -0,0 +1,80 @@
+from unittest import TestCase
+from owrx.storage import FileIndex, Storage
+import tempfile
+import os
+
+
+class FileIndexTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def createFile(self, name: str, size: int = 10, mtime: int = None):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "wb") as f:
+            f.write(b"x" * size)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return name
+
+    def createIndex(self):
+        return FileIndex(self.directory.name, Storage().getNamePattern())
+
+    def testSeed(self):
+        self.createFile("SSTV-230101-120000-14230.png", mtime=1000)
+        self.createFile("FAX-230101-110000.png", mtime=2000)
+        self.createFile("ISM-230101-100000-433920.txt", mtime=1500)
+        self.createFile("something-else.txt")
+        index = self.createIndex()
+        self.assertEqual(
+            index.list(),
+            ["FAX-230101-110000.png", "ISM-230101-100000-433920.txt", "SSTV-230101-120000-14230.png"],
+        )
+        self.assertEqual(index.size, 30)
+
+    def testPaginate(self):
+        names = [self.createFile("FAX-230101-1200%02d.png" % i, mtime=1000 + i) for i in range(10)]
+        index = self.createIndex()
+        self.assertEqual(len(index), 10)
+        self.assertEqual(index.list(0, 3), names[9:6:-1])
+        self.assertEqual(index.list(9, 3), names[0:1])
+        self.assertEqual(index.list(12, 3), [])
+
+    def testAddAndRemove(self):
+        index = self.createIndex()
+        name = self.createFile("ISM-230101-100000.txt", 0, mtime=1000)
+        index.add(name, True)
+        self.createFile("ISM-230101-100000.txt", 100, mtime=3000)
+        index.add(name)
+        self.assertEqual(index.size, 100)
+        older = self.createFile("FAX-230101-110000.png", mtime=2000)
+        index.add(older)
+        self.assertEqual(index.list(), [name, older])
+        index.remove(name)
+        index.remove(name)
+        self.assertEqual(index.list(), [older])
+        self.assertEqual(index.size, 10)
+
+    def testExpireByCount(self):
+        names = [self.createFile("FAX-230101-1200%02d.png" % i, mtime=1000 + i) for i in range(10)]
+        index = self.createIndex()
+        self.assertEqual(index.expire(7), names[0:3])
+        self.assertEqual(index.list(), names[:2:-1])
+        self.assertEqual(index.size, 70)
+        self.assertEqual(index.expire(7), [])
+
+    def testExpireBySize(self):
+        names = [self.createFile("FAX-230101-1200%02d.png" % i, 100, mtime=1000 + i) for i in range(10)]
+        index = self.createIndex()
+        self.assertEqual(index.expire(20, 450), names[0:6])
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index.size, 400)
+
+    def testExpireKeepsOpenFiles(self):
+        names = [self.createFile("ISM-230101-1200%02d.txt" % i, mtime=1000 + i) for i in range(5)]
+        index = self.createIndex()
+        index.add(names[0], True)
+        self.assertEqual(index.expire(2), names[1:4])
+        self.assertEqual(index.list(), [names[4], names[0]])
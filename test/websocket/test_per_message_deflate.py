@@ -0,0 +1,84 @@
+from unittest import TestCase
+from unittest.mock import patch
+from owrx.websocket import PerMessageDeflate, Frame, ProtocolError, MessageTooBig, MAX_MESSAGE_SIZE
+import zlib
+
+
+class PerMessageDeflateTest(TestCase):
+    def setUp(self):
+        # the metrics need a complete configuration
+        patcher = patch("owrx.websocket.WebSocketMetrics.getSharedInstance")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _clientCompress(self, data: bytes) -> bytes:
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        return (compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH))[:-4]
+
+    def testNegotiateDefaults(self):
+        headers = {"Sec-WebSocket-Extensions": "permessage-deflate; client_max_window_bits"}
+        deflate = PerMessageDeflate.negotiate(headers)
+        self.assertIsNotNone(deflate)
+        self.assertEqual(deflate.windowBits, 15)
+        self.assertEqual(deflate.getResponseHeader(), "permessage-deflate; server_no_context_takeover")
+
+    def testNegotiateWindowBits(self):
+        headers = {"sec-websocket-extensions": 'permessage-deflate; server_max_window_bits="10"'}
+        deflate = PerMessageDeflate.negotiate(headers)
+        self.assertEqual(deflate.windowBits, 10)
+        self.assertIn("server_max_window_bits=10", deflate.getResponseHeader())
+
+    def testNegotiateWithoutOffer(self):
+        self.assertIsNone(PerMessageDeflate.negotiate({}))
+        self.assertIsNone(PerMessageDeflate.negotiate({"Sec-WebSocket-Extensions": "x-webkit-deflate-frame"}))
+
+    def testNegotiateSkipsUnacceptableOffers(self):
+        headers = {
+            "Sec-WebSocket-Extensions": "permessage-deflate; server_max_window_bits=8, permessage-deflate; unknown, "
+            "permessage-deflate; server_max_window_bits=12"
+        }
+        self.assertEqual(PerMessageDeflate.negotiate(headers).windowBits, 12)
+
+    def testNegotiateRejectsAllUnacceptableOffers(self):
+        headers = {"Sec-WebSocket-Extensions": "permessage-deflate; server_max_window_bits=8"}
+        self.assertIsNone(PerMessageDeflate.negotiate(headers))
+
+    def testCompressRoundTrip(self):
+        deflate = PerMessageDeflate(12)
+        frame = Frame({"type": "config", "value": {"key": "value " * 100}})
+        compressed = deflate.compress(frame)
+        self.assertEqual(compressed.header[0] & 0x40, 0x40)
+        self.assertLess(compressed.payload.nbytes, frame.payload.nbytes)
+        decompressor = zlib.decompressobj(-12)
+        inflated = decompressor.decompress(bytes(compressed.payload) + b"\x00\x00\xff\xff")
+        self.assertEqual(inflated, bytes(frame.payload))
+
+    def testSmallAndBinaryFramesAreNotCompressed(self):
+        deflate = PerMessageDeflate()
+        small = Frame({"type": "smeter", "value": 0.1})
+        self.assertIs(deflate.compress(small), small)
+        binary = Frame(bytes(1024))
+        self.assertIs(deflate.compress(binary), binary)
+
+    def testDecompressRoundTrip(self):
+        deflate = PerMessageDeflate()
+        messages = [b'{"type":"dspcontrol","params":{"offset_freq":%i}}' % i for i in range(3)]
+        # the client may keep its context across messages
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        for message in messages:
+            data = (compressor.compress(message) + compressor.flush(zlib.Z_SYNC_FLUSH))[:-4]
+            self.assertEqual(deflate.decompress(data), message)
+
+    def testDecompressLimit(self):
+        deflate = PerMessageDeflate()
+        self.assertEqual(len(deflate.decompress(self._clientCompress(bytes(MAX_MESSAGE_SIZE)))), MAX_MESSAGE_SIZE)
+        deflate = PerMessageDeflate()
+        with self.assertRaises(MessageTooBig) as context:
+            deflate.decompress(self._clientCompress(bytes(MAX_MESSAGE_SIZE + 1)))
+        self.assertEqual(context.exception.code, 1009)
+
+    def testInflateWithoutNegotiation(self):
+        with self.assertRaises(ProtocolError) as context:
+            PerMessageDeflate.inflate(None, self._clientCompress(b"test"))
+        self.assertEqual(context.exception.code, 1002)
+        self.assertEqual(PerMessageDeflate.inflate(PerMessageDeflate(), self._clientCompress(b"test")), b"test")